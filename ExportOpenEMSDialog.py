@@ -1,4 +1,4 @@
-from PySide import QtGui, QtCore, QtWidgets
+from PySide import QtCore, QtWidgets
 from PySide.QtCore import Slot, QTimer
 import os, sys
 import re
@@ -17,8 +17,7 @@ APP_CONTEXT = "None"
 try:
 	import FreeCAD
 	#import WebGui	#this plugin was removed in 0.20 and later, it's used to display help
-	import KiCADImporterToolDialog			#import for KiCAD Import Tool
-	import MaterialConstantsCatalogDialog	#import for Material Constants Catalog
+	#KiCAD Import Tool and Material Constants Catalog dialogs are imported when they are opened first time
 	APP_CONTEXT = "FreeCAD"
 except Exception as e:
 	print(f"Error test if addon opened in FreeCAD")
@@ -63,22 +62,26 @@ from utilsOpenEMS.SettingsItem.MaterialSettingsItem import MaterialSettingsItem
 from utilsOpenEMS.SettingsItem.SimulationSettingsItem import SimulationSettingsItem
 from utilsOpenEMS.SettingsItem.GridSettingsItem import GridSettingsItem
 from utilsOpenEMS.SettingsItem.BoundaryConditionSettingsItem import BoundaryConditionSettingsItem
-from utilsOpenEMS.SettingsItem.FreeCADSettingsItem import FreeCADSettingsItem
 
-from utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator import OctaveScriptLinesGenerator
-from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator import PythonScriptLinesGenerator
+#	script generators are imported when solver is used first time, see getScriptGenerator()
+#	mesh tools import generators base class, they are imported in their button handlers
+from utilsOpenEMS.ScriptLinesGenerator.MultiTargetExporter import MultiTargetExporter
 
-from utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator2 import OctaveScriptLinesGenerator2					#EXPERIMENTAL JUST FOR DEBUGGING TILL MOVE TO RELEASE
-from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator2_openems import PythonScriptLinesGenerator2_openems	#EXPERIMENTAL JUST FOR DEBUGGING TILL MOVE TO RELEASE
-from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator3_emerge import PythonScriptLinesGenerator3_emerge		#EXPERIMENTAL JUST FOR DEBUGGING TILL MOVE TO RELEASE
-from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator4_palace import PythonScriptLinesGenerator4_palace		#EXPERIMENTAL JUST FOR DEBUGGING TILL MOVE TO RELEASE
+from utilsOpenEMS.EngineProfile.EngineProfile import EngineProfile
 
 from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.CadEventQueue import CadEventQueue
+from utilsOpenEMS.GuiHelpers.CadObjectList import CadObjectList
+from utilsOpenEMS.GuiHelpers.BoundBoxCache import BoundBoxCache
+from utilsOpenEMS.GuiHelpers.LazyTabs import LazyTabs
+from utilsOpenEMS.GuiHelpers.PriorityListIndex import PriorityListIndex
 
 from utilsOpenEMS.GuiHelpers.GuiSignals import GuiSignals
 
 from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SaveLoad.SettingsDirtyTracker import SettingsDirtyTracker
+from utilsOpenEMS.SaveLoad.SettingsAutosave import SettingsAutosave
 
 # UI file (use Qt Designer to modify)
 from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r
@@ -95,9 +98,14 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		Finish observing CAD signals for add/remove/rename.
 		:return: None
 		"""
+		#	dialog closed normally, autosave journal is not needed
+		self.settingsAutosave.stop()
+
 		if self.cadInterfaceType == "FreeCAD":
 			self.observer.endObservation()
 			self.observer = None
+			self.cadEventQueue.stop()
+			BoundBoxCache.disable()
 			print("FreeCAD observer terminated.")
 
 			#if KiCAD import tool is opened close it
@@ -120,6 +128,8 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			self.finished()
 		elif event.type() == QtCore.QEvent.WindowActivate and self.cadInterfaceType == "Blender":
 			self.blenderWindowActivatedHandler()
+		elif event.type() == QtCore.QEvent.Show:
+			self.lazyTabs.populateCurrent()		#tab displayed when dialog is opened is populated now, others when they are selected
 		return super(ExportOpenEMSDialog, self).eventFilter(object, event)
 		
 	def __init__(self):		
@@ -149,6 +159,25 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		self.form.installEventFilter(self)
 		
 		# add a statusBar widget (comment to revert to QMessageBox if there are any problems)
+		#
+		#	Collapsible generation report panel, shows timing of stages of last script generation
+		#
+		self.generationReportToggleButton = QtWidgets.QToolButton()
+		self.generationReportToggleButton.setText("Generation report")
+		self.generationReportToggleButton.setCheckable(True)
+		self.generationReportToggleButton.setToolButtonStyle(QtCore.Qt.ToolButtonTextBesideIcon)
+		self.generationReportToggleButton.setArrowType(QtCore.Qt.RightArrow)
+		self.generationReportToggleButton.toggled.connect(self.generationReportToggled)
+		self.form.dialogVertLayout.addWidget(self.generationReportToggleButton)
+
+		self.generationReportText = QtWidgets.QPlainTextEdit()
+		self.generationReportText.setReadOnly(True)
+		self.generationReportText.setMaximumHeight(200)
+		self.generationReportText.setStyleSheet("font-family: monospace;")
+		self.generationReportText.setPlainText("No script generated yet.")
+		self.generationReportText.setVisible(False)
+		self.form.dialogVertLayout.addWidget(self.generationReportText)
+
 		self.statusBar = QtWidgets.QStatusBar()
 		self.statusBar.setStyleSheet("QStatusBar{border-top: 1px outset grey;}")
 		self.form.dialogVertLayout.addWidget(self.statusBar)
@@ -159,18 +188,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#self.form.setStyleSheet(".QLabel{font-size: 25pt;}")
 
 		#
-		# instantiate script generators using this dialog form
+		# script generators using this dialog form, they are created when they are used first time
+		#	- targets are keys of MultiTargetExporter.targetGenerators, generator module is imported when target is used
+		#	- octaveScriptGenerator, pythonScriptGenerator and scriptGenerator are properties returning generator for target
 		#
-		#self.octaveScriptGenerator = OctaveScriptLinesGenerator(self.form, statusBar = self.statusBar)
-
-		# EXPERIMENTAL using settings to short code and move auxiliary logic for diferent sutff into settings classes
-		# to be able do in python code generatr same stuff as in octave
-		self.octaveScriptGenerator = OctaveScriptLinesGenerator2(self.form, statusBar=self.statusBar)
-		self.pythonScriptGenerator = PythonScriptLinesGenerator2_openems(self.form, statusBar = self.statusBar)
-
-		self.scriptGenerator = self.octaveScriptGenerator													#variable which store current script generator
-		#self.scriptGenerator2 = OctaveScriptLinesGenerator2(self.form, statusBar=self.statusBar)
-		#self.scriptGenerator3 = PythonScriptLinesGenerator2(self.form, statusBar=self.statusBar)
+		self.scriptGenerators = {}											# target name -> generator instance
+		self.pythonScriptGeneratorTarget = "openEMS_python"					# python generator for current solver type
+		self.scriptGeneratorTarget = "openEMS_octave"						# variable which store current script generator target
 
 		#
 		#	Connect function to change script generator
@@ -187,7 +211,10 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		# INI file object to used for save/load operation
 		#
-		self.simulationSettingsFile = IniFile0v1(self.form, statusBar = self.statusBar, guiSignals = self.guiSignals, APP_DIR = APP_DIR)
+		#	dirty tracker remembers changed settings sections, settings file 0.2 then rewrites only them during save
+		#
+		self.settingsDirtyTracker = SettingsDirtyTracker(self.form)
+		self.simulationSettingsFile = IniFile0v1(self.form, statusBar = self.statusBar, guiSignals = self.guiSignals, APP_DIR = APP_DIR, dirtyTracker = self.settingsDirtyTracker)
 
 		#
 		# TOP LEVEL ITEMS / Category Items (excitation, grid, materials, ...)
@@ -205,9 +232,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#	Left Column - FreeCAD objects list
 		#########################################################################################################
 
-		self.internalObjectNameLabelList = {}
+		#	persistent item for each CAD object, internalObjectNameLabelList is its dictionary object name -> label
+		self.leftColumnObjects = CadObjectList(self.form.objectAssignmentLeftTreeWidget, self.cadHelpers, APP_DIR = APP_DIR)
+		self.internalObjectNameLabelList = self.leftColumnObjects.objectLabels
 
-		self.initLeftColumnTopLevelItems()
+		#	CAD objects are listed when object assignment tab is shown first time
+		self.lazyTabs = LazyTabs(self.form.openEMSTab)
+		self.lazyTabs.addInitializer(self.form.objectAssignmentTab, lambda: self.initLeftColumnTopLevelItems(self.form.objectAssignmentFilterLeft.text()))
 		self.form.objectAssignmentLeftTreeWidget.itemDoubleClicked.connect(self.objectAssignmentLeftTreeWidgetItemDoubleClicked)	
 		self.form.objectAssignmentLeftTreeWidget.itemSelectionChanged.connect(self.objectAssignmentLeftTreeWidgetItemSelectionChanged)
 
@@ -277,6 +308,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		# Clicked on "Generate OpenEMS Script"
 		#		
 		self.form.generateOpenEMSScriptButton.clicked.connect(self.generateOpenEMSScriptButtonClicked)
+		self.form.generateMultiTargetButton.clicked.connect(self.generateMultiTargetButtonClicked)
 
 		#
 		# Clicked on BUTTONS FOR OBJECT PRIORITIES
@@ -310,6 +342,8 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#		
 		self.form.createUserdefGridLinesFromCurrentButton.clicked.connect(self.createUserdefGridLinesFromCurrentButtonClicked)
 		self.form.displayXYGridLinesInModelButton.clicked.connect(self.displayXYGridLinesInModelButtonClicked)
+		self.form.previewFinalMeshButton.clicked.connect(self.previewFinalMeshButtonClicked)
+		self.form.analyzeMeshQualityButton.clicked.connect(self.analyzeMeshQualityButtonClicked)
 		self.form.gridRectangularRadio.toggled.connect(self.gridCoordsTypeChoosed)
 		self.form.gridCylindricalRadio.toggled.connect(self.gridCoordsTypeChoosed)
 
@@ -393,14 +427,8 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			for element in [self.form.lumpedPortResistanceValue, self.form.lumpedPortResistanceUnits]
 		])
 
-		self.form.microstripPortDirection.activated.emit(0)	#emit signal to fill connected combobox or whatever with right values after startup, ie. when user start GUI there is no change
-															# and combobox with propagation direction left with all possibilities
-
-		self.form.coplanarPortDirection.activated.emit(0)	#emit signal to fill connected combobox or whatever with right values after startup, ie. when user start GUI there is no change
-															# and combobox with propagation direction left with all possibilities
-
-		self.form.striplinePortDirection.activated.emit(0)	#emit signal to fill connected combobox or whatever with right values after startup, ie. when user start GUI there is no change
-															# and combobox with propagation direction left with all possibilities
+		#	port material and propagation direction comboboxes are filled when port tab is shown first time
+		self.lazyTabs.addInitializer(self.form.portSettingsTab, self.populatePortSettingsTab)
 
 		################################################################################################################
 		#	PROBE TAB -> DUMPBOX TAB UI EVENT HANDLERS
@@ -437,6 +465,11 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		self.form.BCzmin.currentIndexChanged.connect(self.BCzminCurrentIndexChanged)
 		self.form.BCzmax.currentIndexChanged.connect(self.BCzmaxCurrentIndexChanged)
 
+		self.form.proposeSimulationBoxButton.clicked.connect(self.proposeSimulationBoxButtonClicked)
+		self.form.detectSymmetryButton.clicked.connect(self.detectSymmetryButtonClicked)
+		self.form.calibrateEngineButton.clicked.connect(self.calibrateEngineButtonClicked)
+		self.lazyTabs.addInitializer(self.form.simulationParamsTab, self.updateEngineProfileLabel)		# engine profile file is read when tab is shown
+
 		self.form.genParamMinGridSpacingEnable.stateChanged.connect(lambda:
 			[element.setEnabled(True) for element in [self.form.genParamMinGridSpacingX, self.form.genParamMinGridSpacingY, self.form.genParamMinGridSpacingZ]]
 			if self.form.genParamMinGridSpacingEnable.isChecked() else
@@ -452,6 +485,12 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		# FILTER LEFT COLUMN ITEMS
 		#
+		#	filter is applied when user stops typing or immediately after enter
+		self.objectAssignmentFilterTimer = QTimer()
+		self.objectAssignmentFilterTimer.setSingleShot(True)
+		self.objectAssignmentFilterTimer.setInterval(300)
+		self.objectAssignmentFilterTimer.timeout.connect(self.applyObjectAssignmentFilter)
+		self.form.objectAssignmentFilterLeft.textChanged.connect(lambda text: self.objectAssignmentFilterTimer.start())
 		self.form.objectAssignmentFilterLeft.returnPressed.connect(self.applyObjectAssignmentFilter)
 
 		# MinDecrement changed 
@@ -459,8 +498,8 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		
 		### Other Initialization
 		
-		# initialize dB preview label with converted value
-		self.simParamsMinDecrementValueChanged(self.form.simParamsMinDecrement.value())
+		# initialize dB preview label with converted value when simulation tab is shown
+		self.lazyTabs.addInitializer(self.form.simulationParamsTab, lambda: self.simParamsMinDecrementValueChanged(self.form.simParamsMinDecrement.value()))
 
 		#
 		#	KiCAD Importer Tool
@@ -481,10 +520,22 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				# create observer instance
 				from utilsOpenEMS.GuiHelpers.FreeCADDocObserver import FreeCADDocObserver
 				self.observer = FreeCADDocObserver()
-				self.observer.objectCreated += self.freecadObjectCreated
-				self.observer.objectChanged += self.freecadObjectChanged
-				self.observer.objectDeleted += self.freecadBeforeObjectDeleted
+
+				# events are coalesced per object and handled in bursts, see freecadObjectEventsFlushed()
+				self.cadEventQueue = CadEventQueue(self.freecadObjectEventsFlushed)
+				self.observer.objectCreated += self.cadEventQueue.objectCreated
+				self.observer.objectChanged += self.cadEventQueue.objectChanged
+				self.observer.objectDeleted += self.cadEventQueue.objectDeleted
+				self.leftColumnObjects.recordLabels()		# left column is populated later, labels are needed to handle renames before it
+
+				# bounding boxes are cached while observer invalidates them
+				self.observer.objectChanged += BoundBoxCache.invalidate
+				self.observer.objectRecomputed += BoundBoxCache.invalidate
+				self.observer.objectDeleted += BoundBoxCache.invalidate
+				self.observer.documentActivated += BoundBoxCache.clear
+				self.observer.documentDeleted += BoundBoxCache.clear
 				self.observer.startObservation()
+				BoundBoxCache.enable()
 
 			except:
 				self.cadHelpers.printError("Cannot create FreeCAD observer, there is no connection to CAD program signals.")
@@ -543,6 +594,12 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		self.form.comboBox_solverType.currentIndexChanged.connect(self.updateUiBasedOnSolverType)
 		QTimer.singleShot(0, self.updateUiBasedOnSolverType)	#update gui based on solver type after start
 
+		#
+		#	Autosave settings into journal next to document, if journal is left by crashed session recovery is offered
+		#
+		self.settingsAutosave = SettingsAutosave(self.form, guiSignals = self.guiSignals, APP_DIR = APP_DIR)
+		QTimer.singleShot(0, self.startSettingsAutosave)
+
 		print(f"----> init finished")
 
 	def updateUiBasedOnSolverType(self):
@@ -586,13 +643,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			#disable main BoundaryConditions tab, not applicable for FDTD simulation in openEMS
 			self.form.boundaryConditionTab.setEnabled(False)
 
-			self.pythonScriptGenerator = PythonScriptLinesGenerator2_openems(self.form, statusBar = self.statusBar)
+			self.setPythonScriptGeneratorTarget("openEMS_python")
 
 			#
 			# Hide boundary conditions in right tree widget, not applicable for openEMS
 			#
 			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentRightTreeWidget, "BoundaryCondition", False)
-			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentPriorityTreeView, "BoundaryCondition", False)
+			self.guiHelpers.getObjectPriorityIndex().setCategoryHidden("BoundaryCondition", True)
 			boundaryConditionTabIndex = self.form.openEMSTab.indexOf(self.form.boundaryConditionTab)
 			self.form.openEMSTab.setTabText(boundaryConditionTabIndex, "")
 
@@ -615,7 +672,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			# Display boundary conditions in right tree widget, applicable for FEM EMerge only
 			#
 			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentRightTreeWidget, "LumpedPart", True)
-			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentPriorityTreeView, "LumpedPart", True)
+			self.guiHelpers.getObjectPriorityIndex().setCategoryHidden("LumpedPart", False)
 
 			# post-processing tab nf2ff tab set
 			self.form.nf2ffProcessingTab.setCurrentIndex(0)
@@ -680,15 +737,15 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				self.form.simulationParamsTab_tabWidget.setCurrentIndex(2)
 
 			if tempSolverType == "emerge":
-				self.pythonScriptGenerator = PythonScriptLinesGenerator3_emerge(self.form, statusBar=self.statusBar)
+				self.setPythonScriptGeneratorTarget("EMerge")
 			elif tempSolverType == "palace":
-				self.pythonScriptGenerator = PythonScriptLinesGenerator4_palace(self.form, statusBar=self.statusBar)
+				self.setPythonScriptGeneratorTarget("Palace")
 
 			#
 			# Display boundary conditions in right tree widget, applicable for FEM EMerge only
 			#
 			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentRightTreeWidget, "BoundaryCondition", True)
-			self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentPriorityTreeView, "BoundaryCondition", True)
+			self.guiHelpers.getObjectPriorityIndex().setCategoryHidden("BoundaryCondition", False)
 			boundaryConditionTabIndex = self.form.openEMSTab.indexOf(self.form.boundaryConditionTab)
 			self.form.openEMSTab.setTabText(boundaryConditionTabIndex, "Boundary Conditions")
 			self.form.boundaryConditionTab.setEnabled(True)		# enable main BoundaryConditions tab, just for FEM simulations
@@ -715,7 +772,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				# Hide lumped part in right tree widget, not applicable for EMerge
 				#
 				self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentRightTreeWidget, "LumpedPart", False)
-				self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentPriorityTreeView, "LumpedPart", False)
+				self.guiHelpers.getObjectPriorityIndex().setCategoryHidden("LumpedPart", True)
 
 				#
 				# Excitation tab, disable gaussian impulse, that is available just in palace
@@ -741,7 +798,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				# Display boundary conditions in right tree widget, applicable for openEMS, palace
 				#
 				self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentRightTreeWidget, "LumpedPart", True)
-				self.guiHelpers.setVisibleTreeWidgetItem(self.form.objectAssignmentPriorityTreeView, "LumpedPart", True)
+				self.guiHelpers.getObjectPriorityIndex().setCategoryHidden("LumpedPart", False)
 
 				#
 				# Excitation tab, enable gaussian impulse, that is available just in palace
@@ -766,11 +823,38 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		else:
 			pass
 
-		self.scriptGenerator = self.pythonScriptGenerator
+		self.scriptGeneratorTarget = self.pythonScriptGeneratorTarget
+
+	def getScriptGenerator(self, targetName):
+		"""
+		Return generator for target, it's created at first call and its module is imported then.
+		:param targetName: key from MultiTargetExporter.targetGenerators
+		"""
+		if not targetName in self.scriptGenerators:
+			generatorClass = MultiTargetExporter.getGeneratorClass(targetName)
+			self.scriptGenerators[targetName] = generatorClass(self.form, statusBar=self.statusBar)
+		return self.scriptGenerators[targetName]
+
+	def setPythonScriptGeneratorTarget(self, targetName):
+		self.pythonScriptGeneratorTarget = targetName
+		self.scriptGenerators.pop(targetName, None)		# new generator is created for changed solver type as before
+
+	@property
+	def octaveScriptGenerator(self):
+		return self.getScriptGenerator("openEMS_octave")
+
+	@property
+	def pythonScriptGenerator(self):
+		return self.getScriptGenerator(self.pythonScriptGeneratorTarget)
+
+	@property
+	def scriptGenerator(self):
+		return self.getScriptGenerator(self.scriptGeneratorTarget)
 
 	def KiCADImportButtonClicked(self):
 		# if KiCAD import tool is not created create new one
 		if not hasattr(self, "KiCADImportTool"):
+			import KiCADImporterToolDialog
 			self.KiCADImportTool = KiCADImporterToolDialog.KiCADImporterToolDialog()
 
 		self.KiCADImportTool.show()
@@ -778,6 +862,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 	def MaterialConstantsCatalogButtonClicked(self):
 		# if Material Constants Catalog is not created create new one
 		if not hasattr(self, "MaterialConstantsCatalog") or self.MaterialConstantsCatalog is None:
+			import MaterialConstantsCatalogDialog
 			self.MaterialConstantsCatalog = MaterialConstantsCatalogDialog.MaterialConstantsCatalogDialog(self.form)
 
 		self.MaterialConstantsCatalog.show()
@@ -801,14 +886,38 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		# webbrowser.open(f"{os.path.dirname(__file__)}\\documentation\\help\\index.html", new=2)
 		webbrowser.open(os.path.join(os.path.dirname(__file__), 'documentation', 'help', 'index.html'))
 
+	def freecadObjectEventsFlushed(self, createdObjects, renamedObjects, deletedObjects):
+		"""
+		Handle burst of FreeCAD observer events collected by CadEventQueue, trees are updated in one batch and left column
+		and comboboxes with port and boundary names are refreshed once.
+		:param deletedObjects: CadObjectSnapshot of deleted objects
+		"""
+		#	labels of objects known to GUI are in internalObjectNameLabelList even if left column isn't populated yet,
+		#	renames and deletes are applied to assignments and priorities by these labels before left column is populated
+		with self.guiHelpers.suspendedUpdates(self.guiHelpers.getSettingsTreeWidgets()):
+			#	deleted first, renamed object could get label of deleted one
+			for obj in deletedObjects:
+				obj.Label = self.internalObjectNameLabelList.get(obj.Name, obj.Label)		# label which is in trees, object could be renamed before delete
+				self.freecadBeforeObjectDeleted(obj, enableGuiRefresh=False)
+
+			for obj in renamedObjects:
+				if obj.Name in self.internalObjectNameLabelList:
+					self.freecadObjectChanged(obj, 'Label', enableGuiRefresh=False)
+
+			for obj in createdObjects:
+				self.freecadObjectCreated(obj)
+
+		if len(renamedObjects) > 0 or len(deletedObjects) > 0:
+			self.portsChanged("update")
+			self.boundaryConditionChanged("update")
+
 	def freecadObjectCreated(self, obj):
 		print("freecadObjectCreated :{} ('{}')".format(obj.FullName, obj.Label))
 		# A new object has been created. Only the list of available objects needs to be updated.
-		filterStr = self.form.objectAssignmentFilterLeft.text()
-		self.initLeftColumnTopLevelItems(filterStr)
+		self.leftColumnObjects.addObject(obj)
 		
 	
-	def freecadObjectChanged(self, obj, prop, enableReInitLeftColumn=True):
+	def freecadObjectChanged(self, obj, prop, enableGuiRefresh=True):
 		print("freecadObjectChanged :{} ('{}') property changed: {}".format(obj.FullName, obj.Label, prop))
 
 		#property label was changes, object was renamed in freecad
@@ -816,41 +925,31 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			#
 			#	Rename items in right column where objects are assigned to categories
 			#
-			itemsWithOriginalLabel = self.form.objectAssignmentRightTreeWidget.findItems(self.internalObjectNameLabelList[obj.Name], QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive)
+			itemsWithOriginalLabel = self.guiHelpers.getObjectAssignmentIndex().renameObject(self.internalObjectNameLabelList[obj.Name], obj.Label)
 			print(f"RIGHT ASSIGNMENT WIDGET found {len(itemsWithOriginalLabel)}")
-			for itemToRename in itemsWithOriginalLabel:
-				reResult = re.search("([A-Za-z]*)SettingsItem'", str(type(itemToRename.data(0, QtCore.Qt.UserRole))))
-				if (reResult.group(1).lower() == "freecad"):
-					itemToRename.setText(0, obj.Label)
 
 			#
-			#	Renames items in priority list and mesh priority list, names there are like:
-			#		Material, some name, objectName
-			#							 so this object name from end must be replace by new name
+			#	Rename object in priority list and mesh priority list, object label is last part of priority key
+			#		(Material, some name, objectName)
 			#
 			itemsWithOriginalLabel = []
-			itemsWithOriginalLabel += self.form.objectAssignmentPriorityTreeView.findItems(self.internalObjectNameLabelList[obj.Name], QtCore.Qt.MatchEndsWith | QtCore.Qt.MatchFlag.MatchRecursive)
-			itemsWithOriginalLabel += self.form.meshPriorityTreeView.findItems(self.internalObjectNameLabelList[obj.Name], QtCore.Qt.MatchEndsWith | QtCore.Qt.MatchFlag.MatchRecursive)
+			itemsWithOriginalLabel += self.guiHelpers.getObjectPriorityIndex().renameObject(self.internalObjectNameLabelList[obj.Name], obj.Label)
+			itemsWithOriginalLabel += self.guiHelpers.getMeshPriorityIndex().renameObject(self.internalObjectNameLabelList[obj.Name], obj.Label)
 			print(f"OBJECT PRIORITIES found {len(itemsWithOriginalLabel)}")
-			for itemToRename in itemsWithOriginalLabel:
-				newLabel = itemToRename.text(0)
-				newLabel = newLabel[:-len(self.internalObjectNameLabelList[obj.Name])] + obj.Label
-				itemToRename.setText(0, newLabel)
 
 			#
-			#	initLeftColumnToLevelItems refill internalObjectNameLabelList, so when working in bulk this reinit must be supressed till last item
+			#	Rename object in left column, this also updates its label in internalObjectNameLabelList so it must be last
 			#
-			if enableReInitLeftColumn:
-				filterStr = self.form.objectAssignmentFilterLeft.text()
-				self.initLeftColumnTopLevelItems(filterStr)
+			self.leftColumnObjects.renameObject(obj.Name, obj.Label)
 
 			#
 			#	Update combobox with port and boundary names
 			#
-			self.portsChanged("update")
-			self.boundaryConditionChanged("update")
+			if enableGuiRefresh:
+				self.portsChanged("update")
+				self.boundaryConditionChanged("update")
 
-	def freecadBeforeObjectDeleted(self,obj):
+	def freecadBeforeObjectDeleted(self, obj, enableGuiRefresh=True):
 		# event is generated before object is being removed, so observing instances have to 
 		# (TODO) un-list the object without drawing upon the FreeCAD objects list, and
 		# (TODO) propagate changes to prevent corruption. 
@@ -862,40 +961,24 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		#	Rename items in right column where objects are assigned to categories
 		#
-		itemsWithOriginalLabel = self.form.objectAssignmentRightTreeWidget.findItems(obj.Label, QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive)
-		for itemToRename in itemsWithOriginalLabel:
-			reResult = re.search("([A-Za-z]*)SettingsItem'", str(type(itemToRename.data(0, QtCore.Qt.UserRole))))
-			if (reResult.group(1).lower() == "freecad"):
-				itemToRename.parent().removeChild(itemToRename)
+		self.guiHelpers.getObjectAssignmentIndex().removeObject(obj.Label)
 
 		#
-		#	Renames items in priority list and mesh priority list, names there are like:
-		#		Material, some name, objectName
-		#							 so this object name from end must be replace by new name
+		#	Remove object from priority list and mesh priority list in all groups
 		#
-		itemsWithOriginalLabel = self.form.objectAssignmentPriorityTreeView.findItems(obj.Label, QtCore.Qt.MatchEndsWith | QtCore.Qt.MatchFlag.MatchRecursive)
-		for itemToRename in itemsWithOriginalLabel:
-			self.form.objectAssignmentPriorityTreeView.invisibleRootItem().removeChild(itemToRename)
-
-		itemsWithOriginalLabel = self.form.meshPriorityTreeView.findItems(obj.Label, QtCore.Qt.MatchEndsWith | QtCore.Qt.MatchFlag.MatchRecursive)
-		for itemToRename in itemsWithOriginalLabel:
-			self.form.meshPriorityTreeView.invisibleRootItem().removeChild(itemToRename)
+		self.guiHelpers.removePriorityObject(obj.Label)
 
 		#
-		#	Remove from left widget object because this is running before delete so if init function for left widget would be executed object will be still there
+		#	Remove from left widget, this also removes object label from internalObjectNameLabelList
 		#
-		itemsWithOriginalLabel = self.form.objectAssignmentLeftTreeWidget.findItems(obj.Label, QtCore.Qt.MatchEndsWith | QtCore.Qt.MatchFlag.MatchRecursive)
-		for itemToRename in itemsWithOriginalLabel:
-			self.form.meshPriorityTreeView.invisibleRootItem().removeChild(itemToRename)
-
-		# remove object label from internal list
-		del self.internalObjectNameLabelList[obj.Name]
+		self.leftColumnObjects.removeObject(obj.Name)
 
 		#
 		#	Update combobox with port and boundary names
 		#
-		self.portsChanged("update")
-		self.boundaryConditionChanged("update")
+		if enableGuiRefresh:
+			self.portsChanged("update")
+			self.boundaryConditionChanged("update")
 
 	def blenderWindowActivatedHandler(self):
 		"""
@@ -952,10 +1035,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		if len(renamedObjects_Id_Name) > 0:
 			for id,name in renamedObjects_Id_Name.items():
-				self.freecadObjectChanged(BlenderToCadObject(name, id), 'Label', enableReInitLeftColumn=False)
-
-			#reinit left column due it was supressed during bulk renaming
-			self.initLeftColumnTopLevelItems(self.form.objectAssignmentFilterLeft.text())
+				self.freecadObjectChanged(BlenderToCadObject(name, id), 'Label')
 
 		if len(deletedObjects_Id_Name) > 0:
 			for id,name in deletedObjects_Id_Name.items():
@@ -1000,6 +1080,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			print("--> Removing " + gridLine.Label + " from 3D view.")
 			if "auxGridLine" in gridLine.Label:
 				self.cadHelpers.removeObject(gridLine.Name)
+		self.cadHelpers.removeMeshPreview("finalMeshPreview")
 		print("--> End removing auxiliary gridlines from 3D view.")
 
 	def createUserdefGridLinesFromCurrentButtonClicked(self):
@@ -1031,6 +1112,158 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				print(currItem.text(0))
 				self.objectDrawGrid(currItem)
 
+	def previewFinalMeshButtonClicked(self):
+		"""
+		Display combined mesh lines from all grid settings after priorities and minimal spacing are applied. Lines are drawn
+		as one lightweight overlay with levels of detail, optionally colored by cell size.
+		"""
+		print('previewFinalMeshButtonClicked: start draw final mesh preview')
+
+		if (self.getModelCoordsType() == "cylindrical"):
+			self.guiHelpers.displayMessage("Final mesh preview is available only for rectangular grid.")
+			return
+
+		from utilsOpenEMS.MeshTools.MeshLinesCalculator import MeshLinesCalculator
+		from utilsOpenEMS.MeshTools.MeshPreviewBuilder import MeshPreviewBuilder
+
+		meshLinesCalculator = MeshLinesCalculator(self.form, statusBar=self.statusBar)
+		mesh = meshLinesCalculator.calculateMeshLines()
+		if any(len(mesh[axis]) == 0 for axis in ['x', 'y', 'z']):
+			self.guiHelpers.displayMessage("There are no mesh lines in some axis, check grid settings and mesh priorities.")
+			return
+
+		#	mesh lines are in drawing units, CAD uses mm
+		scale = meshLinesCalculator.getUnitLengthFromUI_m() / meshLinesCalculator.getFreeCADUnitLength_m()
+
+		previewBuilder = MeshPreviewBuilder(maxLinesPerAxis=self.form.previewFinalMeshMaxLines.value())
+		levels = previewBuilder.buildPreviewLevels(mesh, scale=scale, heatmap=self.form.previewFinalMeshHeatmapCheckbox.isChecked())
+		self.cadHelpers.drawMeshPreview("finalMeshPreview", levels, previewBuilder.getLevelDistances(mesh, scale=scale))
+
+		self.statusBar.showMessage(f"Final mesh preview: {len(mesh['x'])} x {len(mesh['y'])} x {len(mesh['z'])} lines, {len(mesh['x'])*len(mesh['y'])*len(mesh['z'])} cells", 10000)
+
+	def analyzeMeshQualityButtonClicked(self):
+		"""
+		Calculate final mesh and report cells which slow down simulation or decrease its accuracy.
+		"""
+		if (self.getModelCoordsType() == "cylindrical"):
+			self.guiHelpers.displayMessage("Mesh quality analysis is available only for rectangular grid.")
+			return
+
+		from utilsOpenEMS.MeshTools.MeshQualityAnalyzer import MeshQualityAnalyzer
+		meshQualityAnalyzer = MeshQualityAnalyzer(self.form, statusBar=self.statusBar)
+		mesh, issues = meshQualityAnalyzer.analyzeMeshQuality()
+		if any(len(mesh[axis]) == 0 for axis in ['x', 'y', 'z']):
+			self.guiHelpers.displayMessage("There are no mesh lines in some axis, check grid settings and mesh priorities.")
+			return
+
+		report = meshQualityAnalyzer.getReportText(mesh, issues)
+		print(report)
+		self.guiHelpers.displayMessage(report, forceModal=True)
+
+	def proposeSimulationBoxButtonClicked(self):
+		"""
+		Propose smallest simulation box keeping clearance from absorbing boundaries and PML thickness, report cells count
+		savings against current box and optionally set proposed PML cells in GUI.
+		"""
+		if (self.getModelCoordsType() == "cylindrical"):
+			self.guiHelpers.displayMessage("Simulation box proposal is available only for rectangular grid.")
+			return
+
+		from utilsOpenEMS.MeshTools.SimulationBoxEstimator import SimulationBoxEstimator
+		simulationBoxEstimator = SimulationBoxEstimator(self.form, statusBar=self.statusBar, clearanceLambda=self.form.simulationBoxClearanceLambda.value())
+		proposal = simulationBoxEstimator.getSimulationBoxProposal()
+		if proposal is None:
+			return
+
+		report = simulationBoxEstimator.getReportText(proposal)
+		print(report)
+
+		pmlSides = [side for side in simulationBoxEstimator.sidesList if proposal['pmlCells'][side] > 0]
+		if len(pmlSides) == 0:
+			self.guiHelpers.displayMessage(report, forceModal=True)
+			return
+
+		if self.guiHelpers.displayYesNoMessage(report + "\nSet proposed PML cells count? Simulation box object has to be resized manually."):
+			for side in pmlSides:
+				getattr(self.form, f"PML{side}cells").setValue(proposal['pmlCells'][side])
+
+	def detectSymmetryButtonClicked(self):
+		"""
+		Check model for mirror symmetry and offer quarter or half model, chosen planes are written into simulation params
+		and generators crop model by them.
+		"""
+		if (self.getModelCoordsType() == "cylindrical"):
+			self.guiHelpers.displayMessage("Symmetry detection is available only for rectangular grid.")
+			return
+
+		from utilsOpenEMS.MeshTools.SymmetryAnalyzer import SymmetryAnalyzer
+		symmetryAnalyzer = SymmetryAnalyzer(self.form, statusBar=self.statusBar)
+		results = symmetryAnalyzer.analyzeSymmetry()
+		report = symmetryAnalyzer.getReportText(results)
+		print(report)
+
+		symmetricPlanes = [result for result in results if result['symmetric']]
+		if len(symmetricPlanes) == 0:
+			self.guiHelpers.displayMessage(report, forceModal=True)
+			return
+
+		#	quarter model is offered first as it saves most, if user refuse it half model is offered
+		chosenPlanes = []
+		if len(symmetricPlanes) >= 2 and self.guiHelpers.displayYesNoMessage(report + "\nUse quarter model?"):
+			chosenPlanes = symmetricPlanes[:2]
+		elif self.guiHelpers.displayYesNoMessage(report + "\nUse half model?"):
+			chosenPlanes = symmetricPlanes[:1]
+
+		if len(chosenPlanes) > 0:
+			self.form.simParamsSymmetryPlanes.setText(symmetryAnalyzer.getSymmetryPlanesText(chosenPlanes))
+			self.form.simParamsSymmetryEnable.setChecked(True)
+
+	def updateEngineProfileLabel(self):
+		engineProfile = EngineProfile().load()
+		if engineProfile is None:
+			self.form.engineProfileLabel.setText("not calibrated")
+		else:
+			self.form.engineProfileLabel.setText(f"{engineProfile['engine']}, {engineProfile['numThreads']} threads, {engineProfile['speed_MCps']:g} MCells/s")
+
+	def calibrateEngineButtonClicked(self):
+		"""
+		Run short benchmark of generated simulation XML with each openEMS engine and threads count, fastest is stored as
+		profile of this machine.
+		"""
+		engineProfile = EngineProfile()
+
+		openEMSExecutable = engineProfile.findOpenEMSExecutable()
+		if openEMSExecutable is None:
+			openEMSExecutable, filter = QtWidgets.QFileDialog.getOpenFileName(parent=self.form, caption='Select openEMS executable')
+			if not openEMSExecutable:
+				return
+
+		#	simulation XML is written by generated script, it's searched in simulation folder
+		programdir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
+		programbase, ext = os.path.splitext(os.path.basename(self.cadHelpers.getCurrDocumentFileName()))
+		outputDir = self.simulationOutputDir if self.simulationOutputDir else f"{programdir}/{programbase}_openEMS_simulation"
+		simulationXmlFile = engineProfile.findSimulationXml(outputDir) if os.path.exists(outputDir) else None
+		if simulationXmlFile is None:
+			simulationXmlFile, filter = QtWidgets.QFileDialog.getOpenFileName(parent=self.form, caption='Select openEMS simulation XML (run generated script with "generate just preview" first)', dir=programdir, filter="openEMS XML (*.xml)")
+			if not simulationXmlFile:
+				return
+
+		def _progress(message):
+			print(message)
+			self.statusBar.showMessage(message)
+			QtWidgets.QApplication.processEvents()
+
+		profile = engineProfile.calibrate(openEMSExecutable, simulationXmlFile, progressCallback=_progress)
+		self.updateEngineProfileLabel()
+
+		report = engineProfile.getReportText(profile)
+		print(report)
+		if profile is None:
+			self.guiHelpers.displayMessage("Engine calibration failed, see console output.")
+		else:
+			self.form.simParamsUseEngineProfile.setChecked(True)
+			self.guiHelpers.displayMessage(report, forceModal=True)
+
 	def updateComboboxWithAllowedItems(self, comboboxRef, sourceCategory="", allowedTypes=[], isActive=None):
 		currentItemText = comboboxRef.currentText()
 		comboboxRef.clear()
@@ -1067,52 +1300,21 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		comboboxRef.setCurrentIndex(currentIndex)
 
 	def updateObjectAssignmentRightTreeWidgetItemData(self, groupName, itemName, data):
-		updatedItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			itemName, 
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)
-
-		#there can be more items in right column which has same name, like air under MAterials and Grid, so always is needed to compare if parent
-		#is same as parent from update function when this was called to update new settings
-		for item in updatedItems:
-			if item.parent().text(0) == groupName:
-				item.setData(0, QtCore.Qt.UserRole, data)
+		#there can be more items in right column which has same name, like air under MAterials and Grid, so index is searched by category and name
+		self.guiHelpers.getObjectAssignmentIndex().setGroupData(groupName, itemName, data)
 
 	def renameObjectAssignmentRightTreeWidgetItem(self, groupName, itemOldName, itemNewName):
-		updatedItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			itemOldName,
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)
-
-		#there can be more items in right column which has same name, like air under MAterials and Grid, so always is needed to compare if parent
-		#is same as parent from update function when this was called to update new settings
-		for item in updatedItems:
-			if item.parent().text(0) == groupName:
-				item.setText(0, itemNewName)
+		#there can be more items in right column which has same name, like air under MAterials and Grid, so index is searched by category and name
+		self.guiHelpers.getObjectAssignmentIndex().renameGroup(groupName, itemOldName, itemNewName)
 
 	def renameObjectAssignmentPriorityTreeViewItem(self, groupName, itemOldName, itemNewName):
-		searchStr = groupName + ", " + itemOldName
-		updatedItems = self.form.objectAssignmentPriorityTreeView.findItems(
-			searchStr,
-			QtCore.Qt.MatchStartsWith
-			)
-
-		for item in updatedItems:
-			newName = groupName + ", " + itemNewName + ", " + item.text(0)[len(searchStr)+2:]	#must take end of mesh priority item name, means length of searchStr + len(", ")
-			self.cadHelpers.printWarning(f"Updating {item.text(0)} -> {newName}")
-			item.setText(0, newName)
+		#groupName is category, group name is second part of priority key (category, group, object)
+		for item in self.guiHelpers.getObjectPriorityIndex().renameGroup(groupName, itemOldName, itemNewName):
+			self.cadHelpers.printWarning(f"Updating priority {itemOldName} -> {item.text(0)}")
 
 	def renameMeshPriorityTreeViewItem(self, itemOldName, itemNewName):
-		searchStr = "Grid, " + itemOldName
-		updatedItems = self.form.meshPriorityTreeView.findItems(
-			searchStr,
-			QtCore.Qt.MatchStartsWith
-			)
-
-		for item in updatedItems:
-			newName = "Grid, " + itemNewName + ", " + item.text(0)[len(searchStr)+2:]	#must take end of mesh priority item name, means length of searchStr + len(", ")
-			self.cadHelpers.printWarning(f"Updating {item.text(0)} -> {newName}")
-			item.setText(0, newName)
+		for item in self.guiHelpers.getMeshPriorityIndex().renameGroup("Grid", itemOldName, itemNewName):
+			self.cadHelpers.printWarning(f"Updating mesh priority {itemOldName} -> {item.text(0)}")
 
 	def renameTreeViewItem(self, treeViewRef, itemOldName, itemNewName):
 		"""
@@ -1202,7 +1404,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			self.guiHelpers.displayMessage('Cannot draw grid for object group.')
 			return
 
-		bbCoords = gridObj[0].Shape.BoundBox
+		bbCoords = self.cadHelpers.getObjectBoundBox(gridObj[0])
 	
 		print("Start drawing aux grid for: " + currSetting.name)
 		print("Enabled coords: " + str(currSetting.xenabled) + " " + str(currSetting.yenabled) + " " + str(currSetting.zenabled))
@@ -1547,29 +1749,11 @@ class ExportOpenEMSDialog(QtCore.QObject):
 	#######################################################################################################################################################################
 	
 	def initLeftColumnTopLevelItems(self, filterStr = ""):
-		self.form.objectAssignmentLeftTreeWidget.clear()
-
-		items = self.cadHelpers.getOpenEMSObjects(filterStr)
-		treeItems = []
-		for i in items:
-			#print("openEMS object to export:" + i.Label)
-
-			# ADDING ITEMS with UserData object which store them in intelligent way
-			#
-			topItem = QtWidgets.QTreeWidgetItem([i.Label])
-			itemData = FreeCADSettingsItem(name = i.Label, freeCadId = i.Name)
-			topItem.setData(0, QtCore.Qt.UserRole, itemData)
-			if (i.Name.find("Sketch") > -1):
-				topItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "wire.svg")))
-			elif (i.Name.find("Discretized_Edge") > -1): 
-				topItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "curve.svg")))
-			else:
-				topItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "object.svg")))
-
-			treeItems.append(topItem)
-			self.internalObjectNameLabelList[i.Name] = i.Label		#add object label into internal list for case when label change to update all object labels in GUI
-
-		self.form.objectAssignmentLeftTreeWidget.insertTopLevelItems(0, treeItems)
+		"""
+		Synchronize left column with all CAD objects, existing items are kept, and apply filter on it.
+		"""
+		self.leftColumnObjects.sync()
+		self.leftColumnObjects.setFilter(filterStr)
 
 	#
 	#	ABORT simulation button handler
@@ -1637,8 +1821,9 @@ class ExportOpenEMSDialog(QtCore.QObject):
 
 	def applyObjectAssignmentFilter(self):
 		print("Filter left column")
+		self.objectAssignmentFilterTimer.stop()
 		filterStr = self.form.objectAssignmentFilterLeft.text()
-		self.initLeftColumnTopLevelItems(filterStr)
+		self.leftColumnObjects.setFilter(filterStr)
 
 	#
 	#	Get COORDINATION TYPE
@@ -1647,12 +1832,10 @@ class ExportOpenEMSDialog(QtCore.QObject):
 	#	returns string coords type
 	#
 	def getModelCoordsType(self):
-		for k in range(self.form.objectAssignmentPriorityTreeView.topLevelItemCount()):
-			priorityObjNameSplitted = self.form.objectAssignmentPriorityTreeView.topLevelItem(k).text(0).split(',')
-			if (priorityObjNameSplitted[0].strip() == "Grid"):
-				gridCategoryItem = self.form.objectAssignmentRightTreeWidget.findItems("Grid", QtCore.Qt.MatchFixedString)
-				gridObj = [gridCategoryItem[0].child(x) for x in range(gridCategoryItem[0].childCount()) if gridCategoryItem[0].child(x).text(0) == priorityObjNameSplitted[1].strip()]
-				return gridObj[0].data(0, QtCore.Qt.UserRole).coordsType
+		for categoryName, groupName, objectLabel in self.guiHelpers.getObjectPriorityIndex().getKeys():
+			if (categoryName == "Grid"):
+				gridObj = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("Grid", groupName)
+				return gridObj.data(0, QtCore.Qt.UserRole).coordsType
 		return ""
 
 	def show(self):
@@ -1668,29 +1851,16 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		#	REMOVE FROM PRIORITY OBJECT ASSIGNMENT tree view
 		#
-		prioritySettingsItemName = rightItem.parent().parent().text(0) + ", " + rightItem.parent().text(0) + ", " + rightItem.text(0)
+		priorityKey = (rightItem.parent().parent().text(0), rightItem.parent().text(0), rightItem.text(0))
 
-		#going through items in priority object list and searching for name, when matched it's removed from list
-		itemsCount = self.form.objectAssignmentPriorityTreeView.topLevelItemCount()
-		for k in range(itemsCount):
-			priorityItem = self.form.objectAssignmentPriorityTreeView.topLevelItem(k)
-			if prioritySettingsItemName in priorityItem.text(0):
-				self.form.objectAssignmentPriorityTreeView.takeTopLevelItem(k)
-				print("Removing item " + prioritySettingsItemName + " from priority object list.")
-				break	#this will break loop SO JUST ONE ITEM FROM PRIORITY LIST IS DELETED
+		if self.guiHelpers.getObjectPriorityIndex().removeKeys([priorityKey]) > 0:
+			print("Removing item " + PriorityListIndex.getText(priorityKey) + " from priority object list.")
 
 		#
 		#	REMOVE FROM PRIORITY MESH ASSIGNMENT tree view
 		#
-
-		#going through items in priority mesh list and searching for name, when matched it's removed from list
-		itemsCount = self.form.meshPriorityTreeView.topLevelItemCount()
-		for k in range(itemsCount):
-			priorityItem = self.form.meshPriorityTreeView.topLevelItem(k)
-			if prioritySettingsItemName in priorityItem.text(0):
-				self.form.meshPriorityTreeView.takeTopLevelItem(k)
-				print("Removing item " + prioritySettingsItemName + " from priority mesh list.")
-				break	#this will break loop SO JUST ONE ITEM FROM PRIORITY LIST IS DELETED
+		if self.guiHelpers.getMeshPriorityIndex().removeKeys([priorityKey]) > 0:
+			print("Removing item " + PriorityListIndex.getText(priorityKey) + " from priority mesh list.")
 
 		#if removing from Port category emit signal to update comboboxes with ports
 		portObjectIsRemoved = False
@@ -1741,23 +1911,16 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				self.guiHelpers.displayMessage("FreeCAD object cannot have child item.")
 				return
 
+			objectAssignmentIndex = self.guiHelpers.getObjectAssignmentIndex()
 			for itemToAdd in self.form.objectAssignmentLeftTreeWidget.selectedItems():
-				# here are created 2 clones of item in left column to be putted into right column into some category
-				# as material, port or something and there is also priority list where another clone is inserted
+				# here is created clone of item in left column to be putted into right column into some category
+				# as material, port or something
 				leftItem = itemToAdd.clone()
-				leftItem2 = itemToAdd.clone()
 
-				# CHECK FOR DUPLICATES OF object in category where object is added
+				# CHECK FOR DUPLICATES OF object in category where object is added, memberships of object are taken from index
 				isObjAlreadyInCategory = False
-				itemWithSameName = self.form.objectAssignmentRightTreeWidget.findItems(leftItem.text(0), QtCore.Qt.MatchFixedString | QtCore.Qt.MatchFlag.MatchRecursive)
-				for item in itemWithSameName:
-					#there must be check if item has parent, if parent is None it means it's category name and categories ALWAYS HAVE SUBCATEGORIES
-					#case scenario:
-					#	- item freecad obj is named excitation
-					#	- there is excitation category
-					#	- in itemWithSameName Excitation category is included so next condition filter it away
-					#
-					if (item.parent() != None and item.parent() == rightItem):
+				for item in objectAssignmentIndex.getObjectItems(leftItem.text(0)):
+					if (item.parent() == rightItem):
 						print(f"Found parent {item.parent().text(0)} item {item.text(0)}")
 						isObjAlreadyInCategory = True
 
@@ -1780,13 +1943,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 					continue
 
 				#
-				# ADD ITEM INTO RIGHT LIST, first clone is inserted
+				# ADD ITEM INTO RIGHT LIST, first clone is inserted, through index so it doesn't need to be rebuilt for next object
 				#
-				rightItem.addChild(leftItem)
+				objectAssignmentIndex.addObject(rightItem, leftItem)
 				rightItem.setExpanded(True)
 
 				#
-				# ADD ITEM INTO PRIORITY LIST, must be 2nd copy that's reason why there is used leftItem2 to have different clone of left item
+				# ADD ITEM INTO PRIORITY LIST, item is created by priority list index
 				#
 				addItemToPriorityList = True
 
@@ -1795,16 +1958,15 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				addItemToPriorityList = addItemToPriorityList and not(reResult.group(1).lower() == 'probe')
 
 				#
-				#	CREATE NEW OBJECT PRIORITY NAME
-				#		- for LumpedPart, Material, ... name is "[category], [category name], [object name]"
-				#		- for Grid child other than Smooth Mesh name is "[category], [category name], [object name]"
-				#		- for Grid Smooth Mesh name is "[category], [category name]" there is no object name as Smooth Mesh group is taken whole as it is
+				#	CREATE NEW OBJECT PRIORITY KEY
+				#		- for LumpedPart, Material, ... key is ([category], [category name], [object name])
+				#		- for Grid child other than Smooth Mesh key is ([category], [category name], [object name])
+				#		- for Grid Smooth Mesh key is ([category], [category name], SMOOTH MESH GROUP) as Smooth Mesh group is taken whole as it is
 				#
 				if (hasattr(rightItem.data(0, QtCore.Qt.UserRole), 'type') and rightItem.data(0, QtCore.Qt.UserRole).type == "Smooth Mesh"):
-					newAddedItemName = rightItem.parent().text(0) + ", " + rightItem.text(0) + ", SMOOTH MESH GROUP"
+					newAddedItemKey = (rightItem.parent().text(0), rightItem.text(0), PriorityListIndex.SMOOTH_MESH_OBJECT)
 				else:
-					newAddedItemName = rightItem.parent().text(0) + ", " + rightItem.text(0) + ", " + leftItem2.text(0)
-				leftItem2.setData(0, QtCore.Qt.UserRole, rightItem.data(0, QtCore.Qt.UserRole))
+					newAddedItemKey = (rightItem.parent().text(0), rightItem.text(0), leftItem.text(0))
 
 				#
 				#	Check if item is already in priority list, must be in same category as material, port or so to be not added due it will be duplicate
@@ -1815,30 +1977,22 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				isGridObjectToBeAdded = reResult.group(1).lower() == 'grid'
 
 				if (isGridObjectToBeAdded):
-					priorityListItems = self.form.meshPriorityTreeView.findItems(newAddedItemName, QtCore.Qt.MatchFixedString)
-					addItemToPriorityList = addItemToPriorityList and len(priorityListItems) == 0	#check for DUPLICATES
+					priorityListIndex = self.guiHelpers.getMeshPriorityIndex()
 				else:
-					priorityListItems = self.form.objectAssignmentPriorityTreeView.findItems(newAddedItemName, QtCore.Qt.MatchFixedString)
-					addItemToPriorityList = addItemToPriorityList and len(priorityListItems) == 0	#check for DUPLICATES
+					priorityListIndex = self.guiHelpers.getObjectPriorityIndex()
+				addItemToPriorityList = addItemToPriorityList and not priorityListIndex.contains(newAddedItemKey)	#check for DUPLICATES
 
 				if addItemToPriorityList:
 					#	Item is gonna be added into list:
 					#		1. copy icon of object category in right list to know what is added (PORT, MATERIAL, Excitation, ...)
 					#		2. add item into priority list with according icon and category
-					leftItem2.setText(0, newAddedItemName)
-
-					if (isGridObjectToBeAdded):
-						self.form.meshPriorityTreeView.insertTopLevelItem(0, leftItem2)
-					else:
-						self.form.objectAssignmentPriorityTreeView.insertTopLevelItem(0, leftItem2)
-
-					leftItem2.setIcon(0, rightItem.parent().icon(0)) #set same icon as parent have means same as category
-					print("Object " + leftItem2.text(0)+ " added into priority list")
+					priorityListIndex.insertItem(0, newAddedItemKey, icon=rightItem.parent().icon(0), data=rightItem.data(0, QtCore.Qt.UserRole))
+					print("Object " + PriorityListIndex.getText(newAddedItemKey) + " added into priority list")
 				else:
 					#
 					#	NO ITEM WOULD BE ADDED BECAUSE ALREADY IS IN LIST
 					#
-					print("Object " + leftItem2.text(0)+ " in category " + rightItem.parent().text(0) + " already in priority list")
+					print("Object " + PriorityListIndex.getText(newAddedItemKey) + " in category " + rightItem.parent().text(0) + " already in priority list")
 
 				#
 				#	SUCCESS
@@ -1867,55 +2021,25 @@ class ExportOpenEMSDialog(QtCore.QObject):
 	#	PRIORITY OBJECT LIST move item UP
 	#
 	def moveupPriorityButtonClicked(self):
-		selectedItems = self.form.objectAssignmentPriorityTreeView.selectedItems()
-		if selectedItems != None:
-			selectedItemTopIndex = self.form.objectAssignmentPriorityTreeView.indexOfTopLevelItem(selectedItems[0])
-			selectedItemBottomIndex = self.form.objectAssignmentPriorityTreeView.indexOfTopLevelItem(selectedItems[-1])
-
-			if selectedItemTopIndex > 0:
-				takenItem = self.form.objectAssignmentPriorityTreeView.takeTopLevelItem(selectedItemTopIndex - 1)
-				self.form.objectAssignmentPriorityTreeView.insertTopLevelItem(selectedItemBottomIndex, takenItem)
+		self.guiHelpers.getObjectPriorityIndex().moveUp(self.form.objectAssignmentPriorityTreeView.selectedItems())
 
 	#
 	#	PRIORITY OBJECT LIST move item DOWN
 	#
 	def movedownPriorityButtonClicked(self):
-		selectedItems = self.form.objectAssignmentPriorityTreeView.selectedItems()
-		if selectedItems != None:
-			selectedItemTopIndex = self.form.objectAssignmentPriorityTreeView.indexOfTopLevelItem(selectedItems[0])
-			selectedItemBottomIndex = self.form.objectAssignmentPriorityTreeView.indexOfTopLevelItem(selectedItems[-1])
-			countAllItems = self.form.objectAssignmentPriorityTreeView.topLevelItemCount()
-
-			if selectedItemBottomIndex < countAllItems-1:
-				takenItem = self.form.objectAssignmentPriorityTreeView.takeTopLevelItem(selectedItemBottomIndex+1)
-				self.form.objectAssignmentPriorityTreeView.insertTopLevelItem(selectedItemTopIndex, takenItem)
+		self.guiHelpers.getObjectPriorityIndex().moveDown(self.form.objectAssignmentPriorityTreeView.selectedItems())
 
 	#
 	#	PRIORITY MESH LIST move item UP
 	#
 	def moveupPriorityMeshButtonClicked(self):
-		selectedItems = self.form.meshPriorityTreeView.selectedItems()
-		if selectedItems != None:
-			selectedItemTopIndex = self.form.meshPriorityTreeView.indexOfTopLevelItem(selectedItems[0])
-			selectedItemBottomIndex = self.form.meshPriorityTreeView.indexOfTopLevelItem(selectedItems[-1])
-
-			if selectedItemTopIndex > 0:
-				takenItem = self.form.meshPriorityTreeView.takeTopLevelItem(selectedItemTopIndex-1)
-				self.form.meshPriorityTreeView.insertTopLevelItem(selectedItemBottomIndex, takenItem)
+		self.guiHelpers.getMeshPriorityIndex().moveUp(self.form.meshPriorityTreeView.selectedItems())
 
 	#
 	#	PRIORITY MESH LIST move item DOWN
 	#
 	def movedownPriorityMeshButtonClicked(self):
-		selectedItems = self.form.meshPriorityTreeView.selectedItems()
-		if selectedItems != None:
-			selectedItemTopIndex = self.form.meshPriorityTreeView.indexOfTopLevelItem(selectedItems[0])
-			selectedItemBottomIndex = self.form.meshPriorityTreeView.indexOfTopLevelItem(selectedItems[-1])
-			countAllItems = self.form.meshPriorityTreeView.topLevelItemCount()
-
-			if selectedItemBottomIndex < countAllItems-1:
-				takenItem = self.form.meshPriorityTreeView.takeTopLevelItem(selectedItemBottomIndex+1)
-				self.form.meshPriorityTreeView.insertTopLevelItem(selectedItemTopIndex, takenItem)
+		self.guiHelpers.getMeshPriorityIndex().moveDown(self.form.meshPriorityTreeView.selectedItems())
 
 	def checkTreeWidgetForDuplicityName(self, refTreeWidget, itemName, ignoreSelectedItem=True):
 		isDuplicityName = False
@@ -1937,10 +2061,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		occurenceList:list[tuple[str, str]] = []
 
 		# CHECK FOR DUPLICATES OF object in category where object is added
-		itemWithSameName = self.form.objectAssignmentRightTreeWidget.findItems(objectName, QtCore.Qt.MatchFixedString | QtCore.Qt.MatchFlag.MatchRecursive)
-		for item in itemWithSameName:
-			if (item.parent() != None and item.parent().parent() != None and item.parent().parent().text(0) in searchCategoriesList):
-				occurenceList.append((item.parent().parent().text(0), item.parent().text(0)))
+		occurenceList += self.guiHelpers.getObjectAssignmentIndex().getObjectMemberships(objectName, searchCategoriesList)
 
 		return occurenceList
 
@@ -2057,50 +2178,40 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			#	Multiple boundary condition definition for same object is not allowed, one object cannot represent PEC and Absorbing
 			#	boundary condition at same time.
 			#
-			allObjectList = self.guiHelpers.getAllItemsFromAssignmentTree(excludeCategoriesList=["Grid"])
-			for objectInfo in allObjectList:
-				objectNameToFind = objectInfo[2]
-				objectOccurenciesList = self.searchObjectNameInAllCategoriesGroups(objectNameToFind, searchCategoriesList=conflictingCategoriesList)
-				for objectOccurenceInfo in objectOccurenciesList:
-					differenciesCount = 0
-					differenciesCount += int(objectInfo[0] != objectOccurenceInfo[0])
-					differenciesCount += int(objectInfo[1] != objectOccurenceInfo[1])
-					if differenciesCount > 0:
-						conflictingObjectList.append((
-							(objectInfo[0], objectInfo[1], objectNameToFind),
-							(objectOccurenceInfo[0], objectOccurenceInfo[1], objectNameToFind)
-						))
-
-			# take every even item getting unique conflicting item list
-			conflictingObjectList = conflictingObjectList[::2]
-
-			#
-			#	Evaluate if Material object are really problem, since only "conducting sheet" is using boundary condition and this
-			#	must be checked.
+			#	Memberships are taken from inverted index object -> (category, group) built in one pass, each pair of groups
+			#	of object is reported once, set of reported pairs prevents mirrored duplicates.
 			#
-			removeConflictingGroupList = []
-			for conflictingObjectPair in conflictingObjectList:
-				sourceCategoryName = conflictingObjectPair[0][0]
-				sourceGroupName = conflictingObjectPair[0][1]
-				targetCategoryName = conflictingObjectPair[1][0]
-				targetGroupName = conflictingObjectPair[1][1]
-
-				removeConflictingPairFromList = False
-				if sourceCategoryName == "Material":
-					removeConflictingPairFromList = removeConflictingPairFromList or self.checkConflictingMaterialDuplicity(sourceCategoryName, sourceGroupName, targetCategoryName, targetGroupName)
-				if targetCategoryName == "Material":
-					removeConflictingPairFromList = removeConflictingPairFromList or self.checkConflictingMaterialDuplicity(targetCategoryName, targetGroupName, sourceCategoryName, sourceGroupName)
-
-				if removeConflictingPairFromList:
-					removeConflictingGroupList.append(conflictingObjectPair)
-
-			#
-			#	Remove groups from conflicting groups marked to be removed.
-			#
-			for groupToRemove in removeConflictingGroupList:
-				conflictingObjectList.remove(groupToRemove)
+			membershipsIndex = self.guiHelpers.getObjectAssignmentIndex().getMembershipsIndex(conflictingCategoriesList)
+			reportedPairs = set()
+			notConflictingGroupPairs = {}		# (source group, target group) -> True if it's not conflict, same for all objects in groups
+			for objectName, memberships in membershipsIndex.items():
+				for k in range(len(memberships)):
+					for m in range(k+1, len(memberships)):
+						source = memberships[k]
+						target = memberships[m]
+						pairKey = (objectName, frozenset((source, target)))
+						if source == target or pairKey in reportedPairs:
+							continue
+						reportedPairs.add(pairKey)
+
+						#
+						#	Evaluate if Material object are really problem, since only "conducting sheet" is using boundary condition and this
+						#	must be checked.
+						#
+						if not (source, target) in notConflictingGroupPairs:
+							isNotConflicting = False
+							if source[0] == "Material":
+								isNotConflicting = isNotConflicting or self.checkConflictingMaterialDuplicity(source[0], source[1], target[0], target[1])
+							if target[0] == "Material":
+								isNotConflicting = isNotConflicting or self.checkConflictingMaterialDuplicity(target[0], target[1], source[0], source[1])
+							notConflictingGroupPairs[(source, target)] = isNotConflicting
+
+						if not notConflictingGroupPairs[(source, target)]:
+							conflictingObjectList.append((
+								(source[0], source[1], objectName),
+								(target[0], target[1], objectName)
+							))
 
-			pass
 		elif self.getSolverType().lower().find("openems") > -1:
 			pass
 
@@ -2160,16 +2271,35 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		self.simulationOutputDir = f"{os.path.dirname(outputFile)}/{programbase}_{self.getSolverType()}_simulation"
 		print(f"-----> saveToFileSettingsButtonClicked, setting simulationOutputDir: {self.simulationOutputDir}")
 
+		#	settings are in file now, autosave starts new journal
+		self.settingsAutosave.discard()
+
+	#
+	#	Offer recovery from autosave journal of crashed session and start autosave
+	#
+	def startSettingsAutosave(self):
+		if self.settingsAutosave.offerRecovery(self.guiHelpers):
+			self.settingsLoaded(None)
+		self.settingsAutosave.start()
+
 	def loadFromFileSettingsButtonClicked(self):
 		outputFile = self.simulationSettingsFile.readFromFile()
 
 		if outputFile is None:
 			return
 
-		programname = os.path.basename(outputFile)
-		programbase, ext = os.path.splitext(programname)  # extract basename and ext from filename
-		self.simulationOutputDir = f"{os.path.dirname(outputFile)}/{programbase}_{self.getSolverType()}_simulation"
-		print(f"-----> loadFromFileSettingsButtonClicked, setting simulationOutputDir: {self.simulationOutputDir}")
+		self.settingsLoaded(outputFile)
+
+	def settingsLoaded(self, outputFile):
+		"""
+		Update GUI after settings were loaded from file.
+		:param outputFile: loaded settings file, None if settings were recovered from autosave journal
+		"""
+		if outputFile is not None:
+			programname = os.path.basename(outputFile)
+			programbase, ext = os.path.splitext(programname)  # extract basename and ext from filename
+			self.simulationOutputDir = f"{os.path.dirname(outputFile)}/{programbase}_{self.getSolverType()}_simulation"
+			print(f"-----> loadFromFileSettingsButtonClicked, setting simulationOutputDir: {self.simulationOutputDir}")
 
 		#
 		#	Add default PEC material during load
@@ -2193,7 +2323,8 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		# Update window title with loaded filename
 		#
-		self.form.setWindowTitle(self._constantWindowTitle + " - " + programbase)
+		if outputFile is not None:
+			self.form.setWindowTitle(self._constantWindowTitle + " - " + programbase)
 
 	#
 	#	Change current scripts type generator based on radiobutton from UI
@@ -2201,13 +2332,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 	#
 	def radioButtonOutputScriptsTypeClicked(self):
 		if self.form.radioButton_octaveType.isChecked():
-			self.scriptGenerator = self.octaveScriptGenerator
+			self.scriptGeneratorTarget = "openEMS_octave"
 			self.guiHelpers.displayMessage("Output type changed to octave", forceModal=False)
 		elif self.form.radioButton_pythonType.isChecked():
-			self.scriptGenerator = self.pythonScriptGenerator
+			self.scriptGeneratorTarget = self.pythonScriptGeneratorTarget
 			self.guiHelpers.displayMessage("Output type changed to python", forceModal=False)
 		else:
-			self.scriptGenerator = self.octaveScriptGenerator
+			self.scriptGeneratorTarget = "openEMS_octave"
 			self.guiHelpers.displayMessage("Some error - output type changed to default octave", forceModal=False)
 
 	def checkMaterialForFaceObjects(self):
@@ -2338,8 +2469,61 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		print(f"----> start saving file into {self.simulationOutputDir}")
 
 		self.scriptGenerator.generateSimulationScript(self.simulationOutputDir)
-		#self.scriptGenerator2.generateSimulationScript(self.simulationOutputDir + "_2nd_generator")
-		#self.scriptGenerator3.generateSimulationScript(self.simulationOutputDir + "_3rd_generator")
+		self.updateGenerationReport(self.scriptGenerator.generationStats)
+
+	def generationReportToggled(self, isChecked):
+		self.generationReportToggleButton.setArrowType(QtCore.Qt.DownArrow if isChecked else QtCore.Qt.RightArrow)
+		self.generationReportText.setVisible(isChecked)
+
+	def updateGenerationReport(self, generationStats):
+		"""
+		Show timing of generation stages in status bar and report panel, generators without stages instrumentation have no stats.
+		"""
+		if generationStats is None:
+			self.generationReportText.setPlainText("Timing is not available for this generator.")
+			return
+		self.generationReportText.setPlainText(generationStats.getReportText())
+		self.statusBar.showMessage(generationStats.getStatusBarText(), 10000)
+
+	#
+	#	Generate simulation files for all solvers checked in multiple solvers export group, assignment tree is read and
+	#	geometry exported just once, each solver output is in sibling directory {settings file base}_{target}_simulation.
+	#
+	def generateMultiTargetButtonClicked(self):
+		targetNames = []
+		if self.form.multiTargetOctaveCheckbox.isChecked():
+			targetNames.append("openEMS_octave")
+		if self.form.multiTargetPythonCheckbox.isChecked():
+			targetNames.append("openEMS_python")
+		if self.form.multiTargetEMergeCheckbox.isChecked():
+			targetNames.append("EMerge")
+		if self.form.multiTargetPalaceCheckbox.isChecked():
+			targetNames.append("Palace")
+
+		if len(targetNames) == 0:
+			self.guiHelpers.displayMessage("No solver selected for multiple solvers export.")
+			return
+
+		if (self.simulationOutputDir is None or self.simulationOutputDir == ""):
+			saveSettingsFlag = self.guiHelpers.displayYesNoMessage("Simulation settings aren't saved till now, do you want to save them? It's recommended to save sttings, otherwise simulaation files will be generated in same folder as FreeCAD file.")
+			if saveSettingsFlag:
+				self.saveToFileSettingsButtonClicked()
+
+		#	simulationOutputDir is {settings file base}_{solver}_simulation, solver suffix is replaced by target name
+		solverSuffix = f"_{self.getSolverType()}_simulation"
+		if self.simulationOutputDir and self.simulationOutputDir.endswith(solverSuffix):
+			outputDirBase = self.simulationOutputDir[:-len(solverSuffix)]
+		else:
+			programdir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
+			programbase, ext = os.path.splitext(os.path.basename(self.cadHelpers.getCurrDocumentFileName()))
+			outputDirBase = f"{programdir}/{programbase}"
+
+		multiTargetExporter = MultiTargetExporter(self.form, statusBar=self.statusBar)
+		outputDirs, modelSnapshot = multiTargetExporter.export(outputDirBase, targetNames)
+
+		report = multiTargetExporter.getReportText(outputDirs, modelSnapshot)
+		print(report)
+		self.guiHelpers.displayMessage(report, forceModal=False)
 
 	def drawS11ButtonClicked(self):
 		portName = self.form.drawS11Port.currentText()
@@ -2511,6 +2695,9 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			gridItem.smoothMesh['xMaxRes'] = self.form.smoothMeshXMaxRes.value()
 			gridItem.smoothMesh['yMaxRes'] = self.form.smoothMeshYMaxRes.value()
 			gridItem.smoothMesh['zMaxRes'] = self.form.smoothMeshZMaxRes.value()
+			gridItem.smoothMesh['materialAware'] = self.form.smoothMeshMaterialAwareCheckbox.isChecked()
+			gridItem.smoothMesh['thirdsRule'] = self.form.smoothMeshThirdsRuleCheckbox.isChecked()
+			gridItem.smoothMesh['thirdsRuleResolution'] = self.form.smoothMeshThirdsRuleResolution.value()
 
 		if (self.form.userDefinedRadioButton.isChecked() or self.form.femGridUserDefinedCheckbox.isChecked()):
 			gridItem.type = "User Defined"
@@ -2603,8 +2790,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		print("Currently removing grid item: " + gridGroupItem.text(0))
 
 		#	Remove from Priority List
-		priorityName = gridGroupItem.parent().text(0) + ", " + gridGroupItem.text(0);
-		self.guiHelpers.removePriorityName(priorityName)
+		self.guiHelpers.removePriorityGroup(gridGroupItem.parent().text(0), gridGroupItem.text(0))
 
 		#	Remove from Assigned Object
 		self.form.gridSettingsTreeView.invisibleRootItem().removeChild(selectedItem)
@@ -2841,26 +3027,14 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			self.guiHelpers.displayMessage("Maaterial PEC which is metal cannot be removed.")
 			return
 
-		materialGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0), 
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)
-
-		# material name MUST BE UNIQUE, this will go through all defined material in Object assignment right column
-		# and return particular material group item in tree view object
-		materialGroupItem = None
-		for item in materialGroupWidgetItems:
-			if (item.parent().text(0) == "Material"):
-				materialGroupItem = item
+		# material name MUST BE UNIQUE, index returns particular material group item in Object assignment right column
+		materialGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("Material", selectedItem.text(0))
 		print("Currently removing material item: " + materialGroupItem.text(0))
 
 		#
 		# 1. There are microstrip, coaxial and other ports with material definition which must be removed first
 		#
-		portGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			"Port",
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-		)[0]
+		portGroupWidgetItems = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Port")
 		portsWithMaterialToDelete = []	#there can be more microstrip ports with same material assignment but different parameters
 		for k in range(portGroupWidgetItems.childCount()):
 			item = portGroupWidgetItems.child(k)
@@ -2889,8 +3063,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		#
 		# 3. Remove from Priority list (Object and Grid priority list)
 		#
-		priorityName = materialGroupItem.parent().text(0) + ", " + materialGroupItem.text(0);
-		self.guiHelpers.removePriorityName(priorityName)
+		self.guiHelpers.removePriorityGroup(materialGroupItem.parent().text(0), materialGroupItem.text(0))
 
 		#
 		# 4. Remove from Materials list
@@ -2943,11 +3116,32 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		"""
 		print(f"@Slot materialsChanged: {operation}")
 
-		if (operation in ["add", "remove", "update"]):
-			self.updateMaterialComboBoxJustMetals(self.form.microstripPortMaterialComboBox)				# update microstrip port material combobox
-			self.updateMaterialComboBoxJustMetals(self.form.coplanarPortMaterialComboBox)				# update coplanar port material combobox
-			self.updateMaterialComboBoxJustUserdefined(self.form.coaxialPortMaterialComboBox)			# update coaxial port material combobox
-			self.updateMaterialComboBoxAllMaterials(self.form.coaxialPortConductorMaterialComboBox)		# update coaxial port material combobox
+		#	port tab not shown yet, comboboxes are filled when it's populated
+		if (operation in ["add", "remove", "update"] and self.lazyTabs.isPopulated(self.form.portSettingsTab)):
+			self.updatePortMaterialComboBoxes()
+
+	def updatePortMaterialComboBoxes(self):
+		self.updateMaterialComboBoxJustMetals(self.form.microstripPortMaterialComboBox)				# update microstrip port material combobox
+		self.updateMaterialComboBoxJustMetals(self.form.coplanarPortMaterialComboBox)				# update coplanar port material combobox
+		self.updateMaterialComboBoxJustUserdefined(self.form.coaxialPortMaterialComboBox)			# update coaxial port material combobox
+		self.updateMaterialComboBoxAllMaterials(self.form.coaxialPortConductorMaterialComboBox)		# update coaxial port material combobox
+
+	def populatePortSettingsTab(self):
+		"""
+		Fill port tab comboboxes, called when port tab is shown first time.
+		:return: None
+		"""
+		self.updatePortMaterialComboBoxes()
+
+		#emit signal to fill connected combobox with right values, ie. when user opens port tab there is no change
+		# and combobox with propagation direction left with all possibilities
+		self.form.microstripPortDirection.activated.emit(self.form.microstripPortDirection.currentIndex())
+		self.form.coplanarPortDirection.activated.emit(self.form.coplanarPortDirection.currentIndex())
+		self.form.striplinePortDirection.activated.emit(self.form.striplinePortDirection.currentIndex())
+
+		#	port could be selected before comboboxes were filled (ie. after settings file was read), display it again
+		if self.form.portSettingsTreeView.currentItem() is not None:
+			self.portTreeWidgetItemChanged(self.form.portSettingsTreeView.currentItem(), None)
 
 	def materialAddPEC(self):
 		"""
@@ -2956,10 +3150,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		:return: None
 		"""
 		# iterates over materials due if there is PEC defined as metal
-		materialCategoryItem = self.form.objectAssignmentRightTreeWidget.findItems(
-			"Material",
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)[0]
+		materialCategoryItem = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Material")
 
 		# here metal and conducting sheet are added into microstrip possible material combobox
 		for k in range(materialCategoryItem.childCount()):
@@ -2987,10 +3178,12 @@ class ExportOpenEMSDialog(QtCore.QObject):
 
 	@Slot(str)
 	def gridTypeChangedToSmoothMesh(self, groupName):
-		searchStr = "Grid, " + groupName
-		newName = "Grid, " + groupName + ", SMOOTH MESH GROUP"
-		[item.setText(0, newName) for item in self.form.meshPriorityTreeView.findItems(searchStr, QtCore.Qt.MatchStartsWith)]
-		[self.form.meshPriorityTreeView.invisibleRootItem().removeChild(item) for item in self.form.meshPriorityTreeView.findItems(newName, QtCore.Qt.MatchStartsWith)[1:]]
+		#objects of grid group are replaced by one smooth mesh item at position of first of them
+		meshPriorityIndex = self.guiHelpers.getMeshPriorityIndex()
+		groupKeys = meshPriorityIndex.getGroupKeys("Grid", groupName)
+		if len(groupKeys) > 0:
+			meshPriorityIndex.replaceKey(groupKeys[0], ("Grid", groupName, PriorityListIndex.SMOOTH_MESH_OBJECT))
+			meshPriorityIndex.removeKeys(groupKeys[1:])
 		self.cadHelpers.printWarning(f"Updated {groupName} in mesh priority list")
 
 	@Slot(str)
@@ -2998,13 +3191,15 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		gridItem = self.guiHelpers.getGridGroupObjectAssignmentTreeItem(groupName)
 		assignedObjectNames = [gridItem.child(k).text(0) for k in range(gridItem.childCount())]
 
-		meshPrioritySmoothMeshItem = self.form.meshPriorityTreeView.findItems("Grid, " + groupName + ", SMOOTH MESH GROUP", QtCore.Qt.MatchExactly)[0]
-		meshPrioritySmoothMeshItemIndex = self.form.meshPriorityTreeView.invisibleRootItem().indexOfChild(meshPrioritySmoothMeshItem)
-		self.form.meshPriorityTreeView.invisibleRootItem().removeChild(meshPrioritySmoothMeshItem)
+		meshPriorityIndex = self.guiHelpers.getMeshPriorityIndex()
+		smoothMeshKey = ("Grid", groupName, PriorityListIndex.SMOOTH_MESH_OBJECT)
+		meshPrioritySmoothMeshItemIndex = meshPriorityIndex.getPosition(smoothMeshKey)
+		if meshPrioritySmoothMeshItemIndex is None:
+			meshPrioritySmoothMeshItemIndex = 0
+		meshPriorityIndex.removeKeys([smoothMeshKey])
 
-		newMeshPriorityItems = [QtWidgets.QTreeWidgetItem([f"Grid, {groupName}, {objName}"]) for objName in assignedObjectNames]
-		[item.setIcon(0, gridItem.icon(0)) for item in newMeshPriorityItems]
-		self.form.meshPriorityTreeView.invisibleRootItem().insertChildren(meshPrioritySmoothMeshItemIndex, newMeshPriorityItems)
+		newMeshPriorityItems = [PriorityListIndex.createItem(("Grid", groupName, objName), icon=gridItem.icon(0)) for objName in assignedObjectNames]
+		meshPriorityIndex.insertItems(meshPrioritySmoothMeshItemIndex, newMeshPriorityItems)
 
 		self.cadHelpers.printWarning(f"Updated {groupName} in mesh priority list, adding objects: {assignedObjectNames}")
 
@@ -3016,22 +3211,28 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			self.renameTreeViewItem(self.form.materialSettingsTreeView, oldName, newName)
 
 			#
-			# There are ports with material definition which must be also renamed
+			# There are ports with material definition which must be also renamed, their settings are changed in place
+			# so no model signal is emitted and PORT section must be marked dirty here
 			#
-			portGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-				"Port",
-				QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)[0]
+			isPortChanged = False
+			portGroupWidgetItems = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Port")
 			for k in range(portGroupWidgetItems.childCount()):
 				item = portGroupWidgetItems.child(k)
 				if (item.data(0, QtCore.Qt.UserRole).type == "microstrip" and item.data(0, QtCore.Qt.UserRole).mslMaterial == oldName):
 					item.data(0, QtCore.Qt.UserRole).mslMaterial = newName
+					isPortChanged = True
 				if (item.data(0, QtCore.Qt.UserRole).type == "coaxial" and item.data(0, QtCore.Qt.UserRole).coaxialMaterial == oldName):
 					item.data(0, QtCore.Qt.UserRole).coaxialMaterial = newName
+					isPortChanged = True
 				if (item.data(0, QtCore.Qt.UserRole).type == "coaxial" and item.data(0, QtCore.Qt.UserRole).coaxialConductorMaterial == oldName):
 					item.data(0, QtCore.Qt.UserRole).coaxialConductorMaterial = newName
+					isPortChanged = True
 				if (item.data(0, QtCore.Qt.UserRole).type == "coplanar" and item.data(0, QtCore.Qt.UserRole).coplanarMaterial == oldName):
 					item.data(0, QtCore.Qt.UserRole).coplanarMaterial = newName
+					isPortChanged = True
+
+			if isPortChanged:
+				self.settingsDirtyTracker.markDirty(["PORT"])
 
 			self.guiHelpers.displayMessage("Material " + oldName + " renamed to " + newName, forceModal=False)
 		except Exception as e:
@@ -3168,14 +3369,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		selectedItem = self.form.excitationSettingsTreeView.selectedItems()[0]
 		print("Selected port name: " + selectedItem.text(0))
 
-		excitationGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0),
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)
-		excitationGroupItem = None
-		for item in excitationGroupWidgetItems:
-			if (item.parent().text(0) == "Excitation"):
-				excitationGroupItem = item
+		excitationGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("Excitation", selectedItem.text(0))
 		print("Currently removing port item: " + excitationGroupItem.text(0))
 
 		self.form.excitationSettingsTreeView.invisibleRootItem().removeChild(selectedItem)
@@ -3368,19 +3562,11 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			selectedItem = self.form.portSettingsTreeView.findItems(name, QtCore.Qt.MatchExactly)[0]
 			print("Called by name to remove port: " + selectedItem.text(0))
 
-		portGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0),
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)
-		portGroupItem = None
-		for item in portGroupWidgetItems:
-			if (item.parent().text(0) == "Port"):
-				portGroupItem = item
+		portGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("Port", selectedItem.text(0))
 		print("Currently removing port item: " + portGroupItem.text(0))
 
 		# Removing from Priority List
-		priorityName = portGroupItem.parent().text(0) + ", " + portGroupItem.text(0);
-		self.guiHelpers.removePriorityName(priorityName)
+		self.guiHelpers.removePriorityGroup(portGroupItem.parent().text(0), portGroupItem.text(0))
 
 		# Removing from Object Assignment Tree
 		self.form.portSettingsTreeView.invisibleRootItem().removeChild(selectedItem)
@@ -3590,14 +3776,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			selectedItem = self.form.probeSettingsTreeView.findItems(name, QtCore.Qt.MatchExactly)[0]
 			print("Called by name to remove probe: " + selectedItem.text(0))
 
-		probeGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0),
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-		)
-		probeGroupItem = None
-		for item in probeGroupWidgetItems:
-			if (item.parent().text(0) == "Probe"):
-				probeGroupItem = item
+		probeGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("Probe", selectedItem.text(0))
 		print("Currently removing probe item: " + probeGroupItem.text(0))
 
 		# Removing from Object Assignment Tree
@@ -3738,19 +3917,11 @@ class ExportOpenEMSDialog(QtCore.QObject):
 			selectedItem = self.form.boundaryConditionSettingsTreeView.findItems(name, QtCore.Qt.MatchExactly)[0]
 			print("Called by name to remove boundaryCondition: " + selectedItem.text(0))
 
-		boundaryConditionGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0),
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-		)
-		boundaryConditionGroupItem = None
-		for item in boundaryConditionGroupWidgetItems:
-			if (item.parent().text(0) == "BoundaryCondition"):
-				boundaryConditionGroupItem = item
+		boundaryConditionGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("BoundaryCondition", selectedItem.text(0))
 		print("Currently removing boundaryCondition item: " + boundaryConditionGroupItem.text(0))
 
 		# Removing from Priority List
-		priorityName = boundaryConditionGroupItem.parent().text(0) + ", " + boundaryConditionGroupItem.text(0);
-		self.guiHelpers.removePriorityName(priorityName)
+		self.guiHelpers.removePriorityGroup(boundaryConditionGroupItem.parent().text(0), boundaryConditionGroupItem.text(0))
 
 		# Removing from Object Assignment Tree
 		self.form.probeSettingsTreeView.invisibleRootItem().removeChild(selectedItem)
@@ -3812,10 +3983,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		comboboxRef.clear()
 
 		# iterates over materials due if there are metal or conducting sheet they are added into microstrip possible materials combobox
-		objectAssignemntRightPortParent = self.form.objectAssignmentRightTreeWidget.findItems(
-			"Material",
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)[0]
+		objectAssignemntRightPortParent = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Material")
 
 		# here user defined are added into coaxial possible material combobox
 		for k in range(objectAssignemntRightPortParent.childCount()):
@@ -3829,10 +3997,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		comboboxRef.clear()
 
 		# iterates over materials due if there are metal or conducting sheet they are added into microstrip possible materials combobox
-		objectAssignemntRightPortParent = self.form.objectAssignmentRightTreeWidget.findItems(
-			"Material",
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)[0]
+		objectAssignemntRightPortParent = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Material")
 
 		# here user defined are added into coaxial possible material combobox
 		for k in range(objectAssignemntRightPortParent.childCount()):
@@ -3850,10 +4015,7 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		comboboxRef.clear()
 
 		# iterates over materials due if there are metal or conducting sheet they are added into microstrip possible materials combobox
-		objectAssignemntRightPortParent = self.form.objectAssignmentRightTreeWidget.findItems(
-			"Material",
-			QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-			)[0]
+		objectAssignemntRightPortParent = self.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Material")
 
 		# here user defined are added into coaxial possible material combobox
 		selectedItem = None
@@ -3971,21 +4133,13 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		selectedItem = self.form.lumpedPartTreeView.selectedItems()[0]
 		print("Selected lumpedpart name: " + selectedItem.text(0))
 
-		lumpedPartGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-			selectedItem.text(0),
-			QtCore.Qt.MatchExactly|QtCore.Qt.MatchFlag.MatchRecursive
-			)
-		lumpedPartGroupItem = None
-		for item in lumpedPartGroupWidgetItems:
-			if (item.parent().text(0) == "LumpedPart"):
-				lumpedPartGroupItem = item
+		lumpedPartGroupItem = self.guiHelpers.getObjectAssignmentIndex().getGroupItem("LumpedPart", selectedItem.text(0))
 		print("Currently removing lumped part item: " + lumpedPartGroupItem.text(0))
 
 		###
 		#	Removing from Priority List
 		###
-		priorityName = lumpedPartGroupItem.parent().text(0) + ", " + lumpedPartGroupItem.text(0);
-		self.guiHelpers.removePriorityName(priorityName)
+		self.guiHelpers.removePriorityGroup(lumpedPartGroupItem.parent().text(0), lumpedPartGroupItem.text(0))
 
 		self.form.lumpedPartTreeView.invisibleRootItem().removeChild(selectedItem)
 		lumpedPartGroupItem.parent().removeChild(lumpedPartGroupItem)
@@ -4099,6 +4253,9 @@ class ExportOpenEMSDialog(QtCore.QObject):
 		self.form.smoothMeshXMaxRes.setValue(0)
 		self.form.smoothMeshYMaxRes.setValue(0)
 		self.form.smoothMeshZMaxRes.setValue(0)
+		self.form.smoothMeshMaterialAwareCheckbox.setChecked(False)
+		self.form.smoothMeshThirdsRuleCheckbox.setChecked(False)
+		self.form.smoothMeshThirdsRuleResolution.setValue(0)
 		self.form.gridGenerateLinesInsideCheckbox.setChecked(False)
 		self.form.gridTopPriorityLinesCheckbox.setChecked(False)
 		self.form.gridOffsetX.setValue(0)
@@ -4149,6 +4306,9 @@ class ExportOpenEMSDialog(QtCore.QObject):
 				self.form.smoothMeshXMaxRes.setValue(currSetting.smoothMesh['xMaxRes'])
 				self.form.smoothMeshYMaxRes.setValue(currSetting.smoothMesh['yMaxRes'])
 				self.form.smoothMeshZMaxRes.setValue(currSetting.smoothMesh['zMaxRes'])
+				self.form.smoothMeshMaterialAwareCheckbox.setChecked(currSetting.smoothMesh.get('materialAware', False))
+				self.form.smoothMeshThirdsRuleCheckbox.setChecked(currSetting.smoothMesh.get('thirdsRule', False))
+				self.form.smoothMeshThirdsRuleResolution.setValue(currSetting.smoothMesh.get('thirdsRuleResolution', 0))
 			except:
 				pass
 
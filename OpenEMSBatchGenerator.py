@@ -0,0 +1,88 @@
+#
+#	Command line batch generator of simulation scripts, same files as from GUI are generated without opening dialog.
+#
+#	Usage:
+#		python OpenEMSBatchGenerator.py --solver openEMS_octave EMerge --output-dir out model.FCStd model_settings.ini other.FCStd
+#		FreeCADCmd OpenEMSBatchGenerator.py -- --solver openEMS_python --output-dir out model.FCStd
+#
+#	Each .FCStd document can be followed by its settings .ini file, if it's not then {document}_settings.ini next to document
+#	is used same as GUI does. Documents are processed in parallel worker processes, --jobs 1 processes them in this process.
+#	Exit code is 1 if generation of any document failed.
+#
+import os
+import sys
+import argparse
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, APP_DIR)
+
+from utilsOpenEMS.ScriptLinesGenerator.BatchGenerator import BatchGenerator
+from utilsOpenEMS.ScriptLinesGenerator.MultiTargetExporter import MultiTargetExporter
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger, setLogLevel, LOG_LEVEL_ENV_VAR
+
+logger = getLogger(__name__)
+
+def parseJobs(files, targetNames, outputDir):
+	"""
+	:param files: list of .FCStd files each optionally followed by .ini file
+	:return: list of jobs for BatchGenerator.run()
+	"""
+	jobs = []
+	for fileName in files:
+		if fileName.lower().endswith(".ini"):
+			if len(jobs) == 0 or jobs[-1]['hasExplicitSettings']:
+				raise ValueError(f"settings file {fileName} is not preceded by .FCStd document")
+			jobs[-1]['settingsFile'] = os.path.abspath(fileName)
+			jobs[-1]['hasExplicitSettings'] = True
+		else:
+			jobs.append({
+				'documentFile': os.path.abspath(fileName),
+				'settingsFile': os.path.abspath(BatchGenerator.getDefaultSettingsFile(fileName)),
+				'targetNames': targetNames,
+				'outputDir': os.path.abspath(outputDir) if outputDir else os.path.dirname(os.path.abspath(fileName)),
+				'hasExplicitSettings': False,
+			})
+
+	for job in jobs:
+		del job['hasExplicitSettings']
+	return jobs
+
+def main(argv):
+	parser = argparse.ArgumentParser(description="Generate openEMS/EMerge/Palace simulation scripts from FreeCAD documents and simulation settings files.")
+	parser.add_argument("files", nargs="+", help=".FCStd documents, each optionally followed by its _settings.ini file")
+	parser.add_argument("--solver", nargs="+", default=["openEMS_octave"], choices=list(MultiTargetExporter.targetGenerators.keys()), help="solvers to generate scripts for")
+	parser.add_argument("--output-dir", default=None, help="directory for {settings}_{solver}_simulation folders, by default next to document")
+	parser.add_argument("--backend", default="freecad", choices=BatchGenerator.backends, help="CAD backend, mock approximates objects by boxes and is meant only for testing without FreeCAD")
+	parser.add_argument("--jobs", type=int, default=None, help="number of worker processes, by default one per document up to CPU count")
+	parser.add_argument("--log-level", default=None, help="DEBUG, INFO, WARNING or ERROR")
+	args = parser.parse_args(argv)
+
+	if args.log_level:
+		os.environ[LOG_LEVEL_ENV_VAR] = args.log_level		#	inherited by worker processes
+		setLogLevel(args.log_level)
+
+	try:
+		jobs = parseJobs(args.files, args.solver, args.output_dir)
+	except ValueError as e:
+		parser.error(str(e))
+
+	if args.backend == "freecad" and not BatchGenerator.isFreeCADAvailable():
+		parser.error("FreeCAD modules not found, run script by FreeCADCmd or add FreeCAD lib directory into PYTHONPATH")
+
+	results = BatchGenerator(APP_DIR, args.backend).run(jobs, args.jobs)
+
+	failedCount = 0
+	for result in results:
+		if result['error'] is None:
+			for targetName, outputDir in result['outputDirs'].items():
+				print(f"{result['documentFile']}: {targetName} -> {outputDir}")
+		else:
+			failedCount += 1
+			print(f"{result['documentFile']}: FAILED {result['error']}")
+
+	return 1 if failedCount > 0 else 0
+
+if __name__ == "__main__":
+	#	FreeCADCmd passes its own arguments before "--"
+	scriptArgs = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+	sys.exit(main(scriptArgs))
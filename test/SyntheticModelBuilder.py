@@ -0,0 +1,113 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+from PySide import QtCore, QtWidgets
+
+from utilsOpenEMS.SettingsItem.FreeCADSettingsItem import FreeCADSettingsItem
+from utilsOpenEMS.SettingsItem.MaterialSettingsItem import MaterialSettingsItem
+from utilsOpenEMS.SettingsItem.GridSettingsItem import GridSettingsItem
+from utilsOpenEMS.SettingsItem.ExcitationSettingsItem import ExcitationSettingsItem
+from utilsOpenEMS.SettingsItem.PortSettingsItem import PortSettingsItem
+from utilsOpenEMS.GuiHelpers.PriorityListIndex import PriorityListIndex
+
+#
+#   Builds synthetic simulation model in dialog which uses MockCadInterface.
+#
+#   Model is lattice of 1mm boxes with 2mm pitch, boxes are assigned round robin to materials (PEC and dielectrics) and
+#   each of them is in object priority list same as when user assigns it in GUI. There is gaussian excitation, one
+#   lumped port and fixed distance grid assigned to air box around whole lattice, air box is in mesh priority list.
+#
+class SyntheticModelBuilder:
+
+    #   sizes used by benchmark suite
+    modelSizes = [10, 1000, 10000]
+
+    def __init__(self, dialog, cadInterface):
+        """
+        :param dialog: ExportOpenEMSDialog instance
+        :param cadInterface: MockCadInterface registered in FactoryCadInterface
+        """
+        self.dialog = dialog
+        self.form = dialog.form
+        self.cadInterface = cadInterface
+
+    def getCategoryItem(self, categoryName):
+        return self.form.objectAssignmentRightTreeWidget.findItems(categoryName, QtCore.Qt.MatchFixedString)[0]
+
+    def addSettingsItem(self, settingsItem):
+        self.dialog.guiHelpers.addSettingsItemGui(settingsItem)
+        category = self.getCategoryItem(settingsItem.__class__.__name__.replace("SettingsItem", ""))
+        return category.child(category.childCount() - 1)
+
+    def assignObject(self, settingsTreeItem, obj, priorityTreeView=None):
+        """
+        Add object under settings item in assignment tree and into priority list.
+        :param priorityTreeView: object or mesh priority list, by default object priority list
+        """
+        objectItem = QtWidgets.QTreeWidgetItem([obj.Label])
+        objectItem.setData(0, QtCore.Qt.UserRole, FreeCADSettingsItem(name=obj.Label, freeCadId=obj.Name))
+        settingsTreeItem.addChild(objectItem)
+
+        if priorityTreeView is None:
+            priorityTreeView = self.form.objectAssignmentPriorityTreeView
+
+        PriorityListIndex.getIndex(priorityTreeView).insertItem(
+            0,
+            (settingsTreeItem.parent().text(0), settingsTreeItem.text(0), obj.Label),
+            data=settingsTreeItem.data(0, QtCore.Qt.UserRole)
+        )
+
+    def build(self, objectsCount, materialsCount=4):
+        """
+        Replace current model by synthetic one.
+        :param objectsCount: number of boxes assigned to materials
+        :param materialsCount: number of materials, first one is PEC others are dielectrics
+        """
+        self.cadInterface.clear()
+        self.dialog.guiHelpers.deleteAllSettings()
+        self.dialog.guiHelpers.removeAllMeshPriorityItems()
+
+        #
+        #   EXCITATION
+        #
+        self.addSettingsItem(ExcitationSettingsItem(name="gauss", type="gaussian", gaussian={'f0': 5e9, 'fc': 4e9}, units="Hz"))
+
+        #
+        #   MATERIALS with lattice of boxes
+        #
+        materialItems = [self.addSettingsItem(MaterialSettingsItem(name="PEC synthetic", type="metal"))]
+        for k in range(1, materialsCount):
+            materialItems.append(self.addSettingsItem(MaterialSettingsItem(
+                name=f"dielectric {k}",
+                type="userdefined",
+                constants={'epsilon': 1.0 + k, 'mue': 1.0, 'kappa': 0.0, 'sigma': 0.0, 'tand': 0.0}
+            )))
+
+        latticeSize = int(math.ceil(objectsCount ** (1.0 / 3)))
+        for n in range(objectsCount):
+            i, j, k = n % latticeSize, (n // latticeSize) % latticeSize, n // (latticeSize * latticeSize)
+            obj = self.cadInterface.addBox(f"box_{n:05d}", 2.0*i, 2.0*j, 2.0*k, 2.0*i + 1.0, 2.0*j + 1.0, 2.0*k + 1.0)
+            self.assignObject(materialItems[n % materialsCount], obj)
+
+        #
+        #   PORT placed in middle of first box
+        #
+        portItem = self.addSettingsItem(PortSettingsItem(name="port 1", type="lumped", R=50, RUnits="Ohm", isActive=True, direction="z"))
+        self.assignObject(portItem, self.cadInterface.addBox("port_1", 0.25, 0.25, 0.0, 0.75, 0.75, 1.0))
+
+        #
+        #   GRID assigned to air box around lattice
+        #
+        gridItem = self.addSettingsItem(GridSettingsItem(
+            name="fixed grid",
+            type="Fixed Distance",
+            fixedDistance={'x': 0.5, 'y': 0.5, 'z': 0.5},
+            units="mm",
+            xenabled=True, yenabled=True, zenabled=True
+        ))
+        latticeEdge = 2.0 * latticeSize
+        self.assignObject(gridItem, self.cadInterface.addBox("air_box", -5.0, -5.0, -5.0, latticeEdge + 5.0, latticeEdge + 5.0, latticeEdge + 5.0), priorityTreeView=self.form.meshPriorityTreeView)
+
+        return self.cadInterface.getObjects()
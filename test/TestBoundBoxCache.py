@@ -0,0 +1,49 @@
+#
+#   Bounding box cache, callers get copies so changes of returned box (ie. port start and stop set by generator) don't
+#   change cached box.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestBoundBoxCache.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from utilsOpenEMS.GuiHelpers.BoundBoxCache import BoundBoxCache
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+
+@pytest.fixture
+def cadInterface():
+    BoundBoxCache.enable()
+    cadInterface = MockCadInterface()
+    cadInterface.addBox("port IN", 0, 0, 0, 1, 2, 3)
+    yield cadInterface
+    BoundBoxCache.disable()
+
+def getCoords(boundBox):
+    return (boundBox.XMin, boundBox.YMin, boundBox.ZMin, boundBox.XMax, boundBox.YMax, boundBox.ZMax)
+
+def test_returnedBoxIsCopy(cadInterface):
+    obj = cadInterface.getObjectsByLabel("port IN")[0]
+
+    boundBox = cadInterface.getObjectBoundBox(obj)
+    assert obj.Name in BoundBoxCache.boundBoxes
+    boundBox.XMin = -5.0
+    boundBox.ZMax = 10.0
+
+    assert getCoords(cadInterface.getObjectBoundBox(obj)) == (0, 0, 0, 1, 2, 3)
+    assert getCoords(cadInterface.getObjectBoundBoxByLabel("port IN")) == (0, 0, 0, 1, 2, 3)
+
+    boundBox = cadInterface.getObjectBoundBoxByLabel("port IN")
+    boundBox.YMax = 7.0
+    assert getCoords(cadInterface.getObjectBoundBox(obj)) == (0, 0, 0, 1, 2, 3)
+    assert getCoords(obj.Shape.BoundBox) == (0, 0, 0, 1, 2, 3)
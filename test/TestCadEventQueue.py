@@ -0,0 +1,136 @@
+#
+#   CAD observer events are collected per object and flushed at once, renames are coalesced, objects created or deleted
+#   in same burst are not renamed.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestCadEventQueue.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from PySide import QtCore, QtWidgets
+from utilsOpenEMS.GuiHelpers.CadEventQueue import CadEventQueue
+
+class CadObject:
+    def __init__(self, name, label):
+        self.Name = name
+        self.Label = label
+        self.FullName = f"Unnamed#{name}"
+
+class FlushRecorder:
+    def __init__(self):
+        self.flushes = []
+
+    def __call__(self, createdObjects, renamedObjects, deletedObjects):
+        self.flushes.append((
+            [obj.Label for obj in createdObjects],
+            [obj.Label for obj in renamedObjects],
+            [(obj.Name, obj.Label) for obj in deletedObjects],
+        ))
+
+@pytest.fixture(scope="module")
+def app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+@pytest.fixture
+def recorder(app):
+    return FlushRecorder()
+
+def test_renamesAreCoalesced(recorder):
+    queue = CadEventQueue(recorder)
+    box = CadObject("Box", "Box")
+    wire = CadObject("Wire", "Wire")
+
+    for label in ["Box A", "Box B", "Box C"]:
+        box.Label = label
+        queue.objectChanged(box, 'Label')
+    wire.Label = "Wire A"
+    queue.objectChanged(wire, 'Label')
+    queue.objectChanged(wire, 'Placement')
+    queue.flush()
+
+    #   renamed once to current label, in order of first rename
+    assert recorder.flushes == [([], ["Box C", "Wire A"], [])]
+
+def test_createdObjectIsNotRenamed(recorder):
+    queue = CadEventQueue(recorder)
+    box = CadObject("Box", "Box")
+
+    queue.objectCreated(box)
+    box.Label = "Antenna"
+    queue.objectChanged(box, 'Label')
+    queue.flush()
+
+    assert recorder.flushes == [(["Antenna"], [], [])]
+
+def test_createdAndDeletedIsIgnored(recorder):
+    queue = CadEventQueue(recorder)
+    box = CadObject("Box", "Box")
+
+    queue.objectCreated(box)
+    queue.objectChanged(box, 'Label')
+    queue.objectDeleted(box)
+    queue.flush()
+
+    #   nothing is left so callback isn't called
+    assert recorder.flushes == []
+
+def test_deletedIsSnapshot(recorder):
+    queue = CadEventQueue(recorder)
+    box = CadObject("Box", "Box")
+
+    box.Label = "Box A"
+    queue.objectChanged(box, 'Label')
+    queue.objectDeleted(box)
+    box.Label = "changed after delete"
+    queue.flush()
+
+    assert recorder.flushes == [([], [], [("Box", "Box A")])]
+
+def test_flushOrderAndClear(recorder):
+    queue = CadEventQueue(recorder)
+    objects = [CadObject(f"Obj{k}", f"Obj{k}") for k in range(4)]
+
+    queue.objectDeleted(objects[3])
+    queue.objectCreated(objects[1])
+    queue.objectCreated(objects[0])
+    queue.objectChanged(objects[2], 'Label')
+    queue.flush()
+    assert recorder.flushes == [(["Obj1", "Obj0"], ["Obj2"], [("Obj3", "Obj3")])]
+
+    #   queue is empty after flush
+    queue.flush()
+    assert len(recorder.flushes) == 1
+
+    queue.objectCreated(objects[0])
+    queue.stop()
+    queue.flush()
+    assert len(recorder.flushes) == 1
+
+def test_timerFlushesBurst(recorder):
+    queue = CadEventQueue(recorder, delay=10)
+    box = CadObject("Box", "Box")
+
+    queue.objectCreated(box)
+    queue.objectChanged(CadObject("Wire", "Wire A"), 'Label')
+    assert queue.timer.isActive()
+
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(200, loop.quit)
+    loop.exec()
+
+    assert recorder.flushes == [(["Box"], ["Wire A"], [])]
+    assert not queue.timer.isActive()
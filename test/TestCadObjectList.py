@@ -0,0 +1,136 @@
+#
+#   CAD objects list in object assignment tab, items are kept when list is synchronized with CAD, filter hides items and
+#   objects seen before list is shown are only recorded by their labels.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestCadObjectList.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide import QtCore, QtWidgets
+
+from utilsOpenEMS.GuiHelpers.CadObjectList import CadObjectList
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+
+@pytest.fixture(scope="module")
+def app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+@pytest.fixture
+def cadInterface():
+    cadInterface = MockCadInterface()
+    for k, label in enumerate(["substrate", "trace", "port IN"]):
+        cadInterface.addBox(label, k, 0, 0, k + 1, 1, 1)
+    return cadInterface
+
+@pytest.fixture
+def treeWidget(app):
+    treeWidget = QtWidgets.QTreeWidget()
+    treeWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+    return treeWidget
+
+def getLabels(treeWidget):
+    return [treeWidget.topLevelItem(k).text(0) for k in range(treeWidget.topLevelItemCount())]
+
+def getVisibleLabels(treeWidget):
+    return [treeWidget.topLevelItem(k).text(0) for k in range(treeWidget.topLevelItemCount()) if not treeWidget.topLevelItem(k).isHidden()]
+
+def test_syncKeepsItems(cadInterface, treeWidget):
+    objectList = CadObjectList(treeWidget, cadInterface)
+    objectList.sync()
+    assert getLabels(treeWidget) == ["substrate", "trace", "port IN"]
+    substrateItem = treeWidget.topLevelItem(0)
+    traceItem = treeWidget.topLevelItem(1)
+
+    #   object renamed, removed and added in CAD, unchanged items stay same
+    traceObject = cadInterface.getObjectsByLabel("trace")[0]
+    traceObject.Label = "trace top"
+    cadInterface.removeObject(cadInterface.getObjectsByLabel("port IN")[0].Name)
+    cadInterface.addBox("port OUT", 5, 0, 0, 6, 1, 1)
+    objectList.sync()
+
+    assert getLabels(treeWidget) == ["substrate", "trace top", "port OUT"]
+    assert treeWidget.topLevelItem(0) is substrateItem
+    assert treeWidget.topLevelItem(1) is traceItem
+    assert traceItem.data(0, QtCore.Qt.UserRole).getName() == "trace top"
+    assert traceItem.data(0, QtCore.Qt.UserRole).freeCadId == traceObject.Name
+    assert objectList.objectLabels == {obj.Name: obj.Label for obj in cadInterface.getObjects()}
+
+    #   nothing changed, nothing is added
+    objectList.sync()
+    assert getLabels(treeWidget) == ["substrate", "trace top", "port OUT"]
+
+def test_filter(cadInterface, treeWidget):
+    objectList = CadObjectList(treeWidget, cadInterface)
+    objectList.sync()
+
+    objectList.setFilter("^(sub|port)")
+    assert getVisibleLabels(treeWidget) == ["substrate", "port IN"]
+
+    objectList.setFilter("")
+    assert getVisibleLabels(treeWidget) == ["substrate", "trace", "port IN"]
+
+    #   invalid regular expression is searched as plain text
+    cadInterface.addBox("via[", 3, 0, 0, 4, 1, 1)
+    objectList.sync()
+    objectList.setFilter("VIA[")
+    assert getVisibleLabels(treeWidget) == ["via["]
+
+    #   renamed and added objects are filtered too
+    cadInterface.getObjectsByLabel("trace")[0].Label = "via[ trace"
+    cadInterface.addBox("substrate via[", 5, 0, 0, 6, 1, 1)
+    objectList.sync()
+    assert getVisibleLabels(treeWidget) == ["via[ trace", "via[", "substrate via["]
+
+def test_filterDeselectsHiddenItems(cadInterface, treeWidget):
+    objectList = CadObjectList(treeWidget, cadInterface)
+    objectList.sync()
+    for k in range(treeWidget.topLevelItemCount()):
+        treeWidget.topLevelItem(k).setSelected(True)
+
+    #   hidden objects must not be assigned by >> button
+    objectList.setFilter("trace")
+    assert [item.text(0) for item in treeWidget.selectedItems()] == ["trace"]
+
+    objectList.setFilter("")
+    assert [item.text(0) for item in treeWidget.selectedItems()] == ["trace"]
+
+def test_labelsRecordedBeforePopulated(cadInterface, treeWidget):
+    objectList = CadObjectList(treeWidget, cadInterface)
+    objectList.recordLabels()
+    substrateObject = cadInterface.getObjectsByLabel("substrate")[0]
+
+    #   no items are created, labels known to GUI are recorded
+    assert treeWidget.topLevelItemCount() == 0
+    assert objectList.objectLabels[substrateObject.Name] == "substrate"
+
+    #   CAD events before list is shown change only recorded labels
+    objectList.renameObject(substrateObject.Name, "substrate FR4")
+    assert objectList.objectLabels[substrateObject.Name] == "substrate FR4"
+    objectList.addObject(cadInterface.addBox("port OUT", 5, 0, 0, 6, 1, 1))
+    objectList.removeObject(cadInterface.getObjectsByLabel("trace")[0].Name)
+    assert treeWidget.topLevelItemCount() == 0
+    assert sorted(objectList.objectLabels.values()) == ["port IN", "port OUT", "substrate FR4"]
+
+    #   first sync creates items for current CAD objects
+    substrateObject.Label = "substrate FR4"
+    cadInterface.removeObject(cadInterface.getObjectsByLabel("trace")[0].Name)
+    objectList.sync()
+    assert getLabels(treeWidget) == ["substrate FR4", "port IN", "port OUT"]
+    assert objectList.isPopulated
@@ -0,0 +1,79 @@
+#
+#   Import time profile of dialog module, checks that opening dialog doesn't import script generators and modules
+#   which are needed only when their tool is used.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestDialogStartup.py -s
+#
+#   Module is imported in new python process with -X importtime, profile of slowest imports is printed. Threshold can be
+#   scaled for slow machines by OPENEMS_BENCHMARK_THRESHOLD_SCALE environment variable (ie. 2.0 doubles it).
+#
+import os
+import sys
+import inspect
+import subprocess
+
+# Add parent dir to system path to instantiate FreeCAD simulation creator gui
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+DIALOG_IMPORT_THRESHOLD_S = 3.0
+
+#
+#   Modules imported on demand, they must not be imported with dialog
+#
+LAZY_MODULES = [
+    "utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator",
+    "utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator2",
+    "utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator",
+    "utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator2_openems",
+    "utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator3_emerge",
+    "utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator4_palace",
+    "utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator",
+    "utilsOpenEMS.MeshTools.MeshLinesCalculator",
+    "KiCADImporterToolDialog",
+    "MaterialConstantsCatalogDialog",
+]
+
+def getImportTimeProfile(moduleName):
+    """
+    :return: dictionary module name -> (self time s, cumulative time s)
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {moduleName}"],
+        cwd=parentdir, env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        #   import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        selfTime, cumulativeTime, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(selfTime) / 1e6, int(cumulativeTime) / 1e6)
+    return profile
+
+@pytest.fixture(scope="module")
+def dialogImportProfile():
+    profile = getImportTimeProfile("ExportOpenEMSDialog")
+
+    print("\nslowest imports of ExportOpenEMSDialog (cumulative s):")
+    for name, (selfTime, cumulativeTime) in sorted(profile.items(), key=lambda item: -item[1][1])[:15]:
+        print(f"\t{cumulativeTime:8.3f}\t{name}")
+    return profile
+
+def test_dialogImportTime(dialogImportProfile):
+    threshold = DIALOG_IMPORT_THRESHOLD_S * float(os.environ.get("OPENEMS_BENCHMARK_THRESHOLD_SCALE", "1.0"))
+    selfTime, cumulativeTime = dialogImportProfile["ExportOpenEMSDialog"]
+    assert cumulativeTime < threshold, f"ExportOpenEMSDialog imported in {cumulativeTime:.3f} s, threshold {threshold:.3f} s"
+
+@pytest.mark.parametrize("moduleName", LAZY_MODULES)
+def test_moduleNotImportedWithDialog(dialogImportProfile, moduleName):
+    assert not moduleName in dialogImportProfile, f"{moduleName} is imported with dialog, it should be imported when it's used"
@@ -0,0 +1,104 @@
+#
+#   Manifest of generated files, one manifest per output directory written at end of generation, it lists only files
+#   generated by last generation.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestGeneratedFilesManifest.py
+#
+import os
+import sys
+import json
+import hashlib
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+pytest.importorskip("numpy")
+
+from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
+
+def createGenerator():
+    """
+    Generator without form, only file writing methods are used.
+    """
+    generator = CommonScriptLinesGenerator.__new__(CommonScriptLinesGenerator)
+    generator.generationStats = None
+    generator.manifestFiles = None
+    return generator
+
+def readManifest(outputDir):
+    with open(os.path.join(outputDir, CommonScriptLinesGenerator.manifestFileName), "r", encoding='utf-8') as f:
+        return json.load(f)
+
+def getHash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def writeGeometryFile(generator, fileName, content):
+    tmpFileName = fileName + ".tmp"
+    with open(tmpFileName, "w", encoding='utf-8') as f:
+        f.write(content)
+    return generator.replaceFileIfChanged(tmpFileName, fileName)
+
+def test_oneManifestPerOutputDir(tmp_path):
+    generator = createGenerator()
+    outputDir = str(tmp_path)
+    os.mkdir(os.path.join(outputDir, "stepfiles"))
+
+    with generator.collectManifest():
+        generator.writeFileIfChanged(os.path.join(outputDir, "model.py"), "model")
+        generator.writeFileIfChanged(os.path.join(outputDir, "config.json"), "{}")
+        writeGeometryFile(generator, os.path.join(outputDir, "stepfiles", "Box.step"), "box")
+
+        #   manifest isn't written until generation finishes
+        assert not os.path.exists(os.path.join(outputDir, CommonScriptLinesGenerator.manifestFileName))
+
+    manifest = readManifest(outputDir)
+    assert manifest["outputs"] == {"model.py": getHash("model"), "config.json": getHash("{}")}
+    assert manifest["inputs"] == {"stepfiles/Box.step": getHash("box")}
+    assert not os.path.exists(os.path.join(outputDir, "stepfiles", CommonScriptLinesGenerator.manifestFileName))
+
+def test_staleEntriesAreDropped(tmp_path):
+    generator = createGenerator()
+    outputDir = str(tmp_path)
+
+    with generator.collectManifest():
+        generator.writeFileIfChanged(os.path.join(outputDir, "model.m"), "model")
+        generator.writeFileIfChanged(os.path.join(outputDir, "old.m"), "old")
+        writeGeometryFile(generator, os.path.join(outputDir, "Box.stl"), "box")
+    firstHash = readManifest(outputDir)["hash"]
+
+    #   unchanged files are listed too, file not generated again is dropped
+    with generator.collectManifest():
+        assert not generator.writeFileIfChanged(os.path.join(outputDir, "model.m"), "model")
+        assert not writeGeometryFile(generator, os.path.join(outputDir, "Box.stl"), "box")
+
+    manifest = readManifest(outputDir)
+    assert manifest["outputs"] == {"model.m": getHash("model")}
+    assert manifest["inputs"] == {"Box.stl": getHash("box")}
+    assert manifest["hash"] != firstHash
+
+    #   postprocessing script written outside of generation doesn't change manifest
+    generator.writeFileIfChanged(os.path.join(outputDir, "draw_S11.m"), "draw")
+    assert readManifest(outputDir) == manifest
+
+def test_failedGenerationKeepsManifest(tmp_path):
+    generator = createGenerator()
+    outputDir = str(tmp_path)
+
+    with generator.collectManifest():
+        generator.writeFileIfChanged(os.path.join(outputDir, "model.m"), "model")
+    manifest = readManifest(outputDir)
+
+    with pytest.raises(ValueError):
+        with generator.collectManifest():
+            generator.writeFileIfChanged(os.path.join(outputDir, "model.m"), "changed model")
+            raise ValueError("generation failed")
+
+    assert readManifest(outputDir) == manifest
+    assert generator.manifestFiles is None
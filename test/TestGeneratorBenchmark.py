@@ -0,0 +1,128 @@
+#
+#   Benchmark of script generators on synthetic models, runs headless with MockCadInterface.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestGeneratorBenchmark.py --benchmark-only
+#
+#   Each benchmark fails if its mean time is over threshold for model size, thresholds can be scaled for slow machines
+#   by OPENEMS_BENCHMARK_THRESHOLD_SCALE environment variable (ie. 2.0 doubles all of them).
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to instantiate FreeCAD simulation creator gui
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+sys.path.insert(0, currentdir)
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("PySide")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide import QtWidgets
+
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+from utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator2 import OctaveScriptLinesGenerator2
+from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator2_openems import PythonScriptLinesGenerator2_openems
+from SyntheticModelBuilder import SyntheticModelBuilder
+
+#
+#   Thresholds in seconds per model size, single get*ScriptLines method and whole generateSimulationScript()
+#
+METHOD_THRESHOLDS_S = {10: 0.5, 1000: 5.0, 10000: 60.0}
+FULL_SCRIPT_THRESHOLDS_S = {10: 2.0, 1000: 20.0, 10000: 240.0}
+
+GENERATOR_CLASSES = [OctaveScriptLinesGenerator2, PythonScriptLinesGenerator2_openems]
+
+#
+#   (method name, items class name passed as argument or None for methods without items)
+#
+SCRIPT_LINES_METHODS = [
+    ("getInitScriptLines", None),
+    ("getBoundaryConditionsScriptLines", None),
+    ("getCoordinateSystemScriptLines", None),
+    ("getExcitationScriptLines", None),
+    ("getMaterialDefinitionsScriptLines", "MaterialSettingsItem"),
+    ("getOrderedGridDefinitionsScriptLines", "GridSettingsItem"),
+    ("getPortDefinitionsScriptLines", "PortSettingsItem"),
+    ("getLumpedPartDefinitionsScriptLines", "LumpedPartSettingsItem"),
+    ("getProbeDefinitionsScriptLines", "ProbeSettingsItem"),
+    ("getNF2FFDefinitionsScriptLines", "ProbeSettingsItem"),
+    ("getMinimalGridlineSpacingScriptLines", None),
+    ("getSymmetryScriptLines", None),
+]
+
+def getThreshold(thresholds, objectsCount):
+    return thresholds[objectsCount] * float(os.environ.get("OPENEMS_BENCHMARK_THRESHOLD_SCALE", "1.0"))
+
+def createGenerator(generatorClass, appDialog):
+    """
+    Generator with message boxes turned off, modal message box would block headless run.
+    """
+    generator = generatorClass(appDialog.form, statusBar=None)
+    generator.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    return generator
+
+@pytest.fixture(scope="module")
+def mockCadInterface():
+    cadInterface = MockCadInterface()
+    FactoryCadInterface.registerMockInterface(cadInterface)
+    yield cadInterface
+    FactoryCadInterface.registerMockInterface(None)
+
+@pytest.fixture(scope="module")
+def appDialog(mockCadInterface):
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+
+    from ExportOpenEMSDialog import ExportOpenEMSDialog
+    dialog = ExportOpenEMSDialog()
+    yield dialog
+    dialog.form.close()
+
+@pytest.fixture(scope="module", params=SyntheticModelBuilder.modelSizes, ids=lambda size: f"{size}obj")
+def syntheticModel(request, appDialog, mockCadInterface):
+    SyntheticModelBuilder(appDialog, mockCadInterface).build(request.param)
+    return request.param
+
+def test_syntheticModelBuilt(syntheticModel, appDialog, mockCadInterface):
+    # boxes + port + air box
+    assert len(mockCadInterface.getObjects()) == syntheticModel + 2
+    assert appDialog.form.objectAssignmentPriorityTreeView.topLevelItemCount() == syntheticModel + 1
+
+@pytest.mark.parametrize("generatorClass", GENERATOR_CLASSES, ids=lambda c: c.__name__)
+@pytest.mark.parametrize("methodName, itemsClassName", SCRIPT_LINES_METHODS, ids=[m[0] for m in SCRIPT_LINES_METHODS])
+def test_scriptLinesMethod(benchmark, syntheticModel, appDialog, mockCadInterface, generatorClass, methodName, itemsClassName, tmp_path):
+    generator = createGenerator(generatorClass, appDialog)
+    method = getattr(generator, methodName)
+
+    if itemsClassName is None:
+        args = []
+    else:
+        args = [generator.getItemsByClassName().get(itemsClassName, None)]
+        if methodName == "getMaterialDefinitionsScriptLines":
+            args.append(str(tmp_path))
+
+    rounds = 1 if syntheticModel >= 10000 else 3
+    genScript = benchmark.pedantic(method, args=args, rounds=rounds, iterations=1)
+
+    assert isinstance(genScript, str)
+    assert benchmark.stats.stats.mean < getThreshold(METHOD_THRESHOLDS_S, syntheticModel)
+
+@pytest.mark.parametrize("generatorClass", GENERATOR_CLASSES, ids=lambda c: c.__name__)
+def test_generateSimulationScript(benchmark, syntheticModel, appDialog, mockCadInterface, generatorClass, tmp_path):
+    generator = createGenerator(generatorClass, appDialog)
+    outputDir = str(tmp_path / "simulation")
+
+    rounds = 1 if syntheticModel >= 10000 else 3
+    benchmark.pedantic(generator.generateSimulationScript, args=[outputDir], rounds=rounds, iterations=1)
+
+    assert os.path.exists(os.path.join(outputDir, generator.manifestFileName))
+    assert benchmark.stats.stats.mean < getThreshold(FULL_SCRIPT_THRESHOLDS_S, syntheticModel)
@@ -0,0 +1,114 @@
+#
+#   Settings file format 0.1 loaded into dialog, objects assigned in file must end up in their groups in object
+#   assignment tree and lumped parts must be loaded, same for file converted into format 0.2.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestIniFile0v1.py
+#
+import os
+import gc
+import sys
+import inspect
+
+# Add parent dir to system path to instantiate FreeCAD simulation creator gui
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide import QtWidgets
+
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SaveLoad.JsonFile0v2 import JsonFile0v2
+
+INI_FILE = os.path.join(parentdir, "utilsOpenEMS", "SaveLoad", "aaaaa.ini")
+
+#   objects assigned in aaaaa.ini
+OBJECT_LABELS = ["port IN", "port OUT", "coax shield", "simbox", "sma substrate", "coax wire"]
+
+@pytest.fixture(scope="module")
+def mockCadInterface():
+    cadInterface = MockCadInterface()
+    for k, label in enumerate(OBJECT_LABELS):
+        cadInterface.addBox(label, k, 0, 0, k + 1, 1, 1)
+    FactoryCadInterface.registerMockInterface(cadInterface)
+    yield cadInterface
+    FactoryCadInterface.registerMockInterface(None)
+
+@pytest.fixture(scope="module")
+def appDialog(mockCadInterface):
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+
+    from ExportOpenEMSDialog import ExportOpenEMSDialog
+    dialog = ExportOpenEMSDialog()
+    dialog.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    yield dialog
+    dialog.form.close()
+
+def readFile(appDialog, fileName, settingsFileClass=IniFile0v1):
+    """
+    Read file same as dialog does it, message boxes are turned off, modal message box would block headless run.
+    """
+    settingsFile = settingsFileClass(appDialog.form, guiSignals=appDialog.guiSignals)
+    settingsFile.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    settingsFile.read(fileName)
+
+def getAssignedObjects(treeWidget):
+    """
+    :return: {category name: {group name: [object labels]}} from object assignment tree
+    """
+    assignedObjects = {}
+    for k in range(treeWidget.topLevelItemCount()):
+        categoryItem = treeWidget.topLevelItem(k)
+        groups = assignedObjects.setdefault(categoryItem.text(0), {})
+        for m in range(categoryItem.childCount()):
+            groupItem = categoryItem.child(m)
+            groups[groupItem.text(0)] = sorted(groupItem.child(n).text(0) for n in range(groupItem.childCount()))
+    return assignedObjects
+
+def getTopLevelNames(treeWidget):
+    return [treeWidget.topLevelItem(k).text(0) for k in range(treeWidget.topLevelItemCount())]
+
+def test_assignedObjectsAreLoaded(appDialog):
+    readFile(appDialog, INI_FILE)
+    gc.collect()
+
+    assignedObjects = getAssignedObjects(appDialog.form.objectAssignmentRightTreeWidget)
+    assert assignedObjects["Port"] == {"IN": ["port IN"], "OUT": ["port OUT"]}
+    assert assignedObjects["Grid"] == {
+        "coax 360": ["coax shield"],
+        "ports Z": ["port IN", "port OUT"],
+        "simbox": ["simbox"],
+        "substrate grid Z": ["sma substrate"],
+    }
+    assert assignedObjects["Material"] == {"PEC": ["coax shield", "coax wire"], "teflon": ["sma substrate"]}
+
+    #   file read again into same dialog gives same tree
+    readFile(appDialog, INI_FILE)
+    gc.collect()
+    assert getAssignedObjects(appDialog.form.objectAssignmentRightTreeWidget) == assignedObjects
+
+def test_lumpedPartsAreLoaded(appDialog):
+    readFile(appDialog, INI_FILE)
+    assert getTopLevelNames(appDialog.form.lumpedPartTreeView) == ["50Ohm"]
+
+def test_convertedFileIsLoaded(appDialog, tmp_path):
+    readFile(appDialog, INI_FILE)
+    assignedObjects = getAssignedObjects(appDialog.form.objectAssignmentRightTreeWidget)
+
+    appDialog.form.lumpedPartTreeView.clear()
+    jsonFileName = JsonFile0v2.convertFromIni(INI_FILE, str(tmp_path / "aaaaa.json"))
+    readFile(appDialog, jsonFileName, JsonFile0v2)
+    gc.collect()
+
+    assert getAssignedObjects(appDialog.form.objectAssignmentRightTreeWidget) == assignedObjects
+    assert getTopLevelNames(appDialog.form.lumpedPartTreeView) == ["50Ohm"]
@@ -0,0 +1,116 @@
+#
+#   Settings file validator with schema compiled once, reported errors must be same as from validator which evaluated
+#   schema for each item.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestIniValidator0v1.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from utilsOpenEMS.SaveLoad.IniValidator0v1 import IniValidator0v1
+
+INI_FILE = os.path.join(parentdir, "utilsOpenEMS", "SaveLoad", "aaaaa.ini")
+
+#   errors reported for aaaaa.ini by validator before schema was compiled
+BASELINE_ERRORS = [
+    "[GRID-coax 360] does not contains item 'unitsAngle'",
+    "[GRID-ports Z] does not contains item 'unitsAngle'",
+    "[GRID-simbox] does not contains item 'unitsAngle'",
+    "[GRID-substrate grid Z] does not contains item 'unitsAngle'",
+]
+
+def writeModifiedFile(tmp_path, oldText, newText):
+    with open(INI_FILE, "r") as f:
+        content = f.read()
+    assert oldText in content
+    fileName = str(tmp_path / "modified.ini")
+    with open(fileName, "w") as f:
+        f.write(content.replace(oldText, newText, 1))
+    return fileName
+
+def test_compiledSchemaIsCached():
+    compiledSchema = IniValidator0v1.getCompiledSchema()
+    assert IniValidator0v1.getCompiledSchema() is compiledSchema
+    assert len(compiledSchema) == len(IniValidator0v1.IniFileSchema['topLevelGroups'])
+
+def test_compileMandatory():
+    assert IniValidator0v1.compileMandatory(True)({}) is True
+    assert IniValidator0v1.compileMandatory(False)({'type': 'lumped'}) is False
+
+    isMandatory = IniValidator0v1.compileMandatory('settings.value("type") == "userdefined"')
+    assert isMandatory({'type': 'userdefined'})
+    assert not isMandatory({'type': 'metal'})
+    assert not isMandatory({})
+
+    isMandatory = IniValidator0v1.compileMandatory("settings.value('type') in ['lumped', 'curve'] and settings.value('isActive') == 'true'")
+    assert isMandatory({'type': 'curve', 'isActive': 'true'})
+    assert not isMandatory({'type': 'curve', 'isActive': 'false'})
+    assert not isMandatory({'type': 'coaxial', 'isActive': 'true'})
+
+    with pytest.raises(ValueError):
+        IniValidator0v1.compileMandatory("len(settings.childKeys()) > 0")
+
+def test_compileAllowedValues():
+    assert IniValidator0v1.compileAllowedValues("float")("2.1")
+    assert not IniValidator0v1.compileAllowedValues("float")("abc")
+    assert IniValidator0v1.compileAllowedValues("int")("8")
+    assert IniValidator0v1.compileAllowedValues("bool")("True")
+    assert not IniValidator0v1.compileAllowedValues("bool")("yes")
+    assert IniValidator0v1.compileAllowedValues("string")(None)
+
+    isValid = IniValidator0v1.compileAllowedValues(r"(metal|userdefined|conducting sheet)")
+    assert isValid("metal")
+    assert not isValid("plastic")
+    assert not isValid(None)
+    assert IniValidator0v1.compileAllowedValues(r"[a-z]+,[a-z]+")(["ab", "cd"])
+
+def test_hasKeyWithPrefix():
+    sortedKeys = sorted(["RUnits", "direction", "isActive", "type"])
+    assert IniValidator0v1.hasKeyWithPrefix(sortedKeys, "R")
+    assert IniValidator0v1.hasKeyWithPrefix(sortedKeys, "RUnits")
+    assert IniValidator0v1.hasKeyWithPrefix(sortedKeys, "type")
+    assert not IniValidator0v1.hasKeyWithPrefix(sortedKeys, "RUnitsX")
+    assert not IniValidator0v1.hasKeyWithPrefix(sortedKeys, "material")
+    assert not IniValidator0v1.hasKeyWithPrefix(sortedKeys, "z")
+    assert not IniValidator0v1.hasKeyWithPrefix([], "R")
+
+def test_baselineFile():
+    assert IniValidator0v1.checkFile(INI_FILE) == BASELINE_ERRORS
+
+    #   repeated check doesn't depend on previous one
+    assert IniValidator0v1.checkFile(INI_FILE) == BASELINE_ERRORS
+
+@pytest.mark.parametrize("oldText, newText, expectedError", [
+    ("material_epsilon=2.1", "material_epsilon=abc", "[MATERIAL-teflon] -> 'material_epsilon' has invalid value 'abc', expected 'float'"),
+    ("type=metal", "type=plastic", "[MATERIAL-PEC] -> 'type' has invalid value 'plastic', expected '(metal|userdefined|conducting sheet)'"),
+    ("direction=z-", "direction=w", "[PORT-OUT] -> 'direction' has invalid value 'w', expected '(x+|y+|z+|x-|y-|z-|r+|r-|theta+|theta-)'"),
+    ("material_sigma=0\n", "", "[MATERIAL-teflon] does not contains item 'material_sigma'"),
+    ('fixedDistance="{\\"x\\": 3.0', 'fixedDistance="{\\"x\\": \\"abc\\"', "[GRID-simbox] -> 'fixedDistance' -> x has invalid value 'abc', expected 'float'"),
+
+    #   item name is matched as prefix, RUnits makes R present so its missing value is reported
+    ("R=0\nRUnits=Ohm\nisActive=false", "RUnits=Ohm\nisActive=false", "[PORT-OUT] -> 'R' has invalid value 'None', expected 'float'"),
+])
+def test_invalidValues(tmp_path, oldText, newText, expectedError):
+    fileName = writeModifiedFile(tmp_path, oldText, newText)
+    assert sorted(IniValidator0v1.checkFile(fileName)) == sorted(BASELINE_ERRORS + [expectedError])
+
+@pytest.mark.parametrize("oldText, newText", [
+    #   invalid JSON and missing mandatory group are only logged
+    ('fixedDistance="{\\"x\\": 3.0', 'fixedDistance="{\\"x\\" 3.0'),
+    ("[SIMULATION-Hardwired%20Name%201]", "[XSIMULATION-Hardwired%20Name%201]"),
+    ("[FILE-INFO]\nversion=2.3\n", ""),
+])
+def test_loggedOnly(tmp_path, oldText, newText):
+    fileName = writeModifiedFile(tmp_path, oldText, newText)
+    assert IniValidator0v1.checkFile(fileName) == BASELINE_ERRORS
@@ -0,0 +1,150 @@
+#
+#   Settings file format 0.2, sections stored behind JSON header are decoded only when they are accessed and unchanged
+#   sections are copied as they are when file is written again.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestJsonFile0v2.py
+#
+import os
+import sys
+import json
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from PySide import QtCore
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SaveLoad.JsonFile0v2 import JsonFile0v2, SectionSettings
+
+INI_FILE = os.path.join(parentdir, "utilsOpenEMS", "SaveLoad", "aaaaa.ini")
+
+def writeSettings(fileName):
+    settings = SectionSettings(fileName)
+    settings.beginGroup("FILE-INFO")
+    settings.setValue("version", "0.2")
+    settings.endGroup()
+    settings.beginGroup("MATERIAL-PEC")
+    settings.setValue("type", "metal")
+    settings.endGroup()
+    settings.beginGroup("GRID-simbox")
+    settings.setValue("type", "Fixed Distance")
+    settings.setValue("generateLinesInside", False)
+    settings.setValue("fixedDistance", {"x": 0.2, "y": 0.2, "z": 1.2})
+    settings.endGroup()
+    settings.beginGroup("_OBJECT0-Box")
+    settings.setValue("category", "Material")
+    settings.setValue("parent", "PEC")
+    settings.endGroup()
+    settings.sync()
+
+def test_sectionsAreDecodedOnDemand(tmp_path):
+    fileName = str(tmp_path / "settings.json")
+    writeSettings(fileName)
+
+    settings = SectionSettings(fileName)
+    assert settings.childGroups() == ["FILE-INFO", "GRID-simbox", "MATERIAL-PEC", "_OBJECT0-Box"]
+    assert settings.childSections() == ["FILE", "GRID", "MATERIAL", "_OBJECT"]
+    assert not any(settings.isSectionLoaded(sectionName) for sectionName in settings.childSections())
+
+    settings.beginGroup("GRID-simbox")
+    assert settings.value("type") == "Fixed Distance"
+    assert settings.value("generateLinesInside") == "false"
+    assert settings.jsonValue("fixedDistance") == {"x": 0.2, "y": 0.2, "z": 1.2}
+    settings.endGroup()
+    assert [sectionName for sectionName in settings.childSections() if settings.isSectionLoaded(sectionName)] == ["GRID"]
+
+    settings.releaseSection("GRID")
+    assert not settings.isSectionLoaded("GRID")
+    assert settings.getSectionGroups("GRID") == ["GRID-simbox"]
+
+def test_readWriteRead(tmp_path):
+    fileName = str(tmp_path / "settings.json")
+    writeSettings(fileName)
+    originalSettings = SectionSettings(fileName)
+    originalBytes = {sectionName: originalSettings.readSectionBytes(sectionName) for sectionName in originalSettings.childSections()}
+
+    settings = SectionSettings(fileName)
+    settings.beginGroup("MATERIAL-teflon")
+    settings.setValue("type", "userdefined")
+    settings.setValue("material_epsilon", 2.1)
+    settings.endGroup()
+    settings.sync()
+    assert not settings.isSectionLoaded("GRID")
+
+    settings = SectionSettings(fileName)
+    assert settings.childGroups() == ["FILE-INFO", "GRID-simbox", "MATERIAL-PEC", "MATERIAL-teflon", "_OBJECT0-Box"]
+    for sectionName in ["FILE", "GRID", "_OBJECT"]:
+        assert settings.readSectionBytes(sectionName) == originalBytes[sectionName]
+
+    settings.beginGroup("MATERIAL-teflon")
+    assert settings.value("material_epsilon") == "2.1"
+    settings.endGroup()
+    settings.beginGroup("_OBJECT0-Box")
+    assert settings.value("parent") == "PEC"
+    settings.endGroup()
+
+def test_groupsToReadDecodeOneSectionAtTime(tmp_path):
+    fileName = str(tmp_path / "settings.json")
+    writeSettings(fileName)
+    settings = SectionSettings(fileName)
+    settingsFile = JsonFile0v2.__new__(JsonFile0v2)
+
+    groupsRead = []
+    for settingsGroup in settingsFile.getGroupsToRead(settings):
+        settings.beginGroup(settingsGroup)
+        settings.childKeys()
+        settings.endGroup()
+        groupsRead.append(settingsGroup)
+        assert [sectionName for sectionName in settings.childSections() if settings.isSectionLoaded(sectionName)] == [settings.getSectionName(settingsGroup)]
+
+    assert groupsRead == ["GRID-simbox", "MATERIAL-PEC", "_OBJECT0-Box"]
+    assert not settings.isSectionLoaded("FILE")
+
+def test_fileInfoVersion(tmp_path):
+    settings = SectionSettings(None)
+    JsonFile0v2.writeFileInfo(JsonFile0v2.__new__(JsonFile0v2), settings)
+    settings.beginGroup("FILE-INFO")
+    assert settings.value("version") == "0.2"
+    settings.endGroup()
+
+    settings = SectionSettings(None)
+    IniFile0v1.writeFileInfo(IniFile0v1.__new__(IniFile0v1), settings)
+    settings.beginGroup("FILE-INFO")
+    assert settings.value("version") == "0.1"
+    settings.endGroup()
+
+def test_convertFromIni(tmp_path):
+    fileName = JsonFile0v2.convertFromIni(INI_FILE, str(tmp_path / "aaaaa.json"))
+    iniSettings = QtCore.QSettings(INI_FILE, QtCore.QSettings.IniFormat)
+    settings = SectionSettings(fileName)
+
+    assert settings.childGroups() == sorted(iniSettings.childGroups())
+
+    for groupName in iniSettings.childGroups():
+        if groupName == "FILE-INFO":
+            continue
+        iniSettings.beginGroup(groupName)
+        settings.beginGroup(groupName)
+        assert sorted(settings.childKeys()) == sorted(iniSettings.childKeys())
+        for key in iniSettings.childKeys():
+            if key in JsonFile0v2.iniJsonKeys:
+                assert settings.jsonValue(key) == json.loads(iniSettings.value(key))
+            else:
+                assert settings.value(key) == iniSettings.value(key)
+        settings.endGroup()
+        iniSettings.endGroup()
+
+    settings.beginGroup("FILE-INFO")
+    assert settings.value("version") == "0.2"
+    settings.endGroup()
+
+    settings.beginGroup("GRID-substrate grid Z")
+    assert settings.jsonValue("fixedDistance") == {"x": 0.2, "y": 0.2, "z": 1.2}
+    settings.endGroup()
@@ -0,0 +1,95 @@
+#
+#   Material aware mesh, cells inside dielectric are smaller than lambda/N in that material, cells outside grow by grading
+#   ratio up to vacuum lambda/N, object boundaries are always mesh lines.
+#
+#   Run:
+#       python -m pytest test/TestMaterialAwareMesher.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+from utilsOpenEMS.MeshTools.MaterialAwareMesher import MaterialAwareMesher
+
+FMAX_HZ = 10e9
+REF_UNIT = 1e-3
+
+def getCells(lines):
+    return [lines[k+1] - lines[k] for k in range(len(lines) - 1)]
+
+def createRegion(xMin, xMax, epsilon=1.0, type="userdefined"):
+    return {'type': type, 'epsilon': epsilon, 'mue': 1.0, 'box': {'x': (xMin, xMax), 'y': (0, 1), 'z': (0, 1)}}
+
+def test_maxCellSize():
+    mesher = MaterialAwareMesher()
+
+    #   lambda/20 at 10GHz is 1.499mm in vacuum, half of it in epsilon 4
+    assert mesher.getMaxCellSize(FMAX_HZ, refUnit=REF_UNIT) == pytest.approx(1.49896229)
+    assert mesher.getMaxCellSize(FMAX_HZ, 4.0, refUnit=REF_UNIT) == pytest.approx(1.49896229 / 2)
+    assert mesher.getMaxCellSize(FMAX_HZ, 0.5, refUnit=REF_UNIT) == pytest.approx(1.49896229)
+    assert mesher.getMaxCellSize(0, 4.0, refUnit=REF_UNIT) == 0
+
+    #   metal has vacuum wavelength whatever epsilon is set
+    assert mesher.getRegionMaxCellSize(createRegion(0, 1, 4.0, 'metal'), FMAX_HZ, REF_UNIT) == pytest.approx(1.49896229)
+
+def test_axisIntervals():
+    mesher = MaterialAwareMesher()
+    regions = [createRegion(-20, 30), createRegion(0, 10, 4.0)]
+
+    intervals = mesher.getAxisIntervals('x', regions, FMAX_HZ, REF_UNIT, 1.5)
+    assert [(start, stop) for start, stop, maxCellSize in intervals] == [(-20, 0), (0, 10), (10, 30)]
+    assert [maxCellSize for start, stop, maxCellSize in intervals] == pytest.approx([1.49896229, 1.49896229 / 2, 1.49896229])
+
+def test_gradedCellsFillInterval():
+    mesher = MaterialAwareMesher()
+
+    cells = mesher.getGradedCells(10, 0.1, 0.2, 1.0)
+    assert sum(cells) == pytest.approx(10)
+    assert max(cells) <= 1.0 + 1e-12
+    assert cells[0] <= 0.1 * 1.5 + 1e-12 and cells[-1] <= 0.2 * 1.5 + 1e-12
+
+    #   interval narrower than growth from both sides
+    cells = mesher.getGradedCells(0.5, 0.1, 0.1, 1.0)
+    assert sum(cells) == pytest.approx(0.5)
+
+def test_calculateLines():
+    mesher = MaterialAwareMesher()
+    regions = [createRegion(-20, 30), createRegion(0, 10, 4.0)]
+
+    lines = mesher.calculateLines('x', regions, FMAX_HZ, REF_UNIT)
+    cells = getCells(lines)
+
+    assert lines[0] == -20 and lines[-1] == pytest.approx(30)
+    assert all(any(abs(line - boundary) < 1e-9 for line in lines) for boundary in [0, 10])
+    assert all(cell > 0 for cell in cells)
+    assert max(cells) <= 1.49896229 + 1e-9
+
+    #   dielectric cells are at most lambda/20 in epsilon 4
+    assert max(getCells([line for line in lines if -1e-9 <= line <= 10 + 1e-9])) <= 1.49896229 / 2 + 1e-9
+
+    #   neighbour cells grading, also where coarse cells grow from dielectric cells rounded down to fit interval
+    assert all(max(cells[k], cells[k+1]) / min(cells[k], cells[k+1]) <= 1.5 + 1e-9 for k in range(len(cells) - 1))
+
+def test_backgroundMaxRes():
+    mesher = MaterialAwareMesher()
+    regions = [createRegion(-20, 30), createRegion(0, 10, 4.0)]
+
+    lines = mesher.calculateLines('x', regions, FMAX_HZ, REF_UNIT, backgroundMaxRes=1.0)
+    assert max(getCells(lines)) <= 1.0 + 1e-9
+
+def test_withoutFrequencyUserMaxResIsUsed():
+    mesher = MaterialAwareMesher()
+    regions = [createRegion(0, 10, 4.0)]
+
+    lines = mesher.calculateLines('x', regions, 0, REF_UNIT, backgroundMaxRes=2.5)
+    assert lines == pytest.approx([0, 2.5, 5, 7.5, 10])
+
+    #   nothing to derive cell size from, only boundaries are returned
+    assert mesher.calculateLines('x', regions, 0, REF_UNIT) == [0, 10]
@@ -0,0 +1,205 @@
+#
+#   Mesh lines calculated in GUI without generating script, lines must be same as generated script creates.
+#
+#   Run:
+#       python -m pytest test/TestMeshLinesCalculator.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+pytest.importorskip("numpy")
+
+from utilsOpenEMS.MeshTools.MeshLinesCalculator import MeshLinesCalculator
+from utilsOpenEMS.SettingsItem.GridSettingsItem import GridSettingsItem
+
+class Widget:
+    """
+    Form input returning fixed value.
+    """
+    def __init__(self, value):
+        self.fixedValue = value
+
+    def currentText(self):
+        return self.fixedValue
+
+    def isChecked(self):
+        return self.fixedValue
+
+    def value(self):
+        return self.fixedValue
+
+    def topLevelItemCount(self):
+        return self.fixedValue
+
+class Form:
+    def __init__(self, meshPrioritiesCount, minGridSpacing=None):
+        self.simParamsDeltaUnitList = Widget("mm")
+        self.meshPriorityTreeView = Widget(meshPrioritiesCount)
+        self.genParamMinGridSpacingEnable = Widget(minGridSpacing is not None)
+        self.genParamMinGridSpacingX = Widget(minGridSpacing)
+        self.genParamMinGridSpacingY = Widget(minGridSpacing)
+        self.genParamMinGridSpacingZ = Widget(minGridSpacing)
+
+class BoundBox:
+    def __init__(self, xMin, xMax, yMin, yMax, zMin, zMax):
+        self.XMin, self.XMax, self.YMin, self.YMax, self.ZMin, self.ZMax = xMin, xMax, yMin, yMax, zMin, zMax
+
+class CadObject:
+    def __init__(self, label, boundBox):
+        self.Label = label
+        self.Shape = None
+        self.boundBox = boundBox
+
+class CadHelpers:
+    def __init__(self, objects):
+        self.objects = objects
+
+    def getObjects(self):
+        return self.objects
+
+    def getObjectsByLabel(self, label):
+        return [obj for obj in self.objects if obj.Label == label]
+
+    def getObjectBoundBox(self, obj):
+        return obj.boundBox
+
+class TreeItem:
+    def __init__(self, text, children=()):
+        self.itemText = text
+        self.children = list(children)
+
+    def text(self, column):
+        return self.itemText
+
+    def childCount(self):
+        return len(self.children)
+
+    def child(self, k):
+        return self.children[k]
+
+class PriorityIndex:
+    def __init__(self, keys):
+        self.keys = keys
+
+    def getKeys(self):
+        return self.keys
+
+class GuiHelpers:
+    def __init__(self, meshPriorityKeys):
+        self.meshPriorityIndex = PriorityIndex(meshPriorityKeys)
+
+    def getMeshPriorityIndex(self):
+        return self.meshPriorityIndex
+
+def createCalculator(objects, meshPriorityKeys, minGridSpacing=None):
+    calculator = MeshLinesCalculator.__new__(MeshLinesCalculator)
+    calculator.form = Form(len(meshPriorityKeys), minGridSpacing)
+    calculator.cadHelpers = CadHelpers(objects)
+    calculator.guiHelpers = GuiHelpers(meshPriorityKeys)
+    calculator.lineOrigins = {'x': {}, 'y': {}, 'z': {}}
+    calculator.maxGridResolution_m = 0
+    calculator.getMaxFrequencyFromExcitation_Hz = lambda: 0
+    return calculator
+
+def createGrid(name, type, **kwargs):
+    grid = GridSettingsItem(name=name, type=type, units="mm", xenabled=True, **kwargs)
+    grid.topPriorityLines = False
+    return grid
+
+def test_arangeWithEndpoint():
+    calculator = MeshLinesCalculator.__new__(MeshLinesCalculator)
+    assert calculator.arangeWithEndpoint(0, 1, 0.25) == pytest.approx([0, 0.25, 0.5, 0.75, 1])
+    assert calculator.arangeWithEndpoint(0, 1, 0.3) == pytest.approx([0, 0.3, 0.6, 0.9])
+    assert calculator.arangeWithEndpoint(2, 2, 0.3) == [2]
+
+def test_linspace():
+    calculator = MeshLinesCalculator.__new__(MeshLinesCalculator)
+    assert calculator.linspace(0, 1, 5) == pytest.approx([0, 0.25, 0.5, 0.75, 1])
+    assert calculator.linspace(0, 1, 1) == [0.5]
+
+def test_smoothMeshLines():
+    calculator = MeshLinesCalculator.__new__(MeshLinesCalculator)
+    assert calculator.smoothMeshLines([0, 1, 3], 0.5) == pytest.approx([0, 0.5, 1, 1.5, 2, 2.5, 3])
+    assert calculator.smoothMeshLines([0, 1, 1, 2.2], 0.5) == pytest.approx([0, 0.5, 1, 1.4, 1.8, 2.2])
+    assert calculator.smoothMeshLines([0, 1], 0) == [0, 1]
+
+def test_fixedDistanceAndCount():
+    boxA = CadObject("boxA", BoundBox(0, 10, 0, 1, 0, 1))
+    boxB = CadObject("boxB", BoundBox(20, 24, 0, 1, 0, 1))
+    gridA = createGrid("gridA", "Fixed Distance", fixedDistance={'x': 2.5, 'y': 0, 'z': 0})
+    gridB = createGrid("gridB", "Fixed Count", fixedCount={'x': 3, 'y': 0, 'z': 0})
+    items = [[TreeItem("gridA", [TreeItem("boxA")]), gridA], [TreeItem("gridB", [TreeItem("boxB")]), gridB]]
+
+    calculator = createCalculator([boxA, boxB], [("Grid", "gridA", "boxA"), ("Grid", "gridB", "boxB")])
+    mesh = calculator.calculateMeshLines(items)
+
+    assert mesh['x'] == pytest.approx([0, 2.5, 5, 7.5, 10, 20, 22, 24])
+    assert mesh['y'] == [] and mesh['z'] == []
+    assert calculator.getLineOrigin('x', 7.5) == ("gridA", "boxA")
+    assert calculator.getLineOrigin('x', 22) == ("gridB", "boxB")
+    assert calculator.getLineOrigin('x', 100) == (None, None)
+
+def test_topPriorityLinesRemoveLowerPriorityLines():
+    boxA = CadObject("boxA", BoundBox(0, 10, 0, 1, 0, 1))
+    boxB = CadObject("boxB", BoundBox(4, 6, 0, 1, 0, 1))
+    gridA = createGrid("gridA", "Fixed Distance", fixedDistance={'x': 1, 'y': 0, 'z': 0})
+    gridB = createGrid("gridB", "Fixed Count", fixedCount={'x': 5, 'y': 0, 'z': 0})
+    gridB.topPriorityLines = True
+    items = [[TreeItem("gridA", [TreeItem("boxA")]), gridA], [TreeItem("gridB", [TreeItem("boxB")]), gridB]]
+
+    #   first key in mesh priority list has highest priority
+    calculator = createCalculator([boxA, boxB], [("Grid", "gridB", "boxB"), ("Grid", "gridA", "boxA")])
+    mesh = calculator.calculateMeshLines(items)
+
+    assert mesh['x'] == pytest.approx([0, 1, 2, 3, 4, 4.5, 5, 5.5, 6, 7, 8, 9, 10])
+    assert calculator.getLineOrigin('x', 5) == ("gridB", "boxB")
+
+def test_smoothMesh():
+    boxA = CadObject("boxA", BoundBox(0, 1, 0, 1, 0, 1))
+    boxB = CadObject("boxB", BoundBox(2, 3, 0, 1, 0, 1))
+    grid = createGrid("smooth", "Smooth Mesh", smoothMeshDefault={'xMaxRes': 0.4, 'yMaxRes': 0, 'zMaxRes': 0, 'materialAware': False, 'thirdsRule': False, 'thirdsRuleResolution': 0})
+    items = [[TreeItem("smooth", [TreeItem("boxA"), TreeItem("boxB")]), grid]]
+
+    calculator = createCalculator([boxA, boxB], [("Grid", "smooth", "SMOOTH MESH GROUP")])
+    mesh = calculator.calculateMeshLines(items)
+
+    cells = [mesh['x'][k+1] - mesh['x'][k] for k in range(len(mesh['x']) - 1)]
+    assert mesh['x'][0] == 0 and mesh['x'][-1] == 3
+    assert max(cells) <= 0.4 + 1e-12
+    assert all(coord in mesh['x'] for coord in [0, 1, 2, 3])
+    assert calculator.getLineOrigin('x', 2) == ("smooth", "boxA, boxB")
+
+@pytest.mark.parametrize("materialAware", [False, True])
+def test_smoothMeshGridOffset(materialAware):
+    boxA = CadObject("boxA", BoundBox(0, 1, 0, 1, 0, 1))
+    boxB = CadObject("boxB", BoundBox(2, 3, 0, 1, 0, 1))
+    grid = createGrid("smooth", "Smooth Mesh", gridOffset={'x': 100, 'y': 0, 'z': 0, 'units': 'um'}, smoothMeshDefault={'xMaxRes': 0.4, 'yMaxRes': 0, 'zMaxRes': 0, 'materialAware': materialAware, 'thirdsRule': False, 'thirdsRuleResolution': 0})
+    grid.generateLinesInside = True
+    items = [[TreeItem("smooth", [TreeItem("boxA"), TreeItem("boxB")]), grid]]
+
+    calculator = createCalculator([boxA, boxB], [("Grid", "smooth", "SMOOTH MESH GROUP")])
+    calculator.getMaterialRegions = lambda: []
+    mesh = calculator.calculateMeshLines(items)
+
+    #   object boundaries are moved 0.1mm inside objects also for material aware mesh
+    assert mesh['x'][0] == pytest.approx(0.1) and mesh['x'][-1] == pytest.approx(2.9)
+    assert all(any(line == pytest.approx(coord) for line in mesh['x']) for coord in [0.1, 0.9, 2.1, 2.9])
+
+def test_minimalGridlineSpacing():
+    box = CadObject("box", BoundBox(0, 1, 0, 1, 0, 1))
+    grid = createGrid("grid", "Fixed Distance", fixedDistance={'x': 0.1, 'y': 0, 'z': 0})
+    items = [[TreeItem("grid", [TreeItem("box")]), grid]]
+
+    #   min. spacing is in mm, lines 0.1mm apart are thinned to every second line
+    calculator = createCalculator([box], [("Grid", "grid", "box")], minGridSpacing=0.15)
+    mesh = calculator.calculateMeshLines(items)
+    assert mesh['x'] == pytest.approx([0, 0.2, 0.4, 0.6, 0.8, 1.0])
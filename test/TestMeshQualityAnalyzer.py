@@ -0,0 +1,132 @@
+#
+#   Mesh quality checks on calculated mesh lines: neighbour cells grading, cells bigger than lambda/N in material and
+#   smallest cells limiting FDTD timestep.
+#
+#   Run:
+#       python -m pytest test/TestMeshQualityAnalyzer.py
+#
+import os
+import sys
+import math
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+pytest.importorskip("numpy")
+
+from utilsOpenEMS.MeshTools.MeshQualityAnalyzer import MeshQualityAnalyzer
+from utilsOpenEMS.SettingsItem.ExcitationSettingsItem import ExcitationSettingsItem
+
+def createAnalyzer(gradingThreshold=1.5, cellsPerWavelength=20, timestepCellsCount=5):
+    analyzer = MeshQualityAnalyzer.__new__(MeshQualityAnalyzer)
+    analyzer.gradingThreshold = gradingThreshold
+    analyzer.cellsPerWavelength = cellsPerWavelength
+    analyzer.timestepCellsCount = timestepCellsCount
+    analyzer.wavelengthCheckSkipReason = None
+    analyzer.lineOrigins = {'x': {}, 'y': {}, 'z': {}}
+    return analyzer
+
+def test_gradingIssues():
+    analyzer = createAnalyzer()
+    mesh = {'x': [0, 1, 2, 4, 8], 'y': [0, 1, 2], 'z': [0, 1]}
+
+    issues = analyzer.analyzeGrading(mesh)
+
+    #   ratio 2.0 at x = 2 and x = 4, cells 1 -> 1 in y are fine
+    assert [(issue['axis'], issue['coord']) for issue in issues] == [('x', 2), ('x', 4)]
+    assert all(issue['type'] == 'grading' for issue in issues)
+    assert "2.00" in issues[0]['message']
+    assert (issues[1]['gridName'], issues[1]['objectLabel']) == (None, None)
+
+def test_gradingThreshold():
+    analyzer = createAnalyzer(gradingThreshold=2.0)
+    assert analyzer.analyzeGrading({'x': [0, 1, 2, 4, 8], 'y': [], 'z': []}) == []
+
+def test_gradingIssueOrigin():
+    analyzer = createAnalyzer()
+    mesh = {'x': [], 'y': [], 'z': []}
+    analyzer.addLines(mesh, 'x', [0, 1, 2], "fine", "trace")
+    analyzer.addLines(mesh, 'x', [6], "coarse", "substrate")
+    mesh['x'] = sorted(mesh['x'])
+
+    issues = analyzer.analyzeGrading(mesh)
+    assert len(issues) == 1
+    assert (issues[0]['gridName'], issues[0]['objectLabel']) == ("coarse", "substrate")
+
+def test_materialWavelength():
+    analyzer = createAnalyzer()
+    fMax_Hz = 10e9
+    refUnit = 1e-3
+
+    #   lambda/20 in epsilon 4 at 10GHz is 0.749mm
+    region = {'material': "FR4", 'type': 'userdefined', 'object': "substrate", 'epsilon': 4.0, 'mue': 1.0, 'box': {'x': (0, 4), 'y': (0, 1), 'z': (0, 1)}}
+    metal = {'material': "PEC", 'type': 'metal', 'object': "trace", 'epsilon': 1.0, 'mue': 1.0, 'box': {'x': (0, 4), 'y': (0, 1), 'z': (0, 1)}}
+    mesh = {'x': [0, 0.5, 1, 2, 4, 10], 'y': [0, 0.5, 1], 'z': [0, 0.5, 1]}
+
+    issues = analyzer.analyzeMaterialWavelength(mesh, [region, metal], fMax_Hz, refUnit)
+
+    assert [(issue['axis'], issue['coord']) for issue in issues] == [('x', 1), ('x', 2)]
+    assert all(issue['objectLabel'] == "substrate" for issue in issues)
+    assert "0.749481" in issues[0]['suggestion']
+    assert analyzer.analyzeMaterialWavelength(mesh, [region], 0, refUnit) == []
+
+def test_timestep():
+    analyzer = createAnalyzer(timestepCellsCount=2)
+    refUnit = 1e-3
+    mesh = {'x': [0, 1, 1.01, 2, 3], 'y': [0, 1, 2], 'z': [0, 1, 2]}
+
+    timestep = analyzer.getTimestep_s(mesh, refUnit)
+    assert timestep == pytest.approx(1 / (MeshQualityAnalyzer.C0 * math.sqrt(1 / (0.01e-3)**2 + 2 / (1e-3)**2)))
+    assert analyzer.getTimestep_s({'x': [0, 1], 'y': [0], 'z': [0, 1]}, refUnit) == 0
+
+    issues = analyzer.analyzeTimestep(mesh, refUnit)
+    assert len(issues) == 1
+    assert issues[0]['axis'] == 'x' and issues[0]['coord'] == 1
+    assert "1.005" in issues[0]['suggestion']
+
+def test_analyzeMeshAndReport():
+    analyzer = createAnalyzer()
+    mesh = {'x': [0, 1, 2, 4, 8], 'y': [0, 1, 2], 'z': [0, 1, 2]}
+
+    issues = analyzer.analyzeMesh(mesh, refUnit=1e-3)
+    assert sorted(set(issue['type'] for issue in issues)) == ['grading', 'timestep']
+
+    report = analyzer.getReportText(mesh, issues, maxIssuesPerType=1)
+    assert report.startswith("Mesh 5 x 3 x 3 lines, 16 cells\n")
+    assert "Neighbour cells ratio above 1.5: 2\n" in report
+    assert "... 1 more" in report
+
+def createGuiAnalyzer(excitationSettings):
+    """
+    Analyzer with GUI access replaced by fixed mesh, material region and excitation.
+    """
+    analyzer = createAnalyzer()
+    mesh = {'x': [0, 0.5, 1, 2, 4, 10], 'y': [0, 0.5, 1], 'z': [0, 0.5, 1]}
+    region = {'material': "FR4", 'type': 'userdefined', 'object': "substrate", 'epsilon': 4.0, 'mue': 1.0, 'box': {'x': (0, 4), 'y': (0, 1), 'z': (0, 1)}}
+    analyzer.calculateMeshLines = lambda: mesh
+    analyzer.getMaterialRegions = lambda: [region]
+    analyzer.getUnitLengthFromUI_m = lambda: 1e-3
+    analyzer.getExcitationSettings = lambda: excitationSettings
+    return analyzer
+
+def test_wavelengthCheckSkippedForCustomExcitation():
+    sinusodial = ExcitationSettingsItem(name="sin", type="sinusodial", sinusodial={'f0': 10}, units="GHz")
+    analyzer = createGuiAnalyzer(sinusodial)
+    analyzer.getMaxFrequencyFromExcitation_Hz = lambda: 10e9
+    mesh, issues = analyzer.analyzeMeshQuality()
+    assert len([issue for issue in issues if issue['type'] == 'lambda']) == 2
+    assert "Cells bigger than lambda/20 in material: 2\n" in analyzer.getReportText(mesh, issues)
+
+    #   generated scripts use max_res = 0 for custom excitation, its f0 isn't used as max. frequency
+    custom = ExcitationSettingsItem(name="custom", type="custom", custom={'functionStr': "sin(2*pi*f0*t)", 'f0': 10}, units="GHz")
+    analyzer = createGuiAnalyzer(custom)
+    analyzer.getMaxFrequencyFromExcitation_Hz = lambda: 10e9
+    mesh, issues = analyzer.analyzeMeshQuality()
+    assert [issue for issue in issues if issue['type'] == 'lambda'] == []
+    assert "Cells bigger than lambda/20 in material: not checked, custom excitation" in analyzer.getReportText(mesh, issues)
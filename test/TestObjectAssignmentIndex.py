@@ -0,0 +1,168 @@
+#
+#   Index of object assignment tree, changes made through index keep it valid, changes made directly in tree invalidate
+#   it and it's built again at next lookup.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestObjectAssignmentIndex.py
+#
+import os
+import gc
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from PySide import QtCore, QtWidgets
+from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
+from utilsOpenEMS.GuiHelpers.ObjectAssignmentIndex import ObjectAssignmentIndex
+from utilsOpenEMS.SettingsItem.MaterialSettingsItem import MaterialSettingsItem
+from utilsOpenEMS.SettingsItem.GridSettingsItem import GridSettingsItem
+
+@pytest.fixture(scope="module")
+def app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+@pytest.fixture
+def treeWidget(app):
+    """
+    Material: PEC (Box, Wire), FR4 (Substrate)
+    Grid: fine (Box)
+    """
+    treeWidget = QtWidgets.QTreeWidget()
+    for categoryName, groups in [("Material", [("PEC", ["Box", "Wire"]), ("FR4", ["Substrate"])]), ("Grid", [("fine", ["Box"])])]:
+        categoryItem = QtWidgets.QTreeWidgetItem([categoryName])
+        treeWidget.addTopLevelItem(categoryItem)
+        for groupName, objectLabels in groups:
+            groupItem = QtWidgets.QTreeWidgetItem([groupName])
+            categoryItem.addChild(groupItem)
+            for objectLabel in objectLabels:
+                groupItem.addChild(QtWidgets.QTreeWidgetItem([objectLabel]))
+    return treeWidget
+
+def test_lookups(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+    assert ObjectAssignmentIndex.getIndex(treeWidget) is index
+
+    assert index.getCategoryItem("Grid").text(0) == "Grid"
+    assert index.getGroupItem("Material", "FR4").text(0) == "FR4"
+    assert index.getGroupItem("Material", "fine") is None
+    assert index.getObjectMemberships("Box") == [("Material", "PEC"), ("Grid", "fine")]
+    assert index.getObjectMemberships("Box", ["Grid"]) == [("Grid", "fine")]
+    assert index.getMembershipsIndex(["Material"]) == {"Box": [("Material", "PEC")], "Wire": [("Material", "PEC")], "Substrate": [("Material", "FR4")]}
+    assert index.getAllObjects(["Grid"]) == [("Material", "PEC", "Box"), ("Material", "PEC", "Wire"), ("Material", "FR4", "Substrate")]
+    assert index.isValid
+
+def test_renameThroughIndex(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+    index.ensureValid()
+
+    renamedItems = index.renameObject("Box", "Box001")
+    assert [item.text(0) for item in renamedItems] == ["Box001", "Box001"]
+    assert index.isValid
+    assert index.getObjectItems("Box") == []
+    assert index.getObjectMemberships("Box001") == [("Material", "PEC"), ("Grid", "fine")]
+
+    assert index.renameObject("Missing", "Other") == []
+    assert index.isValid
+
+def test_removeThroughIndex(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+    index.ensureValid()
+
+    assert index.removeObject("Box") == 2
+    assert index.isValid
+    assert index.getObjectMemberships("Box") == []
+    assert index.getGroupItem("Material", "PEC").childCount() == 1
+    assert index.getAllObjects() == [("Material", "PEC", "Wire"), ("Material", "FR4", "Substrate")]
+
+def test_renameOutsideIndexInvalidates(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+    index.ensureValid()
+
+    treeWidget.topLevelItem(0).child(1).child(0).setText(0, "Substrate001")
+    assert not index.isValid
+
+    assert index.getObjectMemberships("Substrate") == []
+    assert index.getObjectMemberships("Substrate001") == [("Material", "FR4")]
+    assert index.isValid
+
+def test_deleteOutsideIndexInvalidates(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+    index.ensureValid()
+
+    pecItem = treeWidget.topLevelItem(0).child(0)
+    pecItem.removeChild(pecItem.child(1))
+    assert not index.isValid
+    assert index.getObjectItems("Wire") == []
+
+    treeWidget.topLevelItem(0).removeChild(pecItem)
+    assert not index.isValid
+    assert index.getGroupItem("Material", "PEC") is None
+    assert index.getObjectMemberships("Box") == [("Grid", "fine")]
+
+def test_addObjectAndRenameGroup(treeWidget):
+    index = ObjectAssignmentIndex.getIndex(treeWidget)
+
+    index.addObject(index.getGroupItem("Material", "FR4"), QtWidgets.QTreeWidgetItem(["Box"]))
+    assert index.isValid
+    assert index.getObjectMemberships("Box") == [("Material", "PEC"), ("Grid", "fine"), ("Material", "FR4")]
+
+    index.renameGroup("Material", "PEC", "copper")
+    assert index.isValid
+    assert index.getGroupItem("Material", "PEC") is None
+    assert index.getObjectMemberships("Wire") == [("Material", "copper")]
+
+    #   rebuilt index gives same result
+    index.rebuild()
+    assert index.getObjectMemberships("Wire") == [("Material", "copper")]
+    assert sorted(index.getObjectMemberships("Box")) == [("Grid", "fine"), ("Material", "FR4"), ("Material", "copper")]
+
+class Form:
+    """
+    Settings lists and object assignment tree used by GuiHelpers.addSettingsItemGui().
+    """
+    def __init__(self):
+        self.materialSettingsTreeView = QtWidgets.QTreeWidget()
+        self.gridSettingsTreeView = QtWidgets.QTreeWidget()
+        self.objectAssignmentRightTreeWidget = QtWidgets.QTreeWidget()
+        for categoryName in ["Material", "Grid"]:
+            self.objectAssignmentRightTreeWidget.addTopLevelItem(QtWidgets.QTreeWidgetItem([categoryName]))
+
+def test_groupsAddedByGuiHelpers(app):
+    form = Form()
+    guiHelpers = GuiHelpers(form)
+    index = guiHelpers.getObjectAssignmentIndex()
+    index.ensureValid()
+
+    #   groups are clones of settings list items, index must not keep wrappers which become invalid
+    guiHelpers.addSettingsItemGui(MaterialSettingsItem(name="PEC", type="metal"))
+    guiHelpers.addSettingsItemsGui([MaterialSettingsItem(name="FR4", type="userdefined"), GridSettingsItem(name="fine", type="Fixed Distance")])
+    gc.collect()
+
+    pecItem = index.getGroupItem("Material", "PEC")
+    assert pecItem.text(0) == "PEC"
+    assert index.getGroupItem("Grid", "fine").data(0, QtCore.Qt.UserRole).name == "fine"
+
+    index.addObject(pecItem, QtWidgets.QTreeWidgetItem(["Box"]))
+    index.addObject(index.getGroupItem("Grid", "fine"), QtWidgets.QTreeWidgetItem(["Box"]))
+    gc.collect()
+    assert index.getObjectMemberships("Box") == [("Material", "PEC"), ("Grid", "fine")]
+
+    assert index.removeObject("Box") == 2
+    assert form.objectAssignmentRightTreeWidget.topLevelItem(0).child(0).childCount() == 0
+
+    #   material removed from settings list and assignment tree same as dialog does it
+    form.objectAssignmentRightTreeWidget.topLevelItem(0).removeChild(index.getGroupItem("Material", "PEC"))
+    gc.collect()
+    assert index.getGroupItem("Material", "PEC") is None
+    assert index.getGroupItem("Material", "FR4").text(0) == "FR4"
@@ -0,0 +1,154 @@
+#
+#   Index of priority list, inserts, renames, removals and moves done through index keep it valid and in same state as
+#   index built again from list.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestPriorityListIndex.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+from PySide import QtWidgets
+from utilsOpenEMS.GuiHelpers.PriorityListIndex import PriorityListIndex
+
+KEYS = [
+    ("Port", "in", "port IN"),
+    ("Material", "PEC", "Box"),
+    ("Material", "PEC", "Wire"),
+    ("Material", "FR4", "Substrate"),
+]
+
+@pytest.fixture(scope="module")
+def app():
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+    return app
+
+@pytest.fixture
+def treeWidget(app):
+    treeWidget = QtWidgets.QTreeWidget()
+    PriorityListIndex.getIndex(treeWidget).insertItems(0, [PriorityListIndex.createItem(key) for key in KEYS])
+    return treeWidget
+
+def getListKeys(treeWidget):
+    return [PriorityListIndex.keyFromText(treeWidget.topLevelItem(k).text(0)) for k in range(treeWidget.topLevelItemCount())]
+
+def assertSameAsRebuilt(index):
+    """
+    Index updated by changes must be same as index built from list.
+    """
+    assert index.isValid
+    state = (index.getKeys(), {key: index.getPosition(key) for key in index.getKeys()}, dict(index.objectKeys), dict(index.groupKeys))
+    index.rebuild()
+    assert state == (index.getKeys(), {key: index.getPosition(key) for key in index.getKeys()}, dict(index.objectKeys), dict(index.groupKeys))
+
+def test_keyText():
+    assert PriorityListIndex.getText(("Material", "PEC", "Box")) == "Material, PEC, Box"
+    assert PriorityListIndex.keyFromText("Material, PEC, Box, with comma") == ("Material", "PEC", "Box, with comma")
+    assert PriorityListIndex.keyFromText("Grid, fine") == ("Grid", "fine", "")
+
+def test_insert(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+    assert index.getKeys() == KEYS
+    assert getListKeys(treeWidget) == KEYS
+
+    item = index.insertItem(1, ("Grid", "fine", "Box"))
+    assert index.getPosition(("Grid", "fine", "Box")) == 1
+    assert index.getPosition(("Material", "FR4", "Substrate")) == 4
+    assert index.getItem(("Grid", "fine", "Box")) is item
+    assert index.getObjectKeys("Box") == [("Grid", "fine", "Box"), ("Material", "PEC", "Box")]
+    assert getListKeys(treeWidget) == index.getKeys()
+    assertSameAsRebuilt(index)
+
+def test_renameObjectAndGroup(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+
+    index.renameObject("Box", "Box001")
+    assert index.getPosition(("Material", "PEC", "Box001")) == 1
+    assert not index.contains(("Material", "PEC", "Box"))
+    assert treeWidget.topLevelItem(1).text(0) == "Material, PEC, Box001"
+    assertSameAsRebuilt(index)
+
+    index.renameGroup("Material", "PEC", "copper")
+    assert index.getGroupKeys("Material", "copper") == [("Material", "copper", "Box001"), ("Material", "copper", "Wire")]
+    assert index.getGroupKeys("Material", "PEC") == []
+    assert getListKeys(treeWidget) == index.getKeys()
+    assertSameAsRebuilt(index)
+
+def test_renameToExistingKey(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+
+    #   object renamed to label which is already in group, old item is removed
+    item = index.replaceKey(("Material", "PEC", "Wire"), ("Material", "PEC", "Box"))
+    assert item is index.getItem(("Material", "PEC", "Box"))
+    assert index.getKeys() == [KEYS[0], KEYS[1], KEYS[3]]
+    assertSameAsRebuilt(index)
+
+def test_remove(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+
+    assert index.removeGroup("Material", "PEC") == 2
+    assert index.getKeys() == [KEYS[0], KEYS[3]]
+    assert index.getPosition(("Material", "FR4", "Substrate")) == 1
+    assertSameAsRebuilt(index)
+
+    assert index.removeObject("Substrate") == 1
+    assert index.removeObject("Substrate") == 0
+    assert getListKeys(treeWidget) == [KEYS[0]]
+    assertSameAsRebuilt(index)
+
+def test_move(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+    items = [index.getItem(key) for key in KEYS]
+
+    index.moveUp([items[2], items[3]])
+    assert index.getKeys() == [KEYS[0], KEYS[2], KEYS[3], KEYS[1]]
+    assert getListKeys(treeWidget) == index.getKeys()
+    assertSameAsRebuilt(index)
+
+    #   top item cannot move up, bottom item cannot move down
+    index.moveUp([items[0]])
+    index.moveDown([items[1]])
+    assert index.getKeys() == [KEYS[0], KEYS[2], KEYS[3], KEYS[1]]
+
+    index.moveDown([items[0]])
+    assert index.getKeys() == [KEYS[2], KEYS[0], KEYS[3], KEYS[1]]
+    assert [index.getPosition(key) for key in KEYS] == [1, 3, 0, 2]
+    assertSameAsRebuilt(index)
+
+def test_changesOutsideIndexInvalidate(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+    index.ensureValid()
+
+    treeWidget.takeTopLevelItem(0)
+    assert not index.isValid
+    assert index.getKeys() == KEYS[1:]
+
+    #   item without key, ie. added by old code, key is parsed from text
+    treeWidget.addTopLevelItem(QtWidgets.QTreeWidgetItem(["Grid, fine, Box"]))
+    assert index.getPosition(("Grid", "fine", "Box")) == 3
+
+def test_duplicates(treeWidget):
+    index = PriorityListIndex.getIndex(treeWidget)
+
+    index.insertItem(4, KEYS[1])
+    assert index.hasDuplicates
+    assert index.getKeys() == KEYS + [KEYS[1]]
+    assert index.getPosition(KEYS[1]) == 1
+
+    #   first occurrence is removed, index is built again and finds second one
+    assert index.removeKeys([KEYS[1]]) == 1
+    assert index.getKeys() == [KEYS[0], KEYS[2], KEYS[3], KEYS[1]]
+    assert index.getPosition(KEYS[1]) == 3
+    assert not index.hasDuplicates
@@ -0,0 +1,207 @@
+#
+#   Crash-recovery journal of settings autosave, entries are appended as whole lines, incomplete entry left by crash is
+#   ignored and cut off, journal is compacted when it has too many entries. Settings snapshot of dialog is recovered
+#   with assigned objects and lumped parts.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestSettingsAutosave.py
+#
+import os
+import sys
+import json
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide import QtWidgets
+
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SaveLoad.SettingsAutosave import SettingsAutosave
+
+INI_FILE = os.path.join(parentdir, "utilsOpenEMS", "SaveLoad", "aaaaa.ini")
+
+class DocumentHelpers:
+    def __init__(self, documentFileName):
+        self.documentFileName = documentFileName
+
+    def getCurrDocumentFileName(self):
+        return self.documentFileName
+
+class AnswerHelpers:
+    def __init__(self, answer):
+        self.answer = answer
+        self.messages = []
+
+    def displayYesNoMessage(self, message):
+        self.messages.append(message)
+        return self.answer
+
+def createAutosave(tmp_path):
+    """
+    Autosave without form, only journal methods are used.
+    """
+    autosave = SettingsAutosave.__new__(SettingsAutosave)
+    autosave.cadHelpers = DocumentHelpers(str(tmp_path / "antenna.FCStd"))
+    autosave.journalState = {}
+    autosave.journalEntriesCount = 0
+    return autosave
+
+def test_entriesAreReplayed(tmp_path):
+    autosave = createAutosave(tmp_path)
+    journalFileName = autosave.getJournalFileName()
+
+    autosave.appendJournalEntry(journalFileName, {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}, "GRID": {}})
+    autosave.appendJournalEntry(journalFileName, {"GRID": {"GRID-simbox": {"type": "Fixed Count"}}})
+
+    with open(journalFileName, "rb") as f:
+        lines = f.read().split(b"\n")
+    assert len(lines) == 3 and lines[-1] == b""
+
+    sections, lastTime = SettingsAutosave.readJournal(journalFileName)
+    assert sections == {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}, "GRID": {"GRID-simbox": {"type": "Fixed Count"}}}
+    assert lastTime is not None
+
+def test_incompleteEntryIsCutBeforeAppend(tmp_path):
+    autosave = createAutosave(tmp_path)
+    journalFileName = autosave.getJournalFileName()
+
+    autosave.appendJournalEntry(journalFileName, {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}})
+    with open(journalFileName, "ab") as f:
+        f.write(b'{"time": "2026-01-01 00:00:00", "sections": {"GRID": {"GRI')     # crash during write
+
+    sections, lastTime = SettingsAutosave.readJournal(journalFileName)
+    assert sections == {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}}
+
+    autosave.appendJournalEntry(journalFileName, {"PORT": {"PORT-in": {"type": "lumped"}}})
+    with open(journalFileName, "rb") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert all(isinstance(json.loads(line), dict) for line in lines)
+
+    sections, lastTime = SettingsAutosave.readJournal(journalFileName)
+    assert sections == {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}, "PORT": {"PORT-in": {"type": "lumped"}}}
+
+def test_truncateWithoutNewline(tmp_path):
+    journalFileName = str(tmp_path / "journal")
+    with open(journalFileName, "wb") as f:
+        f.write(b"x" * 10000)
+
+    with open(journalFileName, "a+b") as f:
+        SettingsAutosave.truncateIncompleteEntry(f, journalFileName, blockSize=100)
+    assert os.path.getsize(journalFileName) == 0
+
+def test_compaction(tmp_path):
+    autosave = createAutosave(tmp_path)
+    autosave.maxJournalEntries = 3
+    journalFileName = autosave.getJournalFileName()
+
+    for k in range(5):
+        autosave.appendJournalEntry(journalFileName, {"GRID": {f"GRID-{k}": {"type": "Fixed Count"}}, f"SECTION{k}": {}})
+
+    with open(journalFileName, "rb") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert not os.path.exists(journalFileName + ".tmp")
+
+    sections, lastTime = SettingsAutosave.readJournal(journalFileName)
+    assert sections["GRID"] == {"GRID-4": {"type": "Fixed Count"}}
+    assert sorted(sectionName for sectionName in sections.keys() if sectionName.startswith("SECTION")) == [f"SECTION{k}" for k in range(5)]
+
+def test_recoveryDeclined(tmp_path):
+    autosave = createAutosave(tmp_path)
+    journalFileName = autosave.getJournalFileName()
+    autosave.appendJournalEntry(journalFileName, {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}})
+
+    guiHelpers = AnswerHelpers(False)
+    assert autosave.offerRecovery(guiHelpers) is False
+    assert len(guiHelpers.messages) == 1
+    assert "Press Yes" in guiHelpers.messages[0]
+    assert not os.path.exists(journalFileName)
+
+def test_recoveryAccepted(tmp_path):
+    autosave = createAutosave(tmp_path)
+    journalFileName = autosave.getJournalFileName()
+    autosave.appendJournalEntry(journalFileName, {"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}})
+
+    recoveredSections = []
+    autosave.recover = lambda fileName, sections: recoveredSections.append(sections)
+
+    assert autosave.offerRecovery(AnswerHelpers(True)) is True
+    assert recoveredSections == [{"MATERIAL": {"MATERIAL-PEC": {"type": "metal"}}}]
+    assert not os.path.exists(journalFileName)
+
+@pytest.fixture(scope="module")
+def mockCadInterface():
+    cadInterface = MockCadInterface()
+    for k, label in enumerate(["port IN", "port OUT", "coax shield", "simbox", "sma substrate", "coax wire"]):
+        cadInterface.addBox(label, k, 0, 0, k + 1, 1, 1)
+    FactoryCadInterface.registerMockInterface(cadInterface)
+    yield cadInterface
+    FactoryCadInterface.registerMockInterface(None)
+
+@pytest.fixture(scope="module")
+def appDialog(mockCadInterface):
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+
+    from ExportOpenEMSDialog import ExportOpenEMSDialog
+    dialog = ExportOpenEMSDialog()
+    dialog.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    yield dialog
+    dialog.form.close()
+
+def createDialogAutosave(appDialog, tmp_path):
+    autosave = SettingsAutosave(appDialog.form, guiSignals=appDialog.guiSignals)
+    autosave.cadHelpers = DocumentHelpers(str(tmp_path / "antenna.FCStd"))
+    autosave.settingsFile.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    return autosave
+
+def getGroupChildCounts(treeWidget):
+    """
+    :return: {(category name, group name): number of assigned objects}
+    """
+    childCounts = {}
+    for k in range(treeWidget.topLevelItemCount()):
+        categoryItem = treeWidget.topLevelItem(k)
+        for m in range(categoryItem.childCount()):
+            childCounts[(categoryItem.text(0), categoryItem.child(m).text(0))] = categoryItem.child(m).childCount()
+    return childCounts
+
+def test_dialogSettingsRecovered(appDialog, tmp_path):
+    settingsFile = IniFile0v1(appDialog.form, guiSignals=appDialog.guiSignals)
+    settingsFile.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    settingsFile.read(INI_FILE)
+    childCounts = getGroupChildCounts(appDialog.form.objectAssignmentRightTreeWidget)
+    assert childCounts[("Grid", "ports Z")] == 2
+    assert appDialog.form.lumpedPartTreeView.topLevelItemCount() == 1
+
+    #   session with snapshot written into journal crashed
+    autosave = createDialogAutosave(appDialog, tmp_path)
+    autosave.snapshot()
+    autosave.stop(isJournalRemoved=False)
+    assert os.path.exists(autosave.getJournalFileName())
+
+    appDialog.form.lumpedPartTreeView.clear()
+    for groupItems in appDialog.guiHelpers.getObjectAssignmentIndex().getAllGroupItems().values():
+        for groupItem in groupItems:
+            groupItem.takeChildren()
+
+    autosave = createDialogAutosave(appDialog, tmp_path)
+    assert autosave.offerRecovery(AnswerHelpers(True)) is True
+    autosave.stop()
+
+    assert getGroupChildCounts(appDialog.form.objectAssignmentRightTreeWidget) == childCounts
+    assert appDialog.form.lumpedPartTreeView.topLevelItemCount() == 1
+    assert appDialog.form.lumpedPartTreeView.topLevelItem(0).text(0) == "50Ohm"
@@ -0,0 +1,80 @@
+#
+#   Sections of settings file changed in dialog since last load are marked dirty, also when settings are changed in
+#   place without model signal.
+#
+#   Run:
+#       QT_QPA_PLATFORM=offscreen python -m pytest test/TestSettingsDirtyTracker.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to instantiate FreeCAD simulation creator gui
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide import QtCore, QtWidgets
+
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SettingsItem.MaterialSettingsItem import MaterialSettingsItem
+
+INI_FILE = os.path.join(parentdir, "utilsOpenEMS", "SaveLoad", "aaaaa.ini")
+
+@pytest.fixture(scope="module")
+def mockCadInterface():
+    cadInterface = MockCadInterface()
+    for k, label in enumerate(["port IN", "port OUT", "coax shield", "simbox", "sma substrate", "coax wire"]):
+        cadInterface.addBox(label, k, 0, 0, k + 1, 1, 1)
+    FactoryCadInterface.registerMockInterface(cadInterface)
+    yield cadInterface
+    FactoryCadInterface.registerMockInterface(None)
+
+@pytest.fixture(scope="module")
+def appDialog(mockCadInterface):
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication(sys.argv)
+
+    from ExportOpenEMSDialog import ExportOpenEMSDialog
+    dialog = ExportOpenEMSDialog()
+    dialog.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    yield dialog
+    dialog.form.close()
+
+@pytest.fixture
+def loadedDialog(appDialog):
+    """
+    Dialog with aaaaa.ini loaded, nothing is dirty.
+    """
+    settingsFile = IniFile0v1(appDialog.form, guiSignals=appDialog.guiSignals, dirtyTracker=appDialog.settingsDirtyTracker)
+    settingsFile.guiHelpers.displayMessage = lambda msgText, forceModal=True: print(msgText)
+    settingsFile.read(INI_FILE)
+    appDialog.settingsDirtyTracker.clear()
+    return appDialog
+
+def getPortSettings(appDialog):
+    portCategoryItem = appDialog.guiHelpers.getObjectAssignmentIndex().getCategoryItem("Port")
+    return [portCategoryItem.child(k).data(0, QtCore.Qt.UserRole) for k in range(portCategoryItem.childCount())]
+
+def test_materialRenameMarksPortDirty(loadedDialog):
+    loadedDialog.materialRenamed("teflon", "PTFE")
+
+    assert [portSettings.coaxialMaterial for portSettings in getPortSettings(loadedDialog)] == ["PTFE", "PTFE"]
+    assert loadedDialog.settingsDirtyTracker.isDirty("PORT")
+
+def test_materialNotUsedByPortKeepsPortClean(loadedDialog):
+    loadedDialog.guiHelpers.addSettingsItemGui(MaterialSettingsItem(name="FR4", type="userdefined"))
+    loadedDialog.settingsDirtyTracker.clear()
+
+    loadedDialog.materialRenamed("FR4", "FR4 substrate")
+    assert loadedDialog.settingsDirtyTracker.isDirty("MATERIAL")
+    assert not loadedDialog.settingsDirtyTracker.isDirty("PORT")
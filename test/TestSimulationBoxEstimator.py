@@ -0,0 +1,83 @@
+#
+#   Simulation box proposal, absorbing boundaries are moved to lambda/4 clearance from structure, PEC and PMC walls stay
+#   where they are.
+#
+#   Run:
+#       python -m pytest test/TestSimulationBoxEstimator.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+pytest.importorskip("numpy")
+
+from utilsOpenEMS.MeshTools.SimulationBoxEstimator import SimulationBoxEstimator
+
+def createEstimator(clearanceLambda=0.25, minPmlCells=8, maxPmlCells=20):
+    estimator = SimulationBoxEstimator.__new__(SimulationBoxEstimator)
+    estimator.clearanceLambda = clearanceLambda
+    estimator.minPmlCells = minPmlCells
+    estimator.maxPmlCells = maxPmlCells
+    return estimator
+
+def test_proposeBox():
+    estimator = createEstimator()
+    structureBox = {'x': (0, 10), 'y': (0, 10), 'z': (0, 1)}
+    currentBox = {'x': (-50, 60), 'y': (-5, 15), 'z': (-1, 2)}
+    boundaryConditions = {
+        'xmin': ("PML", 8), 'xmax': ("MUR", 0),
+        'ymin': ("PEC", 0), 'ymax': ("PMC", 0),
+        'zmin': ("PML", 8), 'zmax': ("PML", 8),
+    }
+
+    proposedBox, pmlCells, clearance, boundaryCellSize = estimator.proposeBox(structureBox, currentBox, boundaryConditions, 1e9, 3e9, 1e-3)
+
+    #   lambda at 1GHz is 299.79mm, cell at boundary lambda/20 at 3GHz
+    assert clearance == pytest.approx(299.792458 / 4)
+    assert boundaryCellSize == pytest.approx(299.792458 / 3 / 20)
+
+    #   PML lambda/10 thick is only 6 cells, at least 8 cells are proposed
+    assert pmlCells == {'xmin': 8, 'xmax': 0, 'ymin': 0, 'ymax': 0, 'zmin': 8, 'zmax': 8}
+    assert proposedBox['x'] == pytest.approx((-(clearance + 8 * boundaryCellSize), 10 + clearance))
+    assert proposedBox['y'] == (-5, 15)
+    assert proposedBox['z'] == pytest.approx((-(clearance + 8 * boundaryCellSize), 1 + clearance + 8 * boundaryCellSize))
+
+def test_proposeBoxMaxPmlCells():
+    estimator = createEstimator()
+    box = {'x': (0, 1), 'y': (0, 1), 'z': (0, 1)}
+    boundaryConditions = {side: ("PML", 8) for side in SimulationBoxEstimator.sidesList}
+
+    #   lambda/10 at 1GHz is 20 cells of lambda/20 at 10GHz, it's limited to max. PML cells
+    proposedBox, pmlCells, clearance, boundaryCellSize = createEstimator(maxPmlCells=12).proposeBox(box, box, boundaryConditions, 1e9, 10e9, 1e-3)
+    assert set(pmlCells.values()) == {12}
+
+    #   without max. frequency boundary cell is derived from lowest frequency
+    proposedBox, pmlCells, clearance, boundaryCellSize = estimator.proposeBox(box, box, boundaryConditions, 1e9, 0, 1e-3)
+    assert boundaryCellSize == pytest.approx(299.792458 / 20)
+
+def test_estimateLinesCount():
+    estimator = createEstimator()
+    lines = list(range(11))
+
+    #   lines 0..8 stay, 5 new lines below
+    assert estimator.estimateLinesCount(lines, (0, 10), (-5, 8), 1) == 14
+
+    #   without lines current range is meshed by cell size
+    assert estimator.estimateLinesCount([], (0, 10), (-5, 20), 2) == 14
+    assert estimator.estimateLinesCount([], (0, 0), (0, 0), 1) == 2
+
+def test_estimateCellsCount():
+    estimator = createEstimator()
+    mesh = {'x': list(range(11)), 'y': [], 'z': []}
+    currentBox = {'x': (0, 10), 'y': (0, 4), 'z': (0, 4)}
+    proposedBox = {'x': (-5, 8), 'y': (0, 4), 'z': (0, 4)}
+
+    assert estimator.estimateCellsCount(mesh, currentBox, proposedBox, 1) == (10 * 4 * 4, 13 * 4 * 4)
@@ -0,0 +1,123 @@
+#
+#   Mirror symmetry detection, each object needs mirrored counterpart and ports cut in half by plane decide its boundary
+#   condition from their excitation direction.
+#
+#   Run:
+#       python -m pytest test/TestSymmetryAnalyzer.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+pytest.importorskip("PySide")
+pytest.importorskip("numpy")
+
+from utilsOpenEMS.MeshTools.SymmetryAnalyzer import SymmetryAnalyzer
+
+class PortSettings:
+    def __init__(self, type, direction):
+        self.type = type
+        self.direction = direction
+
+    def getType(self):
+        return self.type
+
+def createObject(category, group, label, box, measure, centerOfMass=None, settings=None):
+    return {'category': category, 'group': group, 'label': label, 'settings': settings, 'box': box, 'measure': measure, 'centerOfMass': centerOfMass}
+
+def createPort(direction, type='lumped', box=None):
+    box = box if box is not None else {'x': (-0.5, 0.5), 'y': (-0.5, 0.5), 'z': (0, 1)}
+    return createObject("Port", "in", "port", box, 0.5, None, PortSettings(type, direction))
+
+def createStructure(portDirection='z+'):
+    return [
+        createObject("Material", "FR4", "substrate", {'x': (-5, 5), 'y': (-2, 2), 'z': (0, 1)}, 40, {'x': 0, 'y': 0, 'z': 0.5}),
+        createObject("Material", "PEC", "trace", {'x': (-5, 5), 'y': (-0.5, 0.5), 'z': (1, 1)}, 10, {'x': 0, 'y': 0, 'z': 1}),
+        createPort(portDirection),
+    ]
+
+def createAnalyzer():
+    analyzer = SymmetryAnalyzer.__new__(SymmetryAnalyzer)
+    analyzer.relativeTolerance = 1e-6
+    return analyzer
+
+def test_mirrorCounterpart():
+    analyzer = createAnalyzer()
+    left = createObject("Material", "PEC", "left", {'x': (-3, -1), 'y': (0, 1), 'z': (0, 1)}, 2, {'x': -2, 'y': 0.5, 'z': 0.5})
+    right = createObject("Material", "PEC", "right", {'x': (1, 3), 'y': (0, 1), 'z': (0, 1)}, 2, {'x': 2, 'y': 0.5, 'z': 0.5})
+
+    assert analyzer.isMirrorCounterpart(left, right, 'x', 0, 1e-6)
+    assert not analyzer.isMirrorCounterpart(left, right, 'x', 0.5, 1e-6)
+    assert not analyzer.isMirrorCounterpart(left, right, 'y', 0, 1e-6)
+
+    #   different assignment, volume or center of mass
+    other = dict(right, group="copper")
+    assert not analyzer.isMirrorCounterpart(left, other, 'x', 0, 1e-6)
+    other = dict(right, measure=1.5)
+    assert not analyzer.isMirrorCounterpart(left, other, 'x', 0, 1e-6)
+    other = dict(right, centerOfMass={'x': 2.2, 'y': 0.5, 'z': 0.5})
+    assert not analyzer.isMirrorCounterpart(left, other, 'x', 0, 1e-6)
+    other = dict(right, centerOfMass=None)
+    assert analyzer.isMirrorCounterpart(left, other, 'x', 0, 1e-6)
+
+def test_portExcitationAxis():
+    analyzer = createAnalyzer()
+
+    assert analyzer.getPortExcitationAxis(createPort('x+')) == ('x', None)
+    assert analyzer.getPortExcitationAxis(createPort('y-')) == ('y', None)
+    assert analyzer.getPortExcitationAxis(createPort('z')) == ('z', None)
+    assert analyzer.getPortExcitationAxis(createPort('XZ plane, front layer')) == ('y', None)
+
+    axis, reason = analyzer.getPortExcitationAxis(createPort('r+'))
+    assert axis is None and "cylindrical" in reason
+    axis, reason = analyzer.getPortExcitationAxis(createPort('theta-'))
+    assert axis is None and "cylindrical" in reason
+    axis, reason = analyzer.getPortExcitationAxis(createPort('custom'))
+    assert axis is None and "just x, y, z directions" in reason
+
+def test_portsBoundaryCondition():
+    analyzer = createAnalyzer()
+
+    #   excitation parallel to plane is PMC, normal to plane is PEC
+    assert analyzer.getPortsBoundaryCondition([createPort('z+')], 'x', 0, 1e-6) == ('PMC', None)
+    assert analyzer.getPortsBoundaryCondition([createPort('x-')], 'x', 0, 1e-6) == ('PEC', None)
+
+    bc, reason = analyzer.getPortsBoundaryCondition([createPort('z+'), createPort('x+')], 'x', 0, 1e-6)
+    assert bc is None and "both" in reason
+    bc, reason = analyzer.getPortsBoundaryCondition([createPort('z+')], 'x', 0.5, 1e-6)
+    assert bc is None and "cut in half" in reason
+    bc, reason = analyzer.getPortsBoundaryCondition([createPort('z+', type='microstrip')], 'x', 0, 1e-6)
+    assert bc is None and "just lumped" in reason
+    bc, reason = analyzer.getPortsBoundaryCondition([createPort('r+')], 'x', 0, 1e-6)
+    assert bc is None and "cylindrical" in reason
+    bc, reason = analyzer.getPortsBoundaryCondition([], 'x', 0, 1e-6)
+    assert bc is None and "no port" in reason
+
+def test_analyzePlane():
+    analyzer = createAnalyzer()
+    objects = createStructure()
+
+    result = analyzer.analyzePlane(objects, 'x')
+    assert (result['coord'], result['bc'], result['symmetric']) == (0, 'PMC', True)
+    result = analyzer.analyzePlane(objects, 'y')
+    assert (result['coord'], result['bc'], result['symmetric']) == (0, 'PMC', True)
+
+    #   trace is only on top of substrate
+    result = analyzer.analyzePlane(objects, 'z')
+    assert result['coord'] == 0.5 and not result['symmetric']
+    assert "trace" in result['reason']
+
+    result = analyzer.analyzePlane(createStructure('x+'), 'x')
+    assert (result['bc'], result['symmetric']) == ('PEC', True)
+
+def test_symmetryPlanesText():
+    analyzer = createAnalyzer()
+    planes = [{'axis': 'x', 'coord': 0, 'bc': 'PMC'}, {'axis': 'y', 'coord': 1.25, 'bc': 'PEC'}]
+    assert analyzer.getSymmetryPlanesText(planes) == "x >= 0 PMC; y >= 1.25 PEC"
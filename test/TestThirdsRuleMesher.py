@@ -0,0 +1,57 @@
+#
+#   Thirds rule lines around metal edges, gridline 1/3 of cell inside metal and 2/3 of cell outside, touching metal objects
+#   are one conductor.
+#
+#   Run:
+#       python -m pytest test/TestThirdsRuleMesher.py
+#
+import os
+import sys
+import inspect
+
+# Add parent dir to system path to import addon modules
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+import pytest
+
+from utilsOpenEMS.MeshTools.ThirdsRuleMesher import ThirdsRuleMesher
+
+def createBox(xMin, xMax):
+    return {'x': (xMin, xMax), 'y': (0, 1), 'z': (0, 1)}
+
+def test_edgeLines():
+    mesher = ThirdsRuleMesher(0.3)
+    assert mesher.getEdgeLines(0, 3) == pytest.approx([-0.2, 0.1, 2.9, 3.2])
+
+    #   object thinner than edge resolution keeps its edges
+    assert mesher.getEdgeLines(0, 0.2) == [0, 0.2]
+    assert mesher.getEdgeLines(1, 1) == [1]
+    assert ThirdsRuleMesher(0).getEdgeLines(0, 3) == [0, 3]
+
+def test_mergeIntervals():
+    assert ThirdsRuleMesher.mergeIntervals([]) == []
+    assert ThirdsRuleMesher.mergeIntervals([(1, 2), (0, 1)]) == [(0, 2)]
+    assert ThirdsRuleMesher.mergeIntervals([(0, 3), (1, 2), (5, 6)]) == [(0, 3), (5, 6)]
+    assert ThirdsRuleMesher.mergeIntervals([(0, 1), (0.5, 2), (2, 4)]) == [(0, 4)]
+
+def test_touchingMetalObjects():
+    mesher = ThirdsRuleMesher(0.3)
+
+    #   shared edge at 1 is inside conductor, there are no lines around it
+    lines = mesher.getFixedLines('x', [(createBox(0, 1), True), (createBox(1, 2), True)])
+    assert lines == pytest.approx([-0.2, 0.1, 1.9, 2.2])
+
+    lines = mesher.getFixedLines('x', [(createBox(0, 1), True), (createBox(3, 4), True)])
+    assert lines == pytest.approx([-0.2, 0.1, 0.9, 1.2, 2.8, 3.1, 3.9, 4.2])
+
+def test_dielectricBoundaryAtMetalEdge():
+    mesher = ThirdsRuleMesher(0.3)
+
+    #   substrate boundary at trace edge is dropped, boundary far from metal stays
+    lines = mesher.getFixedLines('x', [(createBox(0, 1), True), (createBox(1, 5), False)])
+    assert lines == pytest.approx([-0.2, 0.1, 0.9, 1.2, 5])
+
+    lines = mesher.getFixedLines('x', [(createBox(-2, 5), False)])
+    assert lines == [-2, 5]
@@ -0,0 +1,198 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import re
+import json
+import time
+import shutil
+import platform
+import tempfile
+import subprocess
+import xml.etree.ElementTree as ET
+
+#
+#   openEMS engine and threads count profile.
+#
+#   Calibration runs short benchmark of simulation XML generated for current model (limited number of timesteps, no
+#   dumps) with each engine and threads count and picks fastest one. Result is stored for each machine in JSON file in
+#   user home directory and generators write it into openEMS run options.
+#
+class EngineProfile:
+
+    engineList = ['basic', 'sse', 'sse-compressed', 'multithreaded']
+
+    def __init__(self, profileFile=None):
+        """
+        :param profileFile: JSON file with profiles, by default ~/.FreeCAD-OpenEMS-Export/engineProfiles.json
+        """
+        if profileFile is None:
+            profileFile = os.path.join(os.path.expanduser("~"), ".FreeCAD-OpenEMS-Export", "engineProfiles.json")
+        self.profileFile = profileFile
+
+    def getMachineName(self):
+        """
+        :return: profile key, same host with different number of CPUs (ie. virtual machine) has its own profile
+        """
+        return f"{platform.node()}_{os.cpu_count()}cpu"
+
+    def getAllProfiles(self):
+        if not os.path.exists(self.profileFile):
+            return {}
+        try:
+            with open(self.profileFile, "r", encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"{__file__} > getAllProfiles() ERROR: cannot read {self.profileFile}: {e}")
+            return {}
+
+    def load(self):
+        """
+        :return: profile for current machine {'engine': str, 'numThreads': int, 'speed_MCps': float, 'results': list} or None
+        """
+        return self.getAllProfiles().get(self.getMachineName(), None)
+
+    def save(self, profile):
+        profiles = self.getAllProfiles()
+        profiles[self.getMachineName()] = profile
+
+        os.makedirs(os.path.dirname(self.profileFile), exist_ok=True)
+        with open(self.profileFile, "w", encoding='utf-8') as f:
+            json.dump(profiles, f, indent=4)
+
+    def getThreadCounts(self):
+        """
+        :return: threads counts to try, powers of 2 up to CPU count and CPU count itself
+        """
+        cpuCount = os.cpu_count() or 1
+        threadCounts = []
+        n = 1
+        while n < cpuCount:
+            threadCounts.append(n)
+            n *= 2
+        threadCounts.append(cpuCount)
+        return threadCounts
+
+    def findOpenEMSExecutable(self):
+        """
+        :return: path to openEMS binary from PATH or None
+        """
+        return shutil.which("openEMS") or shutil.which("openEMS.exe")
+
+    def findSimulationXml(self, directory):
+        """
+        :return: newest openEMS simulation XML (with FDTD settings) in directory and its subdirectories or None
+        """
+        xmlFiles = []
+        for dirPath, dirNames, fileNames in os.walk(directory):
+            for fileName in fileNames:
+                if not fileName.lower().endswith(".xml"):
+                    continue
+                filePath = os.path.join(dirPath, fileName)
+                try:
+                    if ET.parse(filePath).getroot().find('FDTD') is not None:
+                        xmlFiles.append(filePath)
+                except ET.ParseError:
+                    pass
+
+        if len(xmlFiles) == 0:
+            return None
+        return max(xmlFiles, key=os.path.getmtime)
+
+    def writeBenchmarkXml(self, simulationXmlFile, benchmarkDir, timestepsCount):
+        """
+        Copy of simulation XML which runs just given number of timesteps without dumps.
+        :return: path to benchmark XML
+        """
+        tree = ET.parse(simulationXmlFile)
+        root = tree.getroot()
+
+        fdtd = root.find('FDTD')
+        if fdtd is None:
+            raise ValueError(f"{simulationXmlFile} is not openEMS simulation file, FDTD element not found")
+        fdtd.set('NumberOfTimesteps', str(timestepsCount))
+        fdtd.set('endCriteria', '0')
+
+        for properties in root.iter('Properties'):
+            for dumpBox in properties.findall('DumpBox'):
+                properties.remove(dumpBox)
+
+        benchmarkXmlFile = os.path.join(benchmarkDir, "benchmark.xml")
+        tree.write(benchmarkXmlFile)
+        return benchmarkXmlFile
+
+    def runBenchmark(self, openEMSExecutable, benchmarkXmlFile, engine, numThreads, timeout=600):
+        """
+        :return: simulation speed in MCells/s, 0 if run failed
+        """
+        cmd = [openEMSExecutable, benchmarkXmlFile, f"--engine={engine}"]
+        if engine == 'multithreaded':
+            cmd.append(f"--numThreads={numThreads}")
+
+        print(f"Running benchmark: {' '.join(cmd)}")
+        startTime = time.time()
+        try:
+            result = subprocess.run(cmd, cwd=os.path.dirname(benchmarkXmlFile), capture_output=True, text=True, timeout=timeout)
+        except Exception as e:
+            print(f"{__file__} > runBenchmark() ERROR: {e}")
+            return 0
+        elapsedTime = time.time() - startTime
+
+        if result.returncode != 0:
+            print(f"{__file__} > runBenchmark() ERROR: openEMS returned {result.returncode}\n{result.stderr}")
+            return 0
+
+        #	openEMS prints speed at end of simulation ie. "Speed: 123.4 MCells/s (...)"
+        speedMatch = re.findall(r"Speed:\s*([0-9.eE+-]+)\s*MCells/s", result.stdout)
+        if len(speedMatch) > 0:
+            return float(speedMatch[-1])
+
+        print(f"{__file__} > runBenchmark() WARNING: speed not found in openEMS output, using inverse of run time")
+        return 1 / elapsedTime if elapsedTime > 0 else 0
+
+    def calibrate(self, openEMSExecutable, simulationXmlFile, timestepsCount=500, progressCallback=None):
+        """
+        Run benchmark for each engine and threads count, store fastest as profile of this machine.
+        :param openEMSExecutable: path to openEMS binary
+        :param simulationXmlFile: openEMS XML of current model
+        :param progressCallback: function(message) called before each run
+        :return: profile or None if all runs failed
+        """
+        configurations = [(engine, 1) for engine in self.engineList if engine != 'multithreaded']
+        configurations += [('multithreaded', numThreads) for numThreads in self.getThreadCounts()]
+
+        results = []
+        benchmarkDir = tempfile.mkdtemp(prefix="openEMS_benchmark_")
+        try:
+            benchmarkXmlFile = self.writeBenchmarkXml(simulationXmlFile, benchmarkDir, timestepsCount)
+            for engine, numThreads in configurations:
+                if progressCallback is not None:
+                    progressCallback(f"Benchmark engine {engine}, threads {numThreads} ...")
+                speed = self.runBenchmark(openEMSExecutable, benchmarkXmlFile, engine, numThreads)
+                results.append({'engine': engine, 'numThreads': numThreads, 'speed_MCps': speed})
+        finally:
+            shutil.rmtree(benchmarkDir, ignore_errors=True)
+
+        successfulResults = [result for result in results if result['speed_MCps'] > 0]
+        if len(successfulResults) == 0:
+            return None
+
+        best = max(successfulResults, key=lambda result: result['speed_MCps'])
+        profile = {
+            'engine': best['engine'],
+            'numThreads': best['numThreads'],
+            'speed_MCps': best['speed_MCps'],
+            'results': results,
+            'calibrated': time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.save(profile)
+        return profile
+
+    def getReportText(self, profile):
+        if profile is None:
+            return "There is no engine profile for this machine."
+
+        report = f"Best engine: {profile['engine']}, threads: {profile['numThreads']}, speed {profile['speed_MCps']:g} MCells/s\n"
+        for result in profile.get('results', []):
+            report += f"  {result['engine']:16s} threads {result['numThreads']:3d}: {result['speed_MCps']:g} MCells/s\n"
+        return report
@@ -0,0 +1,41 @@
+#
+#   LOGGING
+#
+#   All modules log into child loggers of "openEMSExport" logger. Default level is WARNING so per object messages in
+#   generators and settings load/save don't go into FreeCAD python console which is slow for large models. Level can be
+#   changed by environment variable OPENEMS_EXPORT_LOG_LEVEL (DEBUG, INFO, WARNING, ERROR) or by setLogLevel().
+#
+import os
+import sys
+import logging
+
+ROOT_LOGGER_NAME = "openEMSExport"
+LOG_LEVEL_ENV_VAR = "OPENEMS_EXPORT_LOG_LEVEL"
+
+def _initRootLogger():
+	rootLogger = logging.getLogger(ROOT_LOGGER_NAME)
+	if not rootLogger.handlers:
+		#	stdout is used as print() did before, FreeCAD redirects it into its report view
+		handler = logging.StreamHandler(sys.stdout)
+		handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+		rootLogger.addHandler(handler)
+		rootLogger.propagate = False
+		try:
+			rootLogger.setLevel(os.environ.get(LOG_LEVEL_ENV_VAR, "WARNING").upper())
+		except ValueError:
+			rootLogger.setLevel(logging.WARNING)
+	return rootLogger
+
+def getLogger(name):
+	"""
+	:param name: module name, usually __name__
+	:return: logger which is child of openEMSExport logger
+	"""
+	_initRootLogger()
+	return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name.split('.')[-1]}")
+
+def setLogLevel(level):
+	"""
+	:param level: logging level as number or name, ie. logging.DEBUG or "DEBUG"
+	"""
+	_initRootLogger().setLevel(level.upper() if isinstance(level, str) else level)
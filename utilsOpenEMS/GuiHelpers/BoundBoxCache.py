@@ -0,0 +1,100 @@
+#   author: Lubomir Jagos
+#
+#
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Cache of CAD objects bounding boxes, Shape.BoundBox is computed by CAD from shape every time it's accessed and
+#   generators, mesh tools and GUI helpers ask for same objects many times during one generation.
+#
+#   Boxes are kept by object name (unique in document), labels are mapped to names of cached objects so object doesn't
+#   have to be searched by label in document again. Cache is shared by all CAD interface instances (GUI helpers and
+#   generators create their own), it's enabled only when something invalidates it:
+#       - dialog in FreeCAD, document observer events object changed, recomputed and deleted invalidate object,
+#         document activated or deleted clears whole cache
+#       - batch generation, document doesn't change during generation, cache is cleared when document is closed
+#   When cache is disabled (Blender, no observer) boxes are read from objects every time.
+#
+#   Callers get copy of cached box, generators move box coordinates to port start and stop, that must not change cache.
+#
+class BoundBoxCache:
+
+    isEnabled = False
+    boundBoxes = {}     # object name -> bounding box
+    labelNames = {}     # object label -> object name, only for cached objects
+    nameLabels = {}     # object name -> object label, to remove label of invalidated object
+
+    @staticmethod
+    def enable():
+        BoundBoxCache.clear()
+        BoundBoxCache.isEnabled = True
+
+    @staticmethod
+    def disable():
+        BoundBoxCache.isEnabled = False
+        BoundBoxCache.clear()
+
+    @staticmethod
+    def getBoundBox(obj):
+        """
+        :param obj: CAD object with shape
+        :return: bounding box of object shape, cached if cache is enabled
+        """
+        if not BoundBoxCache.isEnabled:
+            return obj.Shape.BoundBox
+
+        boundBox = BoundBoxCache.boundBoxes.get(obj.Name)
+        if boundBox is None:
+            boundBox = obj.Shape.BoundBox
+            BoundBoxCache.boundBoxes[obj.Name] = boundBox
+            BoundBoxCache.labelNames[obj.Label] = obj.Name
+            BoundBoxCache.nameLabels[obj.Name] = obj.Label
+        return BoundBoxCache.copyBoundBox(boundBox)
+
+    @staticmethod
+    def copyBoundBox(boundBox):
+        """
+        :return: new box of same type, FreeCAD.BoundBox and MockBoundBox both take (XMin, YMin, ZMin, XMax, YMax, ZMax)
+        """
+        return type(boundBox)(boundBox.XMin, boundBox.YMin, boundBox.ZMin, boundBox.XMax, boundBox.YMax, boundBox.ZMax)
+
+    @staticmethod
+    def getBoundBoxByLabel(objLabel, cadHelpers):
+        """
+        :param cadHelpers: CAD interface used to find object if it's not cached yet
+        :return: bounding box of first object with label, None if there is no such object
+        """
+        if BoundBoxCache.isEnabled:
+            objName = BoundBoxCache.labelNames.get(objLabel)
+            if objName is not None:
+                return BoundBoxCache.copyBoundBox(BoundBoxCache.boundBoxes[objName])
+
+        freeCadObj = cadHelpers.getObjectsByLabel(objLabel)
+        if not freeCadObj:
+            return None
+        return BoundBoxCache.getBoundBox(freeCadObj[0])
+
+    @staticmethod
+    def invalidate(obj, *args):
+        """
+        Remove object from cache, signature fits observer events objectChanged(obj, prop), objectRecomputed(obj) and
+        objectDeleted(obj).
+        """
+        if BoundBoxCache.boundBoxes.pop(obj.Name, None) is None:
+            return
+        objLabel = BoundBoxCache.nameLabels.pop(obj.Name, None)
+        if BoundBoxCache.labelNames.get(objLabel) == obj.Name:
+            del BoundBoxCache.labelNames[objLabel]
+
+    @staticmethod
+    def clear(*args):
+        """
+        Remove all objects, signature fits observer document events.
+        """
+        if len(BoundBoxCache.boundBoxes) > 0:
+            logger.debug("bound box cache cleared, %s objects", len(BoundBoxCache.boundBoxes))
+        BoundBoxCache.boundBoxes = {}
+        BoundBoxCache.labelNames = {}
+        BoundBoxCache.nameLabels = {}
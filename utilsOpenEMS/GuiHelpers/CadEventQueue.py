@@ -0,0 +1,92 @@
+#   author: Lubomir Jagos
+#
+#
+from PySide import QtCore
+
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Object as it was when it was deleted, deleted CAD object cannot be accessed later when events are flushed.
+#
+class CadObjectSnapshot:
+    def __init__(self, obj):
+        self.Name = obj.Name
+        self.Label = obj.Label
+        self.FullName = obj.FullName
+
+#
+#   Queue of CAD document observer events (object created, renamed, deleted).
+#
+#   Events are not handled when observer sends them, they are collected per object and flushed by short timer, so bulk
+#   renames or recompute storm (ie. KiCAD import) are handled at once by one GUI update:
+#       - object renamed more times is renamed once to its current label
+#       - object created in burst is not renamed, it's listed with its current label
+#       - object deleted in burst is not renamed, object created and deleted in same burst is ignored
+#       - other property changes than Label are ignored
+#
+#   flushCallback(createdObjects, renamedObjects, deletedObjects) gets lists of objects, deleted objects are CadObjectSnapshot.
+#
+class CadEventQueue:
+
+    def __init__(self, flushCallback, delay=100):
+        """
+        :param delay: ms from first event of burst to flush
+        """
+        self.flushCallback = flushCallback
+        self.createdObjects = {}    # object name -> object
+        self.renamedObjects = {}    # object name -> object
+        self.deletedObjects = {}    # object name -> CadObjectSnapshot
+
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.flush)
+
+    def scheduleFlush(self):
+        # timer isn't restarted so continuous stream of events is still flushed regularly
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def objectCreated(self, obj):
+        self.createdObjects[obj.Name] = obj
+        self.scheduleFlush()
+
+    def objectChanged(self, obj, prop):
+        if prop != 'Label':
+            return
+        if not obj.Name in self.createdObjects:
+            self.renamedObjects[obj.Name] = obj
+            self.scheduleFlush()
+
+    def objectDeleted(self, obj):
+        self.renamedObjects.pop(obj.Name, None)
+        if self.createdObjects.pop(obj.Name, None) is None:
+            self.deletedObjects[obj.Name] = CadObjectSnapshot(obj)
+        self.scheduleFlush()
+
+    def flush(self):
+        self.timer.stop()
+        createdObjects = list(self.createdObjects.values())
+        renamedObjects = list(self.renamedObjects.values())
+        deletedObjects = list(self.deletedObjects.values())
+        self.clear()
+
+        if len(createdObjects) + len(renamedObjects) + len(deletedObjects) == 0:
+            return
+
+        logger.debug("CAD events flushed, created: %s, renamed: %s, deleted: %s", len(createdObjects), len(renamedObjects), len(deletedObjects))
+        self.flushCallback(createdObjects, renamedObjects, deletedObjects)
+
+    def stop(self):
+        """
+        Drop pending events, used when observation ends.
+        """
+        self.timer.stop()
+        self.clear()
+
+    def clear(self):
+        self.createdObjects = {}
+        self.renamedObjects = {}
+        self.deletedObjects = {}
@@ -3,6 +3,10 @@ import os
 
 import PySide.QtWidgets
 from PySide import QtGui, QtCore, QtWidgets, QtUiTools
+from utilsOpenEMS.GuiHelpers.BoundBoxCache import BoundBoxCache
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class CadInterface:
     def __init__(self, APP_DIR=""):
@@ -15,16 +19,16 @@ class CadInterface:
             import Draft
             self.type = "FreeCAD"
         except:
-            print("No FreeCAD interface available.")
+            logger.debug("No FreeCAD interface available.")
 
         try:
             import bpy
             self.type = "Blender"
         except:
-            print("No Blender interface available.")
+            logger.debug("No Blender interface available.")
 
         if self.type == "None":
-            print("No available FreeCAD or Blender interface found using default dummy one, PROGRAM WILL RUN DOING NOTHING.")
+            logger.debug("No available FreeCAD or Blender interface found using default dummy one, PROGRAM WILL RUN DOING NOTHING.")
             #raise Exception("No available FreeCAD or Blender interface found.")
 
         return
@@ -55,7 +59,7 @@ class CadInterface:
         child_count = root.childCount()
         itemList = []
         for i in range(child_count):
-            print('Copying tree widget item ' + root.child(i).data(0, QtCore.Qt.UserRole).getName())
+            logger.debug('Copying tree widget item %s', root.child(i).data(0, QtCore.Qt.UserRole).getName())
             item = root.child(i)
             itemList.append(item.data(0, QtCore.Qt.UserRole))
         return itemList
@@ -86,32 +90,52 @@ class CadInterface:
     def drawDraftCircle(self, lineName, centerPoint, radius):
         return None
 
+    def drawMeshPreview(self, previewName, levels, levelDistances):
+        logger.debug("%s > drawMeshPreview()", __file__)
+        return None
+
+    def removeMeshPreview(self, previewName):
+        logger.debug("%s > removeMeshPreview()", __file__)
+        return None
+
     # return x,y,z boundary box of model, going through all assigned objects into model and return boundary coordinates
     def getModelBoundaryBox(self, treeWidget):
         return None
 
+    def getObjectBoundBox(self, obj):
+        """
+        :return: bounding box of object shape, shared cache is used, see BoundBoxCache
+        """
+        return BoundBoxCache.getBoundBox(obj)
+
+    def getObjectBoundBoxByLabel(self, objLabel):
+        """
+        :return: bounding box of first object with label or None if there is no such object
+        """
+        return BoundBoxCache.getBoundBoxByLabel(objLabel, self)
+
     def getObjects(self):
-        print(f"{__file__} > getObjects()")
+        logger.debug("%s > getObjects()", __file__)
         return []
 
     def removeObject(self, objName):
-        print(f"{__file__} > removeObject()")
+        logger.debug("%s > removeObject()", __file__)
         return None
 
     def getCurrDocumentFileName(self):
-        print(f"{__file__} > getCurrDocumentFileName() > {os.path.join(self.APP_DIR, __file__)}")
+        logger.debug("%s > getCurrDocumentFileName() > %s", __file__, os.path.join(self.APP_DIR, __file__))
         return os.path.join(self.APP_DIR, __file__)
 
     def getObjectsByLabel(self, objLabel):
-        print(f"{__file__} > getObjectsByLabel()")
+        logger.debug("%s > getObjectsByLabel()", __file__)
         return None
 
     def getObjectById(self, objId):
-        print(f"{__file__} > getObjectById()")
+        logger.debug("%s > getObjectById()", __file__)
         return None
 
     def loadUI(self, path_to_ui, objParent):
-        print(f"{__file__} > loadUI() > Loading {path_to_ui}")
+        logger.debug("%s > loadUI() > Loading %s", __file__, path_to_ui)
         loader = QtUiTools.QUiLoader()
         uifile = QtCore.QFile(path_to_ui)
         uifile.open(QtCore.QFile.ReadOnly)
@@ -120,25 +144,29 @@ class CadInterface:
         return ui
 
     def printError(self, msg):
-        print(msg)
+        logger.error(msg)
 
     def printWarning(self, msg):
-        print(msg)
+        logger.warning(msg)
 
     def clearSelection(self):
-        print(f"{__file__} > clearSelection()")
+        logger.debug("%s > clearSelection()", __file__)
         return None
 
     def Vector(self,x,y,z):
-        print(f"{__file__} > Vector()")
+        logger.debug("%s > Vector()", __file__)
         return None
 
     def recompute(self):
-        print(f"{__file__} > recompute()")
+        logger.debug("%s > recompute()", __file__)
         return None
 
     def exportSTL(self, partToExport, exportFileName):
-        print(f"{__file__} > exportSTL()")
+        logger.debug("%s > exportSTL()", __file__)
+        return None
+
+    def exportSTEP(self, partToExport, exportFileName):
+        logger.debug("%s > exportSTEP()", __file__)
         return None
 
 if __name__ == "__main__":
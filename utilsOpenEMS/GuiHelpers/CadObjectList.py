@@ -0,0 +1,142 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import re
+
+from PySide import QtGui, QtCore, QtWidgets
+
+from utilsOpenEMS.SettingsItem.FreeCADSettingsItem import FreeCADSettingsItem
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   CAD objects list in left column of object assignment tab.
+#
+#   Each CAD object has one persistent tree item, items are added, removed and renamed when objects are created, deleted
+#   and renamed in CAD, list is not built again. Filter hides items which label doesn't match filter regular expression,
+#   pattern is compiled once per filter change. Icons are loaded once and shared by all items.
+#
+#   objectLabels is dictionary CAD object name -> label as it's displayed in GUI, used to find old label of renamed object.
+#   Items are created when list is synchronized first time (object assignment tab is shown), before that objects are only
+#   recorded in objectLabels, so renamed or deleted object is found in assignments by its label known to GUI.
+#
+class CadObjectList:
+
+    iconsCache = {}     # icon file name -> QIcon
+
+    def __init__(self, treeWidget, cadHelpers, APP_DIR=""):
+        self.treeWidget = treeWidget
+        self.cadHelpers = cadHelpers
+        self.APP_DIR = APP_DIR
+        self.objectItems = {}       # CAD object name -> tree item
+        self.objectLabels = {}
+        self.filterRegex = None
+        self.isPopulated = False
+
+    def getIcon(self, objectName):
+        if objectName.find("Sketch") > -1:
+            iconFileName = "wire.svg"
+        elif objectName.find("Discretized_Edge") > -1:
+            iconFileName = "curve.svg"
+        else:
+            iconFileName = "object.svg"
+
+        if not iconFileName in CadObjectList.iconsCache:
+            CadObjectList.iconsCache[iconFileName] = QtGui.QIcon(os.path.join(self.APP_DIR, "img", iconFileName))
+        return CadObjectList.iconsCache[iconFileName]
+
+    def isMatchingFilter(self, label):
+        return self.filterRegex is None or self.filterRegex.search(label) is not None
+
+    def setFilter(self, filterStr):
+        """
+        Hide items not matching filter, filter is regular expression, if it's not valid it's searched as plain text.
+        """
+        if len(filterStr) == 0:
+            self.filterRegex = None
+        else:
+            try:
+                self.filterRegex = re.compile(filterStr, re.IGNORECASE)
+            except re.error:
+                self.filterRegex = re.compile(re.escape(filterStr), re.IGNORECASE)
+
+        for objectName, treeItem in self.objectItems.items():
+            self.applyFilter(treeItem, self.objectLabels[objectName])
+
+    def applyFilter(self, treeItem, label):
+        isHidden = not self.isMatchingFilter(label)
+        if isHidden and treeItem.isSelected():
+            treeItem.setSelected(False)     # hidden objects must not be assigned by >> button
+        treeItem.setHidden(isHidden)
+
+    def addObjects(self, objects):
+        """
+        Add items for objects which are not in list yet, they are appended at end as CAD lists new objects at end.
+        Before list is populated only their labels are recorded.
+        """
+        if not self.isPopulated:
+            for obj in objects:
+                self.objectLabels.setdefault(obj.Name, obj.Label)
+            return
+
+        newItems = []
+        for obj in objects:
+            if obj.Name in self.objectItems:
+                continue
+            # ADDING ITEMS with UserData object which store them in intelligent way
+            treeItem = QtWidgets.QTreeWidgetItem([obj.Label])
+            treeItem.setData(0, QtCore.Qt.UserRole, FreeCADSettingsItem(name = obj.Label, freeCadId = obj.Name))
+            treeItem.setIcon(0, self.getIcon(obj.Name))
+            self.objectItems[obj.Name] = treeItem
+            self.objectLabels[obj.Name] = obj.Label        # add object label into list for case when label change to update all object labels in GUI
+            newItems.append(treeItem)
+
+        self.treeWidget.addTopLevelItems(newItems)
+        for treeItem in newItems:
+            self.applyFilter(treeItem, treeItem.text(0))
+
+    def addObject(self, obj):
+        self.addObjects([obj])
+
+    def removeObject(self, objectName):
+        treeItem = self.objectItems.pop(objectName, None)
+        self.objectLabels.pop(objectName, None)
+        if treeItem is not None:
+            self.treeWidget.invisibleRootItem().removeChild(treeItem)
+
+    def renameObject(self, objectName, newLabel):
+        if objectName in self.objectLabels:
+            self.objectLabels[objectName] = newLabel
+        treeItem = self.objectItems.get(objectName)
+        if treeItem is None:
+            return
+        treeItem.setText(0, newLabel)
+        treeItem.setData(0, QtCore.Qt.UserRole, FreeCADSettingsItem(name = newLabel, freeCadId = objectName))
+        self.applyFilter(treeItem, newLabel)
+
+    def recordLabels(self):
+        """
+        Record labels of all CAD objects without creating items, used when CAD events are observed before list is populated.
+        """
+        self.addObjects(self.cadHelpers.getOpenEMSObjects())
+
+    def sync(self):
+        """
+        Synchronize list with all CAD objects, used when changes are not known (Blender, start of dialog). Existing items
+        are kept.
+        """
+        objects = self.cadHelpers.getOpenEMSObjects()
+        self.isPopulated = True
+
+        currentNames = set()
+        for obj in objects:
+            currentNames.add(obj.Name)
+            if obj.Name in self.objectLabels and self.objectLabels[obj.Name] != obj.Label:
+                self.renameObject(obj.Name, obj.Label)
+
+        for objectName in [objectName for objectName in self.objectLabels.keys() if not objectName in currentNames]:
+            self.removeObject(objectName)
+
+        self.addObjects(objects)
@@ -2,8 +2,21 @@ from utilsOpenEMS.GuiHelpers.CadInterface import CadInterface
 
 class FactoryCadInterface:
 
+    #   interface returned instead of real CAD one, used by tests and benchmarks, see MockCadInterface
+    mockInterface = None
+
+    @staticmethod
+    def registerMockInterface(mockInterface):
+        """
+        Register interface returned by all following createHelper() calls, None restores CAD detection.
+        """
+        FactoryCadInterface.mockInterface = mockInterface
+
     @staticmethod
     def createHelper(APP_DIR = ""):
+        if FactoryCadInterface.mockInterface is not None:
+            return FactoryCadInterface.mockInterface
+
         interfaceInstance = CadInterface()
         if interfaceInstance.type == "FreeCAD":
             from  utilsOpenEMS.GuiHelpers.FreeCADHelpers import FreeCADHelpers
@@ -13,4 +26,4 @@ class FactoryCadInterface:
             return BlenderHelpers(APP_DIR)
         else:
             return CadInterface(APP_DIR)
-            #raise Exception("Cannot recognize CAD interface nor FreeCAD or Blender.")
\ No newline at end of file
+            #raise Exception("Cannot recognize CAD interface nor FreeCAD or Blender.")
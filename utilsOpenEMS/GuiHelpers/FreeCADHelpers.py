@@ -1,11 +1,14 @@
 from utilsOpenEMS.GuiHelpers.CadInterface import CadInterface
+from utilsOpenEMS.GuiHelpers.ObjectAssignmentIndex import ObjectAssignmentIndex
 
-from PySide import QtCore
 import FreeCAD
 import FreeCADGui
 import Draft
 import Mesh
 import os
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class FreeCADHelpers(CadInterface):
 
@@ -45,23 +48,66 @@ class FreeCADHelpers(CadInterface):
         circle.Label = lineName
         Draft.autogroup(circle)
 
+    #
+    #	Draw mesh preview directly into 3D view scenegraph, no document objects are created so it's fast also for big meshes.
+    #		levels - list of levels of detail from most detailed, each is dictionary {'segments': [(p1, p2), ...], 'colors': [(r,g,b), ...]}
+    #		levelDistances - camera distances where next less detailed level is displayed
+    #
+    def drawMeshPreview(self, previewName, levels, levelDistances):
+        from pivy import coin
+
+        self.removeMeshPreview(previewName)
+        if len(levels) == 0:
+            return
+
+        lod = coin.SoLOD()
+        lod.range.setValues(0, len(levelDistances), levelDistances)
+        for level in levels:
+            levelNode = coin.SoSeparator()
+
+            material = coin.SoMaterial()
+            material.diffuseColor.setValues(0, len(level['colors']), level['colors'])
+            materialBinding = coin.SoMaterialBinding()
+            materialBinding.value = coin.SoMaterialBinding.PER_PART
+
+            coords = coin.SoCoordinate3()
+            points = [point for segment in level['segments'] for point in segment]
+            coords.point.setValues(0, len(points), points)
+
+            lineSet = coin.SoLineSet()
+            lineSet.numVertices.setValues(0, len(level['segments']), [2] * len(level['segments']))
+
+            levelNode.addChild(material)
+            levelNode.addChild(materialBinding)
+            levelNode.addChild(coords)
+            levelNode.addChild(lineSet)
+            lod.addChild(levelNode)
+
+        previewNode = coin.SoSeparator()
+        previewNode.setName(previewName)
+        lightModel = coin.SoLightModel()
+        lightModel.model = coin.SoLightModel.BASE_COLOR
+        previewNode.addChild(lightModel)
+        previewNode.addChild(lod)
+
+        FreeCADGui.ActiveDocument.ActiveView.getSceneGraph().addChild(previewNode)
+        if not hasattr(self, "meshPreviewNodes"):
+            self.meshPreviewNodes = {}
+        self.meshPreviewNodes[previewName] = previewNode
+
+    def removeMeshPreview(self, previewName):
+        if not hasattr(self, "meshPreviewNodes") or not previewName in self.meshPreviewNodes.keys():
+            return
+        try:
+            FreeCADGui.ActiveDocument.ActiveView.getSceneGraph().removeChild(self.meshPreviewNodes[previewName])
+        except Exception as e:
+            logger.debug("removeMeshPreview: cannot remove %s from 3D view, %s", previewName, e)
+        del self.meshPreviewNodes[previewName]
+
     # return x,y,z boundary box of model, going through all assigned objects into model and return boundary coordinates
     def getModelBoundaryBox(self, treeWidget):
-        root = treeWidget.invisibleRootItem()
-        child_count = root.childCount()
-        itemList = []
-
-        # iterate over whole objects assignments treeview and get just material or grid freecad objects because they are just one which are meshed
-        for i in range(child_count):
-            if (root.child(i).text(0) == "Material" or root.child(i).text(0) == "Grid"):
-                child_count2 = root.child(i).childCount()
-                for j in range(child_count2):
-                    child_count3 = root.child(i).child(j).childCount()
-                    for k in range(child_count3):
-                        print(root.child(i).child(j).child(k).data(0, QtCore.Qt.UserRole).getName())
-                        freeCadObjName = root.child(i).child(j).child(k).data(0, QtCore.Qt.UserRole).getName()
-                        freeCadObj = FreeCAD.ActiveDocument.getObjectsByLabel(freeCadObjName)
-                        itemList.append(freeCadObj)
+        # just material or grid freecad objects are meshed, their labels are taken from assignment tree index, boxes are cached
+        objectLabels = ObjectAssignmentIndex.getIndex(treeWidget).getMembershipsIndex(["Material", "Grid"]).keys()
 
         # values initialization, for minimal values must have be init to big numbers to be sure they will be overwritten, for max values have to put their small numbers to be sure to be overwritten
         minX = 9999
@@ -70,21 +116,16 @@ class FreeCADHelpers(CadInterface):
         maxX = -9999
         maxY = -9999
         maxZ = -9999
-        for i in range(len(itemList)):
-            print(itemList[i][0].Shape.BoundBox)
-            bBox = itemList[i][0].Shape.BoundBox
-            if (bBox.XMin < minX):
-                minX = bBox.XMin
-            if (bBox.YMin < minY):
-                minY = bBox.YMin
-            if (bBox.ZMin < minZ):
-                minZ = bBox.ZMin
-            if (bBox.XMax > maxX):
-                maxX = bBox.XMax
-            if (bBox.YMax > maxY):
-                maxY = bBox.YMax
-            if (bBox.ZMax > maxZ):
-                maxZ = bBox.ZMax
+        for objectLabel in objectLabels:
+            bBox = self.getObjectBoundBoxByLabel(objectLabel)
+            if bBox is None:
+                continue
+            minX = min(minX, bBox.XMin)
+            minY = min(minY, bBox.YMin)
+            minZ = min(minZ, bBox.ZMin)
+            maxX = max(maxX, bBox.XMax)
+            maxY = max(maxY, bBox.YMax)
+            maxZ = max(maxZ, bBox.ZMax)
 
         return minX, minY, minZ, maxX, maxY, maxZ
 
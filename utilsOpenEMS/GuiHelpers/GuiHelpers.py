@@ -1,16 +1,49 @@
 from PySide import QtGui, QtCore, QtWidgets
 import re
 import os
+from contextlib import contextmanager
 from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r
+from utilsOpenEMS.GuiHelpers.ObjectAssignmentIndex import ObjectAssignmentIndex
+from utilsOpenEMS.GuiHelpers.PriorityListIndex import PriorityListIndex
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class GuiHelpers:
+
+    #   batch generation runs without user, messages are logged instead of displayed and yes/no questions are answered no
+    isHeadless = False
+
     def __init__(self, form, statusBar = None, APP_DIR=""):
         self.APP_DIR = APP_DIR
         self.form = form
         self.statusBar = statusBar
 
+    def getObjectAssignmentIndex(self):
+        """
+        :return: ObjectAssignmentIndex of object assignment tree, it's shared by all helpers of form
+        """
+        return ObjectAssignmentIndex.getIndex(self.form.objectAssignmentRightTreeWidget)
+
+    def getObjectPriorityIndex(self):
+        """
+        :return: PriorityListIndex of object priority list
+        """
+        return PriorityListIndex.getIndex(self.form.objectAssignmentPriorityTreeView)
+
+    def getMeshPriorityIndex(self):
+        """
+        :return: PriorityListIndex of mesh priority list
+        """
+        return PriorityListIndex.getIndex(self.form.meshPriorityTreeView)
+
     def displayMessage(self, msgText, forceModal=True):
-        if (not forceModal) and (self.statusBar is not None):
+        if GuiHelpers.isHeadless:
+            if forceModal:
+                logger.warning(msgText)
+            else:
+                logger.info(msgText)
+        elif (not forceModal) and (self.statusBar is not None):
             self.statusBar.showMessage(msgText, 5000)
         else:
             msgBox = QtWidgets.QMessageBox()
@@ -21,6 +54,10 @@ class GuiHelpers:
     #   Display messagebox wit Save/Cancel buttons and after user choice return True/False
     #
     def displayYesNoMessage(self, msgText):
+        if GuiHelpers.isHeadless:
+            logger.warning(f"{msgText} -> answered no")
+            return False
+
         msgBox = QtWidgets.QMessageBox()
         msgBox.setText(msgText)
         #msgBox.setInformativeText("Do you want to save your changes?")
@@ -90,27 +127,22 @@ class GuiHelpers:
             comboBox.setCurrentIndex(index)
 
     def removeAllMeshPriorityItems(self):
-        print("START REMOVING MESH PRIORITY WIDGET ITEMS")
-        print("ITEM TO REMOVE: " + str(self.form.meshPriorityTreeView.invisibleRootItem().childCount()))
-
-        priorityItemsCount = self.form.meshPriorityTreeView.topLevelItemCount()
-        for k in reversed(range(priorityItemsCount)):
-            print("REMOVING ITEM " + self.form.meshPriorityTreeView.takeTopLevelItem(k).text(0))
-            self.form.meshPriorityTreeView.takeTopLevelItem(k)
-
+        logger.debug("REMOVING MESH PRIORITY WIDGET ITEMS: %s", self.form.meshPriorityTreeView.topLevelItemCount())
+        self.getMeshPriorityIndex().clear()
 
     def updateMeshPriorityDisableItems(self):
-        itemsCount = self.form.meshPriorityTreeView.topLevelItemCount()
-        for k in range(itemsCount):
-            priorityItem = self.form.meshPriorityTreeView.topLevelItem(k)
-            itemNameFields = priorityItem.text(0).split(',')
-            gridParent = self.form.objectAssignmentRightTreeWidget.findItems(itemNameFields[1].strip(),
-                                                                             QtCore.Qt.MatchRecursive)
-            if len(gridParent) > 0:
-                if not _bool(gridParent[0].data(0, QtCore.Qt.UserRole).topPriorityLines):
-                    self.form.meshPriorityTreeView.topLevelItem(k).setBackground(0, QtGui.QColor('white'))
-                else:
-                    self.form.meshPriorityTreeView.topLevelItem(k).setBackground(0, QtGui.QColor('lightgray'))
+        meshPriorityIndex = self.getMeshPriorityIndex()
+        priorityItems = [(key, meshPriorityIndex.getItem(key)) for key in meshPriorityIndex.getKeys()]
+
+        # background doesn't change keys so index stays valid
+        with meshPriorityIndex.ownChanges():
+            for (categoryName, gridName, objectLabel), priorityItem in priorityItems:
+                gridParent = self.getObjectAssignmentIndex().getGroupItem("Grid", gridName)
+                if gridParent is not None:
+                    if not _bool(gridParent.data(0, QtCore.Qt.UserRole).topPriorityLines):
+                        priorityItem.setBackground(0, QtGui.QColor('white'))
+                    else:
+                        priorityItem.setBackground(0, QtGui.QColor('lightgray'))
 
         """
         # If grid item is set to have priority lines it means it should be highlighted in mesh priority widget
@@ -127,7 +159,11 @@ class GuiHelpers:
     #
     # Universal function to add items into categories in GUI.
     #
-    def addSettingsItemGui(self, settingsItem):
+    def createSettingsTreeItem(self, settingsItem):
+        """
+        Create tree item for settings item and find settings list where it belongs.
+        :return: tuple (tree item, settings tree widget, category name) or None if settings item type is not known
+        """
         treeItemName = settingsItem.name
         treeItem = QtWidgets.QTreeWidgetItem([treeItemName])
 
@@ -139,7 +175,6 @@ class GuiHelpers:
 
         # add item into excitation list
         treeWidgetRef = {}
-        itemChangedRef = {}
         if (typeStr.lower() == "excitation"):
             treeWidgetRef = self.form.excitationSettingsTreeView
         elif (typeStr.lower() == "port"):
@@ -155,8 +190,16 @@ class GuiHelpers:
         elif (typeStr.lower() == "boundarycondition"):
             treeWidgetRef = self.form.boundaryConditionSettingsTreeView
         else:
-            print('cannot assign item ' + typeStr)
+            logger.debug("cannot assign item %s", typeStr)
+            return None
+
+        return treeItem, treeWidgetRef, typeStr
+
+    def addSettingsItemGui(self, settingsItem):
+        createdItem = self.createSettingsTreeItem(settingsItem)
+        if createdItem is None:
             return
+        treeItem, treeWidgetRef, typeStr = createdItem
 
         treeWidgetRef.insertTopLevelItem(0, treeItem)
         treeWidgetRef.setCurrentItem(treeWidgetRef.topLevelItem(0))
@@ -165,33 +208,79 @@ class GuiHelpers:
         targetGroup = self.form.objectAssignmentRightTreeWidget.findItems(typeStr, QtCore.Qt.MatchExactly)
         targetGroup[0].addChild(treeItem.clone())
 
+    def addSettingsItemsGui(self, settingsItems):
+        """
+        Add list of settings items, result is same as calling addSettingsItemGui() for each of them in order (last added
+        is on top of its settings list and is current) but each tree widget is changed once by insertTopLevelItems()
+        and addChildren().
+        """
+        newItemsByType = {}     # category name -> (settings tree widget, [tree items in order of adding])
+        for settingsItem in settingsItems:
+            createdItem = self.createSettingsTreeItem(settingsItem)
+            if createdItem is None:
+                continue
+            treeItem, treeWidgetRef, typeStr = createdItem
+            newItemsByType.setdefault(typeStr, (treeWidgetRef, []))[1].append(treeItem)
+
+        for typeStr, (treeWidgetRef, treeItems) in newItemsByType.items():
+            # addSettingsItemGui() inserts each item at top, so list ends in reversed order
+            treeWidgetRef.insertTopLevelItems(0, list(reversed(treeItems)))
+            treeWidgetRef.setCurrentItem(treeWidgetRef.topLevelItem(0))
+
+            targetGroup = self.form.objectAssignmentRightTreeWidget.findItems(typeStr, QtCore.Qt.MatchExactly)
+            targetGroup[0].addChildren([treeItem.clone() for treeItem in treeItems])
+
+    def getSettingsTreeWidgets(self):
+        """
+        :return: all tree widgets which contain settings, assignments and priorities
+        """
+        return [
+            self.form.objectAssignmentRightTreeWidget,
+            self.form.objectAssignmentPriorityTreeView,
+            self.form.meshPriorityTreeView,
+            self.form.gridSettingsTreeView,
+            self.form.materialSettingsTreeView,
+            self.form.excitationSettingsTreeView,
+            self.form.portSettingsTreeView,
+            self.form.probeSettingsTreeView,
+            self.form.lumpedPartTreeView,
+            self.form.boundaryConditionSettingsTreeView,
+        ]
+
+    @contextmanager
+    def suspendedUpdates(self, widgets):
+        """
+        Turn off repainting and signals of widgets while they are changed in bulk, original state is restored at the end.
+        Use as: with guiHelpers.suspendedUpdates(widgets): ...
+        """
+        wereSignalsBlocked = [widget.blockSignals(True) for widget in widgets]
+        for widget in widgets:
+            widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for widget, wasBlocked in zip(widgets, wereSignalsBlocked):
+                widget.blockSignals(wasBlocked)
+                widget.setUpdatesEnabled(True)
+
     ###
     #	Removing from Priority List
     ###
-    def removePriorityName(self, priorityName):
-        print("Removing from objects priority list tree view:" + priorityName)
-        priorityItemRemoved = True
-        while priorityItemRemoved:
-            priorityItemRemoved = False
-
-            # search item in priority list for OBJECTS
-            priorityItemsCount = self.form.objectAssignmentPriorityTreeView.topLevelItemCount()
-            for k in range(priorityItemsCount):
-                priorityItem = self.form.objectAssignmentPriorityTreeView.topLevelItem(k)
-                if priorityName in priorityItem.text(0):
-                    self.form.objectAssignmentPriorityTreeView.takeTopLevelItem(k)
-                    priorityItemRemoved = True
-                    break
-
-            # search item also in priority list for MESH
-            if not priorityItemRemoved:
-                priorityItemsCount = self.form.meshPriorityTreeView.topLevelItemCount()
-                for k in range(priorityItemsCount):
-                    priorityItem = self.form.meshPriorityTreeView.topLevelItem(k)
-                    if priorityName in priorityItem.text(0):
-                        self.form.meshPriorityTreeView.takeTopLevelItem(k)
-                        priorityItemRemoved = True
-                        break
+    def removePriorityGroup(self, categoryName, groupName):
+        """
+        Remove all objects of settings item from object and mesh priority list, used when settings item is removed.
+        """
+        logger.debug("Removing from priority lists: %s, %s", categoryName, groupName)
+        self.getObjectPriorityIndex().removeGroup(categoryName, groupName)
+        self.getMeshPriorityIndex().removeGroup(categoryName, groupName)
+
+    def removePriorityObject(self, objectLabel):
+        """
+        Remove object from object and mesh priority list in all groups.
+        """
+        logger.debug("Removing from priority lists: %s", objectLabel)
+        self.getObjectPriorityIndex().removeObject(objectLabel)
+        self.getMeshPriorityIndex().removeObject(objectLabel)
 
     def portSpecificSettingsTabSetActiveByName(self, tabName):
         """
@@ -215,7 +304,7 @@ class GuiHelpers:
         index = controlRef.findText(text, QtCore.Qt.MatchFixedString)
         if index >= 0:
             controlRef.setCurrentIndex(index)
-            print(f"setComboboxItem for {controlRef} to value {text} at index {index}")
+            logger.debug("setComboboxItem for %s to value %s at index %s", controlRef, text, index)
         else:
             if (alternativeEquivalentValues != None):
                 #
@@ -223,17 +312,17 @@ class GuiHelpers:
                 #
                 for alternativeValueTuple in alternativeEquivalentValues:
                     if (alternativeValueTuple[0] == text):
-                        print(f"WARNING: For {controlRef} instead {text} trying to use alternative equivalent value {alternativeValueTuple[1]}")
+                        logger.warning(f"WARNING: For {controlRef} instead {text} trying to use alternative equivalent value {alternativeValueTuple[1]}")
                         self.setComboboxItem(controlRef, alternativeValueTuple[1])
                     elif (alternativeValueTuple[1] == text):
-                        print(f"WARNING: For {controlRef} instead {text} trying to use alternative equivalent value {alternativeValueTuple[0]}")
+                        logger.warning(f"WARNING: For {controlRef} instead {text} trying to use alternative equivalent value {alternativeValueTuple[0]}")
                         self.setComboboxItem(controlRef, alternativeValueTuple[0])
                 return
             else:
-                print(f"WARNING: Cannot set for {controlRef} item {text}, wasn't found in items.")
+                logger.warning(f"WARNING: Cannot set for {controlRef} item {text}, wasn't found in items.")
                 return
 
-            print(f"WARNING: Cannot set for {controlRef} item {text}, alternative value was not found.")
+            logger.warning(f"WARNING: Cannot set for {controlRef} item {text}, alternative value was not found.")
 
     def hasPortSomeObjects(self, portName):
         """
@@ -243,38 +332,17 @@ class GuiHelpers:
         """
         hasPortSomeObjects = False
 
-        itemWithSameName = self.form.objectAssignmentRightTreeWidget.findItems(portName, QtCore.Qt.MatchFixedString | QtCore.Qt.MatchRecursive)
-        for item in itemWithSameName:
-            #test if it's under Port category, so look if parent().parent() is None as it's top level item and then if parent is Port item category
-            if (item.parent().parent() == None and item.parent().text(0) == "Port"):
-                if (item.childCount() > 0):
-                    hasPortSomeObjects = True
+        for item in self.getObjectAssignmentIndex().getGroupItems("Port", portName):
+            if (item.childCount() > 0):
+                hasPortSomeObjects = True
 
         return hasPortSomeObjects
 
     def getGridGroupObjectAssignmentTreeItem(self, groupName):
-        gridGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-            groupName,
-            QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-        )
-        gridGroupItem = None
-        for item in gridGroupWidgetItems:
-            if (item.parent().text(0) == "Grid"):
-                gridGroupItem = item
-
-        return gridGroupItem
+        return self.getObjectAssignmentIndex().getGroupItem("Grid", groupName)
 
     def getMaterialGroupObjectAssignmentTreeItem(self, materialName):
-        gridGroupWidgetItems = self.form.objectAssignmentRightTreeWidget.findItems(
-            materialName,
-            QtCore.Qt.MatchExactly | QtCore.Qt.MatchFlag.MatchRecursive
-        )
-        materialGroupItem = None
-        for item in gridGroupWidgetItems:
-            if (item.parent().text(0) == "Material"):
-                materialGroupItem = item
-
-        return materialGroupItem
+        return self.getObjectAssignmentIndex().getGroupItem("Material", materialName)
 
     def setVisibleTreeWidgetItem(self, treeWidgetRef, search_text, isVisible):
         for i in range(treeWidgetRef.topLevelItemCount()):
@@ -283,16 +351,4 @@ class GuiHelpers:
                 item.setHidden(not isVisible)
 
     def getAllItemsFromAssignmentTree(self, excludeCategoriesList: list[str] = []) -> list[tuple[str, str, str]]:
-        allItemList:list[tuple[str, str, str]] = []
-
-        for k in range(self.form.objectAssignmentRightTreeWidget.topLevelItemCount()):
-            categoryItem = self.form.objectAssignmentRightTreeWidget.topLevelItem(k)
-            if categoryItem.text(0) in excludeCategoriesList:
-                continue
-            for m in range(categoryItem.childCount()):
-                groupItem = categoryItem.child(m)
-                for n in range(groupItem.childCount()):
-                    objectItem = groupItem.child(n)
-                    allItemList.append((categoryItem.text(0), groupItem.text(0), objectItem.text(0)))
-
-        return allItemList
+        return self.getObjectAssignmentIndex().getAllObjects(excludeCategoriesList)
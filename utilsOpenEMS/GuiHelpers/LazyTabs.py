@@ -0,0 +1,51 @@
+#   author: Lubomir Jagos
+#
+#
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Deferred population of tab widget pages.
+#
+#   Initializers registered for tab page are not called when dialog is created, they are called once when page is
+#   shown first time (it becomes current tab) so dialog opens without filling tabs which user may never open. Code which
+#   needs data of page before it's shown calls ensurePopulated(page). Updates of page content which would be done again
+#   by initializer (ie. comboboxes refreshed when materials change) are skipped while isPopulated(page) is False.
+#
+class LazyTabs:
+
+    def __init__(self, tabWidget):
+        self.tabWidget = tabWidget
+        self.pendingInitializers = {}       # tab page -> list of functions without arguments
+        self.populatedTabs = set()
+        self.tabWidget.currentChanged.connect(self.tabChanged)
+
+    def addInitializer(self, tabPage, callback):
+        initializers = self.pendingInitializers.setdefault(tabPage, [])
+        if callback not in initializers:
+            initializers.append(callback)
+
+    def isPopulated(self, tabPage):
+        return tabPage in self.populatedTabs
+
+    def tabChanged(self, index):
+        self.ensurePopulated(self.tabWidget.widget(index))
+
+    def populateCurrent(self):
+        """
+        Populate tab which is displayed when dialog is opened, currentChanged isn't emitted for it.
+        """
+        self.ensurePopulated(self.tabWidget.currentWidget())
+
+    def ensurePopulated(self, tabPage):
+        self.populatedTabs.add(tabPage)
+        initializers = self.pendingInitializers.pop(tabPage, [])
+        if len(initializers) > 0:
+            logger.debug("populating tab %s", tabPage.objectName())
+        for callback in initializers:
+            callback()
+
+    def populateAll(self):
+        for tabPage in list(self.pendingInitializers.keys()):
+            self.ensurePopulated(tabPage)
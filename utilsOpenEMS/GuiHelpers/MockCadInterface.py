@@ -0,0 +1,271 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+
+from utilsOpenEMS.GuiHelpers.CadInterface import CadInterface
+from utilsOpenEMS.GuiHelpers.BoundBoxCache import BoundBoxCache
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Headless CAD interface for tests and benchmarks, objects are kept in memory and have just attributes which are used by
+#   script generators (Label, Name, Shape.BoundBox, Shape.OrderedVertexes, Points). STL and STEP export writes placeholder
+#   file with box of object, when isGeometryExportEnabled is False nothing is written and file name is put in skippedExports.
+#
+#   Register instance by FactoryCadInterface.registerMockInterface() before generators are created, then every
+#   FactoryCadInterface.createHelper() call returns it.
+#
+#   For batch generation without FreeCAD objects can be read from .FCStd file by loadFCStd(), Part::Box and Part::Cylinder
+#   get axis aligned boxes computed from placement and dimensions. Other objects and rotated objects can't be represented,
+#   they are listed in unsupportedObjects (label -> reason) so caller can refuse to use them.
+#
+class MockBoundBox:
+    def __init__(self, XMin=0.0, YMin=0.0, ZMin=0.0, XMax=0.0, YMax=0.0, ZMax=0.0):
+        self.XMin = XMin
+        self.YMin = YMin
+        self.ZMin = ZMin
+        self.XMax = XMax
+        self.YMax = YMax
+        self.ZMax = ZMax
+
+    @property
+    def XLength(self):
+        return self.XMax - self.XMin
+
+    @property
+    def YLength(self):
+        return self.YMax - self.YMin
+
+    @property
+    def ZLength(self):
+        return self.ZMax - self.ZMin
+
+    def __repr__(self):
+        return f"BoundBox ({self.XMin}, {self.YMin}, {self.ZMin}, {self.XMax}, {self.YMax}, {self.ZMax})"
+
+class MockVector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    #   FreeCAD vertex has X, Y, Z and vector has x, y, z, mock has both
+    @property
+    def X(self):
+        return self.x
+
+    @property
+    def Y(self):
+        return self.y
+
+    @property
+    def Z(self):
+        return self.z
+
+class MockShape:
+    def __init__(self, boundBox, vertexes=None):
+        self.BoundBox = boundBox
+        self.OrderedVertexes = [] if vertexes is None else vertexes
+        self.Faces = []
+
+        self.Volume = boundBox.XLength * boundBox.YLength * boundBox.ZLength
+        self.Area = 2 * (boundBox.XLength * boundBox.YLength + boundBox.XLength * boundBox.ZLength + boundBox.YLength * boundBox.ZLength)
+        self.CenterOfMass = MockVector((boundBox.XMin + boundBox.XMax) / 2, (boundBox.YMin + boundBox.YMax) / 2, (boundBox.ZMin + boundBox.ZMax) / 2)
+
+class MockObject:
+    def __init__(self, label, name, shape, points=None):
+        self.Label = label
+        self.Name = name
+        self.Shape = shape
+        self.Points = [] if points is None else points
+        self.OpenVertices = []
+
+class MockCadInterface(CadInterface):
+
+    def __init__(self, APP_DIR="", documentFileName=None):
+        """
+        :param documentFileName: path of fake CAD document, generated files are placed next to it, by default in temp dir
+        """
+        self.type = "Mock"
+        self.APP_DIR = APP_DIR
+        self.objects = []
+        self.objectsByLabel = {}
+        self.exportedFilesCount = 0
+        self.isGeometryExportEnabled = True
+        self.skippedExports = []
+        self.unsupportedObjects = {}
+
+        if documentFileName is None:
+            documentFileName = os.path.join(tempfile.mkdtemp(prefix="openEMS_mock_"), "mock_model.FCStd")
+        self.documentFileName = documentFileName
+
+    def addBox(self, label, XMin, YMin, ZMin, XMax, YMax, ZMax):
+        """
+        Add box object into mock document.
+        :return: created object
+        """
+        obj = MockObject(label, f"Box{len(self.objects):05d}", MockShape(MockBoundBox(XMin, YMin, ZMin, XMax, YMax, ZMax)))
+        self.objects.append(obj)
+        self.objectsByLabel.setdefault(label, []).append(obj)
+        return obj
+
+    def addCurve(self, label, points):
+        """
+        Add discretized edge object with given points [(x, y, z), ...] into mock document.
+        :return: created object
+        """
+        vectors = [MockVector(*point) for point in points]
+        boundBox = MockBoundBox(
+            min([v.x for v in vectors]), min([v.y for v in vectors]), min([v.z for v in vectors]),
+            max([v.x for v in vectors]), max([v.y for v in vectors]), max([v.z for v in vectors])
+        )
+        obj = MockObject(label, f"Discretized_Edge{len(self.objects):05d}", MockShape(boundBox, vertexes=vectors), points=vectors)
+        self.objects.append(obj)
+        self.objectsByLabel.setdefault(label, []).append(obj)
+        return obj
+
+    def clear(self):
+        self.objects = []
+        self.objectsByLabel = {}
+        self.unsupportedObjects = {}
+        BoundBoxCache.clear()      # names of new objects are reused
+
+    def loadFCStd(self, fileName):
+        """
+        Replace objects by objects from FreeCAD document, its Document.xml is read so FreeCAD is not needed.
+        Part::Box and Part::Cylinder get their bounding box, other objects are zero size box at their placement and they
+        are put into unsupportedObjects same as rotated objects.
+        :param fileName: .FCStd file
+        :return: number of loaded objects
+        """
+        self.clear()
+        self.documentFileName = fileName
+
+        with zipfile.ZipFile(fileName) as fcstdFile:
+            documentXml = ET.fromstring(fcstdFile.read("Document.xml"))
+
+        objectTypes = {}
+        for objectElement in documentXml.iter("Objects"):
+            for obj in objectElement.findall("Object"):
+                objectTypes[obj.get("name")] = obj.get("type", "")
+
+        objectDataElement = documentXml.find("ObjectData")
+        if objectDataElement is None:
+            return 0
+
+        for obj in objectDataElement.findall("Object"):
+            name = obj.get("name")
+            properties = {}
+            for prop in obj.iter("Property"):
+                valueElement = prop[0] if len(prop) > 0 else None
+                if valueElement is not None:
+                    properties[prop.get("name")] = valueElement
+
+            label = properties["Label"].get("value") if "Label" in properties else name
+            position = [0.0, 0.0, 0.0]
+            isRotated = False
+            if "Placement" in properties:
+                position = [float(properties["Placement"].get(axis, 0.0)) for axis in ["Px", "Py", "Pz"]]
+                #   rotation is quaternion Q0..Q2 vector part, Q3 scalar part
+                isRotated = any(abs(float(properties["Placement"].get(axis, 0.0))) > 1e-12 for axis in ["Q0", "Q1", "Q2"])
+
+            def getFloat(propName):
+                return float(properties[propName].get("value", 0.0)) if propName in properties else 0.0
+
+            objectType = objectTypes.get(name, "")
+            if objectType == "Part::Box":
+                size = [getFloat("Length"), getFloat("Width"), getFloat("Height")]
+                boundBox = MockBoundBox(*position, *[position[k] + size[k] for k in range(3)])
+            elif objectType == "Part::Cylinder":
+                radius = getFloat("Radius")
+                boundBox = MockBoundBox(position[0] - radius, position[1] - radius, position[2], position[0] + radius, position[1] + radius, position[2] + getFloat("Height"))
+            else:
+                boundBox = MockBoundBox(*position, *position)
+                self.unsupportedObjects[label] = f"type {objectType} is not supported"
+
+            if isRotated and not label in self.unsupportedObjects:
+                self.unsupportedObjects[label] = "rotated placement is not supported"
+
+            mockObj = MockObject(label, name, MockShape(boundBox))
+            self.objects.append(mockObj)
+            self.objectsByLabel.setdefault(label, []).append(mockObj)
+
+        return len(self.objects)
+
+    ###############################################################################################################################
+    #   CAD SPECIFIC FUNCTIONS
+    ###############################################################################################################################
+
+    def getObjects(self):
+        return self.objects
+
+    def getObjectsByLabel(self, objLabel):
+        return list(self.objectsByLabel.get(objLabel, []))
+
+    def getObjectById(self, objId):
+        for obj in self.objects:
+            if obj.Name == objId:
+                return obj
+        return None
+
+    def removeObject(self, objName):
+        obj = self.getObjectById(objName)
+        if obj is not None:
+            self.objects.remove(obj)
+            self.objectsByLabel[obj.Label].remove(obj)
+            BoundBoxCache.invalidate(obj)
+
+    def getCurrDocumentFileName(self):
+        return self.documentFileName
+
+    def getModelBoundaryBox(self, treeWidget):
+        if len(self.objects) == 0:
+            return None
+        boundBoxes = [self.getObjectBoundBox(obj) for obj in self.objects]
+        return (
+            min([bBox.XMin for bBox in boundBoxes]),
+            min([bBox.YMin for bBox in boundBoxes]),
+            min([bBox.ZMin for bBox in boundBoxes]),
+            max([bBox.XMax for bBox in boundBoxes]),
+            max([bBox.YMax for bBox in boundBoxes]),
+            max([bBox.ZMax for bBox in boundBoxes]),
+        )
+
+    def Vector(self, x, y, z):
+        return MockVector(x, y, z)
+
+    def recompute(self):
+        return None
+
+    def exportSTL(self, partToExport, exportFileName):
+        if not self.isGeometryExportEnabled:
+            logger.warning(f"mock CAD interface doesn't export geometry, {exportFileName} not written")
+            self.skippedExports.append(exportFileName)
+            return
+
+        with open(exportFileName, "w", encoding='utf-8') as f:
+            for obj in partToExport:
+                bb = obj.Shape.BoundBox
+                f.write(f"solid {obj.Label}\n")
+                f.write(f"  outer loop {bb.XMin} {bb.YMin} {bb.ZMin} {bb.XMax} {bb.YMax} {bb.ZMax}\n")
+                f.write(f"endsolid {obj.Label}\n")
+        self.exportedFilesCount += 1
+
+    def exportSTEP(self, partToExport, exportFileName):
+        if not self.isGeometryExportEnabled:
+            logger.warning(f"mock CAD interface doesn't export geometry, {exportFileName} not written")
+            self.skippedExports.append(exportFileName)
+            return
+
+        with open(exportFileName, "w", encoding='utf-8') as f:
+            f.write("ISO-10303-21;\n")
+            for obj in partToExport:
+                bb = obj.Shape.BoundBox
+                f.write(f"/* {obj.Label} {bb.XMin} {bb.YMin} {bb.ZMin} {bb.XMax} {bb.YMax} {bb.ZMax} */\n")
+            f.write("END-ISO-10303-21;\n")
+        self.exportedFilesCount += 1
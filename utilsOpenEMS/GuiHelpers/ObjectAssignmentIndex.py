@@ -0,0 +1,233 @@
+#   author: Lubomir Jagos
+#
+#
+from contextlib import contextmanager
+
+from PySide import QtCore
+
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Index of object assignment tree (right column), tree has 3 levels:
+#       category (Material, Grid, Port, ...) -> group (settings item, ie. material name) -> object (assigned FreeCAD object)
+#
+#   Tree widget stays GUI and data store, index keeps dictionaries pointing to its items so lookups don't need to search
+#   tree by findItems(..., MatchRecursive):
+#       category name -> category item
+#       (category name, group name) -> group items
+#       object label -> object items, object can be assigned into more groups (memberships)
+#
+#   Index listens to model of tree widget, any change made outside of index (items added, removed, renamed) marks it
+#   invalid and it's built again at next lookup, so bulk changes cost one rebuild. Renames and removals of objects and
+#   groups done through index update dictionaries directly and index stays valid.
+#
+#   There is one index per tree widget, get it by ObjectAssignmentIndex.getIndex(treeWidget).
+#
+class ObjectAssignmentIndex:
+
+    def __init__(self, treeWidget):
+        self.treeWidget = treeWidget
+        self.isValid = False
+        self.ownChangesLevel = 0
+
+        self.categoryItems = {}
+        self.groupItems = {}
+        self.objectItems = {}
+
+        model = self.treeWidget.model()
+        model.rowsInserted.connect(self.invalidate)
+        model.rowsRemoved.connect(self.invalidate)
+        model.rowsMoved.connect(self.invalidate)
+        model.dataChanged.connect(self.invalidate)
+        model.layoutChanged.connect(self.invalidate)
+        model.modelReset.connect(self.invalidate)
+
+    @staticmethod
+    def getIndex(treeWidget):
+        """
+        :return: index of tree widget, created at first call
+        """
+        index = getattr(treeWidget, "objectAssignmentIndex", None)
+        if index is None:
+            index = ObjectAssignmentIndex(treeWidget)
+            treeWidget.objectAssignmentIndex = index
+        return index
+
+    def invalidate(self, *args):
+        if self.ownChangesLevel == 0:
+            self.isValid = False
+
+    @contextmanager
+    def ownChanges(self):
+        """
+        Changes of tree made by index itself, dictionaries are updated by caller so index isn't invalidated.
+        """
+        self.ownChangesLevel += 1
+        try:
+            yield
+        finally:
+            self.ownChangesLevel -= 1
+
+    def rebuild(self):
+        self.categoryItems = {}
+        self.groupItems = {}
+        self.objectItems = {}
+
+        #   items are taken through topLevelItem(), wrappers of items reached through temporary invisibleRootItem() wrapper
+        #   become invalid when it's garbage collected
+        for k in range(self.treeWidget.topLevelItemCount()):
+            categoryItem = self.treeWidget.topLevelItem(k)
+            categoryName = categoryItem.text(0)
+            self.categoryItems.setdefault(categoryName, categoryItem)
+            for m in range(categoryItem.childCount()):
+                groupItem = categoryItem.child(m)
+                self.groupItems.setdefault((categoryName, groupItem.text(0)), []).append(groupItem)
+                for n in range(groupItem.childCount()):
+                    objectItem = groupItem.child(n)
+                    self.objectItems.setdefault(objectItem.text(0), []).append(objectItem)
+
+        self.isValid = True
+        logger.debug("object assignment index rebuilt, %s groups, %s objects", len(self.groupItems), len(self.objectItems))
+
+    def ensureValid(self):
+        if not self.isValid:
+            self.rebuild()
+
+    ###############################################################################################################################
+    #   Lookups
+    ###############################################################################################################################
+
+    def getCategoryItem(self, categoryName):
+        self.ensureValid()
+        return self.categoryItems.get(categoryName)
+
+    def getGroupItems(self, categoryName, groupName):
+        self.ensureValid()
+        return list(self.groupItems.get((categoryName, groupName), []))
+
+    def getGroupItem(self, categoryName, groupName):
+        """
+        :return: group item, group names are unique in category, None if there is no such group
+        """
+        groupItems = self.getGroupItems(categoryName, groupName)
+        return groupItems[0] if len(groupItems) > 0 else None
+
+    def getAllGroupItems(self):
+        """
+        :return: dictionary (category name, group name) -> list of group items
+        """
+        self.ensureValid()
+        return self.groupItems
+
+    def getObjectItems(self, objectLabel, categoriesList=None):
+        """
+        :param categoriesList: return just memberships in these categories, None means all categories
+        :return: items of object in all groups where it's assigned
+        """
+        self.ensureValid()
+        objectItems = self.objectItems.get(objectLabel, [])
+        if categoriesList is None:
+            return list(objectItems)
+        return [item for item in objectItems if item.parent().parent().text(0) in categoriesList]
+
+    def getObjectMemberships(self, objectLabel, categoriesList=None):
+        """
+        :return: list of tuples (category name, group name) where object is assigned
+        """
+        return [(item.parent().parent().text(0), item.parent().text(0)) for item in self.getObjectItems(objectLabel, categoriesList)]
+
+    def getMembershipsIndex(self, categoriesList):
+        """
+        Inverted index of assignments in given categories, built in one pass over objects.
+        :return: dictionary object label -> list of tuples (category name, group name) in order of tree
+        """
+        self.ensureValid()
+        membershipsIndex = {}
+        for objectLabel, objectItems in self.objectItems.items():
+            for objectItem in objectItems:
+                groupItem = objectItem.parent()
+                categoryName = groupItem.parent().text(0)
+                if categoryName in categoriesList:
+                    membershipsIndex.setdefault(objectLabel, []).append((categoryName, groupItem.text(0)))
+        return membershipsIndex
+
+    def getAllObjects(self, excludeCategoriesList=[]):
+        """
+        :return: list of tuples (category name, group name, object label) in order of tree
+        """
+        allObjectList = []
+        for (categoryName, groupName), groupItems in self.getAllGroupItems().items():
+            if categoryName in excludeCategoriesList:
+                continue
+            for groupItem in groupItems:
+                for n in range(groupItem.childCount()):
+                    allObjectList.append((categoryName, groupName, groupItem.child(n).text(0)))
+        return allObjectList
+
+    ###############################################################################################################################
+    #   Changes
+    ###############################################################################################################################
+
+    def addObject(self, groupItem, objectItem):
+        """
+        Assign object into group, index stays valid so more objects can be added without rebuilding it.
+        """
+        self.ensureValid()
+        with self.ownChanges():
+            groupItem.addChild(objectItem)
+        self.objectItems.setdefault(objectItem.text(0), []).append(objectItem)
+
+    def renameObject(self, oldLabel, newLabel):
+        """
+        Rename all items of object in tree.
+        :return: renamed items
+        """
+        objectItems = self.getObjectItems(oldLabel)
+        with self.ownChanges():
+            for objectItem in objectItems:
+                objectItem.setText(0, newLabel)
+
+        if len(objectItems) > 0:
+            del self.objectItems[oldLabel]
+            self.objectItems.setdefault(newLabel, []).extend(objectItems)
+        return objectItems
+
+    def removeObject(self, objectLabel):
+        """
+        Remove object from all groups where it's assigned.
+        :return: number of removed items
+        """
+        objectItems = self.getObjectItems(objectLabel)
+        with self.ownChanges():
+            for objectItem in objectItems:
+                objectItem.parent().removeChild(objectItem)
+
+        self.objectItems.pop(objectLabel, None)
+        return len(objectItems)
+
+    def renameGroup(self, categoryName, oldName, newName):
+        """
+        Rename group in category, used when settings item is renamed.
+        :return: renamed items
+        """
+        groupItems = self.getGroupItems(categoryName, oldName)
+        with self.ownChanges():
+            for groupItem in groupItems:
+                groupItem.setText(0, newName)
+
+        if len(groupItems) > 0:
+            del self.groupItems[(categoryName, oldName)]
+            self.groupItems.setdefault((categoryName, newName), []).extend(groupItems)
+        return groupItems
+
+    def setGroupData(self, categoryName, groupName, data):
+        """
+        Set settings item of group, group name doesn't change so index stays valid.
+        """
+        groupItems = self.getGroupItems(categoryName, groupName)
+        with self.ownChanges():
+            for groupItem in groupItems:
+                groupItem.setData(0, QtCore.Qt.UserRole, data)
+        return groupItems
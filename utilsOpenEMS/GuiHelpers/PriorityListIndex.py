@@ -0,0 +1,355 @@
+#   author: Lubomir Jagos
+#
+#
+from contextlib import contextmanager
+
+from PySide import QtCore, QtWidgets
+
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Index of priority list (object priority or mesh priority), list is flat, each top level item is one assignment
+#   identified by key:
+#       (category name, group name, object label)
+#   smooth mesh grid is in mesh priority list whole as one item, its object label is SMOOTH_MESH_OBJECT.
+#
+#   Key is stored in item under keyRole, item text "Category, Group, Object" is only displayed and written into settings
+#   file, it's never parsed back except when file is read (keyFromText).
+#
+#   Index keeps:
+#       orderedKeys - keys in order of list, top item has highest priority
+#       positions - key -> row, computed from orderedKeys when it's needed after insert or remove
+#       items - key -> tree item
+#       objectKeys, groupKeys - object label -> keys, (category name, group name) -> keys, for renames and removals
+#
+#   Same as ObjectAssignmentIndex, changes made outside of index mark it invalid and it's built again at next lookup,
+#   changes done through index update it directly. Moving items up or down changes only positions of moved items.
+#
+#   There is one index per tree widget, get it by PriorityListIndex.getIndex(treeWidget).
+#
+class PriorityListIndex:
+
+    keyRole = QtCore.Qt.UserRole + 1
+    SMOOTH_MESH_OBJECT = "SMOOTH MESH GROUP"
+
+    def __init__(self, treeWidget):
+        self.treeWidget = treeWidget
+        self.isValid = False
+        self.ownChangesLevel = 0
+        self.hasDuplicates = False
+
+        self.orderedKeys = []
+        self.positions = None
+        self.items = {}
+        self.objectKeys = {}
+        self.groupKeys = {}
+
+        model = self.treeWidget.model()
+        model.rowsInserted.connect(self.invalidate)
+        model.rowsRemoved.connect(self.invalidate)
+        model.rowsMoved.connect(self.invalidate)
+        model.dataChanged.connect(self.invalidate)
+        model.layoutChanged.connect(self.invalidate)
+        model.modelReset.connect(self.invalidate)
+
+    @staticmethod
+    def getIndex(treeWidget):
+        """
+        :return: index of tree widget, created at first call
+        """
+        index = getattr(treeWidget, "priorityListIndex", None)
+        if index is None:
+            index = PriorityListIndex(treeWidget)
+            treeWidget.priorityListIndex = index
+        return index
+
+    @staticmethod
+    def getText(key):
+        """
+        :return: text displayed in list and used as key in settings file, ie. "Material, PEC, Box"
+        """
+        return ", ".join(key)
+
+    @staticmethod
+    def keyFromText(text):
+        """
+        Parse key from item text, used only for settings file and items created without key.
+        """
+        key = [field.strip() for field in text.split(",", 2)]
+        return tuple(key + [""] * (3 - len(key)))
+
+    @staticmethod
+    def createItem(key, icon=None, data=None):
+        """
+        Create priority list item for key, item is not inserted into list, use insertItems().
+        :param data: data stored under UserRole, ie. settings item of group
+        """
+        item = QtWidgets.QTreeWidgetItem([PriorityListIndex.getText(key)])
+        item.setData(0, PriorityListIndex.keyRole, list(key))
+        if data is not None:
+            item.setData(0, QtCore.Qt.UserRole, data)
+        if icon is not None:
+            item.setIcon(0, icon)
+        return item
+
+    def invalidate(self, *args):
+        if self.ownChangesLevel == 0:
+            self.isValid = False
+
+    @contextmanager
+    def ownChanges(self):
+        """
+        Changes of list made by index itself, dictionaries are updated by caller so index isn't invalidated.
+        """
+        self.ownChangesLevel += 1
+        try:
+            yield
+        finally:
+            self.ownChangesLevel -= 1
+
+    def rebuild(self):
+        self.orderedKeys = []
+        self.positions = None
+        self.items = {}
+        self.objectKeys = {}
+        self.groupKeys = {}
+        self.hasDuplicates = False
+
+        with self.ownChanges():
+            for k in range(self.treeWidget.topLevelItemCount()):
+                item = self.treeWidget.topLevelItem(k)
+                key = item.data(0, PriorityListIndex.keyRole)
+                if key is None:
+                    key = PriorityListIndex.keyFromText(item.text(0))
+                    item.setData(0, PriorityListIndex.keyRole, list(key))
+                key = tuple(key)
+
+                self.orderedKeys.append(key)
+                if key in self.items:
+                    self.hasDuplicates = True
+                    continue
+                self.registerKey(key, item)
+
+        self.isValid = True
+        if self.hasDuplicates:
+            logger.warning(f"priority list {self.treeWidget.objectName()} contains duplicate items")
+        logger.debug("priority list index rebuilt, %s items", len(self.orderedKeys))
+
+    def ensureValid(self):
+        if not self.isValid:
+            self.rebuild()
+
+    def registerKey(self, key, item):
+        self.items[key] = item
+        self.objectKeys.setdefault(key[2], set()).add(key)
+        self.groupKeys.setdefault((key[0], key[1]), set()).add(key)
+
+    def unregisterKey(self, key):
+        self.items.pop(key, None)
+
+        #   renamed and removed labels and groups are not kept as empty entries
+        for keysDict, lookupKey in [(self.objectKeys, key[2]), (self.groupKeys, (key[0], key[1]))]:
+            keys = keysDict.get(lookupKey)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if len(keys) == 0:
+                del keysDict[lookupKey]
+
+    def finishChanges(self):
+        """
+        Duplicates share one dictionary entry, after change of list with duplicates index is built again.
+        """
+        if self.hasDuplicates:
+            self.isValid = False
+
+    ###############################################################################################################################
+    #   Lookups
+    ###############################################################################################################################
+
+    def getKey(self, item):
+        self.ensureValid()
+        return tuple(item.data(0, PriorityListIndex.keyRole))
+
+    def getKeys(self):
+        """
+        :return: list of keys (category name, group name, object label) from top to bottom
+        """
+        self.ensureValid()
+        return list(self.orderedKeys)
+
+    def getItem(self, key):
+        self.ensureValid()
+        return self.items.get(key)
+
+    def contains(self, key):
+        self.ensureValid()
+        return key in self.items
+
+    def getPosition(self, key):
+        """
+        :return: row of item in list, 0 is top item with highest priority, None if key isn't in list
+        """
+        self.ensureValid()
+        if self.positions is None:
+            self.positions = {}
+            for row, orderedKey in enumerate(self.orderedKeys):
+                self.positions.setdefault(orderedKey, row)
+        return self.positions.get(key)
+
+    def getObjectKeys(self, objectLabel):
+        self.ensureValid()
+        return sorted(self.objectKeys.get(objectLabel, []), key=self.getPosition)
+
+    def getGroupKeys(self, categoryName, groupName):
+        """
+        :return: keys of group in order of list
+        """
+        self.ensureValid()
+        return sorted(self.groupKeys.get((categoryName, groupName), []), key=self.getPosition)
+
+    ###############################################################################################################################
+    #   Changes
+    ###############################################################################################################################
+
+    def insertItems(self, row, items):
+        """
+        Insert items created by createItem() at row, row 0 is top of list.
+        """
+        self.ensureValid()
+        keys = [tuple(item.data(0, PriorityListIndex.keyRole)) for item in items]
+        with self.ownChanges():
+            self.treeWidget.insertTopLevelItems(row, items)
+
+        self.orderedKeys[row:row] = keys
+        self.positions = None
+        for key, item in zip(keys, items):
+            if key in self.items:
+                self.hasDuplicates = True
+                continue
+            self.registerKey(key, item)
+        self.finishChanges()
+
+    def insertItem(self, row, key, icon=None, data=None):
+        """
+        :return: new item inserted at row
+        """
+        item = PriorityListIndex.createItem(key, icon, data)
+        self.insertItems(row, [item])
+        return item
+
+    def removeKeys(self, keys):
+        """
+        :return: number of removed items
+        """
+        rows = sorted({self.getPosition(key) for key in keys if self.contains(key)}, reverse=True)
+        with self.ownChanges():
+            for row in rows:
+                self.treeWidget.takeTopLevelItem(row)
+                del self.orderedKeys[row]
+
+        for key in keys:
+            self.unregisterKey(key)
+        self.positions = None
+        self.finishChanges()
+        return len(rows)
+
+    def removeObject(self, objectLabel):
+        """
+        Remove object from all groups in list.
+        """
+        return self.removeKeys(self.getObjectKeys(objectLabel))
+
+    def removeGroup(self, categoryName, groupName):
+        """
+        Remove all objects of group, used when settings item is removed.
+        """
+        return self.removeKeys(self.getGroupKeys(categoryName, groupName))
+
+    def clear(self):
+        with self.ownChanges():
+            self.treeWidget.clear()
+        self.rebuild()
+
+    def replaceKey(self, oldKey, newKey, icon=None):
+        """
+        Change key of item, item stays at its position. If there is already item with new key, old item is removed.
+        :return: item with new key, None if there is no item with old key
+        """
+        item = self.getItem(oldKey)
+        if item is None or oldKey == newKey:
+            return item
+        if self.contains(newKey):
+            self.removeKeys([oldKey])
+            return self.getItem(newKey)
+
+        with self.ownChanges():
+            item.setText(0, PriorityListIndex.getText(newKey))
+            item.setData(0, PriorityListIndex.keyRole, list(newKey))
+            if icon is not None:
+                item.setIcon(0, icon)
+
+        row = self.getPosition(oldKey)
+        self.unregisterKey(oldKey)
+        self.registerKey(newKey, item)
+        self.orderedKeys[row] = newKey
+        del self.positions[oldKey]
+        self.positions[newKey] = row
+        self.finishChanges()
+        return item
+
+    def renameObject(self, oldLabel, newLabel):
+        """
+        Rename object in all groups.
+        :return: renamed items
+        """
+        return [self.replaceKey(key, (key[0], key[1], newLabel)) for key in self.getObjectKeys(oldLabel)]
+
+    def renameGroup(self, categoryName, oldName, newName):
+        """
+        Rename group, used when settings item is renamed.
+        :return: renamed items
+        """
+        return [self.replaceKey(key, (categoryName, newName, key[2])) for key in self.getGroupKeys(categoryName, oldName)]
+
+    def moveUp(self, selectedItems):
+        """
+        Move selected items one row up, item above them is moved below them.
+        """
+        rows = [self.getPosition(self.getKey(item)) for item in selectedItems]
+        if len(rows) == 0 or min(rows) == 0:
+            return
+        self.moveRow(min(rows) - 1, max(rows))
+
+    def moveDown(self, selectedItems):
+        """
+        Move selected items one row down, item below them is moved above them.
+        """
+        rows = [self.getPosition(self.getKey(item)) for item in selectedItems]
+        if len(rows) == 0 or max(rows) >= len(self.orderedKeys) - 1:
+            return
+        self.moveRow(max(rows) + 1, min(rows))
+
+    def moveRow(self, fromRow, toRow):
+        """
+        Move one item, positions are updated only for rows between fromRow and toRow.
+        """
+        key = self.orderedKeys[fromRow]
+        with self.ownChanges():
+            self.treeWidget.insertTopLevelItem(toRow, self.treeWidget.takeTopLevelItem(fromRow))
+
+        del self.orderedKeys[fromRow]
+        self.orderedKeys.insert(toRow, key)
+        if self.positions is not None:
+            for row in range(min(fromRow, toRow), max(fromRow, toRow) + 1):
+                self.positions[self.orderedKeys[row]] = row
+        self.finishChanges()
+
+    def setCategoryHidden(self, categoryName, isHidden):
+        self.ensureValid()
+        with self.ownChanges():
+            for key, item in self.items.items():
+                if key[0] == categoryName:
+                    item.setHidden(isHidden)
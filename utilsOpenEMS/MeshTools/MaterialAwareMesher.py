@@ -0,0 +1,151 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+#
+#   Material aware mesh lines generator.
+#
+#   Maximum cell size is calculated for each object from wavelength inside its material lambda = c0 / (f * sqrt(epsilon * mue)),
+#   for object without dielectric material (air, metal, conducting sheet) vacuum wavelength is used. Object boundaries are
+#   fixed lines, space between them is filled with cells which grow from smaller neighbour cells by grading ratio up to
+#   maximum cell size allowed in that interval, so there are dense cells only inside dielectrics.
+#
+class MaterialAwareMesher:
+
+    C0 = 299792458
+
+    def __init__(self, cellsPerWavelength=20, gradingRatio=1.5):
+        """
+        :param cellsPerWavelength: N in lambda/N, max. cell size in material
+        :param gradingRatio: max. ratio of neighbour cells
+        """
+        self.cellsPerWavelength = cellsPerWavelength
+        self.gradingRatio = gradingRatio
+
+    def getMaxCellSize(self, fMax_Hz, epsilon=1.0, mue=1.0, refUnit=1.0):
+        """
+        :return: max. cell size in drawing units for material, 0 if frequency is not known
+        """
+        if fMax_Hz <= 0:
+            return 0
+        refractiveIndex = math.sqrt(max(epsilon, 1.0) * max(mue, 1.0))
+        return self.C0 / (fMax_Hz * refractiveIndex) / self.cellsPerWavelength / refUnit
+
+    def getRegionMaxCellSize(self, region, fMax_Hz, refUnit):
+        if region.get('type', '') in ['metal', 'conducting sheet']:
+            return self.getMaxCellSize(fMax_Hz, refUnit=refUnit)
+        return self.getMaxCellSize(fMax_Hz, region.get('epsilon', 1.0), region.get('mue', 1.0), refUnit)
+
+    def getAxisIntervals(self, axis, regions, fMax_Hz, refUnit, backgroundMaxRes):
+        """
+        Split axis by region boundaries into intervals and assign max. cell size to each of them, where more regions
+        overlap the smallest cell size wins.
+        :return: list of tuples (start, stop, maxCellSize)
+        """
+        fixedLines = sorted(set([coord for region in regions for coord in region['box'][axis]]))
+
+        intervals = []
+        for k in range(len(fixedLines)-1):
+            start = fixedLines[k]
+            stop = fixedLines[k+1]
+            middle = (start + stop) / 2
+
+            maxCellSize = backgroundMaxRes
+            for region in regions:
+                regionMin, regionMax = region['box'][axis]
+                if regionMin <= middle <= regionMax:
+                    regionMaxCellSize = self.getRegionMaxCellSize(region, fMax_Hz, refUnit)
+                    if regionMaxCellSize > 0:
+                        maxCellSize = min(maxCellSize, regionMaxCellSize) if maxCellSize > 0 else regionMaxCellSize
+
+            intervals.append((start, stop, min(maxCellSize, stop - start) if maxCellSize > 0 else stop - start))
+        return intervals
+
+    def getGradedCells(self, width, leftCellSize, rightCellSize, maxCellSize):
+        """
+        Cells filling interval, they grow from both sides by grading ratio up to maxCellSize.
+        :return: list of cell sizes, their sum is equal to width
+        """
+        leftCells = []
+        cellSize = leftCellSize
+        while cellSize < maxCellSize:
+            cellSize = min(cellSize * self.gradingRatio, maxCellSize)
+            leftCells.append(cellSize)
+
+        rightCells = []
+        cellSize = rightCellSize
+        while cellSize < maxCellSize:
+            cellSize = min(cellSize * self.gradingRatio, maxCellSize)
+            rightCells.append(cellSize)
+
+        #
+        #   interval is too narrow for whole growth, remove biggest cells from side which has them
+        #
+        while sum(leftCells) + sum(rightCells) > width and (leftCells or rightCells):
+            if not rightCells or (leftCells and leftCells[-1] >= rightCells[-1]):
+                leftCells.pop()
+            else:
+                rightCells.pop()
+
+        middleWidth = width - sum(leftCells) - sum(rightCells)
+        middleCells = []
+        if middleWidth > 1e-12 * max(1.0, width):
+            cellCount = max(1, int(math.ceil(middleWidth / maxCellSize - 1e-9)))
+            middleCells = [middleWidth / cellCount] * cellCount
+
+        cells = leftCells + middleCells + list(reversed(rightCells))
+
+        #
+        #   too small rest in middle would make tiny cell, it's spread to other cells in interval instead
+        #
+        if len(cells) > 1 and middleCells and middleCells[0] < min(leftCellSize, rightCellSize) / self.gradingRatio:
+            cells = leftCells + list(reversed(rightCells))
+            scale = width / sum(cells)
+            cells = [cell * scale for cell in cells]
+
+        return cells
+
+    def calculateLines(self, axis, regions, fMax_Hz, refUnit=1.0, backgroundMaxRes=0):
+        """
+        Material aware mesh lines for one axis.
+        :param axis: 'x', 'y' or 'z'
+        :param regions: list of dictionaries with 'box', 'epsilon', 'mue' and 'type' as returned by getMaterialRegions()
+        :param fMax_Hz: max. simulated frequency
+        :param refUnit: drawing unit in meters
+        :param backgroundMaxRes: max. cell size in drawing units outside dielectrics, if 0 vacuum lambda/N is used
+        :return: sorted list of line coordinates in drawing units
+        """
+        if backgroundMaxRes <= 0:
+            backgroundMaxRes = self.getMaxCellSize(fMax_Hz, refUnit=refUnit)
+
+        intervals = self.getAxisIntervals(axis, regions, fMax_Hz, refUnit, backgroundMaxRes)
+        if len(intervals) == 0:
+            return sorted(set([coord for region in regions for coord in region['box'][axis]]))
+
+        #
+        #   finest intervals are filled first, coarser neighbours then grow from their real boundary cells, uniform cells
+        #   in interval are usually smaller than its max. cell size
+        #
+        intervalCells = [None] * len(intervals)
+        for k in sorted(range(len(intervals)), key=lambda k: intervals[k][2]):
+            start, stop, maxCellSize = intervals[k]
+
+            leftCellSize = maxCellSize
+            if k > 0:
+                leftCellSize = min(maxCellSize, intervalCells[k-1][-1] if intervalCells[k-1] else intervals[k-1][2])
+            rightCellSize = maxCellSize
+            if k < len(intervals) - 1:
+                rightCellSize = min(maxCellSize, intervalCells[k+1][0] if intervalCells[k+1] else intervals[k+1][2])
+
+            intervalCells[k] = self.getGradedCells(stop - start, leftCellSize, rightCellSize, maxCellSize)
+
+        lines = [intervals[0][0]]
+        for (start, stop, maxCellSize), cells in zip(intervals, intervalCells):
+            coord = start
+            for cell in cells[:-1]:
+                coord += cell
+                lines.append(coord)
+            lines.append(stop)
+
+        return lines
@@ -0,0 +1,237 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _r
+from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
+from utilsOpenEMS.MeshTools.ThirdsRuleMesher import ThirdsRuleMesher
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Calculates final mesh lines in python the same way as generated script does it, so they can be displayed or analyzed
+#   before simulation is run. Lines are returned in drawing units (simParamsDeltaUnitList), same as in generated script.
+#
+#   Supported grid types:
+#       Fixed Distance, Fixed Count, Smooth Mesh - lines are calculated
+#       User Defined                             - only top priority lines removal is applied, user code is not evaluated
+#       FEM Max Size                             - ignored, it's not FDTD grid
+#
+#   Smooth Mesh lines are approximation of CSXCAD SmoothMeshLines(), each gap between object boundaries is divided into
+#   equal cells not bigger than max resolution, grading of neighbour cells is not done. Material aware smooth mesh lines
+#   are same as in generated script.
+#
+class MeshLinesCalculator(CommonScriptLinesGenerator):
+
+    axisList = ['x', 'y', 'z']
+
+    #
+    #   constructor, get access to form GUI
+    #
+    def __init__(self, form, statusBar = None):
+        super(MeshLinesCalculator, self).__init__(form, statusBar)
+
+        #
+        #   for each axis dictionary rounded line coordinate -> (grid settings name, object label), used to find out which
+        #   grid rule generated line
+        #
+        self.lineOrigins = {'x': {}, 'y': {}, 'z': {}}
+        self.maxGridResolution_m = 0
+
+    def arangeWithEndpoint(self, start, stop, step):
+        """
+        Same behaviour as arangeWithEndpoint() generated into python script.
+        :param start: first line coordinate
+        :param stop: last line coordinate
+        :param step: distance between lines
+        :return: list of coordinates
+        """
+        if start == stop or step <= 0:
+            return [start]
+
+        lineCount = int(math.floor((stop - start) / step + 1e-9)) + 1
+        lines = [start + k * step for k in range(lineCount)]
+        if abs(lines[-1] - stop) > 1e-9 * max(1.0, abs(stop)) and abs(lines[-1] + step - stop) <= 1e-9 * max(1.0, abs(stop)):
+            lines.append(stop)
+        return lines
+
+    def linspace(self, start, stop, count):
+        count = int(count)
+        if count <= 1:
+            return [(start + stop) / 2]
+        return [start + (stop - start) * k / (count - 1) for k in range(count)]
+
+    def smoothMeshLines(self, fixedLines, maxRes):
+        """
+        Simplified SmoothMeshLines(), fills gaps between fixed lines with equidistant lines so no cell is bigger than maxRes.
+        :param fixedLines: sorted list of coordinates which must stay in mesh
+        :param maxRes: maximum cell size in drawing units
+        :return: sorted list of coordinates
+        """
+        if len(fixedLines) == 0 or maxRes <= 0:
+            return list(fixedLines)
+
+        lines = [fixedLines[0]]
+        for k in range(1, len(fixedLines)):
+            gap = fixedLines[k] - fixedLines[k-1]
+            if gap <= 0:
+                continue
+            cellCount = int(math.ceil(gap / maxRes - 1e-9))
+            for n in range(1, cellCount):
+                lines.append(fixedLines[k-1] + gap * n / cellCount)
+            lines.append(fixedLines[k])
+        return lines
+
+    def getMaxResolutionFromExcitation_m(self):
+        """
+        Calculates maximum cell size as 1/20 of minimal wavelength same way as getExcitationScriptLines() does but without
+        generating any script lines.
+        :return: maximum cell size in meters, 0 if it cannot be calculated
+        """
+        fMax = self.getMaxFrequencyFromExcitation_Hz()
+        return 0 if fMax <= 0 else 3e8 / (fMax * 20)
+
+    def addLines(self, mesh, axis, lines, gridName, objectLabel):
+        for line in lines:
+            mesh[axis].append(line)
+            self.lineOrigins[axis][_r(line)] = (gridName, objectLabel)
+
+    def removeLines(self, mesh, axis, minCoord, maxCoord):
+        mesh[axis] = [line for line in mesh[axis] if not (line >= minCoord and line <= maxCoord)]
+
+    def applyMinimalGridlineSpacing(self, mesh):
+        """
+        Removes gridlines which are closer as defined in GUI, same algorithm as getMinimalGridlineSpacingScriptLines().
+        """
+        if not self.form.genParamMinGridSpacingEnable.isChecked():
+            return mesh
+
+        minSpacing = {
+            'x': self.form.genParamMinGridSpacingX.value() / 1000 / self.getUnitLengthFromUI_m(),
+            'y': self.form.genParamMinGridSpacingY.value() / 1000 / self.getUnitLengthFromUI_m(),
+            'z': self.form.genParamMinGridSpacingZ.value() / 1000 / self.getUnitLengthFromUI_m(),
+        }
+
+        for axis in self.axisList:
+            lines = mesh[axis]
+            for k in range(len(lines)-1):
+                if (not math.isinf(lines[k]) and abs(lines[k+1]-lines[k]) <= minSpacing[axis]):
+                    lines[k+1] = math.inf
+            mesh[axis] = [line for line in lines if not math.isinf(line)]
+
+        return mesh
+
+    def calculateMeshLines(self, items=None):
+        """
+        Calculates final mesh lines from all grid settings in order given by mesh priority list.
+        :param items: list of [treeItem, GridSettingsItem] as returned by getItemsByClassName(), if None they are read from GUI
+        :return: dictionary {'x': [...], 'y': [...], 'z': [...]} with sorted unique coordinates in drawing units
+        """
+        mesh = {'x': [], 'y': [], 'z': []}
+        self.lineOrigins = {'x': {}, 'y': {}, 'z': {}}
+
+        if items is None:
+            items = self.getItemsByClassName().get("GridSettingsItem", None)
+
+        meshPrioritiesCount = self.form.meshPriorityTreeView.topLevelItemCount()
+        if (not items) or (meshPrioritiesCount == 0):
+            return mesh
+
+        refUnit = self.getUnitLengthFromUI_m()
+        self.maxGridResolution_m = self.getMaxResolutionFromExcitation_m()
+
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
+        gridSettingsByName = {gridSettingsNode.text(0): [gridSettingsNode, gridSettingsInst] for [gridSettingsNode, gridSettingsInst] in items}
+        fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
+
+        for [categoryName, gridName, FreeCADObjectName] in orderedAssociations:
+            if not (gridName in gridSettingsByName):
+                continue
+            gridCategoryObj, gridSettingsInst = gridSettingsByName[gridName]
+
+            if (gridSettingsInst.coordsType == "cylindrical"):
+                logger.debug("MeshLinesCalculator: cylindrical grid '%s' is skipped, only rectangular grid lines are calculated.", gridName)
+                continue
+
+            enabled = {'x': gridSettingsInst.xenabled, 'y': gridSettingsInst.yenabled, 'z': gridSettingsInst.zenabled}
+
+            if (gridSettingsInst.getType() in ['Fixed Distance', 'Fixed Count', 'User Defined']):
+                fcObject = fcObjects.get(FreeCADObjectName, None)
+                if (not fcObject) or (not "Shape" in dir(fcObject)):
+                    continue
+
+                xmin, xmax, ymin, ymax, zmin, zmax = self.getObjectBoundaries(gridSettingsInst, self.cadHelpers.getObjectBoundBox(fcObject))
+                bounds = {'x': (xmin, xmax), 'y': (ymin, ymax), 'z': (zmin, zmax)}
+
+                for axis in self.axisList:
+                    if not enabled[axis]:
+                        continue
+                    axisMin, axisMax = bounds[axis]
+                    if gridSettingsInst.topPriorityLines:
+                        self.removeLines(mesh, axis, _r(axisMin), _r(axisMax))
+
+                    if (gridSettingsInst.getType() == 'Fixed Distance'):
+                        lines = self.arangeWithEndpoint(axisMin, axisMax, gridSettingsInst.getXYZ(refUnit)[axis])
+                    elif (gridSettingsInst.getType() == 'Fixed Count'):
+                        lines = self.linspace(axisMin, axisMax, gridSettingsInst.getXYZ(refUnit)[axis])
+                    else:
+                        lines = []
+                    self.addLines(mesh, axis, lines, gridName, FreeCADObjectName)
+
+            elif (gridSettingsInst.getType() == 'Smooth Mesh'):
+                boundaryLists = {'x': [], 'y': [], 'z': []}
+                objectLabels = []
+                objectBoxes = []
+                metalObjectLabels = self.getMetalObjectLabels() if gridSettingsInst.smoothMesh.get('thirdsRule', False) else []
+
+                for k in range(gridCategoryObj.childCount()):
+                    childName = gridCategoryObj.child(k).text(0)
+                    fcObject = fcObjects.get(childName, None)
+                    if (not fcObject) or (not "Shape" in dir(fcObject)):
+                        continue
+
+                    xmin, xmax, ymin, ymax, zmin, zmax = self.getObjectBoundaries(gridSettingsInst, self.cadHelpers.getObjectBoundBox(fcObject))
+                    boundaryLists['x'] += [xmin, xmax]
+                    boundaryLists['y'] += [ymin, ymax]
+                    boundaryLists['z'] += [zmin, zmax]
+                    objectLabels.append(childName)
+                    objectBoxes.append(({'x': (xmin, xmax), 'y': (ymin, ymax), 'z': (zmin, zmax)}, childName in metalObjectLabels))
+
+                if len(objectLabels) == 0:
+                    continue
+
+                for axis in self.axisList:
+                    if not enabled[axis]:
+                        continue
+                    if gridSettingsInst.smoothMesh.get('thirdsRule', False):
+                        fixedLines = ThirdsRuleMesher(gridSettingsInst.smoothMesh.get('thirdsRuleResolution', 0)).getFixedLines(axis, objectBoxes)
+                    else:
+                        fixedLines = sorted(set(boundaryLists[axis]))
+                    if gridSettingsInst.topPriorityLines:
+                        self.removeLines(mesh, axis, _r(fixedLines[0]), _r(fixedLines[-1]))
+
+                    if self.isMaterialAwareMesh(gridSettingsInst, axis):
+                        self.addLines(mesh, axis, self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, axis), gridName, ", ".join(objectLabels))
+                        continue
+
+                    maxRes = gridSettingsInst.smoothMesh[axis + 'MaxRes']
+                    if maxRes == 0:
+                        maxRes = self.maxGridResolution_m / refUnit
+
+                    self.addLines(mesh, axis, self.smoothMeshLines(fixedLines, maxRes), gridName, ", ".join(objectLabels))
+
+            else:
+                logger.debug("MeshLinesCalculator: grid '%s' type '%s' is not calculated.", gridName, gridSettingsInst.getType())
+
+        for axis in self.axisList:
+            mesh[axis] = sorted(set([_r(line) for line in mesh[axis]]))
+
+        return self.applyMinimalGridlineSpacing(mesh)
+
+    def getLineOrigin(self, axis, coord):
+        """
+        :return: tuple (grid settings name, object label) which generated line, (None, None) if unknown
+        """
+        return self.lineOrigins[axis].get(_r(coord), (None, None))
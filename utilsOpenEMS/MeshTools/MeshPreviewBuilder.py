@@ -0,0 +1,136 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+#
+#   Builds lightweight preview of final mesh from lines calculated by MeshLinesCalculator.
+#
+#   Mesh lines are not drawn through whole volume, each line is drawn only on back planes of mesh box (xmin, ymin, zmin
+#   planes), so there are just 2 segments per line. For big meshes lines are decimated into several levels of detail,
+#   CAD preview switches between them based on camera distance.
+#
+class MeshPreviewBuilder:
+
+    axisList = ['x', 'y', 'z']
+
+    defaultColor = (0.5, 0.5, 0.5)
+
+    def __init__(self, maxLinesPerAxis=2000, levelsCount=3, levelReduction=4):
+        """
+        :param maxLinesPerAxis: maximum number of lines per axis in most detailed level
+        :param levelsCount: number of levels of detail
+        :param levelReduction: each next level has this many times less lines
+        """
+        self.maxLinesPerAxis = max(2, int(maxLinesPerAxis))
+        self.levelsCount = max(1, int(levelsCount))
+        self.levelReduction = max(2, int(levelReduction))
+
+    def decimateLines(self, lines, maxCount):
+        """
+        Reduce number of lines by taking each n-th line, first and last lines are always kept so mesh box stays same.
+        Taking each n-th line keeps density distribution so dense regions are still visible.
+        :param lines: sorted list of coordinates
+        :param maxCount: maximum number of returned lines
+        :return: sorted list of coordinates
+        """
+        if len(lines) <= maxCount:
+            return list(lines)
+
+        step = int(math.ceil(len(lines) / max(1, maxCount - 1)))
+        decimated = lines[::step]
+        if decimated[-1] != lines[-1]:
+            decimated.append(lines[-1])
+        return decimated
+
+    def getCellSizes(self, lines):
+        """
+        Cell size around each line as average of its neighbour cells.
+        :return: list of cell sizes, same length as lines
+        """
+        if len(lines) < 2:
+            return [0 for line in lines]
+
+        sizes = []
+        for k in range(len(lines)):
+            neighbourCells = []
+            if k > 0:
+                neighbourCells.append(lines[k] - lines[k-1])
+            if k < len(lines) - 1:
+                neighbourCells.append(lines[k+1] - lines[k])
+            sizes.append(sum(neighbourCells) / len(neighbourCells))
+        return sizes
+
+    def getHeatmapColor(self, cellSize, minCellSize, maxCellSize):
+        """
+        Color for cell size in logarithmic scale, smallest cells are red, biggest blue.
+        :return: (r, g, b) tuple with values 0..1
+        """
+        if cellSize <= 0 or minCellSize <= 0 or maxCellSize <= minCellSize:
+            return (0.0, 1.0, 0.0)
+
+        t = (math.log(cellSize) - math.log(minCellSize)) / (math.log(maxCellSize) - math.log(minCellSize))
+        t = min(1.0, max(0.0, t))
+        return (1.0 - t, 1.0 - abs(2.0 * t - 1.0), t)
+
+    def getLineSegments(self, axis, coord, box):
+        """
+        Segments for one mesh line drawn at back planes of mesh box.
+        :param box: dictionary {'x': (min, max), 'y': (min, max), 'z': (min, max)}
+        :return: list of segments [(p1, p2), ...]
+        """
+        (xmin, xmax), (ymin, ymax), (zmin, zmax) = box['x'], box['y'], box['z']
+        if axis == 'x':
+            return [((coord, ymin, zmin), (coord, ymax, zmin)), ((coord, ymin, zmin), (coord, ymin, zmax))]
+        elif axis == 'y':
+            return [((xmin, coord, zmin), (xmax, coord, zmin)), ((xmin, coord, zmin), (xmin, coord, zmax))]
+        else:
+            return [((xmin, ymin, coord), (xmax, ymin, coord)), ((xmin, ymin, coord), (xmin, ymax, coord))]
+
+    def buildPreviewLevels(self, mesh, scale=1.0, heatmap=False):
+        """
+        Build levels of detail for mesh preview.
+        :param mesh: dictionary {'x': [...], 'y': [...], 'z': [...]} with sorted coordinates
+        :param scale: multiplication factor to convert mesh coordinates into CAD units
+        :param heatmap: if True segments are colored by cell size
+        :return: list of levels from most detailed, each level is dictionary {'segments': [...], 'colors': [...]}
+        """
+        if any(len(mesh[axis]) == 0 for axis in self.axisList):
+            return []
+
+        scaledMesh = {axis: [line * scale for line in mesh[axis]] for axis in self.axisList}
+        box = {axis: (scaledMesh[axis][0], scaledMesh[axis][-1]) for axis in self.axisList}
+
+        #
+        #   cell sizes are calculated from full mesh so heatmap shows real cells also when lines are decimated
+        #
+        cellSizes = {}
+        for axis in self.axisList:
+            cellSizes[axis] = dict(zip(scaledMesh[axis], self.getCellSizes(scaledMesh[axis])))
+        allSizes = [size for axis in self.axisList for size in cellSizes[axis].values() if size > 0]
+        minCellSize = min(allSizes) if allSizes else 0
+        maxCellSize = max(allSizes) if allSizes else 0
+
+        levels = []
+        maxCount = self.maxLinesPerAxis
+        for levelIndex in range(self.levelsCount):
+            segments = []
+            colors = []
+            for axis in self.axisList:
+                for coord in self.decimateLines(scaledMesh[axis], maxCount):
+                    color = self.getHeatmapColor(cellSizes[axis][coord], minCellSize, maxCellSize) if heatmap else self.defaultColor
+                    for segment in self.getLineSegments(axis, coord, box):
+                        segments.append(segment)
+                        colors.append(color)
+            levels.append({'segments': segments, 'colors': colors})
+            maxCount = max(2, maxCount // self.levelReduction)
+
+        return levels
+
+    def getLevelDistances(self, mesh, scale=1.0):
+        """
+        Camera distances where preview switches to less detailed level, they are multiples of mesh box diagonal.
+        :return: list of distances, one less than number of levels
+        """
+        diagonal = math.sqrt(sum([((mesh[axis][-1] - mesh[axis][0]) * scale) ** 2 for axis in self.axisList if len(mesh[axis]) > 0]))
+        return [diagonal * (2 ** (k + 1)) for k in range(self.levelsCount - 1)]
@@ -0,0 +1,222 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+from utilsOpenEMS.MeshTools.MeshLinesCalculator import MeshLinesCalculator
+
+#
+#   Mesh quality analyzer, works on top of mesh lines calculated by MeshLinesCalculator and reports:
+#       grading   - neighbour cells size ratio is bigger than threshold, openEMS recommends max. 1.5
+#       lambda    - cell inside material is bigger than lambda/N where lambda is wavelength in material for max. frequency
+#       timestep  - smallest cells which set FDTD timestep, suggests lines which can be merged
+#
+#   Each issue is dictionary:
+#       {'type': 'grading'|'lambda'|'timestep', 'axis': 'x'|'y'|'z', 'coord': line coordinate, 'message': text,
+#        'gridName': grid settings which generated line, 'objectLabel': object, 'suggestion': text}
+#
+class MeshQualityAnalyzer(MeshLinesCalculator):
+
+    C0 = 299792458
+
+    #
+    #   constructor, get access to form GUI
+    #
+    def __init__(self, form, statusBar = None, gradingThreshold=1.5, cellsPerWavelength=20, timestepCellsCount=5):
+        """
+        :param gradingThreshold: max. allowed ratio of neighbour cells
+        :param cellsPerWavelength: N in lambda/N, max. cell size in material
+        :param timestepCellsCount: max. number of reported cells limiting timestep
+        """
+        super(MeshQualityAnalyzer, self).__init__(form, statusBar)
+
+        self.gradingThreshold = gradingThreshold
+        self.cellsPerWavelength = cellsPerWavelength
+        self.timestepCellsCount = timestepCellsCount
+        self.wavelengthCheckSkipReason = None
+
+    def getCells(self, lines):
+        """
+        :return: list of tuples (start, stop, size) for each cell between neighbour lines
+        """
+        return [(lines[k], lines[k+1], lines[k+1] - lines[k]) for k in range(len(lines)-1)]
+
+    def getTimestep_s(self, mesh, refUnit):
+        """
+        FDTD timestep by Courant criterion calculated from smallest cell in each direction.
+        :param refUnit: drawing unit in meters
+        :return: timestep in seconds, 0 if some axis has no cells
+        """
+        minCells = []
+        for axis in self.axisList:
+            cells = self.getCells(mesh[axis])
+            if len(cells) == 0:
+                return 0
+            minCells.append(min([cell[2] for cell in cells]) * refUnit)
+        return 1 / (self.C0 * math.sqrt(sum([1 / cellSize**2 for cellSize in minCells])))
+
+    def getIssueOrigin(self, axis, coordA, coordB):
+        """
+        Line origin for cell, line which was added by grid rule is preferred over line with unknown origin.
+        """
+        gridName, objectLabel = self.getLineOrigin(axis, coordB)
+        if gridName is None:
+            gridName, objectLabel = self.getLineOrigin(axis, coordA)
+        return gridName, objectLabel
+
+    def analyzeGrading(self, mesh):
+        issues = []
+        for axis in self.axisList:
+            cells = self.getCells(mesh[axis])
+            for k in range(len(cells)-1):
+                sizeA = cells[k][2]
+                sizeB = cells[k+1][2]
+                if min(sizeA, sizeB) <= 0:
+                    continue
+                ratio = max(sizeA, sizeB) / min(sizeA, sizeB)
+                if ratio <= self.gradingThreshold:
+                    continue
+
+                coord = cells[k][1]
+                gridName, objectLabel = self.getIssueOrigin(axis, cells[k][0], cells[k+1][1])
+                issues.append({
+                    'type': 'grading',
+                    'axis': axis,
+                    'coord': coord,
+                    'message': f"{axis} = {coord:g}: neighbour cells ratio {ratio:.2f} ({sizeA:g} / {sizeB:g})",
+                    'gridName': gridName,
+                    'objectLabel': objectLabel,
+                    'suggestion': f"add smooth mesh around {axis} = {coord:g} or lower resolution difference of neighbour grid rules",
+                })
+        return issues
+
+    def analyzeMaterialWavelength(self, mesh, materialRegions, fMax_Hz, refUnit):
+        issues = []
+        if fMax_Hz <= 0:
+            return issues
+
+        for region in materialRegions:
+            if region['type'] in ['metal', 'conducting sheet']:
+                continue
+
+            refractiveIndex = math.sqrt(max(region['epsilon'], 1e-12) * max(region['mue'], 1e-12))
+            maxCellSize = self.C0 / (fMax_Hz * refractiveIndex) / self.cellsPerWavelength / refUnit
+
+            for axis in self.axisList:
+                regionMin, regionMax = region['box'][axis]
+                for start, stop, size in self.getCells(mesh[axis]):
+                    if stop <= regionMin or start >= regionMax or size <= maxCellSize:
+                        continue
+                    issues.append({
+                        'type': 'lambda',
+                        'axis': axis,
+                        'coord': start,
+                        'message': f"{axis} = {start:g} .. {stop:g}: cell {size:g} is bigger than lambda/{self.cellsPerWavelength} = {maxCellSize:g} in material {region['material']} (epsilon = {region['epsilon']:g})",
+                        'gridName': self.getIssueOrigin(axis, start, stop)[0],
+                        'objectLabel': region['object'],
+                        'suggestion': f"use max. {maxCellSize:g} cell size for {region['object']} in {axis} direction",
+                    })
+        return issues
+
+    def analyzeTimestep(self, mesh, refUnit):
+        """
+        Finds smallest cells which limit FDTD timestep and suggests merging their lines into one line in the middle.
+        """
+        issues = []
+        currentTimestep = self.getTimestep_s(mesh, refUnit)
+        if currentTimestep == 0:
+            return issues
+
+        allCells = [(size, axis, start, stop) for axis in self.axisList for start, stop, size in self.getCells(mesh[axis])]
+        allCells.sort()
+
+        #
+        #   cells up to twice size of smallest cell are considered as limiting timestep
+        #
+        limitingCells = [cell for cell in allCells if cell[0] <= 2 * allCells[0][0]][:self.timestepCellsCount]
+
+        #
+        #   merge smallest cells and calculate how timestep improves
+        #
+        mergedMesh = {axis: list(mesh[axis]) for axis in self.axisList}
+        for size, axis, start, stop in limitingCells:
+            if start in mergedMesh[axis] and stop in mergedMesh[axis] and len(mergedMesh[axis]) > 2:
+                mergedMesh[axis].remove(start)
+                mergedMesh[axis].remove(stop)
+                mergedMesh[axis].append((start + stop) / 2)
+                mergedMesh[axis].sort()
+        mergedTimestep = self.getTimestep_s(mergedMesh, refUnit)
+
+        for size, axis, start, stop in limitingCells:
+            gridName, objectLabel = self.getIssueOrigin(axis, start, stop)
+            issues.append({
+                'type': 'timestep',
+                'axis': axis,
+                'coord': start,
+                'message': f"{axis} = {start:g} .. {stop:g}: cell {size:g} limits timestep to {currentTimestep:.3e} s",
+                'gridName': gridName,
+                'objectLabel': objectLabel,
+                'suggestion': f"merge lines {start:g} and {stop:g} into {(start + stop) / 2:g} or set minimal gridline spacing above {size:g}, timestep after merging smallest cells {mergedTimestep:.3e} s",
+            })
+        return issues
+
+    def analyzeMesh(self, mesh, materialRegions=None, fMax_Hz=0, refUnit=1.0):
+        """
+        Run all checks on calculated mesh lines.
+        :param mesh: dictionary {'x': [...], 'y': [...], 'z': [...]} with sorted coordinates in drawing units
+        :param materialRegions: list of material regions as returned by getMaterialRegions()
+        :param fMax_Hz: max. simulated frequency
+        :param refUnit: drawing unit in meters
+        :return: list of issues
+        """
+        issues = []
+        issues += self.analyzeGrading(mesh)
+        issues += self.analyzeMaterialWavelength(mesh, materialRegions if materialRegions is not None else [], fMax_Hz, refUnit)
+        issues += self.analyzeTimestep(mesh, refUnit)
+        return issues
+
+    def analyzeMeshQuality(self):
+        """
+        Calculate mesh lines from GUI settings and analyze them.
+        :return: tuple (mesh, issues)
+        """
+        mesh = self.calculateMeshLines()
+
+        #
+        #   custom excitation function can contain any frequencies, generated scripts don't derive max. resolution from it
+        #   (max_res = 0) so wavelength check has no reference frequency and isn't done
+        #
+        fMax_Hz = self.getMaxFrequencyFromExcitation_Hz()
+        excitationSettings = self.getExcitationSettings()
+        self.wavelengthCheckSkipReason = None
+        if excitationSettings is not None and excitationSettings.getType() == 'custom':
+            self.wavelengthCheckSkipReason = "custom excitation has no defined max. frequency"
+            fMax_Hz = 0
+
+        issues = self.analyzeMesh(mesh, self.getMaterialRegions(), fMax_Hz, self.getUnitLengthFromUI_m())
+        return mesh, issues
+
+    def getReportText(self, mesh, issues, maxIssuesPerType=10):
+        """
+        :return: human readable report, for each issue type just first maxIssuesPerType issues are listed
+        """
+        titles = {
+            'grading': f"Neighbour cells ratio above {self.gradingThreshold:g}",
+            'lambda': f"Cells bigger than lambda/{self.cellsPerWavelength} in material",
+            'timestep': "Cells limiting timestep",
+        }
+
+        report = f"Mesh {len(mesh['x'])} x {len(mesh['y'])} x {len(mesh['z'])} lines, {max(0, len(mesh['x'])-1) * max(0, len(mesh['y'])-1) * max(0, len(mesh['z'])-1)} cells\n"
+        for issueType in ['grading', 'lambda', 'timestep']:
+            typeIssues = [issue for issue in issues if issue['type'] == issueType]
+            if issueType == 'lambda' and self.wavelengthCheckSkipReason is not None:
+                report += f"\n{titles[issueType]}: not checked, {self.wavelengthCheckSkipReason}\n"
+                continue
+            report += f"\n{titles[issueType]}: {len(typeIssues)}\n"
+            for issue in typeIssues[:maxIssuesPerType]:
+                report += f"  {issue['message']}\n"
+                report += f"    source: grid '{issue['gridName']}', object '{issue['objectLabel']}'\n"
+                report += f"    suggestion: {issue['suggestion']}\n"
+            if len(typeIssues) > maxIssuesPerType:
+                report += f"  ... {len(typeIssues) - maxIssuesPerType} more\n"
+        return report
@@ -0,0 +1,214 @@
+#   author: Lubomir Jagos
+#
+#
+import math
+
+from PySide import QtCore
+
+from utilsOpenEMS.MeshTools.MeshLinesCalculator import MeshLinesCalculator
+
+#
+#   Proposes smallest simulation box around structure which keeps given clearance (default lambda/4 at lowest excitation
+#   frequency) from absorbing boundaries, and PML thickness for each side.
+#
+#   Structure is made from objects assigned to materials which are not air (epsilon = mue = 1 without losses), ports and
+#   lumped parts. Current simulation box is given by calculated mesh lines or model boundary box if there are no mesh lines.
+#
+#   openEMS PML is placed inside mesh, so for PML side box edge is at clearance + PML cells from structure. Sides with
+#   PEC or PMC are intentional walls (ground plane, symmetry), their position is kept as it is.
+#
+class SimulationBoxEstimator(MeshLinesCalculator):
+
+    sidesList = ['xmin', 'xmax', 'ymin', 'ymax', 'zmin', 'zmax']
+
+    #
+    #   constructor, get access to form GUI
+    #
+    def __init__(self, form, statusBar = None, clearanceLambda=0.25, minPmlCells=8, maxPmlCells=20):
+        """
+        :param clearanceLambda: clearance between structure and absorbing boundary as fraction of lowest frequency wavelength
+        :param minPmlCells: minimal PML thickness in cells, 8 is openEMS default
+        :param maxPmlCells: maximal proposed PML thickness in cells
+        """
+        super(SimulationBoxEstimator, self).__init__(form, statusBar)
+
+        self.clearanceLambda = clearanceLambda
+        self.minPmlCells = minPmlCells
+        self.maxPmlCells = maxPmlCells
+
+    def getBoundaryConditions(self):
+        """
+        Boundary conditions as set in GUI, same source as getBoundaryConditionsScriptLines().
+        :return: dictionary side -> (type, PML cells), ie. {'xmin': ('PML', 8), ...}
+        """
+        return {
+            'xmin': (self.form.BCxmin.currentText(), self.form.PMLxmincells.value()),
+            'xmax': (self.form.BCxmax.currentText(), self.form.PMLxmaxcells.value()),
+            'ymin': (self.form.BCymin.currentText(), self.form.PMLymincells.value()),
+            'ymax': (self.form.BCymax.currentText(), self.form.PMLymaxcells.value()),
+            'zmin': (self.form.BCzmin.currentText(), self.form.PMLzmincells.value()),
+            'zmax': (self.form.BCzmax.currentText(), self.form.PMLzmaxcells.value()),
+        }
+
+    def getStructureBox(self):
+        """
+        :return: dictionary {'x': (min, max), 'y': (min, max), 'z': (min, max)} in drawing units or None if there is no structure
+        """
+        boxes = []
+        for region in self.getMaterialRegions():
+            isAir = region['type'] == 'userdefined' and region['epsilon'] == 1.0 and region['mue'] == 1.0
+            if not isAir:
+                boxes.append(region['box'])
+
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+        for categoryName in ["Port", "LumpedPart"]:
+            category = self.form.objectAssignmentRightTreeWidget.findItems(categoryName, QtCore.Qt.MatchFixedString)
+            if len(category) == 0:
+                continue
+            for k in range(category[0].childCount()):
+                for n in range(category[0].child(k).childCount()):
+                    fcObject = self.cadHelpers.getObjectsByLabel(category[0].child(k).child(n).text(0))
+                    if (not fcObject) or (not "Shape" in dir(fcObject[0])):
+                        continue
+                    bbCoords = self.cadHelpers.getObjectBoundBox(fcObject[0])
+                    boxes.append({
+                        'x': (sf * bbCoords.XMin, sf * bbCoords.XMax),
+                        'y': (sf * bbCoords.YMin, sf * bbCoords.YMax),
+                        'z': (sf * bbCoords.ZMin, sf * bbCoords.ZMax),
+                    })
+
+        if len(boxes) == 0:
+            return None
+        return {axis: (min([box[axis][0] for box in boxes]), max([box[axis][1] for box in boxes])) for axis in self.axisList}
+
+    def getCurrentBox(self, mesh):
+        """
+        :return: current simulation box in drawing units from mesh lines or from model boundary box
+        """
+        if all(len(mesh[axis]) > 1 for axis in self.axisList):
+            return {axis: (mesh[axis][0], mesh[axis][-1]) for axis in self.axisList}
+
+        modelBoundaryBox = self.cadHelpers.getModelBoundaryBox(self.form.objectAssignmentRightTreeWidget)
+        if modelBoundaryBox is None:
+            return None
+
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+        minX, minY, minZ, maxX, maxY, maxZ = [sf * coord for coord in modelBoundaryBox]
+        return {'x': (minX, maxX), 'y': (minY, maxY), 'z': (minZ, maxZ)}
+
+    def proposeBox(self, structureBox, currentBox, boundaryConditions, fLow_Hz, fMax_Hz, refUnit):
+        """
+        :param structureBox: box around structure in drawing units
+        :param currentBox: current simulation box in drawing units
+        :param boundaryConditions: dictionary side -> (type, PML cells)
+        :param fLow_Hz: lowest frequency of interest
+        :param fMax_Hz: highest frequency, cell size at boundary is lambda/20 of it
+        :param refUnit: drawing unit in meters
+        :return: tuple (proposed box, proposed PML cells per side, clearance, cell size at boundary), lengths are in drawing units
+        """
+        wavelengthLow = 299792458 / fLow_Hz / refUnit
+        clearance = self.clearanceLambda * wavelengthLow
+        boundaryCellSize = (299792458 / fMax_Hz / 20 / refUnit) if fMax_Hz > 0 else wavelengthLow / 20
+
+        proposedBox = {}
+        pmlCells = {}
+        for axis in self.axisList:
+            sideCoords = []
+            for side, direction in [(axis + 'min', -1), (axis + 'max', 1)]:
+                bcType, currentPmlCells = boundaryConditions[side]
+                structureEdge = structureBox[axis][0] if direction < 0 else structureBox[axis][1]
+                currentEdge = currentBox[axis][0] if direction < 0 else currentBox[axis][1]
+
+                if bcType == "PML":
+                    #	PML should be at least about lambda/10 thick at lowest frequency to absorb well
+                    pmlCells[side] = min(self.maxPmlCells, max(self.minPmlCells, int(math.ceil(wavelengthLow / 10 / boundaryCellSize))))
+                    sideCoords.append(structureEdge + direction * (clearance + pmlCells[side] * boundaryCellSize))
+                elif bcType == "MUR":
+                    pmlCells[side] = 0
+                    sideCoords.append(structureEdge + direction * clearance)
+                else:
+                    pmlCells[side] = 0
+                    sideCoords.append(currentEdge)
+            proposedBox[axis] = tuple(sideCoords)
+
+        return proposedBox, pmlCells, clearance, boundaryCellSize
+
+    def estimateLinesCount(self, lines, currentRange, proposedRange, cellSize):
+        """
+        Lines count in axis after box is changed, lines outside proposed range are removed, extension is meshed by cellSize.
+        """
+        if len(lines) > 1:
+            count = len([line for line in lines if proposedRange[0] <= line <= proposedRange[1]])
+        else:
+            count = int(math.ceil((min(currentRange[1], proposedRange[1]) - max(currentRange[0], proposedRange[0])) / cellSize)) + 1
+        count += int(math.ceil(max(0, currentRange[0] - proposedRange[0]) / cellSize))
+        count += int(math.ceil(max(0, proposedRange[1] - currentRange[1]) / cellSize))
+        return max(count, 2)
+
+    def estimateCellsCount(self, mesh, currentBox, proposedBox, cellSize):
+        """
+        :return: tuple (current cells count, proposed cells count)
+        """
+        currentCells = 1
+        proposedCells = 1
+        for axis in self.axisList:
+            if len(mesh[axis]) > 1:
+                currentLines = len(mesh[axis])
+            else:
+                currentLines = int(math.ceil((currentBox[axis][1] - currentBox[axis][0]) / cellSize)) + 1
+            currentCells *= max(1, currentLines - 1)
+            proposedCells *= max(1, self.estimateLinesCount(mesh[axis], currentBox[axis], proposedBox[axis], cellSize) - 1)
+        return currentCells, proposedCells
+
+    def getSimulationBoxProposal(self):
+        """
+        Calculate simulation box proposal from GUI settings.
+        :return: dictionary with proposal or None if it cannot be calculated, error message is displayed
+        """
+        fLow_Hz = self.getMinFrequencyFromExcitation_Hz()
+        if fLow_Hz <= 0:
+            self.guiHelpers.displayMessage("Cannot propose simulation box, lowest frequency cannot be determined from excitation.")
+            return None
+
+        structureBox = self.getStructureBox()
+        if structureBox is None:
+            self.guiHelpers.displayMessage("Cannot propose simulation box, there are no objects assigned to non air materials or ports.")
+            return None
+
+        mesh = self.calculateMeshLines()
+        currentBox = self.getCurrentBox(mesh)
+        if currentBox is None:
+            self.guiHelpers.displayMessage("Cannot propose simulation box, current simulation box is unknown.")
+            return None
+
+        refUnit = self.getUnitLengthFromUI_m()
+        proposedBox, pmlCells, clearance, boundaryCellSize = self.proposeBox(structureBox, currentBox, self.getBoundaryConditions(), fLow_Hz, self.getMaxFrequencyFromExcitation_Hz(), refUnit)
+        currentCells, proposedCells = self.estimateCellsCount(mesh, currentBox, proposedBox, boundaryCellSize)
+
+        return {
+            'structureBox': structureBox,
+            'currentBox': currentBox,
+            'proposedBox': proposedBox,
+            'pmlCells': pmlCells,
+            'clearance': clearance,
+            'boundaryCellSize': boundaryCellSize,
+            'currentCells': currentCells,
+            'proposedCells': proposedCells,
+        }
+
+    def getReportText(self, proposal):
+        unitStr = self.form.simParamsDeltaUnitList.currentText()
+        _box = lambda box: ", ".join([f"{axis}: {box[axis][0]:g} .. {box[axis][1]:g}" for axis in self.axisList])
+
+        report = ""
+        report += f"Structure extent [{unitStr}]: {_box(proposal['structureBox'])}\n"
+        report += f"Current simulation box [{unitStr}]: {_box(proposal['currentBox'])}\n"
+        report += f"Proposed simulation box [{unitStr}]: {_box(proposal['proposedBox'])}\n"
+        report += f"Clearance {proposal['clearance']:g} {unitStr}, cell size at boundary {proposal['boundaryCellSize']:g} {unitStr}\n"
+        report += "Proposed PML cells: " + ", ".join([f"{side}: {proposal['pmlCells'][side]}" for side in self.sidesList if proposal['pmlCells'][side] > 0]) + "\n"
+        report += f"Cells count current: {proposal['currentCells']}, proposed: {proposal['proposedCells']}"
+        if proposal['currentCells'] > 0:
+            savings = 100 * (1 - proposal['proposedCells'] / proposal['currentCells'])
+            report += f" ({savings:.1f}% saved)" if savings >= 0 else f" ({-savings:.1f}% more, current box is too small for clearance)"
+        report += "\n"
+        return report
@@ -0,0 +1,198 @@
+#   author: Lubomir Jagos
+#
+#
+from PySide import QtCore
+
+from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
+
+#
+#   Mirror symmetry detection for planes x = const, y = const, z = const going through center of structure.
+#
+#   Structure is made from objects assigned to materials, ports and lumped parts. Plane is symmetric when each object
+#   has counterpart with same assignment, mirrored boundary box, same volume (area for sheets) and mirrored center of mass,
+#   object can be its own counterpart. All ports must be cut in half by plane, their direction decides plane boundary condition:
+#       port excites field parallel to plane  -> field is symmetric, plane is magnetic wall PMC
+#       port excites field normal to plane    -> field is antisymmetric, plane is electric wall PEC
+#
+#   Excitation signal is scalar so it doesn't break symmetry. Just lumped ports are supported as their resistance is
+#   scaled for cropped model, see CommonScriptLinesGenerator.getSymmetryPortRScale().
+#
+class SymmetryAnalyzer(CommonScriptLinesGenerator):
+
+    axisList = ['x', 'y', 'z']
+
+    #
+    #   constructor, get access to form GUI
+    #
+    def __init__(self, form, statusBar = None, relativeTolerance=1e-6):
+        """
+        :param relativeTolerance: coordinates tolerance as fraction of structure size
+        """
+        super(SymmetryAnalyzer, self).__init__(form, statusBar)
+
+        self.relativeTolerance = relativeTolerance
+
+    def getAssignedObjects(self):
+        """
+        :return: list of dictionaries {'category', 'group', 'label', 'settings', 'box', 'measure', 'centerOfMass'} in drawing units
+        """
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+
+        objects = []
+        for categoryName in ["Material", "Port", "LumpedPart"]:
+            category = self.form.objectAssignmentRightTreeWidget.findItems(categoryName, QtCore.Qt.MatchFixedString)
+            if len(category) == 0:
+                continue
+            for k in range(category[0].childCount()):
+                settingsItem = category[0].child(k)
+                for n in range(settingsItem.childCount()):
+                    objectLabel = settingsItem.child(n).text(0)
+                    fcObject = self.cadHelpers.getObjectsByLabel(objectLabel)
+                    if (not fcObject) or (not "Shape" in dir(fcObject[0])):
+                        continue
+                    shape = fcObject[0].Shape
+                    bbCoords = self.cadHelpers.getObjectBoundBox(fcObject[0])
+
+                    #	compound shapes don't have center of mass, then just boundary box and volume are compared
+                    try:
+                        centerOfMass = {'x': sf * shape.CenterOfMass.x, 'y': sf * shape.CenterOfMass.y, 'z': sf * shape.CenterOfMass.z}
+                    except Exception:
+                        centerOfMass = None
+
+                    measure = getattr(shape, 'Volume', 0)
+                    if measure == 0:
+                        measure = getattr(shape, 'Area', 0)
+
+                    objects.append({
+                        'category': categoryName,
+                        'group': settingsItem.text(0),
+                        'label': objectLabel,
+                        'settings': settingsItem.data(0, QtCore.Qt.UserRole),
+                        'box': {
+                            'x': (sf * bbCoords.XMin, sf * bbCoords.XMax),
+                            'y': (sf * bbCoords.YMin, sf * bbCoords.YMax),
+                            'z': (sf * bbCoords.ZMin, sf * bbCoords.ZMax),
+                        },
+                        'measure': measure,
+                        'centerOfMass': centerOfMass,
+                    })
+        return objects
+
+    def isMirrorCounterpart(self, objA, objB, axis, coord, tolerance):
+        """
+        :return: True if objB is objA mirrored by plane axis = coord
+        """
+        if objA['category'] != objB['category'] or objA['group'] != objB['group']:
+            return False
+
+        for boxAxis in self.axisList:
+            boxA = objA['box'][boxAxis]
+            boxB = objB['box'][boxAxis]
+            if boxAxis == axis:
+                boxA = (2*coord - boxA[1], 2*coord - boxA[0])
+            if abs(boxA[0] - boxB[0]) > tolerance or abs(boxA[1] - boxB[1]) > tolerance:
+                return False
+
+        #	volume is calculated from tessellation in CAD, it's compared with lower precision than coordinates
+        if abs(objA['measure'] - objB['measure']) > 1e-3 * max(abs(objA['measure']), abs(objB['measure'])):
+            return False
+
+        if objA['centerOfMass'] is not None and objB['centerOfMass'] is not None:
+            for comAxis in self.axisList:
+                comA = 2*coord - objA['centerOfMass'][comAxis] if comAxis == axis else objA['centerOfMass'][comAxis]
+                if abs(comA - objB['centerOfMass'][comAxis]) > tolerance:
+                    return False
+
+        return True
+
+    def getPortExcitationAxis(self, port):
+        """
+        Axis of port excitation field, it's taken from same base vectors as generators use, ie. y- is [0 -1 0] so it's y.
+        :return: tuple (axis 'x', 'y', 'z' or None, reason if None)
+        """
+        direction = port['settings'].direction
+        if direction.startswith(("r", "theta")):
+            return None, f"port {port['label']} has cylindrical direction {direction}, just cartesian directions are supported"
+
+        baseVector = self.baseVectorStr.get(direction)
+        if baseVector is None:
+            return None, f"port {port['label']} has direction {direction}, just x, y, z directions are supported"
+
+        baseVectorComponents = baseVector.strip("[]").split()
+        return self.axisList[[component != "0" for component in baseVectorComponents].index(True)], None
+
+    def getPortsBoundaryCondition(self, objects, axis, coord, tolerance):
+        """
+        :return: tuple (boundary condition 'PEC' or 'PMC' or None, reason if None)
+        """
+        ports = [obj for obj in objects if obj['category'] == 'Port']
+        if len(ports) == 0:
+            return None, "there is no port, boundary condition on plane cannot be determined"
+
+        boundaryConditions = set()
+        for port in ports:
+            portMin, portMax = port['box'][axis]
+            if not (portMin + tolerance < coord < portMax - tolerance):
+                return None, f"port {port['label']} isn't cut in half by plane"
+            if port['settings'].getType() != 'lumped':
+                return None, f"port {port['label']} is {port['settings'].getType()}, just lumped ports can be cut by symmetry plane"
+            portAxis, reason = self.getPortExcitationAxis(port)
+            if portAxis is None:
+                return None, reason
+            boundaryConditions.add('PEC' if portAxis == axis else 'PMC')
+
+        if len(boundaryConditions) > 1:
+            return None, "ports excite both symmetric and antisymmetric field"
+        return boundaryConditions.pop(), None
+
+    def analyzePlane(self, objects, axis):
+        """
+        :return: dictionary {'axis', 'coord', 'bc', 'symmetric', 'reason'}
+        """
+        coord = (min([obj['box'][axis][0] for obj in objects]) + max([obj['box'][axis][1] for obj in objects])) / 2
+        extent = max([max(obj['box'][boxAxis][1] for obj in objects) - min(obj['box'][boxAxis][0] for obj in objects) for boxAxis in self.axisList])
+        tolerance = self.relativeTolerance * max(extent, 1.0)
+
+        result = {'axis': axis, 'coord': coord, 'bc': None, 'symmetric': False, 'reason': None}
+        for obj in objects:
+            if not any([self.isMirrorCounterpart(obj, other, axis, coord, tolerance) for other in objects]):
+                result['reason'] = f"object {obj['label']} ({obj['category']} {obj['group']}) has no mirror counterpart"
+                return result
+
+        result['bc'], result['reason'] = self.getPortsBoundaryCondition(objects, axis, coord, tolerance)
+        result['symmetric'] = result['bc'] is not None
+        return result
+
+    def analyzeSymmetry(self):
+        """
+        :return: list of plane results for x, y, z, empty if there are no assigned objects
+        """
+        objects = self.getAssignedObjects()
+        if len(objects) == 0:
+            return []
+        return [self.analyzePlane(objects, axis) for axis in self.axisList]
+
+    def getSymmetryPlanesText(self, planes):
+        """
+        Symmetry planes in format used by simulation params, part with higher coordinates is kept.
+        """
+        return "; ".join([f"{plane['axis']} >= {float(plane['coord']):.12g} {plane['bc']}" for plane in planes])
+
+    def getReportText(self, results):
+        if len(results) == 0:
+            return "There are no objects assigned to materials, ports or lumped parts.\n"
+
+        unitStr = self.form.simParamsDeltaUnitList.currentText()
+        report = ""
+        for result in results:
+            if result['symmetric']:
+                report += f"{result['axis']} = {result['coord']:g} {unitStr}: symmetric, plane boundary condition {result['bc']}\n"
+            else:
+                report += f"{result['axis']} = {result['coord']:g} {unitStr}: not symmetric, {result['reason']}\n"
+
+        symmetricPlanes = [result for result in results if result['symmetric']]
+        if len(symmetricPlanes) >= 2:
+            report += f"\nQuarter model possible: {self.getSymmetryPlanesText(symmetricPlanes[:2])}, about 4x less memory and runtime\n"
+        if len(symmetricPlanes) >= 1:
+            report += f"\nHalf model possible: {self.getSymmetryPlanesText(symmetricPlanes[:1])}, about 2x less memory and runtime\n"
+        return report
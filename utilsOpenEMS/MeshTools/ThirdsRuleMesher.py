@@ -0,0 +1,77 @@
+#   author: Lubomir Jagos
+#
+#
+#   Thirds rule for metal edges, openEMS gives most accurate results when metal edge is not on gridline but there is
+#   gridline 1/3 of cell inside metal and 2/3 of cell outside.
+#
+#           outside            |   metal
+#       ---------|------------edge----|---------
+#             -2h/3                 +h/3
+#
+#   Edges are taken from boundary box of objects, so it's accurate for rectangular traces and pads which are most common
+#   case for microstrip and CPW structures.
+#
+class ThirdsRuleMesher:
+
+    def __init__(self, edgeResolution):
+        """
+        :param edgeResolution: cell size h around edge in drawing units
+        """
+        self.edgeResolution = edgeResolution
+
+    def getEdgeLines(self, edgeMin, edgeMax):
+        """
+        Lines around edges of one metal object in one axis.
+        :return: list of coordinates, if object is thinner than edge resolution its edges are returned as they are
+        """
+        h = self.edgeResolution
+        if h <= 0 or (edgeMax - edgeMin) < h:
+            return [edgeMin, edgeMax] if edgeMin != edgeMax else [edgeMin]
+
+        return [edgeMin - 2*h/3, edgeMin + h/3, edgeMax - h/3, edgeMax + 2*h/3]
+
+    @staticmethod
+    def mergeIntervals(intervals):
+        """
+        Merge touching or overlapping intervals, metal objects which touch are one conductor and have edges only at its
+        outer boundaries.
+        :param intervals: list of tuples (min, max)
+        :return: sorted list of disjoint tuples (min, max)
+        """
+        mergedIntervals = []
+        for edgeMin, edgeMax in sorted(intervals):
+            if len(mergedIntervals) > 0 and edgeMin <= mergedIntervals[-1][1]:
+                mergedIntervals[-1] = (mergedIntervals[-1][0], max(mergedIntervals[-1][1], edgeMax))
+            else:
+                mergedIntervals.append((edgeMin, edgeMax))
+        return mergedIntervals
+
+    def getFixedLines(self, axis, objectBoxes):
+        """
+        Fixed lines for smooth mesh, metal objects have thirds rule lines instead of their edges, other objects have
+        their boundaries.
+        :param axis: 'x', 'y' or 'z'
+        :param objectBoxes: list of tuples (box, isMetal), box is dictionary {'x': (min, max), 'y': (min, max), 'z': (min, max)}
+        :return: sorted list of coordinates, touching or overlapping metal objects are merged before lines are placed
+        """
+        metalIntervals = []
+        otherLines = []
+        for box, isMetal in objectBoxes:
+            edgeMin, edgeMax = box[axis]
+            if isMetal:
+                metalIntervals.append((edgeMin, edgeMax))
+            else:
+                otherLines += [edgeMin, edgeMax]
+
+        metalLines = []
+        for edgeMin, edgeMax in self.mergeIntervals(metalIntervals):
+            metalLines += self.getEdgeLines(edgeMin, edgeMax)
+
+        #
+        #   boundary of dielectric which is same as metal edge would break thirds rule, metal edge has precedence
+        #
+        h = self.edgeResolution
+        metalEdges = [coord for box, isMetal in objectBoxes if isMetal for coord in box[axis]]
+        otherLines = [line for line in otherLines if not any([abs(line - edge) < h for edge in metalEdges])]
+
+        return sorted(set(metalLines + otherLines))
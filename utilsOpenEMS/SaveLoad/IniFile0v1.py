@@ -7,6 +7,7 @@ from PySide import QtGui, QtCore, QtWidgets
 from utilsOpenEMS.GuiHelpers.GuiSignals import GuiSignals
 
 from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
+from utilsOpenEMS.GuiHelpers.PriorityListIndex import PriorityListIndex
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
 
 from utilsOpenEMS.SettingsItem.SettingsItem import SettingsItem
@@ -23,71 +24,176 @@ from utilsOpenEMS.SettingsItem.FreeCADSettingsItem import FreeCADSettingsItem
 from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r
 
 from utilsOpenEMS.SaveLoad.IniValidator0v1 import IniValidator0v1
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class IniFile0v1:
 
-    def __init__(self, form, statusBar = None, guiSignals = None, APP_DIR = ""):
+    fileDialogFilter = 'Simulation settings (*.ini *.json *.msgpack)'
+    defaultFileSuffix = "_settings.ini"       # default settings file is {document name}_settings.ini next to document
+    fileFormatVersion = "0.1"
+
+    #   sections which read() loads into GUI, groups of other sections (FILE) are not accessed
+    readSectionNames = [
+        "EXCITATION", "GRID", "MATERIAL", "PORT", "LUMPEDPART", "POSTPROCESSING", "PRIORITYLIST", "PROBE", "SIMULATION",
+        "SOLVER", "BOUNDARYCONDITION", "_OBJECT",
+    ]
+
+    def __init__(self, form, statusBar = None, guiSignals = None, APP_DIR = "", dirtyTracker = None):
+        """
+        :param dirtyTracker: SettingsDirtyTracker of form, if set files of format 0.2 are saved incrementally
+        """
         self.form = form
         self.statusBar = statusBar
         self.cadHelpers = FactoryCadInterface.createHelper(APP_DIR=APP_DIR)
         self.guiHelpers = GuiHelpers(self.form, statusBar = self.statusBar, APP_DIR=APP_DIR)
         self.guiSignals = guiSignals
         self.APP_DIR = APP_DIR
+        self.dirtyTracker = dirtyTracker
+        self.jsonSettingsFile = None
 
     def writeToFile(self):
         freeCadFileDir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
-        filename, filter = QtWidgets.QFileDialog.getSaveFileName(parent=self.form, caption='Write simulation settings file', dir=freeCadFileDir, filter='*.ini')
+        filename, filter = QtWidgets.QFileDialog.getSaveFileName(parent=self.form, caption='Write simulation settings file', dir=freeCadFileDir, filter=self.fileDialogFilter)
         if filename != '':
-            self.write(filename)
+            self.getSettingsFileForName(filename).write(filename)
             return filename
 
         return None
 
     def readFromFile(self):
         freeCadFileDir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
-        filename, filter = QtWidgets.QFileDialog.getOpenFileName(parent=self.form, caption='Open simulation settings file', dir=freeCadFileDir, filter='*.ini')
+        filename, filter = QtWidgets.QFileDialog.getOpenFileName(parent=self.form, caption='Open simulation settings file', dir=freeCadFileDir, filter=self.fileDialogFilter)
         if filename != '':
-            IniValidator0v1.checkFile(filename)
-            self.read(filename)
+            settingsFile = self.getSettingsFileForName(filename)
+            if settingsFile is self:
+                IniValidator0v1.checkFile(filename)
+            settingsFile.read(filename)
             return filename
 
         return None
 
-    ##
-    #   SAVE SETTINGS METHOD
+    def getSettingsFileForName(self, filename):
+        """
+        Settings file object able to read/write file based on its extension, .json and .msgpack files are JsonFile0v2
+        format, everything else is .ini file handled by this object. JsonFile0v2 object is kept as it remembers last
+        saved file for incremental saves.
+        """
+        if os.path.splitext(filename)[1].lower() in ['.json', '.msgpack']:
+            if self.jsonSettingsFile is None:
+                from utilsOpenEMS.SaveLoad.JsonFile0v2 import JsonFile0v2
+                self.jsonSettingsFile = JsonFile0v2(self.form, statusBar=self.statusBar, guiSignals=self.guiSignals, APP_DIR=self.APP_DIR, dirtyTracker=self.dirtyTracker)
+            return self.jsonSettingsFile
+        return self
+
+    #
+    #   Storage access, settings are written and read through QSettings interface (beginGroup, setValue, value, ...),
+    #   other formats provide object with same interface and store JSON values natively.
     #
+    def openSettings(self, filename):
+        return QtCore.QSettings(filename, QtCore.QSettings.IniFormat)
+
+    def getJsonValue(self, settings, key):
+        return json.loads(settings.value(key))
+
+    def setJsonValue(self, settings, key, value):
+        settings.setValue(key, json.dumps(value))
+
+    @staticmethod
+    def getSectionName(groupName):
+        """
+        :return: section of group, it's prefix of group name, ie. MATERIAL for MATERIAL-PEC, _OBJECT for _OBJECT0-Box
+        """
+        sectionNameMatch = re.match(r"_?[A-Z]+", groupName)
+        return sectionNameMatch.group(0) if sectionNameMatch else groupName
+
+    def getGroupsToRead(self, settings):
+        """
+        :return: groups loaded by read() in order of settings file, settings items are before _OBJECT groups assigned to them
+        """
+        return [settingsGroup for settingsGroup in settings.childGroups() if self.getSectionName(settingsGroup) in self.readSectionNames]
+
     def write(self, filename=None):
 
         if filename is None or filename == False:
             programname = os.path.basename(self.cadHelpers.getCurrDocumentFileName())
             programdir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
             programbase, ext = os.path.splitext(programname)  # extract basename and ext from filename
-            outFile = programdir + '/' + programbase + "_settings.ini"
+            outFile = programdir + '/' + programbase + self.defaultFileSuffix
         else:
             outFile = filename
 
-        print("Saving settings to file: " + outFile)
+        logger.info("Saving settings to file: %s", outFile)
         if self.statusBar is not None:
             self.statusBar.showMessage("Saving settings to file...", 5000)
             QtWidgets.QApplication.processEvents()
 
+        settings = self.openSettingsForWrite(outFile)
+
+        for sectionNames, writeSection in self.getSectionWriters():
+            if self.isSectionChanged(sectionNames):
+                self.clearSections(settings, sectionNames)
+                writeSection(settings)
+
+        settings.sync()
+        self.sectionsSaved(outFile)
+
+        # sys.exit()  # prevents second call
+        logger.info("Current settings saved to file: %s", outFile)
+        self.guiHelpers.displayMessage("Settings saved to file: " + outFile, forceModal=False)
+        return
+
+    def getSectionWriters(self):
+        """
+        :return: list of (sections names, method writing them), section is prefix of group name, ie. MATERIAL for MATERIAL-PEC
+        """
+        return [
+            (["FILE"], self.writeFileInfo),
+            (["MATERIAL"], self.writeMaterials),
+            (["GRID"], self.writeGrids),
+            (["EXCITATION"], self.writeExcitations),
+            (["PORT"], self.writePorts),
+            (["PROBE"], self.writeProbes),
+            (["SIMULATION", "SOLVER"], self.writeSimulationParams),
+            (["LUMPEDPART"], self.writeLumpedParts),
+            (["BOUNDARYCONDITION"], self.writeBoundaryConditions),
+            (["_OBJECT"], self.writeObjectAssignments),
+            (["PRIORITYLIST"], self.writePriorityLists),
+            (["POSTPROCESSING"], self.writePostprocessing),
+        ]
+
+    #
+    #   Write hooks, .ini file is always written whole, JsonFile0v2 overrides them to rewrite just changed sections.
+    #
+    def openSettingsForWrite(self, outFile):
         if (os.path.exists(outFile)):
             os.remove(outFile)  # Remove outFile in case an old version exists.
+        return self.openSettings(outFile)
 
-        settings = QtCore.QSettings(outFile, QtCore.QSettings.IniFormat)
+    def isSectionChanged(self, sectionNames):
+        return True
 
+    def clearSections(self, settings, sectionNames):
+        return
+
+    def sectionsSaved(self, outFile):
+        return
+
+    def writeFileInfo(self, settings):
         #file info
         settings.beginGroup("FILE-INFO")
-        settings.setValue("version", "0.1")
+        settings.setValue("version", self.fileFormatVersion)
         settings.endGroup()
 
+    def writeMaterials(self, settings):
         #
         # SAVE MATERIAL SETTINGS
         #
         materialList = self.cadHelpers.getAllTreeWidgetItems(self.form.materialSettingsTreeView)
         for k in range(len(materialList)):
-            print("Save new MATERIAL constants into file: ")
-            print(materialList[k].constants)
+            logger.debug("Save new MATERIAL constants into file: ")
+            logger.debug(materialList[k].constants)
 
             settings.beginGroup("MATERIAL-" + materialList[k].getName())
             settings.setValue("type", materialList[k].type)
@@ -110,16 +216,17 @@ class IniFile0v1:
                     settings.setValue("conductingSheetThicknessUnits", "um")
                     settings.setValue("conductingSheetConductivity", 50e6)
                     settings.setValue("conductingSheetPermeability", 1.0)
-                    print(f"IniFile.py > write(), ERROR, set default values for conductingSheetThicknessValue, conductingSheetThicknessUnits\n{e}")
+                    logger.error(f"IniFile.py > write(), ERROR, set default values for conductingSheetThicknessValue, conductingSheetThicknessUnits\n{e}")
 
             settings.endGroup()
 
+    def writeGrids(self, settings):
         #
         # SAVE GRID SETTINGS
         #
         gridList = self.cadHelpers.getAllTreeWidgetItems(self.form.gridSettingsTreeView)
         for k in range(len(gridList)):
-            print("Save new GRID constants into file: " + gridList[k].getName())
+            logger.debug("Save new GRID constants into file: %s", gridList[k].getName())
 
             settings.beginGroup("GRID-" + gridList[k].getName())
             settings.setValue("coordsType", gridList[k].coordsType)
@@ -133,56 +240,58 @@ class IniFile0v1:
                 settings.setValue("xenabled", gridList[k].xenabled)
                 settings.setValue("yenabled", gridList[k].yenabled)
                 settings.setValue("zenabled", gridList[k].zenabled)
-                settings.setValue("fixedDistance", json.dumps(gridList[k].fixedDistance))
+                self.setJsonValue(settings, "fixedDistance", gridList[k].fixedDistance)
             elif (gridList[k].type == "Fixed Count"):
                 settings.setValue("xenabled", gridList[k].xenabled)
                 settings.setValue("yenabled", gridList[k].yenabled)
                 settings.setValue("zenabled", gridList[k].zenabled)
-                settings.setValue("fixedCount", json.dumps(gridList[k].fixedCount))
+                self.setJsonValue(settings, "fixedCount", gridList[k].fixedCount)
             elif (gridList[k].type == "Smooth Mesh"):
                 settings.setValue("xenabled", gridList[k].xenabled)
                 settings.setValue("yenabled", gridList[k].yenabled)
                 settings.setValue("zenabled", gridList[k].zenabled)
-                settings.setValue("smoothMesh", json.dumps(gridList[k].smoothMesh))
+                self.setJsonValue(settings, "smoothMesh", gridList[k].smoothMesh)
             elif (gridList[k].type == "User Defined"):
                 settings.setValue("xenabled", gridList[k].xenabled)
                 settings.setValue("yenabled", gridList[k].yenabled)
                 settings.setValue("zenabled", gridList[k].zenabled)
-                settings.setValue("userDefined", json.dumps(gridList[k].userDefined))
+                self.setJsonValue(settings, "userDefined", gridList[k].userDefined)
             elif (gridList[k].type == "FEM Max Size"):
-                settings.setValue("femMesh", json.dumps(gridList[k].femMesh))
+                self.setJsonValue(settings, "femMesh", gridList[k].femMesh)
 
             try:
-                settings.setValue("gridOffset", json.dumps(gridList[k].gridOffset))
+                self.setJsonValue(settings, "gridOffset", gridList[k].gridOffset)
             except Exception as e:
                 settings.setValue("gridOffset", {'x': 0, 'y': 0, 'z': 0, 'units': 'um'})
-                print(f"IniFile.py > write(), ERROR, set default values for gridOffset\n{e}")
+                logger.error(f"IniFile.py > write(), ERROR, set default values for gridOffset\n{e}")
 
             settings.endGroup()
 
+    def writeExcitations(self, settings):
         #
         # SAVE EXCITATION
         #
         excitationList = self.cadHelpers.getAllTreeWidgetItems(self.form.excitationSettingsTreeView)
         for k in range(len(excitationList)):
-            print("Save new EXCITATION constants into file: " + excitationList[k].getName())
+            logger.debug("Save new EXCITATION constants into file: %s", excitationList[k].getName())
 
             settings.beginGroup("EXCITATION-" + excitationList[k].getName())
             settings.setValue("type", excitationList[k].type)
-            settings.setValue("sinusodial", json.dumps(excitationList[k].sinusodial))
-            settings.setValue("gaussian", json.dumps(excitationList[k].gaussian))
-            settings.setValue("custom", json.dumps(excitationList[k].custom))
-            settings.setValue("sweep", json.dumps(excitationList[k].sweep))
-            settings.setValue("fem_gaussian", json.dumps(excitationList[k].femGaussian))
+            self.setJsonValue(settings, "sinusodial", excitationList[k].sinusodial)
+            self.setJsonValue(settings, "gaussian", excitationList[k].gaussian)
+            self.setJsonValue(settings, "custom", excitationList[k].custom)
+            self.setJsonValue(settings, "sweep", excitationList[k].sweep)
+            self.setJsonValue(settings, "fem_gaussian", excitationList[k].femGaussian)
             settings.setValue("units", excitationList[k].units)
             settings.endGroup()
 
+    def writePorts(self, settings):
         #
         # SAVE PORT SETTINGS
         #
         portList = self.cadHelpers.getAllTreeWidgetItems(self.form.portSettingsTreeView)
         for k in range(len(portList)):
-            print("Save new PORT constants into file: " + portList[k].getName())
+            logger.debug("Save new PORT constants into file: %s", portList[k].getName())
 
             settings.beginGroup("PORT-" + portList[k].getName())
             settings.setValue("type", portList[k].type)
@@ -195,9 +304,9 @@ class IniFile0v1:
                     settings.setValue("isActive", portList[k].isActive)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                     settings.setValue("direction", portList[k].direction)
-                    settings.setValue("directionCustomVector", json.dumps(portList[k].directionCustomVector))
+                    self.setJsonValue(settings, "directionCustomVector", portList[k].directionCustomVector)
                 except Exception as e:
-                    print(f"{__file__} > write() lumped ERROR: {e}")
+                    logger.error(f"{__file__} > write() lumped ERROR: {e}")
 
             elif (portList[k].type == "circular waveguide"):
                 settings.setValue("isActive", portList[k].isActive)
@@ -227,7 +336,7 @@ class IniFile0v1:
                     settings.setValue("propagation", portList[k].mslPropagation)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                 except Exception as e:
-                    print(f"{__file__} > write() microstrip material ERROR: {e}")
+                    logger.error(f"{__file__} > write() microstrip material ERROR: {e}")
 
             elif (portList[k].type == "coaxial"):
                 try:
@@ -249,7 +358,7 @@ class IniFile0v1:
                     settings.setValue("conductorMaterial", portList[k].coaxialConductorMaterial)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                 except Exception as e:
-                    print(f"{__file__} > write() coaxial material ERROR: {e}")
+                    logger.error(f"{__file__} > write() coaxial material ERROR: {e}")
 
             elif (portList[k].type == "coplanar"):
                 try:
@@ -268,7 +377,7 @@ class IniFile0v1:
                     settings.setValue('measPlaneShiftUnits', portList[k].coplanarMeasPlaneShiftUnits)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                 except Exception as e:
-                    print(f"{__file__} > write() coplanar ERROR: {e}")
+                    logger.error(f"{__file__} > write() coplanar ERROR: {e}")
 
             elif (portList[k].type == "stripline"):
                 try:
@@ -284,7 +393,7 @@ class IniFile0v1:
                     settings.setValue('measPlaneShiftUnits', portList[k].striplineMeasPlaneShiftUnits)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                 except Exception as e:
-                    print(f"{__file__} > write() coplanar ERROR: {e}")
+                    logger.error(f"{__file__} > write() coplanar ERROR: {e}")
 
             elif (portList[k].type == "curve"):
                 try:
@@ -293,16 +402,17 @@ class IniFile0v1:
                     settings.setValue("isActive", portList[k].isActive)
                     settings.setValue("infiniteResistance", portList[k].infiniteResistance)
                 except Exception as e:
-                    print(f"{__file__} > write() curve ERROR: {e}")
+                    logger.error(f"{__file__} > write() curve ERROR: {e}")
 
             settings.endGroup()
 
+    def writeProbes(self, settings):
         #
         # SAVE PROBES SETTINGS
         #
         probeList = self.cadHelpers.getAllTreeWidgetItems(self.form.probeSettingsTreeView)
         for k in range(len(probeList)):
-            print("Save new PROBE constants into file: " + probeList[k].getName())
+            logger.debug("Save new PROBE constants into file: %s", probeList[k].getName())
 
             settings.beginGroup("PROBE-" + probeList[k].getName())
             settings.setValue("type", probeList[k].type)
@@ -314,7 +424,7 @@ class IniFile0v1:
                     settings.setValue("probeDomain", probeList[k].probeDomain)
                     settings.setValue("probeFrequencyList", probeList[k].probeFrequencyList)
                 except Exception as e:
-                    print(f"{__file__} > write() probe ERROR: {e}")
+                    logger.error(f"{__file__} > write() probe ERROR: {e}")
 
             elif (probeList[k].type == "dumpbox"):
                 try:
@@ -323,10 +433,11 @@ class IniFile0v1:
                     settings.setValue("dumpboxFileType", probeList[k].dumpboxFileType)
                     settings.setValue("dumpboxFrequencyList", probeList[k].dumpboxFrequencyList)
                 except Exception as e:
-                    print(f"{__file__} > write() dumpbox ERROR: {e}")
+                    logger.error(f"{__file__} > write() dumpbox ERROR: {e}")
 
             settings.endGroup()
 
+    def writeSimulationParams(self, settings):
         #
         # SAVE SIMULATION PARAMS
         #
@@ -358,6 +469,9 @@ class IniFile0v1:
         simulationSettings.params['min_gridspacing_y'] = self.form.genParamMinGridSpacingY.value()
         simulationSettings.params['min_gridspacing_z'] = self.form.genParamMinGridSpacingZ.value()
         simulationSettings.params['OverSampling'] = self.form.simParamsOverSampling.value()
+        simulationSettings.params['symmetry_enable'] = self.form.simParamsSymmetryEnable.isChecked()
+        simulationSettings.params['symmetry_planes'] = self.form.simParamsSymmetryPlanes.text()
+        simulationSettings.params['use_engine_profile'] = self.form.simParamsUseEngineProfile.isChecked()
 
         #write all settings from "Simulation Params" tab from EMerge tab
         simulationSettings.params['base_length_unit_m_emerge'] = self.form.simParamsDeltaUnitList_emerge.currentText()
@@ -396,8 +510,8 @@ class IniFile0v1:
         #
         settings.beginGroup("SIMULATION-" + simulationSettings.name)
         settings.setValue("name", simulationSettings.name)
-        settings.setValue("params", json.dumps(simulationSettings.params))
-        settings.setValue("paramsPalace", json.dumps(simulationPalaceSettings.palaceParams))
+        self.setJsonValue(settings, "params", simulationSettings.params)
+        self.setJsonValue(settings, "paramsPalace", simulationPalaceSettings.palaceParams)
         settings.endGroup()
 
         #
@@ -408,29 +522,32 @@ class IniFile0v1:
         settings.setValue("engine", self.form.simParamsSolverEngine_emerge.currentText())
         settings.endGroup()
 
+    def writeLumpedParts(self, settings):
         # SAVE LUMPED PART SETTINGS
 
         lumpedPartList = self.cadHelpers.getAllTreeWidgetItems(self.form.lumpedPartTreeView)
-        print("Lumped part list contains " + str(len(lumpedPartList)) + " items.")
+        logger.debug("Lumped part list contains %s items.", len(lumpedPartList))
         for k in range(len(lumpedPartList)):
-            print("Saving new LUMPED PART " + lumpedPartList[k].getName())
+            logger.debug("Saving new LUMPED PART %s", lumpedPartList[k].getName())
 
             settings.beginGroup("LUMPEDPART-" + lumpedPartList[k].getName())
-            settings.setValue("params", json.dumps(lumpedPartList[k].params))
+            self.setJsonValue(settings, "params", lumpedPartList[k].params)
             settings.endGroup()
 
+    def writeBoundaryConditions(self, settings):
         # SAVE BOUNDARY CONDITION SETTINGS
 
         boundaryConditionList = self.cadHelpers.getAllTreeWidgetItems(self.form.boundaryConditionSettingsTreeView)
-        print("Boundary condition list contains " + str(len(boundaryConditionList)) + " items.")
+        logger.debug("Boundary condition list contains %s items.", len(boundaryConditionList))
         for k in range(len(boundaryConditionList)):
-            print("Saving new BOUNDARY CONDITION " + boundaryConditionList[k].getName())
+            logger.debug("Saving new BOUNDARY CONDITION %s", boundaryConditionList[k].getName())
 
             settings.beginGroup("BOUNDARYCONDITION-" + boundaryConditionList[k].getName())
             settings.setValue("type", boundaryConditionList[k].type)
             settings.setValue("customType", boundaryConditionList[k].customType)
             settings.endGroup()
 
+    def writeObjectAssignments(self, settings):
         # SAVE OBJECT ASSIGNMENTS
 
         topItemsCount = self.form.objectAssignmentRightTreeWidget.topLevelItemCount()
@@ -438,12 +555,12 @@ class IniFile0v1:
         for k in range(topItemsCount):
             topItem = self.form.objectAssignmentRightTreeWidget.topLevelItem(k)
             topItemName = topItem.text(0)
-            print("---> topItem: " + topItem.text(0))
+            logger.debug("---> topItem: %s", topItem.text(0))
             for m in range(topItem.childCount()):
                 childItem = topItem.child(m)
                 childItemName = childItem.text(0)
-                print("Save new OBJECT ASSIGNMENTS for category -> settings profile: ")
-                print("\t" + topItemName + " --> " + childItemName)
+                logger.debug("Save new OBJECT ASSIGNMENTS for category -> settings profile: ")
+                logger.debug("\t%s --> %s", topItemName, childItemName)
                 for n in range(childItem.childCount()):
                     objItem = childItem.child(n)
                     objItemName = objItem.text(0)
@@ -460,30 +577,32 @@ class IniFile0v1:
 
                     objCounter += 1
 
+    def writePriorityLists(self, settings):
         # SAVE PRIORITY OBJECT LIST SETTINGS
 
         settings.beginGroup("PRIORITYLIST-OBJECTS")
-        priorityObjList = self.form.objectAssignmentPriorityTreeView
+        priorityObjKeys = self.guiHelpers.getObjectPriorityIndex().getKeys()
 
-        print("Priority list contains " + str(priorityObjList.topLevelItemCount()) + " items.")
-        for k in range(priorityObjList.topLevelItemCount()):
-            priorityObjName = priorityObjList.topLevelItem(k).text(0)
-            print("Saving new PRIORITY for " + priorityObjName)
+        logger.debug("Priority list contains %s items.", len(priorityObjKeys))
+        for k, priorityObjKey in enumerate(priorityObjKeys):
+            priorityObjName = PriorityListIndex.getText(priorityObjKey)
+            logger.debug("Saving new PRIORITY for %s", priorityObjName)
             settings.setValue(priorityObjName, str(k*10))           #multiply priority by 10 to left there some numbers between
         settings.endGroup()
 
         # SAVE MESH PRIORITY
 
         settings.beginGroup("PRIORITYLIST-MESH")
-        priorityMeshObjList = self.form.meshPriorityTreeView
+        priorityMeshObjKeys = self.guiHelpers.getMeshPriorityIndex().getKeys()
 
-        print("Priority list contains " + str(priorityMeshObjList.topLevelItemCount()) + " items.")
-        for k in range(priorityMeshObjList.topLevelItemCount()):
-            priorityMeshObjName = priorityMeshObjList.topLevelItem(k).text(0)
-            print("Saving new MESH PRIORITY for " + priorityMeshObjName)
+        logger.debug("Priority list contains %s items.", len(priorityMeshObjKeys))
+        for k, priorityMeshObjKey in enumerate(priorityMeshObjKeys):
+            priorityMeshObjName = PriorityListIndex.getText(priorityMeshObjKey)
+            logger.debug("Saving new MESH PRIORITY for %s", priorityMeshObjName)
             settings.setValue(priorityMeshObjName, str(k*10))          #multiply priority by 10 to left there some numbers between
         settings.endGroup()
 
+    def writePostprocessing(self, settings):
         #
         # SAVE POSTPROCESSING OPTIONS
         #
@@ -527,21 +646,17 @@ class IniFile0v1:
         fieldProbeEmergeSettings["cutplaneZFieldProcessingEmerge"] = self.form.cutplaneZFieldProcessingEmerge.value()
 
         settings.beginGroup("POSTPROCESSING-EmergePlotFields")
-        settings.setValue("plotFieldSettings", json.dumps(fieldProbeEmergeSettings))
-        settings.setValue("plotNF2FFSettings", json.dumps(nf2ffEmergeSettings))
+        self.setJsonValue(settings, "plotFieldSettings", fieldProbeEmergeSettings)
+        self.setJsonValue(settings, "plotNF2FFSettings", nf2ffEmergeSettings)
         settings.endGroup()
 
-        # sys.exit()  # prevents second call
-        print("Current settings saved to file: " + outFile)
-        self.guiHelpers.displayMessage("Settings saved to file: " + outFile, forceModal=False)
-        return
 
 
     ##
     #   LOAD SETTINGS METHOD
     #
     def read(self, filename=None):
-        print("Load current values from file.")
+        logger.debug("Load current values from file.")
         if self.statusBar is not None:
             self.statusBar.showMessage("Loading current values from file...", 5000)
             QtWidgets.QApplication.processEvents()
@@ -553,681 +668,717 @@ class IniFile0v1:
             #
             # DEBUG: now read hardwired file name with __file__ + "_settings.ini"
             #
-            print("setting default filename...")
+            logger.debug("setting default filename...")
             programname = os.path.basename(self.cadHelpers.getCurrDocumentFileName())
             programdir = os.path.dirname(self.cadHelpers.getCurrDocumentFileName())
             programbase, ext = os.path.splitext(programname)  # extract basename and ext from filename
-            outFile = programdir + '/' + programbase + "_settings.ini"
+            outFile = programdir + '/' + programbase + self.defaultFileSuffix
         else:
             outFile = filename
 
-        print("Loading data from file: " + outFile)
-        settings = QtCore.QSettings(outFile, QtCore.QSettings.IniFormat)
+        logger.info("Loading data from file: %s", outFile)
+        settings = self.openSettings(outFile)
 
         #
         # LOADING ITEMS FROM SETTINGS FILE
         #
         failedLoadedFreeCadObjects = []
 
-        print("Settings file groups:", end="")
-        print(settings.childGroups())
-        for settingsGroup in settings.childGroups():
-
-            # extract category name from ini name
-            itemNameReg = re.search("-(.*)", settingsGroup)
-            itemName = itemNameReg.group(1)
-
-            if (re.compile("EXCITATION").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                categorySettings = ExcitationSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.type = settings.value('type')
-                categorySettings.sinusodial = json.loads(settings.value('sinusodial'))
-                categorySettings.gaussian = json.loads(settings.value('gaussian'))
-                categorySettings.custom = json.loads(settings.value('custom'))
-                categorySettings.units = settings.value('units')
-
-                #
-                #   Jan2026 - added for emerge solver, therefore it's not present in old ini files
-                #
-                try:
-                    categorySettings.sweep = json.loads(settings.value('sweep'))
-                    categorySettings.femGaussian = json.loads(settings.value('fem_gaussian'))
-                except:
-                    pass
-
-                settings.endGroup()
-                print(f"loading EXCITATION - {categorySettings.name} - {categorySettings.type}")
-
-            elif (re.compile("GRID").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                categorySettings = GridSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.coordsType = settings.value('coordsType')
-                categorySettings.units = settings.value('units')
-                categorySettings.unitsAngle = settings.value('unitsAngle')
-                categorySettings.generateLinesInside = _bool(settings.value('generateLinesInside'))
-                categorySettings.topPriorityLines = _bool(settings.value('topPriorityLines'))
-                categorySettings.type = settings.value('type')
-                categorySettings.xenabled = _bool(settings.value('xenabled'))
-                categorySettings.yenabled = _bool(settings.value('yenabled'))
-                categorySettings.zenabled = _bool(settings.value('zenabled'))
-
-                print(f"loading GRID - {categorySettings.name} - {categorySettings.type}")
-
-                if (categorySettings.type == "Fixed Distance"):
-                    categorySettings.fixedDistance = json.loads(settings.value('fixedDistance'))
-                elif (categorySettings.type == "Fixed Count"):
-                    categorySettings.fixedCount = json.loads(settings.value('fixedCount'))
-                elif (categorySettings.type == "User Defined"):
-                    categorySettings.userDefined = json.loads(settings.value('userDefined'))
-                elif (categorySettings.type == "Smooth Mesh"):
-                    try:
-                        categorySettings.smoothMesh = json.loads(settings.value('smoothMesh'))
-                    except Exception as e:
-                        print(f"Error during load reading smooth mesh: {e}")
-                elif (categorySettings.type == "FEM Max Size"):
-                    try:
-                        categorySettings.femMesh = json.loads(settings.value('femMesh'))
-                    except Exception as e:
-                        print(f"Error during load reading fem mesh: {e}")
-                else:
-                    print(f"Grid reading {categorySettings.type} cannot find aditional infor needed for settings, default values left set.")
-
-                try:
-                    categorySettings.gridOffset = json.loads(settings.value('gridOffset'))
-                except Exception as e:
-                    print(f"Error during load reading grid offset: {e}")
-
-                settings.endGroup()
+        logger.debug("Settings file groups: %s", settings.childGroups())
+        #
+        #   Tree items are created first and inserted into tree widgets in bulk, tree widgets don't repaint and don't emit
+        #   signals during load, dependent items are updated once at the end.
+        #
+        loadedSettingsItems = []        # settings items waiting to be added into GUI
+        assignmentParentItems = None    # (category, settings name) -> tree items in object assignment tree, see getAssignmentParentItems()
+        assignedObjectItems = {}        # parent tree item id -> (parent tree item, [object tree items])
 
-            elif (re.compile("PORT").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                categorySettings = PortSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.type = settings.value('type')
-                print(f"loading PORT - {categorySettings.name} - {categorySettings.type}")
+        with self.guiHelpers.suspendedUpdates(self.guiHelpers.getSettingsTreeWidgets()):
+            for settingsGroup in self.getGroupsToRead(settings):
 
-                try:
-                    categorySettings.excitationAmplitude = float(settings.value('excitationAmplitude'))
-                    categorySettings.infiniteResistance = _bool(settings.value('infiniteResistance'))
-                except Exception as e:
-                    print(f"There was error during reading excitation or infiniteResistance port settings: {e}")
+                # extract category name from ini name
+                itemNameReg = re.search("-(.*)", settingsGroup)
+                itemName = itemNameReg.group(1)
 
-                if (categorySettings.type == "lumped"):
+                if (re.compile("EXCITATION").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = ExcitationSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.type = settings.value('type')
+                    categorySettings.sinusodial = self.getJsonValue(settings, 'sinusodial')
+                    categorySettings.gaussian = self.getJsonValue(settings, 'gaussian')
+                    categorySettings.custom = self.getJsonValue(settings, 'custom')
+                    categorySettings.units = settings.value('units')
+
+                    #
+                    #   Jan2026 - added for emerge solver, therefore it's not present in old ini files
+                    #
                     try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
-                        categorySettings.isActive = _bool(settings.value('isActive'))
-                        categorySettings.direction = settings.value('direction')
-                        categorySettings.directionCustomVector = json.loads(settings.value('directionCustomVector'))
-                    except Exception as e:
-                        print(f"There was error during reading resistance and port direction related info for port settings: {e}")
+                        categorySettings.sweep = self.getJsonValue(settings, 'sweep')
+                        categorySettings.femGaussian = self.getJsonValue(settings, 'fem_gaussian')
+                    except:
                         pass
 
-                elif (categorySettings.type == "circular waveguide"):
-                    categorySettings.isActive = _bool(settings.value('isActive'))
-                    categorySettings.direction = settings.value('direction')
-                    categorySettings.modeName = settings.value('modeName')
-                    categorySettings.polarizationAngle = settings.value('polarizationAngle')
-                    categorySettings.waveguideCircDir = settings.value('waveguideDirection')
-
-                elif (categorySettings.type == "rectangular waveguide"):
-                    categorySettings.isActive = _bool(settings.value('isActive'))
-                    categorySettings.direction = settings.value('direction')
-                    categorySettings.modeName = settings.value('modeName')
-                    categorySettings.waveguideRectDir = settings.value('waveguideDirection')
-
-                elif (categorySettings.type == "microstrip"):
-                    #this is in try block to have backward compatibility
-                    try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
-                        categorySettings.isActive = _bool(settings.value('isActive'))
-                        categorySettings.direction = settings.value('direction')
-                        categorySettings.mslMaterial = settings.value('material')
-                        categorySettings.mslFeedShiftValue = float(settings.value('feedpointShiftValue'))
-                        categorySettings.mslFeedShiftUnits = settings.value('feedpointShiftUnits')
-                        categorySettings.mslMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
-                        categorySettings.mslMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
-                        categorySettings.mslPropagation = settings.value('propagation')
-                    except Exception as e:
-                        print(f"There was error during reading microstrip port settings: {e}")
+                    settings.endGroup()
+                    logger.debug("loading EXCITATION - %s - %s", categorySettings.name, categorySettings.type)
+
+                elif (re.compile("GRID").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = GridSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.coordsType = settings.value('coordsType')
+                    categorySettings.units = settings.value('units')
+                    categorySettings.unitsAngle = settings.value('unitsAngle')
+                    categorySettings.generateLinesInside = _bool(settings.value('generateLinesInside'))
+                    categorySettings.topPriorityLines = _bool(settings.value('topPriorityLines'))
+                    categorySettings.type = settings.value('type')
+                    categorySettings.xenabled = _bool(settings.value('xenabled'))
+                    categorySettings.yenabled = _bool(settings.value('yenabled'))
+                    categorySettings.zenabled = _bool(settings.value('zenabled'))
+
+                    logger.debug("loading GRID - %s - %s", categorySettings.name, categorySettings.type)
+
+                    if (categorySettings.type == "Fixed Distance"):
+                        categorySettings.fixedDistance = self.getJsonValue(settings, 'fixedDistance')
+                    elif (categorySettings.type == "Fixed Count"):
+                        categorySettings.fixedCount = self.getJsonValue(settings, 'fixedCount')
+                    elif (categorySettings.type == "User Defined"):
+                        categorySettings.userDefined = self.getJsonValue(settings, 'userDefined')
+                    elif (categorySettings.type == "Smooth Mesh"):
+                        try:
+                            categorySettings.smoothMesh = self.getJsonValue(settings, 'smoothMesh')
+                        except Exception as e:
+                            logger.error(f"Error during load reading smooth mesh: {e}")
+                    elif (categorySettings.type == "FEM Max Size"):
+                        try:
+                            categorySettings.femMesh = self.getJsonValue(settings, 'femMesh')
+                        except Exception as e:
+                            logger.error(f"Error during load reading fem mesh: {e}")
+                    else:
+                        logger.debug("Grid reading %s cannot find aditional infor needed for settings, default values left set.", categorySettings.type)
 
-                elif (categorySettings.type == "coaxial"):
                     try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
-                        categorySettings.isActive = _bool(settings.value('isActive'))
-                        categorySettings.direction = settings.value('direction')
-                        categorySettings.coaxialInnerRadiusValue = float(settings.value('coaxialInnerRadiusValue'))
-                        categorySettings.coaxialInnerRadiusUnits = settings.value('coaxialInnerRadiusUnits')
-                        categorySettings.coaxialShellThicknessValue = float(settings.value('coaxialShellThicknessValue'))
-                        categorySettings.coaxialShellThicknessUnits = settings.value('coaxialShellThicknessUnits')
-                        categorySettings.coaxialFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
-                        categorySettings.coaxialFeedpointShiftUnits = settings.value('feedpointShiftUnits')
-                        categorySettings.coaxialMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
-                        categorySettings.coaxialMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
-
-                        #now this is at the end of try block to ensure all properites are read, due conductor material was added so old files doesn't have it
-                        categorySettings.coaxialMaterial = settings.value('material')
-                        categorySettings.coaxialConductorMaterial = settings.value('conductorMaterial')
+                        categorySettings.gridOffset = self.getJsonValue(settings, 'gridOffset')
                     except Exception as e:
-                        print(f"There was error during reading coaxial port settings: {e}")
+                        logger.error(f"Error during load reading grid offset: {e}")
+
+                    settings.endGroup()
+
+                elif (re.compile("PORT").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = PortSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.type = settings.value('type')
+                    logger.debug("loading PORT - %s - %s", categorySettings.name, categorySettings.type)
 
-                elif (categorySettings.type == "coplanar"):
                     try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
+                        categorySettings.excitationAmplitude = float(settings.value('excitationAmplitude'))
+                        categorySettings.infiniteResistance = _bool(settings.value('infiniteResistance'))
+                    except Exception as e:
+                        logger.error(f"There was error during reading excitation or infiniteResistance port settings: {e}")
+
+                    if (categorySettings.type == "lumped"):
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.directionCustomVector = self.getJsonValue(settings, 'directionCustomVector')
+                        except Exception as e:
+                            logger.error(f"There was error during reading resistance and port direction related info for port settings: {e}")
+                            pass
+
+                    elif (categorySettings.type == "circular waveguide"):
                         categorySettings.isActive = _bool(settings.value('isActive'))
                         categorySettings.direction = settings.value('direction')
-                        categorySettings.coplanarMaterial = settings.value('material')
-                        categorySettings.coplanarPropagation = settings.value('propagation')
-                        categorySettings.coplanarGapValue = float(settings.value('coplanarGapValue'))
-                        categorySettings.coplanarGapUnits = settings.value('coplanarGapUnits')
-                        categorySettings.coplanarFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
-                        categorySettings.coplanarFeedpointShiftUnits = settings.value('feedpointShiftUnits')
-                        categorySettings.coplanarMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
-                        categorySettings.coplanarMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
-                    except Exception as e:
-                        print(f"There was error during reading coplanar port settings: {e}")
+                        categorySettings.modeName = settings.value('modeName')
+                        categorySettings.polarizationAngle = settings.value('polarizationAngle')
+                        categorySettings.waveguideCircDir = settings.value('waveguideDirection')
 
-                elif (categorySettings.type == "stripline"):
-                    try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
+                    elif (categorySettings.type == "rectangular waveguide"):
                         categorySettings.isActive = _bool(settings.value('isActive'))
                         categorySettings.direction = settings.value('direction')
-                        categorySettings.striplinePropagation = settings.value('propagation')
-                        categorySettings.striplineFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
-                        categorySettings.striplineFeedpointShiftUnits = settings.value('feedpointShiftUnits')
-                        categorySettings.striplineMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
-                        categorySettings.striplineMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
-                    except Exception as e:
-                        print(f"There was error during reading coplanar port settings: {e}")
+                        categorySettings.modeName = settings.value('modeName')
+                        categorySettings.waveguideRectDir = settings.value('waveguideDirection')
+
+                    elif (categorySettings.type == "microstrip"):
+                        #this is in try block to have backward compatibility
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.mslMaterial = settings.value('material')
+                            categorySettings.mslFeedShiftValue = float(settings.value('feedpointShiftValue'))
+                            categorySettings.mslFeedShiftUnits = settings.value('feedpointShiftUnits')
+                            categorySettings.mslMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
+                            categorySettings.mslMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
+                            categorySettings.mslPropagation = settings.value('propagation')
+                        except Exception as e:
+                            logger.error(f"There was error during reading microstrip port settings: {e}")
+
+                    elif (categorySettings.type == "coaxial"):
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.coaxialInnerRadiusValue = float(settings.value('coaxialInnerRadiusValue'))
+                            categorySettings.coaxialInnerRadiusUnits = settings.value('coaxialInnerRadiusUnits')
+                            categorySettings.coaxialShellThicknessValue = float(settings.value('coaxialShellThicknessValue'))
+                            categorySettings.coaxialShellThicknessUnits = settings.value('coaxialShellThicknessUnits')
+                            categorySettings.coaxialFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
+                            categorySettings.coaxialFeedpointShiftUnits = settings.value('feedpointShiftUnits')
+                            categorySettings.coaxialMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
+                            categorySettings.coaxialMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
+
+                            #now this is at the end of try block to ensure all properites are read, due conductor material was added so old files doesn't have it
+                            categorySettings.coaxialMaterial = settings.value('material')
+                            categorySettings.coaxialConductorMaterial = settings.value('conductorMaterial')
+                        except Exception as e:
+                            logger.error(f"There was error during reading coaxial port settings: {e}")
+
+                    elif (categorySettings.type == "coplanar"):
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.coplanarMaterial = settings.value('material')
+                            categorySettings.coplanarPropagation = settings.value('propagation')
+                            categorySettings.coplanarGapValue = float(settings.value('coplanarGapValue'))
+                            categorySettings.coplanarGapUnits = settings.value('coplanarGapUnits')
+                            categorySettings.coplanarFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
+                            categorySettings.coplanarFeedpointShiftUnits = settings.value('feedpointShiftUnits')
+                            categorySettings.coplanarMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
+                            categorySettings.coplanarMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
+                        except Exception as e:
+                            logger.error(f"There was error during reading coplanar port settings: {e}")
+
+                    elif (categorySettings.type == "stripline"):
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.striplinePropagation = settings.value('propagation')
+                            categorySettings.striplineFeedpointShiftValue = float(settings.value('feedpointShiftValue'))
+                            categorySettings.striplineFeedpointShiftUnits = settings.value('feedpointShiftUnits')
+                            categorySettings.striplineMeasPlaneShiftValue = float(settings.value('measPlaneShiftValue'))
+                            categorySettings.striplineMeasPlaneShiftUnits = settings.value('measPlaneShiftUnits')
+                        except Exception as e:
+                            logger.error(f"There was error during reading coplanar port settings: {e}")
+
+                    elif (categorySettings.type == "curve"):
+                        try:
+                            categorySettings.R = settings.value('R')
+                            categorySettings.RUnits = settings.value('RUnits')
+                            categorySettings.isActive = _bool(settings.value('isActive'))
+                        except Exception as e:
+                            logger.error(f"There was error during reading curve port settings: {e}")
 
-                elif (categorySettings.type == "curve"):
-                    try:
-                        categorySettings.R = settings.value('R')
-                        categorySettings.RUnits = settings.value('RUnits')
-                        categorySettings.isActive = _bool(settings.value('isActive'))
-                    except Exception as e:
-                        print(f"There was error during reading curve port settings: {e}")
+                    settings.endGroup()
+
+                elif (re.compile("PROBE").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = ProbeSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.type = settings.value('type')
+                    logger.debug("loading PROBE - %s - %s", categorySettings.name, categorySettings.type)
 
-                settings.endGroup()
+                    if (categorySettings.type == "probe"):
+                        try:
+                            categorySettings.probeType = settings.value('probeType')
+                            categorySettings.direction = settings.value('direction')
+                            categorySettings.probeDomain = settings.value('probeDomain')
 
-            elif (re.compile("PROBE").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                categorySettings = ProbeSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.type = settings.value('type')
-                print(f"loading PROBE - {categorySettings.name} - {categorySettings.type}")
+                            categorySettings.probeFrequencyList = settings.value('probeFrequencyList')
+                            if len(categorySettings.probeFrequencyList) > 0 and len(categorySettings.probeFrequencyList[0]) == 1:
+                                categorySettings.probeFrequencyList = ["".join(categorySettings.probeFrequencyList)]
+
+                        except Exception as e:
+                            logger.error(f"There was error during reading probe probe settings: {e}")
+
+                    elif (categorySettings.type == "dumpbox"):
+                        try:
+                            categorySettings.dumpboxType = settings.value('dumpboxType')
+                            categorySettings.dumpboxDomain = settings.value('dumpboxDomain')
+                            categorySettings.dumpboxFileType = settings.value('dumpboxFileType')
+
+                            categorySettings.dumpboxFrequencyList = settings.value('dumpboxFrequencyList')
+                            if len(categorySettings.dumpboxFrequencyList) > 0 and len(categorySettings.dumpboxFrequencyList[0]) == 1:
+                                categorySettings.dumpboxFrequencyList = ["".join(categorySettings.dumpboxFrequencyList)]
+
+                        except Exception as e:
+                            logger.error(f"There was error during reading dumpbox probe settings: {e}")
+
+                    settings.endGroup()
+
+                elif (re.compile("MATERIAL").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = MaterialSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.type = settings.value('type')
+                    categorySettings.constants = {'epsilon': 1.0, 'mue': 1.0, 'kappa': 0.0, 'sigma': 0.0, 'tand': 0.0}  #default values if there is error during load
 
-                if (categorySettings.type == "probe"):
                     try:
-                        categorySettings.probeType = settings.value('probeType')
-                        categorySettings.direction = settings.value('direction')
-                        categorySettings.probeDomain = settings.value('probeDomain')
+                        categorySettings.constants['epsilon'] = settings.value('material_epsilon')
+                        categorySettings.constants['mue'] = settings.value('material_mue')
+                        categorySettings.constants['kappa'] = settings.value('material_kappa')
+                        categorySettings.constants['sigma'] = settings.value('material_sigma')
+                        categorySettings.constants['tand'] = settings.value('material_tand')
+                    except:
+                        pass
 
-                        categorySettings.probeFrequencyList = settings.value('probeFrequencyList')
-                        if len(categorySettings.probeFrequencyList) > 0 and len(categorySettings.probeFrequencyList[0]) == 1:
-                            categorySettings.probeFrequencyList = ["".join(categorySettings.probeFrequencyList)]
+                    logger.debug("loading MATERIAL - %s - %s - %s", categorySettings.name, categorySettings.type, categorySettings.constants)
 
-                    except Exception as e:
-                        print(f"There was error during reading probe probe settings: {e}")
+                    try:
+                        categorySettings.constants['conductingSheetThicknessValue'] = settings.value('conductingSheetThicknessValue')
+                        categorySettings.constants['conductingSheetThicknessUnits'] = settings.value('conductingSheetThicknessUnits')
+                        categorySettings.constants['conductingSheetConductivity'] = settings.value('conductingSheetConductivity')
+                        categorySettings.constants['conductingSheetPermeability'] = settings.value('conductingSheetPermeability')
+                    except:
+                        logger.error(f"There was error during loading conductive sheet material params for '{itemName}'")
+                        pass
+
+                    settings.endGroup()
 
-                elif (categorySettings.type == "dumpbox"):
+                elif (re.compile("SIMULATION").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    simulationSettings = SimulationSettingsItem()
+                    simulationSettings.name = itemName
+                    simulationSettings.type = settings.value('type')
+                    simulationSettings.params = self.getJsonValue(settings, 'params')
+
+                    #
+                    #   Backward compatibility - try/except load params for palace simulation settings tab
+                    #
+                    simulationPalaceSettings = SimulationPalaceSettingsItem()
                     try:
-                        categorySettings.dumpboxType = settings.value('dumpboxType')
-                        categorySettings.dumpboxDomain = settings.value('dumpboxDomain')
-                        categorySettings.dumpboxFileType = settings.value('dumpboxFileType')
+                        simulationPalaceSettings.palaceParams = self.getJsonValue(settings, 'paramsPalace')
+                    except:
+                        pass
 
-                        categorySettings.dumpboxFrequencyList = settings.value('dumpboxFrequencyList')
-                        if len(categorySettings.dumpboxFrequencyList) > 0 and len(categorySettings.dumpboxFrequencyList[0]) == 1:
-                            categorySettings.dumpboxFrequencyList = ["".join(categorySettings.dumpboxFrequencyList)]
+                    settings.endGroup()
+                    logger.debug("loading SIMULATION PARAMS: %s", simulationSettings.params)
+
+                    self.form.simParamsMaxTimesteps.setValue(simulationSettings.params['max_timestamps'])
+                    self.form.simParamsMinDecrement.setValue(simulationSettings.params['min_decrement'])
+                    self.form.generateJustPreviewCheckbox.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('generateJustPreview',False) else QtCore.Qt.Unchecked)
+                    self.form.generateDebugPECCheckbox.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('generateDebugPEC', False) else QtCore.Qt.Unchecked)
+                    self.form.octaveExecCommandList.setCurrentText(simulationSettings.params.get("mFileExecCommand", self.form.octaveExecCommandList.itemData(0)))
+                    self.form.simParamsDeltaUnitList.setCurrentText(simulationSettings.params.get("base_length_unit_m", self.form.simParamsDeltaUnitList.itemData(0)))
+
+                    self.guiHelpers.setSimlationParamBC(self.form.BCxmin, simulationSettings.params['BCxmin'])
+                    self.guiHelpers.setSimlationParamBC(self.form.BCxmax, simulationSettings.params['BCxmax'])
+                    self.guiHelpers.setSimlationParamBC(self.form.BCymin, simulationSettings.params['BCymin'])
+                    self.guiHelpers.setSimlationParamBC(self.form.BCymax, simulationSettings.params['BCymax'])
+                    self.guiHelpers.setSimlationParamBC(self.form.BCzmin, simulationSettings.params['BCzmin'])
+                    self.guiHelpers.setSimlationParamBC(self.form.BCzmax, simulationSettings.params['BCzmax'])
+
+                    self.form.PMLxmincells.setValue(simulationSettings.params['PMLxmincells'])
+                    self.form.PMLxmaxcells.setValue(simulationSettings.params['PMLxmaxcells'])
+                    self.form.PMLymincells.setValue(simulationSettings.params['PMLymincells'])
+                    self.form.PMLymaxcells.setValue(simulationSettings.params['PMLymaxcells'])
+                    self.form.PMLzmincells.setValue(simulationSettings.params['PMLzmincells'])
+                    self.form.PMLzmaxcells.setValue(simulationSettings.params['PMLzmaxcells'])
+
+                    #newly added params for emerge solver
+                    try:
+                        self.form.simParamsDeltaUnitList_emerge.setCurrentText(simulationSettings.params['base_length_unit_m_emerge'])
+                        self.form.simParamsSolverEngine_emerge.setCurrentText(simulationSettings.params['solverEngine_emerge'])
+                        self.form.simParamsDisableRAMCheck_emerge.setChecked(simulationSettings.params['disableRAMCheck_emerge'])
+                    except:
+                        pass
 
-                    except Exception as e:
-                        print(f"There was error during reading dumpbox probe settings: {e}")
+                    #
+                    #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
+                    #   this is for min_gridspacing settings
+                    #
+                    try:
+                        self.form.genParamMinGridSpacingEnable.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('min_gridspacing_enable',False) else QtCore.Qt.Unchecked)
+                        self.form.genParamMinGridSpacingX.setValue(simulationSettings.params['min_gridspacing_x'])
+                        self.form.genParamMinGridSpacingY.setValue(simulationSettings.params['min_gridspacing_y'])
+                        self.form.genParamMinGridSpacingZ.setValue(simulationSettings.params['min_gridspacing_z'])
+                    except:
+                        pass
 
-                settings.endGroup()
+                    #
+                    #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
+                    #   this is for simulation type setting
+                    #
+                    try:
+                        self.form.radioButton_octaveType.setChecked(True)                                                       # by default octave type is checked
+                        self.form.radioButton_octaveType.setChecked(simulationSettings.params['outputScriptType'] == 'octave')
+                        if simulationSettings.params['outputScriptType'] == 'python':
+                            self.form.radioButton_pythonType.setChecked(simulationSettings.params['outputScriptType'] == 'python')
+                            self.form.radioButton_pythonType.clicked.emit()
+                    except:
+                        pass
 
-            elif (re.compile("MATERIAL").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                categorySettings = MaterialSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.type = settings.value('type')
-                categorySettings.constants = {'epsilon': 1.0, 'mue': 1.0, 'kappa': 0.0, 'sigma': 0.0, 'tand': 0.0}  #default values if there is error during load
+                    #
+                    #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
+                    #   this is for simulation oversampling setting
+                    #
+                    try:
+                        self.form.simParamsOverSampling.setValue(simulationSettings.params['OverSampling'])
+                    except:
+                        pass
 
-                try:
-                    categorySettings.constants['epsilon'] = settings.value('material_epsilon')
-                    categorySettings.constants['mue'] = settings.value('material_mue')
-                    categorySettings.constants['kappa'] = settings.value('material_kappa')
-                    categorySettings.constants['sigma'] = settings.value('material_sigma')
-                    categorySettings.constants['tand'] = settings.value('material_tand')
-                except:
-                    pass
+                    #
+                    #   symmetry planes settings, by default symmetry is not used
+                    #
+                    self.form.simParamsSymmetryEnable.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('symmetry_enable', False) else QtCore.Qt.Unchecked)
+                    self.form.simParamsSymmetryPlanes.setText(simulationSettings.params.get('symmetry_planes', ""))
 
-                print(f"loading MATERIAL - {categorySettings.name} - {categorySettings.type} - {categorySettings.constants}")
+                    #
+                    #   engine profile itself is stored for each machine outside of simulation file, just its usage is saved
+                    #
+                    self.form.simParamsUseEngineProfile.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('use_engine_profile', False) else QtCore.Qt.Unchecked)
 
-                try:
-                    categorySettings.constants['conductingSheetThicknessValue'] = settings.value('conductingSheetThicknessValue')
-                    categorySettings.constants['conductingSheetThicknessUnits'] = settings.value('conductingSheetThicknessUnits')
-                    categorySettings.constants['conductingSheetConductivity'] = settings.value('conductingSheetConductivity')
-                    categorySettings.constants['conductingSheetPermeability'] = settings.value('conductingSheetPermeability')
-                except:
-                    print(f"There was error during loading conductive sheet material params for '{itemName}'")
-                    pass
-
-                settings.endGroup()
-
-            elif (re.compile("SIMULATION").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                simulationSettings = SimulationSettingsItem()
-                simulationSettings.name = itemName
-                simulationSettings.type = settings.value('type')
-                simulationSettings.params = json.loads(settings.value('params'))
-
-                #
-                #   Backward compatibility - try/except load params for palace simulation settings tab
-                #
-                simulationPalaceSettings = SimulationPalaceSettingsItem()
-                try:
-                    simulationPalaceSettings.palaceParams = json.loads(settings.value('paramsPalace'))
-                except:
-                    pass
-
-                settings.endGroup()
-                print(f'loading SIMULATION PARAMS: {(simulationSettings.params)}')
-
-                self.form.simParamsMaxTimesteps.setValue(simulationSettings.params['max_timestamps'])
-                self.form.simParamsMinDecrement.setValue(simulationSettings.params['min_decrement'])
-                self.form.generateJustPreviewCheckbox.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('generateJustPreview',False) else QtCore.Qt.Unchecked)
-                self.form.generateDebugPECCheckbox.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('generateDebugPEC', False) else QtCore.Qt.Unchecked)
-                self.form.octaveExecCommandList.setCurrentText(simulationSettings.params.get("mFileExecCommand", self.form.octaveExecCommandList.itemData(0)))
-                self.form.simParamsDeltaUnitList.setCurrentText(simulationSettings.params.get("base_length_unit_m", self.form.simParamsDeltaUnitList.itemData(0)))
-
-                self.guiHelpers.setSimlationParamBC(self.form.BCxmin, simulationSettings.params['BCxmin'])
-                self.guiHelpers.setSimlationParamBC(self.form.BCxmax, simulationSettings.params['BCxmax'])
-                self.guiHelpers.setSimlationParamBC(self.form.BCymin, simulationSettings.params['BCymin'])
-                self.guiHelpers.setSimlationParamBC(self.form.BCymax, simulationSettings.params['BCymax'])
-                self.guiHelpers.setSimlationParamBC(self.form.BCzmin, simulationSettings.params['BCzmin'])
-                self.guiHelpers.setSimlationParamBC(self.form.BCzmax, simulationSettings.params['BCzmax'])
-
-                self.form.PMLxmincells.setValue(simulationSettings.params['PMLxmincells'])
-                self.form.PMLxmaxcells.setValue(simulationSettings.params['PMLxmaxcells'])
-                self.form.PMLymincells.setValue(simulationSettings.params['PMLymincells'])
-                self.form.PMLymaxcells.setValue(simulationSettings.params['PMLymaxcells'])
-                self.form.PMLzmincells.setValue(simulationSettings.params['PMLzmincells'])
-                self.form.PMLzmaxcells.setValue(simulationSettings.params['PMLzmaxcells'])
-
-                #newly added params for emerge solver
-                try:
-                    self.form.simParamsDeltaUnitList_emerge.setCurrentText(simulationSettings.params['base_length_unit_m_emerge'])
-                    self.form.simParamsSolverEngine_emerge.setCurrentText(simulationSettings.params['solverEngine_emerge'])
-                    self.form.simParamsDisableRAMCheck_emerge.setChecked(simulationSettings.params['disableRAMCheck_emerge'])
-                except:
-                    pass
-
-                #
-                #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
-                #   this is for min_gridspacing settings
-                #
-                try:
-                    self.form.genParamMinGridSpacingEnable.setCheckState(QtCore.Qt.Checked if simulationSettings.params.get('min_gridspacing_enable',False) else QtCore.Qt.Unchecked)
-                    self.form.genParamMinGridSpacingX.setValue(simulationSettings.params['min_gridspacing_x'])
-                    self.form.genParamMinGridSpacingY.setValue(simulationSettings.params['min_gridspacing_y'])
-                    self.form.genParamMinGridSpacingZ.setValue(simulationSettings.params['min_gridspacing_z'])
-                except:
-                    pass
-
-                #
-                #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
-                #   this is for simulation type setting
-                #
-                try:
-                    self.form.radioButton_octaveType.setChecked(True)                                                       # by default octave type is checked
-                    self.form.radioButton_octaveType.setChecked(simulationSettings.params['outputScriptType'] == 'octave')
-                    if simulationSettings.params['outputScriptType'] == 'python':
-                        self.form.radioButton_pythonType.setChecked(simulationSettings.params['outputScriptType'] == 'python')
-                        self.form.radioButton_pythonType.clicked.emit()
-                except:
-                    pass
-
-                #
-                #   try catch block here due backward compatibility, if error don't do anything about it and left default values set
-                #   this is for simulation oversampling setting
-                #
-                try:
-                    self.form.simParamsOverSampling.setValue(simulationSettings.params['OverSampling'])
-                except:
-                    pass
+                    #
+                    #   try catch block here due backward compatibility, loading simulation settings for palace solver tab
+                    #
+                    try:
+                        self.guiHelpers.setComboboxItem(self.form.simParamsSimulationTypeList_palace, simulationPalaceSettings.palaceParams["problemType"])
+                        self.form.simParamsVerbose_palace.setValue(simulationPalaceSettings.palaceParams["problemVerbose"])
+                        self.form.simParamsOutputDirectory_palace.setText(simulationPalaceSettings.palaceParams["problemOutput"])
+                        self.form.simParamsModelMeshName_palace.setText(simulationPalaceSettings.palaceParams["modelMeshName"])
+                        self.guiHelpers.setComboboxItem(self.form.simParamsModelMeshBaseUnits_palace, simulationPalaceSettings.palaceParams["modelMeshBaseUnits"])
+                        self.guiHelpers.setComboboxItem(self.form.simParamsLinearSolverType_palace, simulationPalaceSettings.palaceParams["linearSolverType"])
+                        self.guiHelpers.setComboboxItem(self.form.simParamsLinearSolverKSPType_palace, simulationPalaceSettings.palaceParams["linearSolverKSPType"])
+                        self.form.simParamsLinearSolverTolerance_palace.setValue(simulationPalaceSettings.palaceParams["linearSolverTolerance"])
+                        self.form.simParamsLinearSolverMaximumIterationCount_palace.setValue(simulationPalaceSettings.palaceParams["linearSolverMaxIterationCount"])
+                        self.form.simParamsLinearSolverOrder_palace.setValue(simulationPalaceSettings.palaceParams["solverOrder"])
+                        self.guiHelpers.setComboboxItem(self.form.simParamsSolverDevice_palace, simulationPalaceSettings.palaceParams["solverDevice"])
+
+                        self.form.simParamsUseNf2ff_palace.setChecked(simulationPalaceSettings.palaceParams['useNf2ff'])
+                        self.guiHelpers.setComboboxItem(self.form.portNf2ffPalaceObjectList, simulationPalaceSettings.palaceParams["nf2ffBoundaryConditionName"])
+                        self.form.boundaryNf2ffPalaceFreq.setValue(simulationPalaceSettings.palaceParams["nf2ffFreqMHz"])
+                        self.form.boundaryNf2ffPalaceTheta.setValue(simulationPalaceSettings.palaceParams["nf2ffTheta"])
+                        self.form.boundaryNf2ffPalacePhi.setValue(simulationPalaceSettings.palaceParams["nf2ffPhi"])
+                        self.form.boundaryNf2ffPalaceNSample.setValue(simulationPalaceSettings.palaceParams["nf2ffNSample"])
+
+                        self.form.simParamsSaveStep_palace.setValue(simulationPalaceSettings.palaceParams["saveStep"])
+                    except:
+                        pass
 
-                #
-                #   try catch block here due backward compatibility, loading simulation settings for palace solver tab
-                #
-                try:
-                    self.guiHelpers.setComboboxItem(self.form.simParamsSimulationTypeList_palace, simulationPalaceSettings.palaceParams["problemType"])
-                    self.form.simParamsVerbose_palace.setValue(simulationPalaceSettings.palaceParams["problemVerbose"])
-                    self.form.simParamsOutputDirectory_palace.setText(simulationPalaceSettings.palaceParams["problemOutput"])
-                    self.form.simParamsModelMeshName_palace.setText(simulationPalaceSettings.palaceParams["modelMeshName"])
-                    self.guiHelpers.setComboboxItem(self.form.simParamsModelMeshBaseUnits_palace, simulationPalaceSettings.palaceParams["modelMeshBaseUnits"])
-                    self.guiHelpers.setComboboxItem(self.form.simParamsLinearSolverType_palace, simulationPalaceSettings.palaceParams["linearSolverType"])
-                    self.guiHelpers.setComboboxItem(self.form.simParamsLinearSolverKSPType_palace, simulationPalaceSettings.palaceParams["linearSolverKSPType"])
-                    self.form.simParamsLinearSolverTolerance_palace.setValue(simulationPalaceSettings.palaceParams["linearSolverTolerance"])
-                    self.form.simParamsLinearSolverMaximumIterationCount_palace.setValue(simulationPalaceSettings.palaceParams["linearSolverMaxIterationCount"])
-                    self.form.simParamsLinearSolverOrder_palace.setValue(simulationPalaceSettings.palaceParams["solverOrder"])
-                    self.guiHelpers.setComboboxItem(self.form.simParamsSolverDevice_palace, simulationPalaceSettings.palaceParams["solverDevice"])
-
-                    self.form.simParamsUseNf2ff_palace.setChecked(simulationPalaceSettings.palaceParams['useNf2ff'])
-                    self.guiHelpers.setComboboxItem(self.form.portNf2ffPalaceObjectList, simulationPalaceSettings.palaceParams["nf2ffBoundaryConditionName"])
-                    self.form.boundaryNf2ffPalaceFreq.setValue(simulationPalaceSettings.palaceParams["nf2ffFreqMHz"])
-                    self.form.boundaryNf2ffPalaceTheta.setValue(simulationPalaceSettings.palaceParams["nf2ffTheta"])
-                    self.form.boundaryNf2ffPalacePhi.setValue(simulationPalaceSettings.palaceParams["nf2ffPhi"])
-                    self.form.boundaryNf2ffPalaceNSample.setValue(simulationPalaceSettings.palaceParams["nf2ffNSample"])
-
-                    self.form.simParamsSaveStep_palace.setValue(simulationPalaceSettings.palaceParams["saveStep"])
-                except:
-                    pass
-
-                continue  # there is no tree widget to add item to
-
-            elif (re.compile("_OBJECT").search(settingsGroup)):
-                settings.beginGroup(settingsGroup)
-                objParent = settings.value('parent')
-                objCategory = settings.value('category')
-                objFreeCadId = settings.value('freeCadId')
-                settings.endGroup()
-                print(f"loading FreeCadObject -> '{objCategory}' -> '{objParent}' -> '{settingsGroup[8:]}' id: '{objFreeCadId}'")
-
-                # adding excitation also into OBJECT ASSIGNMENT WINDOW
-                targetGroup = self.form.objectAssignmentRightTreeWidget.findItems(objCategory, QtCore.Qt.MatchExactly)
-                for k in range(len(targetGroup)):
-                    for m in range(targetGroup[k].childCount()):
-                        if (targetGroup[k].child(m).text(0) == objParent):
-                            settingsItem = FreeCADSettingsItem(itemName)
-
-                            # treeItem = QtWidgets.QTreeWidgetItem([itemName])
-                            treeItem = QtWidgets.QTreeWidgetItem()
-                            treeItem.setText(0, itemName)
+                    continue  # there is no tree widget to add item to
 
+                elif (re.compile("_OBJECT").search(settingsGroup)):
+                    settings.beginGroup(settingsGroup)
+                    objParent = settings.value('parent')
+                    objCategory = settings.value('category')
+                    objFreeCadId = settings.value('freeCadId')
+                    settings.endGroup()
+                    logger.debug("loading FreeCadObject -> '%s' -> '%s' -> '%s' id: '%s'", objCategory, objParent, settingsGroup[8:], objFreeCadId)
+
+                    # settings items must be in object assignment tree before objects are assigned to them
+                    if len(loadedSettingsItems) > 0:
+                        self.guiHelpers.addSettingsItemsGui(loadedSettingsItems)
+                        loadedSettingsItems = []
+                        assignmentParentItems = None
+                    if assignmentParentItems is None:
+                        assignmentParentItems = self.getAssignmentParentItems()
+
+                    # adding excitation also into OBJECT ASSIGNMENT WINDOW
+                    for parentItem in assignmentParentItems.get((objCategory, objParent), []):
+                        settingsItem = FreeCADSettingsItem(itemName)
+
+                        # treeItem = QtWidgets.QTreeWidgetItem([itemName])
+                        treeItem = QtWidgets.QTreeWidgetItem()
+                        treeItem.setText(0, itemName)
+
+                        #
+                        #   Check if object valid during load, ie. if object label was changed this will try to find if some other object with
+                        #   original label is there, if not then object is found based on its freeCad ID and new label is set.
+                        #   If object is under Grid or Material settings also material priority list and mesh priority list must be updated.
+                        #
+                        errorLoadByName = False
+                        try:
+                            freeCadObj = self.cadHelpers.getObjectsByLabel(itemName)[0]
+                        except:
                             #
-                            #   Check if object valid during load, ie. if object label was changed this will try to find if some other object with
-                            #   original label is there, if not then object is found based on its freeCad ID and new label is set.
-                            #   If object is under Grid or Material settings also material priority list and mesh priority list must be updated.
+                            #   Object is not available using its label so it found based on it freeCad ID
                             #
-                            errorLoadByName = False
-                            try:
-                                freeCadObj = self.cadHelpers.getObjectsByLabel(itemName)[0]
-                            except:
+                            if objFreeCadId is None:
                                 #
-                                #   Object is not available using its label so it found based on it freeCad ID
+                                #   If freeCad ID is not provided then don't continue and object will not appears in GUI
+                                #   It will be added to list of missing objects and displayed do user.
                                 #
-                                if objFreeCadId is None:
+                                failedLoadedFreeCadObjects.append(f"{objCategory}, {objParent}, {itemName}")
+                                continue
+
+                            elif len(objFreeCadId) > 0:
+                                freeCadObj = self.cadHelpers.getObjectById(objFreeCadId)
+                                if not freeCadObj is None:
                                     #
-                                    #   If freeCad ID is not provided then don't continue and object will not appears in GUI
-                                    #   It will be added to list of missing objects and displayed do user.
+                                    #   Object was found based on its freeCad ID, icon will be set as warning icon
+                                    #
+                                    treeItem.setText(0, freeCadObj.Label)  # auto repair name, replace it with current name
+                                    errorLoadByName = True
+
+                                    #update mesh priority and object priority list if object is under grid settings, material or port settings
+                                    if objCategory == "Grid":
+                                        self.renameMeshPriorityItem(objParent, itemName, freeCadObj.Label)
+                                    elif objCategory in ["Material", "Port"]:
+                                        self.renameObjectsPriorityItem(objCategory, objParent, itemName, freeCadObj.Label)
+
+                                else:
+                                    #
+                                    #   Object was not found based on its freeCad ID, probably deleted, added to list of missing objects.
                                     #
                                     failedLoadedFreeCadObjects.append(f"{objCategory}, {objParent}, {itemName}")
                                     continue
 
-                                elif len(objFreeCadId) > 0:
-                                    freeCadObj = self.cadHelpers.getObjectById(objFreeCadId)
-                                    if not freeCadObj is None:
-                                        #
-                                        #   Object was found based on its freeCad ID, icon will be set as warning icon
-                                        #
-                                        treeItem.setText(0, freeCadObj.Label)  # auto repair name, replace it with current name
-                                        errorLoadByName = True
-
-                                        #update mesh priority and object priority list if object is under grid settings, material or port settings
-                                        if objCategory == "Grid":
-                                            self.renameMeshPriorityItem(objParent, itemName, freeCadObj.Label)
-                                        elif objCategory in ["Material", "Port"]:
-                                            self.renameObjectsPriorityItem(objCategory, objParent, itemName, freeCadObj.Label)
-
-                                    else:
-                                        #
-                                        #   Object was not found based on its freeCad ID, probably deleted, added to list of missing objects.
-                                        #
-                                        failedLoadedFreeCadObjects.append(f"{objCategory}, {objParent}, {itemName}")
-                                        continue
+                        #
+                        #	ERROR - here needs to be checked if freeCadObj was even found based on its Label if no try looking based on its ID from file,
+                        #	need to do this this way due backward compatibility
+                        #		- also FreeCAD should have set uniqe label for objects in Preferences
+                        #
+                        # set unique FreeCAD inside name as ID
+                        settingsItem.setFreeCadId(freeCadObj.Name)
+
+                        # SAVE settings object into GUI tree item
+                        treeItem.setData(0, QtCore.Qt.UserRole, settingsItem)
+
+                        if (freeCadObj.Name.find("Sketch") > -1):
+                            treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "wire.svg")))
+                        elif (freeCadObj.Name.find("Discretized_Edge") > -1):
+                            treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "curve.svg")))
+                        else:
+                            treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "object.svg")))
+
+                        #
+                        #	THERE IS MISMATCH BETWEEN NAME STORED IN IN FILE AND FREECAD NAME
+                        #
+                        if errorLoadByName:
+                            treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "errorLoadObject.svg")))
+
+                        assignedObjectItems.setdefault(id(parentItem), (parentItem, []))[1].append(treeItem)
+                        logger.debug("\tItem added")
+
+                    continue  # items is already added into tree widget nothing more needed
+
+                elif (re.compile("LUMPEDPART").search(settingsGroup)):
+                    logger.debug("LumpedPart item settings found.")
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = LumpedPartSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.params = self.getJsonValue(settings, 'params')
+
+                    #
+                    #   This is just assign default values for some params which were added later, it's like security check to have them set
+                    #
+                    if (not "capsEnabled" in categorySettings.params.keys()):
+                        categorySettings.params["capsEnabled"] = True
+                        logger.warning(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for capsEnabled to True")
+                    if (not "direction" in categorySettings.params.keys()):
+                        categorySettings.params["direction"] = "z"
+                        logger.warning(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for direction to 'z'")
+                    if (not "combinationType" in categorySettings.params.keys()):
+                        categorySettings.params["combinationType"] = None
+                        logger.warning(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for combinationType to None")
 
-                            #
-                            #	ERROR - here needs to be checked if freeCadObj was even found based on its Label if no try looking based on its ID from file,
-                            #	need to do this this way due backward compatibility
-                            #		- also FreeCAD should have set uniqe label for objects in Preferences
-                            #
-                            # set unique FreeCAD inside name as ID
-                            settingsItem.setFreeCadId(freeCadObj.Name)
+                    settings.endGroup()
 
-                            # SAVE settings object into GUI tree item
-                            treeItem.setData(0, QtCore.Qt.UserRole, settingsItem)
+                elif (re.compile("BOUNDARYCONDITION").search(settingsGroup)):
+                    logger.debug("BoundaryCondition item settings found.")
+                    settings.beginGroup(settingsGroup)
+                    categorySettings = BoundaryConditionSettingsItem()
+                    categorySettings.name = itemName
+                    categorySettings.type = settings.value('type')
+                    categorySettings.customType = settings.value('customType')
 
-                            if (freeCadObj.Name.find("Sketch") > -1):
-                                treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "wire.svg")))
-                            elif (freeCadObj.Name.find("Discretized_Edge") > -1):
-                                treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "curve.svg")))
-                            else:
-                                treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "object.svg")))
+                    settings.endGroup()
 
-                            #
-                            #	THERE IS MISMATCH BETWEEN NAME STORED IN IN FILE AND FREECAD NAME
-                            #
-                            if errorLoadByName:
-                                treeItem.setIcon(0, QtGui.QIcon(os.path.join(self.APP_DIR, "img", "errorLoadObject.svg")))
-
-                            targetGroup[k].child(m).addChild(treeItem)
-                            print("\tItem added")
-
-                continue  # items is already added into tree widget nothing more needed
-
-            elif (re.compile("LUMPEDPART").search(settingsGroup)):
-                print("LumpedPart item settings found.")
-                settings.beginGroup(settingsGroup)
-                categorySettings = LumpedPartSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.params = json.loads(settings.value('params'))
-
-                #
-                #   This is just assign default values for some params which were added later, it's like security check to have them set
-                #
-                if (not "capsEnabled" in categorySettings.params.keys()):
-                    categorySettings.params["capsEnabled"] = True
-                    print(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for capsEnabled to True")
-                if (not "direction" in categorySettings.params.keys()):
-                    categorySettings.params["direction"] = "z"
-                    print(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for direction to 'z'")
-                if (not "combinationType" in categorySettings.params.keys()):
-                    categorySettings.params["combinationType"] = None
-                    print(f"WARNING: {os.path.basename(__file__)}: read(): LumpedPart: {itemName}: setting default value for combinationType to None")
-
-                settings.endGroup()
-
-            elif (re.compile("BOUNDARYCONDITION").search(settingsGroup)):
-                print("BoundaryCondition item settings found.")
-                settings.beginGroup(settingsGroup)
-                categorySettings = BoundaryConditionSettingsItem()
-                categorySettings.name = itemName
-                categorySettings.type = settings.value('type')
-                categorySettings.customType = settings.value('customType')
-
-                settings.endGroup()
-
-            elif (re.compile("PRIORITYLIST-OBJECTS").search(settingsGroup)):
-                print("PriorityList group settings found.")
-
-                # start reading priority objects configuration in ini file
-                settings.beginGroup(settingsGroup)
-
-                #
-                #   Better approach how to add priority into GUI, now priorities doesn't have to be sequential numbers
-                #   and can be repeated, yes there will be oreder mistakes, but this is more robust and doesn't crash
-                #   when priorities were modified by hand and are repeating.
-                #
-
-                #init top item list with zeros, but as key is used order of each key
-                topItemsList = {}
-                for prioritySettingsKey in settings.childKeys():
-                    prioritySettingsOrder = int(settings.value(prioritySettingsKey))
-                    #if key number already used increment by 1 to make it unique
-                    while (prioritySettingsOrder in list(topItemsList.keys())):
-                        prioritySettingsOrder += 1
-
-                    prioritySettingsType = prioritySettingsKey.split(", ")
-                    print("Priority list adding item " + prioritySettingsKey)
-
-                    # adding item into priority list
-                    topItem = QtWidgets.QTreeWidgetItem([prioritySettingsKey])
-                    topItem.setData(0, QtCore.Qt.UserRole, prioritySettingsType)
-                    topItem.setIcon(0, self.cadHelpers.getIconByCategory(prioritySettingsType))
-                    topItemsList[prioritySettingsOrder] = topItem
-
-                #sort topItemList using its keys
-                sortedTopItemsList = []
-                for key in sorted(topItemsList):
-                    sortedTopItemsList.append(topItemsList[key])
-
-                self.form.objectAssignmentPriorityTreeView.insertTopLevelItems(0, sortedTopItemsList)
-
-                settings.endGroup()
-                continue
-
-            elif (re.compile("PRIORITYLIST-MESH").search(settingsGroup)):
-                print("PriorityList mesh group settings found.")
-
-                # clear all items from mesh tree widget
-                self.guiHelpers.removeAllMeshPriorityItems()
-
-                # start reading priority objects configuration in ini file
-                settings.beginGroup(settingsGroup)
-
-                #
-                #   Better approach how to add priority into GUI, now priorities doesn't have to be sequential numbers
-                #   and can be repeated, yes there will be oreder mistakes, but this is more robust and doesn't crash
-                #   when priorities were modified by hand and are repeating.
-                #
-
-                #init top item list with zeros, but as key is used order of each key
-                topItemsList = {}
-                for prioritySettingsKey in settings.childKeys():
-                    prioritySettingsOrder = int(settings.value(prioritySettingsKey))
-                    #if key number already used increment by 1 to make it unique
-                    while (prioritySettingsOrder in list(topItemsList.keys())):
-                        prioritySettingsOrder += 1
-
-                    prioritySettingsType = prioritySettingsKey.split(", ")
-                    print("Priority list adding item " + prioritySettingsKey)
-
-                    # adding item into priority list
-                    topItem = QtWidgets.QTreeWidgetItem([prioritySettingsKey])
-                    topItem.setData(0, QtCore.Qt.UserRole, prioritySettingsType)
-                    topItem.setIcon(0, self.cadHelpers.getIconByCategory(prioritySettingsType))
-                    topItemsList[prioritySettingsOrder] = topItem
-
-                #sort topItemList using its keys
-                sortedTopItemsList = []
-                for key in sorted(topItemsList):
-                    sortedTopItemsList.append(topItemsList[key])
-
-                self.form.meshPriorityTreeView.insertTopLevelItems(0, sortedTopItemsList)
-                print("Priority list array initialized with size " + str(len(sortedTopItemsList)))
-
-                settings.endGroup()
-
-                #
-                # If grid settings is not set to be top priority lines, therefore it's disabled (because then it's not take into account when generate mesh lines and it's overlapping something)
-                #
-                self.guiHelpers.updateMeshPriorityDisableItems()
-
-                continue
+                elif (re.compile("PRIORITYLIST-OBJECTS").search(settingsGroup)):
+                    logger.debug("PriorityList group settings found.")
 
-            elif (re.compile("POSTPROCESSING-EmergePlotFields").search(settingsGroup)):
-
-                #
-                #   This parameters were added into .ini file just now recently (March 2026) therefore it's wrapped in try/except
-                #   to not cause error when older .ini files are opened and don't have these params inside
-                #
-                try:
+                    # start reading priority objects configuration in ini file
+                    settings.beginGroup(settingsGroup)
+
+                    #
+                    #   Better approach how to add priority into GUI, now priorities doesn't have to be sequential numbers
+                    #   and can be repeated, yes there will be oreder mistakes, but this is more robust and doesn't crash
+                    #   when priorities were modified by hand and are repeating.
+                    #
+
+                    #init top item list with zeros, but as key is used order of each key
+                    topItemsList = {}
+                    for prioritySettingsKey in settings.childKeys():
+                        prioritySettingsOrder = int(settings.value(prioritySettingsKey))
+                        #if key number already used increment by 1 to make it unique
+                        while (prioritySettingsOrder in list(topItemsList.keys())):
+                            prioritySettingsOrder += 1
+
+                        # key in file is text of item "Category, Group, Object", it's parsed only here
+                        prioritySettingsType = PriorityListIndex.keyFromText(prioritySettingsKey)
+                        logger.debug("Priority list adding item %s", prioritySettingsKey)
+
+                        # adding item into priority list
+                        topItem = PriorityListIndex.createItem(prioritySettingsType, icon=self.cadHelpers.getIconByCategory(prioritySettingsType), data=list(prioritySettingsType))
+                        topItemsList[prioritySettingsOrder] = topItem
+
+                    #sort topItemList using its keys
+                    sortedTopItemsList = []
+                    for key in sorted(topItemsList):
+                        sortedTopItemsList.append(topItemsList[key])
+
+                    self.guiHelpers.getObjectPriorityIndex().insertItems(0, sortedTopItemsList)
+
+                    settings.endGroup()
+                    continue
+
+                elif (re.compile("PRIORITYLIST-MESH").search(settingsGroup)):
+                    logger.debug("PriorityList mesh group settings found.")
+
+                    # clear all items from mesh tree widget
+                    self.guiHelpers.removeAllMeshPriorityItems()
+
+                    # start reading priority objects configuration in ini file
                     settings.beginGroup(settingsGroup)
-                    plotNF2FFSettings = json.loads(settings.value('plotNF2FFSettings'))
-                    plotFieldSettings = json.loads(settings.value('plotFieldSettings'))
-
-                    self.guiHelpers.setComboboxItem(self.form.portNf2ffEmergeObjectList, plotNF2FFSettings["portNf2ffEmergeObjectList"])
-                    self.form.boundaryNf2ffEmergeFreq.setValue(plotNF2FFSettings["boundaryNf2ffEmergeFreq"])
-                    self.guiHelpers.setComboboxItem(self.form.polarizationNf2ffEmerge, plotNF2FFSettings["polarizationNf2ffEmerge"])
-                    self.guiHelpers.setComboboxItem(self.form.quantityNf2ffEmerge, plotNF2FFSettings["quantityNf2ffEmerge"])
-                    self.form.useDecibelsNf2ffEmerge.setChecked(plotNF2FFSettings["useDecibelsNf2ffEmerge"])
-                    self.form.dBFloorNf2ffEmerge.setValue(plotNF2FFSettings["dBFloorNf2ffEmerge"])
-                    self.form.diagramRMaxNF2FFEmerge.setValue(plotNF2FFSettings["diagramRMaxNF2FFEmerge"])
-                    self.form.diagramPlacementXNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementXNF2FFEmerge"])
-                    self.form.diagramPlacementYNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementYNF2FFEmerge"])
-                    self.form.diagramPlacementZNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementZNF2FFEmerge"])
-                    self.form.diagramIsotropicNF2FFEmerge.setChecked(plotNF2FFSettings["diagramIsotropicNF2FFEmerge"])
-
-                    self.form.frequencyFieldProcessingEmerge.setValue(plotFieldSettings["frequencyFieldProcessingEmerge"])
-                    self.guiHelpers.setComboboxItem(self.form.typeFieldProcessingEmerge, plotFieldSettings["typeFieldProcessingEmerge"])
-                    self.guiHelpers.setComboboxItem(self.form.metricFieldProcessingEmerge, plotFieldSettings["metricFieldProcessingEmerge"])
-                    self.form.discretizationStepSizeFieldProcessingEmerge.setValue(plotFieldSettings["discretizationStepSizeFieldProcessingEmerge"])
-                    self.form.animateFieldProcessingEmerge.setChecked(plotFieldSettings["animateFieldProcessingEmerge"])
-                    self.form.cutplaneXFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneXFieldProcessingEmerge"])
-                    self.form.cutplaneYFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneYFieldProcessingEmerge"])
-                    self.form.cutplaneZFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneZFieldProcessingEmerge"])
+
+                    #
+                    #   Better approach how to add priority into GUI, now priorities doesn't have to be sequential numbers
+                    #   and can be repeated, yes there will be oreder mistakes, but this is more robust and doesn't crash
+                    #   when priorities were modified by hand and are repeating.
+                    #
+
+                    #init top item list with zeros, but as key is used order of each key
+                    topItemsList = {}
+                    for prioritySettingsKey in settings.childKeys():
+                        prioritySettingsOrder = int(settings.value(prioritySettingsKey))
+                        #if key number already used increment by 1 to make it unique
+                        while (prioritySettingsOrder in list(topItemsList.keys())):
+                            prioritySettingsOrder += 1
+
+                        # key in file is text of item "Category, Group, Object", it's parsed only here
+                        prioritySettingsType = PriorityListIndex.keyFromText(prioritySettingsKey)
+                        logger.debug("Priority list adding item %s", prioritySettingsKey)
+
+                        # adding item into priority list
+                        topItem = PriorityListIndex.createItem(prioritySettingsType, icon=self.cadHelpers.getIconByCategory(prioritySettingsType), data=list(prioritySettingsType))
+                        topItemsList[prioritySettingsOrder] = topItem
+
+                    #sort topItemList using its keys
+                    sortedTopItemsList = []
+                    for key in sorted(topItemsList):
+                        sortedTopItemsList.append(topItemsList[key])
+
+                    self.guiHelpers.getMeshPriorityIndex().insertItems(0, sortedTopItemsList)
+                    logger.debug("Priority list array initialized with size %s", len(sortedTopItemsList))
 
                     settings.endGroup()
 
-                except Exception as e:
-                    print(e)
+                    #
+                    # If grid settings is not set to be top priority lines, therefore it's disabled (because then it's not take into account when generate mesh lines and it's overlapping something)
+                    #
+                    self.guiHelpers.updateMeshPriorityDisableItems()
 
-                continue
+                    continue
 
-            elif (re.compile("POSTPROCESSING").search(settingsGroup)):
-                print("POSTPROCESSING item settings found.")
-                settings.beginGroup(settingsGroup)
-                #
-                #	In case of error just continue and do nothing to correct values
-                #
-                try:
-                    self.guiHelpers.setComboboxItem(self.form.portNf2ffObjectList, settings.value("nf2ffObject"))
-                    self.form.portNf2ffThetaStart.setValue(float(settings.value("nf2ffThetaStart")))
-                    self.form.portNf2ffThetaStop.setValue(float(settings.value("nf2ffThetaStop")))
-                    self.form.portNf2ffThetaStep.setValue(float(settings.value("nf2ffThetaStep")))
-                    self.form.portNf2ffPhiStart.setValue(float(settings.value("nf2ffPhiStart")))
-                    self.form.portNf2ffPhiStop.setValue(float(settings.value("nf2ffPhiStop")))
-                    self.form.portNf2ffPhiStep.setValue(float(settings.value("nf2ffPhiStep")))
-                    self.form.portNf2ffFreqCount.setValue(float(settings.value("nf2ffFreqCount")))
-
-                    self.guiHelpers.setComboboxItem(self.form.portNf2ffInput, settings.value("nf2ffInputPort"))
-                    self.form.portNf2ffFreq.setValue(float(settings.value("nf2ffFreqValue")))
-                except:
-                    pass
-
-                settings.endGroup()
-                continue
-
-            elif (re.compile("SOLVER").search(settingsGroup)):
-                print("SOLVER item settings found.")
-                settings.beginGroup(settingsGroup)
-                #
-                #	In case of error just continue and do nothing to correct values
-                #
-                try:
-                    self.guiHelpers.setComboboxItem(self.form.comboBox_solverType, settings.value("solver"))
-                except:
-                    pass
+                elif (re.compile("POSTPROCESSING-EmergePlotFields").search(settingsGroup)):
+
+                    #
+                    #   This parameters were added into .ini file just now recently (March 2026) therefore it's wrapped in try/except
+                    #   to not cause error when older .ini files are opened and don't have these params inside
+                    #
+                    try:
+                        settings.beginGroup(settingsGroup)
+                        plotNF2FFSettings = self.getJsonValue(settings, 'plotNF2FFSettings')
+                        plotFieldSettings = self.getJsonValue(settings, 'plotFieldSettings')
+
+                        self.guiHelpers.setComboboxItem(self.form.portNf2ffEmergeObjectList, plotNF2FFSettings["portNf2ffEmergeObjectList"])
+                        self.form.boundaryNf2ffEmergeFreq.setValue(plotNF2FFSettings["boundaryNf2ffEmergeFreq"])
+                        self.guiHelpers.setComboboxItem(self.form.polarizationNf2ffEmerge, plotNF2FFSettings["polarizationNf2ffEmerge"])
+                        self.guiHelpers.setComboboxItem(self.form.quantityNf2ffEmerge, plotNF2FFSettings["quantityNf2ffEmerge"])
+                        self.form.useDecibelsNf2ffEmerge.setChecked(plotNF2FFSettings["useDecibelsNf2ffEmerge"])
+                        self.form.dBFloorNf2ffEmerge.setValue(plotNF2FFSettings["dBFloorNf2ffEmerge"])
+                        self.form.diagramRMaxNF2FFEmerge.setValue(plotNF2FFSettings["diagramRMaxNF2FFEmerge"])
+                        self.form.diagramPlacementXNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementXNF2FFEmerge"])
+                        self.form.diagramPlacementYNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementYNF2FFEmerge"])
+                        self.form.diagramPlacementZNF2FFEmerge.setValue(plotNF2FFSettings["diagramPlacementZNF2FFEmerge"])
+                        self.form.diagramIsotropicNF2FFEmerge.setChecked(plotNF2FFSettings["diagramIsotropicNF2FFEmerge"])
+
+                        self.form.frequencyFieldProcessingEmerge.setValue(plotFieldSettings["frequencyFieldProcessingEmerge"])
+                        self.guiHelpers.setComboboxItem(self.form.typeFieldProcessingEmerge, plotFieldSettings["typeFieldProcessingEmerge"])
+                        self.guiHelpers.setComboboxItem(self.form.metricFieldProcessingEmerge, plotFieldSettings["metricFieldProcessingEmerge"])
+                        self.form.discretizationStepSizeFieldProcessingEmerge.setValue(plotFieldSettings["discretizationStepSizeFieldProcessingEmerge"])
+                        self.form.animateFieldProcessingEmerge.setChecked(plotFieldSettings["animateFieldProcessingEmerge"])
+                        self.form.cutplaneXFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneXFieldProcessingEmerge"])
+                        self.form.cutplaneYFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneYFieldProcessingEmerge"])
+                        self.form.cutplaneZFieldProcessingEmerge.setValue(plotFieldSettings["cutplaneZFieldProcessingEmerge"])
+
+                        settings.endGroup()
+
+                    except Exception as e:
+                        logger.debug(e)
 
-                settings.endGroup()
-                continue
+                    continue
 
-            else:
-                # if no item recognized then conitnue next run, at the end there is adding into object assignment tab
-                # and if category is not known it's need to goes for another one
-                continue
+                elif (re.compile("POSTPROCESSING").search(settingsGroup)):
+                    logger.debug("POSTPROCESSING item settings found.")
+                    settings.beginGroup(settingsGroup)
+                    #
+                    #	In case of error just continue and do nothing to correct values
+                    #
+                    try:
+                        self.guiHelpers.setComboboxItem(self.form.portNf2ffObjectList, settings.value("nf2ffObject"))
+                        self.form.portNf2ffThetaStart.setValue(float(settings.value("nf2ffThetaStart")))
+                        self.form.portNf2ffThetaStop.setValue(float(settings.value("nf2ffThetaStop")))
+                        self.form.portNf2ffThetaStep.setValue(float(settings.value("nf2ffThetaStep")))
+                        self.form.portNf2ffPhiStart.setValue(float(settings.value("nf2ffPhiStart")))
+                        self.form.portNf2ffPhiStop.setValue(float(settings.value("nf2ffPhiStop")))
+                        self.form.portNf2ffPhiStep.setValue(float(settings.value("nf2ffPhiStep")))
+                        self.form.portNf2ffFreqCount.setValue(float(settings.value("nf2ffFreqCount")))
+
+                        self.guiHelpers.setComboboxItem(self.form.portNf2ffInput, settings.value("nf2ffInputPort"))
+                        self.form.portNf2ffFreq.setValue(float(settings.value("nf2ffFreqValue")))
+                    except:
+                        pass
+
+                    settings.endGroup()
+                    continue
+
+                elif (re.compile("SOLVER").search(settingsGroup)):
+                    logger.debug("SOLVER item settings found.")
+                    settings.beginGroup(settingsGroup)
+                    #
+                    #	In case of error just continue and do nothing to correct values
+                    #
+                    try:
+                        self.guiHelpers.setComboboxItem(self.form.comboBox_solverType, settings.value("solver"))
+                    except:
+                        pass
+
+                    settings.endGroup()
+                    continue
+
+                else:
+                    # if no item recognized then conitnue next run, at the end there is adding into object assignment tab
+                    # and if category is not known it's need to goes for another one
+                    continue
+
+                # settings items are added into GUI at once, before first assigned object or at the end of load
+                loadedSettingsItems.append(categorySettings)
+
+            self.guiHelpers.addSettingsItemsGui(loadedSettingsItems)
+            for parentItem, objectItems in assignedObjectItems.values():
+                parentItem.addChildren(objectItems)
 
-            # add all items
-            self.guiHelpers.addSettingsItemGui(categorySettings)
             # start with expanded treeWidget
             self.form.objectAssignmentRightTreeWidget.expandAll()
 
+        #
+        #   Signals were blocked during load, settings tabs are updated to show current items
+        #
+        for settingsTreeWidget in [self.form.gridSettingsTreeView, self.form.materialSettingsTreeView, self.form.excitationSettingsTreeView,
+                                   self.form.probeSettingsTreeView, self.form.lumpedPartTreeView, self.form.boundaryConditionSettingsTreeView]:
+            topItem = settingsTreeWidget.currentItem()
+            if topItem is not None:
+                settingsTreeWidget.currentItemChanged.emit(topItem, topItem)
+
         #
         #   Failed loaded objects name listed in message for user and
         #   will be removed in priority list if they are mesh, material
@@ -1242,7 +1393,7 @@ class IniFile0v1:
                 auxCounter += 1
 
                 #remove p[articular line for object from priority list if its there
-                self.guiHelpers.removePriorityName(objName)
+                self.guiHelpers.removePriorityObject(objName)
 
             self.guiHelpers.displayMessage(f"Fail to load:\n{missingObjects}")
 
@@ -1272,30 +1423,33 @@ class IniFile0v1:
             topItem = self.form.portSettingsTreeView.invisibleRootItem().child(0)
             self.form.portSettingsTreeView.currentItemChanged.emit(topItem, topItem)    #this signal is connected so it must be emitted
         else:
-            print(f"{__file__} > read(): no guiSignals defined, probably not passed into constructor, some UI things doesn't have to be populated")
+            logger.debug("%s > read(): no guiSignals defined, probably not passed into constructor, some UI things doesn't have to be populated", __file__)
 
         #
         #   Final message from which file were settings loaded
         #
         self.guiHelpers.displayMessage("Settings loaded from file: " + outFile, forceModal=False)
-        print(f"---> IniFIle0v1 > read() finished.")
+        logger.debug("---> IniFIle0v1 > read() finished.")
 
         return
 
-    def renameMeshPriorityItem(self, gridGroupName, oldName, newName):
-        meshItemName = "Grid, " + gridGroupName + ", " + oldName
-        meshItemNameNew = "Grid, " + gridGroupName + ", " + newName
+    def getAssignmentParentItems(self):
+        """
+        Index of settings items in object assignment tree, used to assign loaded objects without searching tree for each of them.
+        :return: dictionary (category name, settings item name) -> list of tree items
+        """
+        return dict(self.guiHelpers.getObjectAssignmentIndex().getAllGroupItems())
 
-        meshPriorityItemsToRename = self.form.meshPriorityTreeView.findItems(meshItemName, QtCore.Qt.MatchExactly)
-        for meshItemPriority in meshPriorityItemsToRename:
-            meshItemPriority.setText(0, meshItemNameNew)
-            meshItemPriority.setIcon(0, QtGui.QIcon("./img/errorLoadObject.svg"))
+    def renameMeshPriorityItem(self, gridGroupName, oldName, newName):
+        self.guiHelpers.getMeshPriorityIndex().replaceKey(
+            ("Grid", gridGroupName, oldName),
+            ("Grid", gridGroupName, newName),
+            icon=QtGui.QIcon("./img/errorLoadObject.svg")
+        )
 
     def renameObjectsPriorityItem(self, objCategory, objParentItemName, oldName, newName):
-        objItemName = objCategory + ", " + objParentItemName + ", " + oldName
-        objItemNameNew = objCategory + ", " + objParentItemName + ", " + newName
-
-        objPriorityItemsToRename = self.form.objectAssignmentPriorityTreeView.findItems(objItemName, QtCore.Qt.MatchExactly)
-        for objItemPriority in objPriorityItemsToRename:
-            objItemPriority.setText(0, objItemNameNew)
-            objItemPriority.setIcon(0, QtGui.QIcon("./img/errorLoadObject.svg"))
+        self.guiHelpers.getObjectPriorityIndex().replaceKey(
+            (objCategory, objParentItemName, oldName),
+            (objCategory, objParentItemName, newName),
+            icon=QtGui.QIcon("./img/errorLoadObject.svg")
+        )
@@ -1,13 +1,18 @@
 import os
 import re
+import ast
 import json
+import bisect
 
 from PySide import QtGui, QtCore, QtWidgets
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
 #from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r
 
 def _bool(s):
 	return s in ('True', 'true', '1', 'yes', True)
 
+logger = getLogger(__name__)
+
 class IniValidator0v1:
 
     IniFileSchema = {
@@ -192,6 +197,18 @@ class IniValidator0v1:
                                 'mandatory': True,
                                 'allowedValues': "float"
                             },
+                            'materialAware': {
+                                'mandatory': False,
+                                'allowedValues': "bool"
+                            },
+                            'thirdsRule': {
+                                'mandatory': False,
+                                'allowedValues': "bool"
+                            },
+                            'thirdsRuleResolution': {
+                                'mandatory': False,
+                                'allowedValues': "float"
+                            },
                         }
                     },
                 ]
@@ -601,6 +618,18 @@ class IniValidator0v1:
                                 'mandatory': False,
                                 'allowedValues': "int"
                             },
+                            'symmetry_enable': {
+                                'mandatory': False,
+                                'allowedValues': "bool"
+                            },
+                            'symmetry_planes': {
+                                'mandatory': False,
+                                'allowedValues': "string"
+                            },
+                            'use_engine_profile': {
+                                'mandatory': False,
+                                'allowedValues': "bool"
+                            },
                             'generateJustPreview': {
                                 'mandatory': True,
                                 'allowedValues': "bool"
@@ -708,137 +737,207 @@ class IniValidator0v1:
         ]
     }
 
+    #   schema compiled by getCompiledSchema(), shared by all calls, it's never changed during check
+    compiledSchema = None
+
+    #   condition in 'mandatory', ie. settings.value('type') == 'dumpbox' or settings.value('type') in ['lumped', 'curve']
+    mandatoryConditionRegex = re.compile(r"""^settings\.value\((['"])(.+?)\1\)\s*(==|in)\s*(.+)$""")
+    boolValueRegex = re.compile(r"(0|1|false|true)")
+
     def __init__(self):
         return
 
     @classmethod
-    def checkFile(self, filepath):
+    def compileMandatory(cls, mandatory):
+        """
+        Compile 'mandatory' from schema into predicate called with dictionary of group values, expressions are parsed,
+        not evaluated, supported are conditions settings.value('key') == 'value' and settings.value('key') in [...]
+        joined by 'and'.
+        :return: predicate(groupValues) -> bool
+        """
+        if type(mandatory) == bool:
+            return lambda groupValues: mandatory
+
+        conditions = []
+        for conditionStr in mandatory.split(" and "):
+            conditionMatch = cls.mandatoryConditionRegex.match(conditionStr.strip())
+            if conditionMatch is None:
+                raise ValueError(f"{__file__} > compileMandatory() ERROR: unsupported mandatory condition '{conditionStr}'")
+
+            key, operator, expectedValue = conditionMatch.group(2), conditionMatch.group(3), ast.literal_eval(conditionMatch.group(4))
+            if operator == "==":
+                conditions.append((key, [expectedValue]))
+            else:
+                conditions.append((key, list(expectedValue)))
+
+        return lambda groupValues: all([groupValues.get(key) in expectedValues for key, expectedValues in conditions])
+
+    @classmethod
+    def compileAllowedValues(cls, allowedValues):
+        """
+        :return: function(value) -> True if value is valid
+        """
+        def isInt(value):
+            try:
+                int(value)
+                return True
+            except:
+                return False
+
+        def isFloat(value):
+            try:
+                float(value)
+                return True
+            except:
+                return False
+
+        if allowedValues == "string":
+            return lambda value: True
+        elif allowedValues == "int":
+            return isInt
+        elif allowedValues == "float":
+            return isFloat
+        elif allowedValues == "bool":
+            return lambda value: cls.boolValueRegex.match(str(value).lower()) is not None
+
+        allowedValuesRegex = re.compile(allowedValues)
+        def isMatching(value):
+            try:
+                value = ",".join(value) if type(value) == list else value
+                return allowedValuesRegex.match(value) is not None
+            except:
+                return False
+        return isMatching
+
+    @classmethod
+    def compileItem(cls, schemaItem):
+        compiledItem = {
+            'name': schemaItem.get('name'),
+            'isMandatory': cls.compileMandatory(schemaItem['mandatory']),
+            'isAlwaysChecked': type(schemaItem['mandatory']) == bool,    # value is checked when present even if item is not mandatory
+            'allowedValues': schemaItem['allowedValues'],
+            'elements': None,
+            'isValid': None,
+        }
+
+        if type(schemaItem['allowedValues']) == dict:
+            compiledItem['elements'] = [
+                dict(cls.compileItem(elementDefinition), name=elementKey) for elementKey, elementDefinition in schemaItem['allowedValues'].items()
+            ]
+        else:
+            compiledItem['isValid'] = cls.compileAllowedValues(schemaItem['allowedValues'])
+
+        #   item name can be regex, plain names are checked as key prefix without regex
+        if compiledItem['name'] is not None:
+            compiledItem['isLiteralName'] = re.escape(compiledItem['name']) == compiledItem['name']
+            compiledItem['nameRegex'] = re.compile(compiledItem['name'])
+
+        return compiledItem
+
+    @classmethod
+    def getCompiledSchema(cls):
+        """
+        Compile IniFileSchema into precompiled regexes and predicates, it's done once and cached in class.
+        """
+        if cls.compiledSchema is None:
+            cls.compiledSchema = [
+                {
+                    'name': schemaGroup['name'],
+                    'nameRegex': re.compile(schemaGroup['name']),
+                    'mandatory': schemaGroup['mandatory'],
+                    'items': [cls.compileItem(schemaItem) for schemaItem in schemaGroup.get('items', [])],
+                }
+                for schemaGroup in cls.IniFileSchema['topLevelGroups']
+            ]
+        return cls.compiledSchema
+
+    @staticmethod
+    def hasKeyWithPrefix(sortedKeys, prefix):
+        """
+        :param sortedKeys: sorted list of group keys, keys starting with prefix are right after position of prefix
+        """
+        position = bisect.bisect_left(sortedKeys, prefix)
+        return position < len(sortedKeys) and sortedKeys[position].startswith(prefix)
+
+    @classmethod
+    def checkGroup(cls, groupName, groupValues, compiledGroup, errorList):
         """
-        Check .ini file if it's valid and print errors found in file against defined schema for this version.
+        Check values of one .ini group against compiled schema group, errors are appended into errorList.
+        :param groupValues: dictionary of all group keys and their values
+        """
+        sortedKeys = sorted(groupValues.keys())
+
+        for compiledItem in compiledGroup['items']:
+            #   item name is matched from start of key same as re.match() does, so plain name is key prefix
+            if compiledItem['isLiteralName']:
+                isPresent = compiledItem['name'] in groupValues or cls.hasKeyWithPrefix(sortedKeys, compiledItem['name'])
+            else:
+                isPresent = any(compiledItem['nameRegex'].match(key) for key in sortedKeys)
+
+            isMandatory = compiledItem['isMandatory'](groupValues)
+            if isMandatory and not isPresent:
+                errorList.append(f"[{groupName}] does not contains item '{compiledItem['name']}'")
+
+            if not (isPresent and (isMandatory or compiledItem['isAlwaysChecked'])):
+                continue
+
+            currentGroupItemValue = groupValues.get(compiledItem['name'])
+            if compiledItem['elements'] is None:
+                if not compiledItem['isValid'](currentGroupItemValue):
+                    errorList.append(f"[{groupName}] -> '{compiledItem['name']}' has invalid value '{currentGroupItemValue}', expected '{compiledItem['allowedValues']}'")
+                continue
+
+            #
+            #   JSON value, its elements are checked
+            #
+            try:
+                currentGroupItemValue = json.loads(currentGroupItemValue)
+            except Exception as e:
+                logger.warning(f"[{groupName}] -> '{compiledItem['name']}: ERROR json format: {e}")
+                continue
+
+            for compiledElement in compiledItem['elements']:
+                elementKey = compiledElement['name']
+                if not elementKey in currentGroupItemValue.keys():
+                    continue
+                if compiledElement['isMandatory'](groupValues) or compiledElement['isAlwaysChecked']:
+                    if not compiledElement['isValid'](currentGroupItemValue[elementKey]):
+                        errorList.append(f"[{groupName}] -> '{compiledItem['name']}' -> {elementKey} has invalid value '{currentGroupItemValue[elementKey]}', expected '{compiledElement['allowedValues']}'")
+
+    @classmethod
+    def checkFile(cls, filepath):
+        """
+        Check .ini file if it's valid and log errors found in file against defined schema for this version.
+        Each group is read once and checked in one pass, all state of check is local for this call.
         :param filepath:
         :return: [] error list, in case no error list is empty
         """
         settings = QtCore.QSettings(filepath, QtCore.QSettings.IniFormat)
+        compiledSchema = cls.getCompiledSchema()
 
-        print(f"####Formal file check using validator: {os.path.basename(__file__)}")
-        print("#### START report")
+        logger.debug("####Formal file check using validator: %s", os.path.basename(__file__))
 
         errorList = []
+        presentSchemaGroups = set()
         for currentGroupName in settings.childGroups():
-            #print(currentGroup)
             settings.beginGroup(currentGroupName)
-
-            for iniSchemaGroup in self.IniFileSchema['topLevelGroups']:
-                if re.match(iniSchemaGroup['name'], currentGroupName):
-
-                    #
-                    #   Make mark in schema description that top group is present.
-                    #
-                    iniSchemaGroup['isPresent'] = True
-
-                    if 'items' in iniSchemaGroup.keys():
-                        for iniGroupItem in iniSchemaGroup['items']:
-
-                            #
-                            #   Check if all mandatory group items are present.
-                            #
-                            isMandatory = bool(eval(str(iniGroupItem['mandatory'])))
-                            isPresent = sum([bool(re.match(iniGroupItem['name'], key)) for key in settings.childKeys()])
-                            if isMandatory and not isPresent:
-                                errorList.append(f"[{currentGroupName}] does not contains item '{iniGroupItem['name']}'")
-
-                            #
-                            #   Check item value.
-                            #       Item must be present and also
-                            #       its mandatory must be True/False (bool datatype) then it's evaluated evenwhen not mandatory to check if has expected value
-                            #       or its mandatory is defined by string which is evaluated in eval(), if True then is evaluated
-                            #
-                            if isPresent and (isMandatory or type(iniGroupItem['mandatory']) == bool):
-                                currentGroupItemValue = settings.value(iniGroupItem['name'])
-                                errorType = False
-                                if iniGroupItem['allowedValues'] == "string":
-                                    pass
-                                elif (iniGroupItem['allowedValues'] == "int"):
-                                    try:
-                                        int(currentGroupItemValue)
-                                    except:
-                                        errorType = True
-                                elif (iniGroupItem['allowedValues'] == "float"):
-                                    try:
-                                        float(currentGroupItemValue)
-                                    except:
-                                        errorType = True
-                                elif (iniGroupItem['allowedValues'] == "bool"):
-                                    if not re.match(r"(0|1|false|true)", str(currentGroupItemValue).lower()):
-                                        errorType = True
-                                elif (type(iniGroupItem['allowedValues']) == dict):
-                                    #
-                                    #   check for JSON not implemented yet.
-                                    #
-                                    jsonError = False
-                                    try:
-                                        currentGroupItemValue = json.loads(currentGroupItemValue)
-                                    except Exception as e:
-                                        print(f"[{currentGroupName}] -> '{iniGroupItem['name']}: ERROR json format: {e}")
-                                        continue
-
-                                    for elementKey, elementDefinition in iniGroupItem['allowedValues'].items():
-                                        isPresent = elementKey in currentGroupItemValue.keys()
-                                        if isPresent:
-                                            isMandatory = bool(eval(str(elementDefinition['mandatory'])))
-                                            if (isMandatory or type(elementDefinition['mandatory']) == bool):
-                                                if elementDefinition['allowedValues'] == "string":
-                                                    pass
-                                                elif (elementDefinition['allowedValues'] == "int"):
-                                                    try:
-                                                        int(currentGroupItemValue[elementKey])
-                                                    except:
-                                                        errorType = True
-                                                elif (elementDefinition['allowedValues'] == "float"):
-                                                    try:
-                                                        float(currentGroupItemValue[elementKey])
-                                                    except:
-                                                        errorType = True
-                                                elif (elementDefinition['allowedValues'] == "bool"):
-                                                    if not re.match(r"(0|1|false|true)", str(currentGroupItemValue[elementKey]).lower()):
-                                                        errorType = True
-                                                else:
-                                                    try:
-                                                        currentGroupItemValue[elementKey] = ",".join(currentGroupItemValue[elementKey]) if type(currentGroupItemValue[elementKey]) == list else currentGroupItemValue[elementKey]
-                                                        if not re.match(elementDefinition['allowedValues'], currentGroupItemValue[elementKey]):
-                                                            errorType = True
-                                                    except:
-                                                        errorType = True
-
-                                                if errorType:
-                                                    errorList.append(f"[{currentGroupName}] -> '{iniGroupItem['name']}' -> {elementKey} has invalid value '{currentGroupItemValue[elementKey]}', expected '{elementDefinition['allowedValues']}'")
-                                                    errorType = False   #null error flag to not write any other error
-                                    pass
-                                else:
-                                    try:
-                                        currentGroupItemValue = ",".join(currentGroupItemValue) if type(currentGroupItemValue) == list else currentGroupItemValue
-                                        if not re.match(iniGroupItem['allowedValues'], currentGroupItemValue):
-                                            errorType = True
-                                    except:
-                                        errorType = True
-
-                                if errorType:
-                                    errorList.append(f"[{currentGroupName}] -> '{iniGroupItem['name']}' has invalid value '{currentGroupItemValue}', expected '{iniGroupItem['allowedValues']}'")
-
+            groupValues = {key: settings.value(key) for key in settings.childKeys()}
             settings.endGroup()
 
-        #
-        #   Check if all mandatory top group are present from schema, checking mark 'isPresent'
-        #
-        for iniSchemaGroup in self.IniFileSchema['topLevelGroups']:
-            if not 'isPresent' in iniSchemaGroup.keys() and iniSchemaGroup['mandatory']:
-                print(f"FAIL - {iniSchemaGroup['name']} group is mandatory and not found")
+            for compiledGroup in compiledSchema:
+                if compiledGroup['nameRegex'].match(currentGroupName):
+                    presentSchemaGroups.add(compiledGroup['name'])
+                    cls.checkGroup(currentGroupName, groupValues, compiledGroup, errorList)
 
         #
-        #   Print errors
+        #   Check if all mandatory top group are present from schema
         #
-        [print(f"{msg}") for msg in errorList]
-        print("#### END report")
+        for compiledGroup in compiledSchema:
+            if compiledGroup['mandatory'] and not compiledGroup['name'] in presentSchemaGroups:
+                logger.warning(f"FAIL - {compiledGroup['name']} group is mandatory and not found")
+
+        for msg in errorList:
+            logger.warning(msg)
 
         return errorList
 
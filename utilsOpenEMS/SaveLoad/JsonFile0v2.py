@@ -0,0 +1,354 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import sys
+import json
+
+from PySide import QtCore
+
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = getLogger(__name__)
+
+#
+#   Settings storage of format 0.2, groups are same as in .ini format 0.1 (MATERIAL-name, GRID-name, _OBJECT0-name, ...)
+#   but values are stored typed and JSON values (grid fixedDistance, excitation gaussian, ...) are stored as objects,
+#   not as strings which must be parsed again.
+#
+#   Groups are stored in sections by their prefix (MATERIAL, GRID, _OBJECT, PRIORITYLIST, ...). File starts with one line
+#   JSON header containing index of sections (offset, length, names of groups), after header there are section blobs
+#   encoded as JSON or MessagePack (.msgpack extension, needs msgpack module). Section is decoded just when some of its
+#   groups is accessed, so large sections as object assignments are not parsed if they are not needed. Sections which were
+#   not changed are copied into new file as raw bytes during save.
+#
+#   Object provides subset of QSettings interface used by IniFile0v1 (beginGroup, endGroup, childGroups, childKeys, value,
+#   setValue, sync), value() returns strings for scalars same as QSettings for .ini file.
+#
+class SectionSettings:
+
+    fileFormatName = "FreeCAD-OpenEMS-Export settings"
+    fileFormatVersion = "0.2"
+
+    def __init__(self, fileName):
+        """
+        :param fileName: .json or .msgpack file, None creates settings only in memory (autosave snapshots), sync() can't be used then
+        """
+        self.fileName = fileName
+        self.encoding = "msgpack" if fileName is not None and os.path.splitext(fileName)[1].lower() == ".msgpack" else "json"
+        if self.encoding == "msgpack" and msgpack is None:
+            raise ImportError(f"{__file__} > SectionSettings() ERROR: msgpack module is not installed, cannot use {fileName}")
+
+        self.sectionsIndex = {}         # section name -> {'offset', 'length', 'groups'} of sections in file
+        self.sections = {}              # section name -> {group name -> {key -> value}}, decoded sections
+        self.changedSections = set()    # sections which must be encoded again during sync()
+        self.headerLength = 0
+        self.currentGroup = None
+
+        if fileName is not None and os.path.exists(fileName):
+            self.readHeader()
+
+    @staticmethod
+    def getSectionName(groupName):
+        return IniFile0v1.getSectionName(groupName)
+
+    def encode(self, data):
+        if self.encoding == "msgpack":
+            return msgpack.packb(data, use_bin_type=True, default=str)
+        return json.dumps(data, default=str).encode("utf-8")
+
+    def decode(self, dataBytes):
+        if self.encoding == "msgpack":
+            return msgpack.unpackb(dataBytes, raw=False)
+        return json.loads(dataBytes.decode("utf-8"))
+
+    def readHeader(self):
+        with open(self.fileName, "rb") as f:
+            headerLine = f.readline()
+        header = json.loads(headerLine.decode("utf-8"))
+        if header.get("format") != self.fileFormatName:
+            raise ValueError(f"{__file__} > readHeader() ERROR: {self.fileName} is not settings file of version {self.fileFormatVersion}")
+
+        self.headerLength = len(headerLine)
+        self.sectionsIndex = header["sections"]
+
+    def readSectionBytes(self, sectionName):
+        sectionIndex = self.sectionsIndex[sectionName]
+        with open(self.fileName, "rb") as f:
+            f.seek(self.headerLength + sectionIndex["offset"])
+            return f.read(sectionIndex["length"])
+
+    def getSection(self, sectionName, isCreated=False):
+        """
+        :return: decoded section, it's read from file at first access
+        """
+        if not sectionName in self.sections:
+            if sectionName in self.sectionsIndex:
+                logger.debug("loading section %s from %s", sectionName, self.fileName)
+                self.sections[sectionName] = self.decode(self.readSectionBytes(sectionName))
+            elif isCreated:
+                self.sections[sectionName] = {}
+            else:
+                return {}
+        return self.sections[sectionName]
+
+    def childSections(self):
+        return sorted(set(self.sectionsIndex.keys()) | set(self.sections.keys()))
+
+    def getSectionGroups(self, sectionName):
+        """
+        :return: names of section groups, taken from file header if section isn't decoded
+        """
+        if sectionName in self.sections:
+            return sorted(self.sections[sectionName].keys())
+        return sorted(self.sectionsIndex.get(sectionName, {}).get("groups", []))
+
+    def isSectionLoaded(self, sectionName):
+        return sectionName in self.sections
+
+    def releaseSection(self, sectionName):
+        """
+        Drop decoded section which wasn't changed, it's read from file again when it's accessed.
+        """
+        if sectionName in self.sectionsIndex and not sectionName in self.changedSections:
+            self.sections.pop(sectionName, None)
+
+    def getGroup(self, groupName, isCreated=False):
+        section = self.getSection(self.getSectionName(groupName), isCreated)
+        if isCreated:
+            self.changedSections.add(self.getSectionName(groupName))
+            return section.setdefault(groupName, {})
+        return section.get(groupName, {})
+
+    ###############################################################################################################################
+    #   QSettings interface
+    ###############################################################################################################################
+
+    def beginGroup(self, groupName):
+        self.currentGroup = groupName
+
+    def endGroup(self):
+        self.currentGroup = None
+
+    def childGroups(self):
+        """
+        Names of all groups sorted same as QSettings does, groups names are in file header so no section is decoded.
+        """
+        groupNames = set()
+        for sectionName, sectionIndex in self.sectionsIndex.items():
+            if not sectionName in self.sections:
+                groupNames.update(sectionIndex["groups"])
+        for section in self.sections.values():
+            groupNames.update(section.keys())
+        return sorted(groupNames)
+
+    def childKeys(self):
+        return list(self.getGroup(self.currentGroup).keys())
+
+    def value(self, key, defaultValue=None):
+        value = self.getGroup(self.currentGroup).get(key, defaultValue)
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, dict):
+            return json.dumps(value)
+        return value
+
+    def jsonValue(self, key):
+        """
+        :return: stored object, values converted from .ini file which weren't valid JSON are parsed here
+        """
+        value = self.getGroup(self.currentGroup).get(key)
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+    def setValue(self, key, value):
+        self.getGroup(self.currentGroup, isCreated=True)[key] = value
+
+    def clearSection(self, sectionName):
+        """
+        Remove all groups of section, it's encoded again during sync() so its old content isn't even decoded.
+        """
+        self.sections[sectionName] = {}
+        self.changedSections.add(sectionName)
+
+    def sync(self):
+        """
+        Write file, unchanged sections are copied as raw bytes from current file. File is written into temporary file
+        which replaces original one so file is never left half written.
+        """
+        sectionsBytes = {}
+        for sectionName in sorted(set(self.sectionsIndex.keys()) | set(self.sections.keys())):
+            if sectionName in self.changedSections or not sectionName in self.sectionsIndex:
+                sectionsBytes[sectionName] = self.encode(self.sections[sectionName])
+            else:
+                sectionsBytes[sectionName] = self.readSectionBytes(sectionName)
+
+        sectionsIndex = {}
+        offset = 0
+        for sectionName, sectionBytes in sectionsBytes.items():
+            if sectionName in self.sections:
+                groupNames = list(self.sections[sectionName].keys())
+            else:
+                groupNames = self.sectionsIndex[sectionName]["groups"]
+            sectionsIndex[sectionName] = {"offset": offset, "length": len(sectionBytes), "groups": groupNames}
+            offset += len(sectionBytes)
+
+        header = {"format": self.fileFormatName, "version": self.fileFormatVersion, "encoding": self.encoding, "sections": sectionsIndex}
+        headerLine = (json.dumps(header) + "\n").encode("utf-8")
+
+        tmpFileName = self.fileName + ".tmp"
+        with open(tmpFileName, "wb") as f:
+            f.write(headerLine)
+            for sectionBytes in sectionsBytes.values():
+                f.write(sectionBytes)
+        os.replace(tmpFileName, self.fileName)
+
+        self.sectionsIndex = sectionsIndex
+        self.headerLength = len(headerLine)
+        self.changedSections = set()
+
+#
+#   Simulation settings file version 0.2, GUI is written and read in the same way as IniFile0v1 does, just storage is
+#   SectionSettings and JSON values are not serialized into strings.
+#
+#   If dirtyTracker is set and settings are saved into same file which was last saved or loaded, only sections changed
+#   since then are written again, other sections are copied from file as they are.
+#
+class JsonFile0v2(IniFile0v1):
+
+    defaultFileSuffix = "_settings.json"
+    fileFormatVersion = SectionSettings.fileFormatVersion
+
+    def __init__(self, form, statusBar = None, guiSignals = None, APP_DIR = "", dirtyTracker = None):
+        super().__init__(form, statusBar=statusBar, guiSignals=guiSignals, APP_DIR=APP_DIR, dirtyTracker=dirtyTracker)
+        self.lastSavedFile = None
+        self.isIncrementalWrite = False
+
+    #   keys which .ini file 0.1 stores as JSON strings, during conversion they are stored as objects
+    iniJsonKeys = [
+        "fixedDistance", "fixedCount", "smoothMesh", "userDefined", "femMesh", "gridOffset",
+        "sinusodial", "gaussian", "custom", "sweep", "fem_gaussian",
+        "directionCustomVector", "params", "paramsPalace", "plotFieldSettings", "plotNF2FFSettings",
+    ]
+
+    def getSettingsFileForName(self, filename):
+        if os.path.splitext(filename)[1].lower() in ['.json', '.msgpack']:
+            return self
+        return IniFile0v1(self.form, statusBar=self.statusBar, guiSignals=self.guiSignals, APP_DIR=self.APP_DIR)
+
+    def openSettings(self, filename):
+        return SectionSettings(filename)
+
+    def getJsonValue(self, settings, key):
+        return settings.jsonValue(key)
+
+    def setJsonValue(self, settings, key, value):
+        settings.setValue(key, value)
+
+    def openSettingsForWrite(self, outFile):
+        self.isIncrementalWrite = (
+            self.dirtyTracker is not None and
+            self.lastSavedFile == os.path.abspath(outFile) and
+            os.path.exists(outFile)
+        )
+        if self.isIncrementalWrite:
+            logger.info("Saving changed sections %s into %s", self.dirtyTracker.getDirtySections(), outFile)
+            return self.openSettings(outFile)
+        return super().openSettingsForWrite(outFile)
+
+    def isSectionChanged(self, sectionNames):
+        if not self.isIncrementalWrite:
+            return True
+        return any(self.dirtyTracker.isDirty(sectionName) for sectionName in sectionNames)
+
+    def clearSections(self, settings, sectionNames):
+        if self.isIncrementalWrite:
+            for sectionName in sectionNames:
+                settings.clearSection(sectionName)
+
+    def sectionsSaved(self, outFile):
+        self.lastSavedFile = os.path.abspath(outFile)
+        if self.dirtyTracker is not None:
+            self.dirtyTracker.clear()
+
+    def getGroupsToRead(self, settings):
+        """
+        Sections are decoded when read() gets to their first group and released after their last group, sections which
+        aren't loaded into GUI are never decoded.
+        """
+        for sectionName in settings.childSections():
+            if not sectionName in self.readSectionNames:
+                continue
+            for settingsGroup in settings.getSectionGroups(sectionName):
+                yield settingsGroup
+            settings.releaseSection(sectionName)
+
+    def read(self, filename=None):
+        super().read(filename)
+
+        #   GUI now matches file, next save into it can be incremental
+        if filename:
+            self.sectionsSaved(filename)
+
+    @staticmethod
+    def readSection(filename, sectionName):
+        """
+        Read just one section from file without decoding others, ie. readSection(filename, "_OBJECT")
+        :return: dictionary group name -> {key -> value}
+        """
+        return SectionSettings(filename).getSection(sectionName)
+
+    @classmethod
+    def convertFromIni(cls, iniFileName, outFileName=None):
+        """
+        Convert .ini settings file 0.1 into format 0.2, no GUI is needed.
+        :param outFileName: .json or .msgpack file, by default .ini file name with .json extension
+        :return: output file name
+        """
+        if outFileName is None:
+            outFileName = os.path.splitext(iniFileName)[0] + ".json"
+
+        iniSettings = QtCore.QSettings(iniFileName, QtCore.QSettings.IniFormat)
+        if os.path.exists(outFileName):
+            os.remove(outFileName)
+        settings = SectionSettings(outFileName)
+
+        for groupName in iniSettings.childGroups():
+            iniSettings.beginGroup(groupName)
+            settings.beginGroup(groupName)
+            for key in iniSettings.childKeys():
+                value = iniSettings.value(key)
+                if key in cls.iniJsonKeys and isinstance(value, str):
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        logger.warning(f"{iniFileName}: [{groupName}] {key} is not valid JSON, kept as string")
+                settings.setValue(key, value)
+            settings.endGroup()
+            iniSettings.endGroup()
+
+        settings.beginGroup("FILE-INFO")
+        settings.setValue("version", cls.fileFormatVersion)
+        settings.endGroup()
+
+        settings.sync()
+        logger.info("%s converted into %s", iniFileName, outFileName)
+        return outFileName
+
+if __name__ == "__main__":
+    #
+    #   Converter: python -m utilsOpenEMS.SaveLoad.JsonFile0v2 antenna_settings.ini [antenna_settings.json|.msgpack]
+    #
+    if len(sys.argv) < 2:
+        print(f"usage: {sys.argv[0]} settings.ini [output.json|output.msgpack]")
+        sys.exit(1)
+    print(JsonFile0v2.convertFromIni(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
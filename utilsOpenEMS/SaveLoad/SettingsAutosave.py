@@ -0,0 +1,283 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import copy
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide import QtCore
+
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.SaveLoad.JsonFile0v2 import JsonFile0v2, SectionSettings
+from utilsOpenEMS.SaveLoad.SettingsDirtyTracker import SettingsDirtyTracker
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Background autosave of settings into crash-recovery journal {document name}_settings.journal next to document.
+#
+#   Journal is append-only, each line is JSON entry {"time", "sections": {section name -> groups}} containing sections
+#   changed since previous entry, same sections and groups as settings file 0.2 has. Replaying entries in order gives
+#   last autosaved settings, incomplete last line (crash during write) is ignored when journal is read and it's cut off
+#   before next entry is appended. When journal has too many entries it's compacted into one entry written into temporary
+#   file which replaces journal.
+#
+#   Snapshot is taken after change of settings trees (with delay so burst of changes makes one entry) and periodically
+#   for form inputs (simulation params, postprocessing, ...). Reading GUI into plain dictionaries must be done in GUI
+#   thread, encoding and writing into file is done in background thread so UI is never blocked by disk.
+#
+#   Journal is removed when settings are saved by user or dialog is closed, if it exists when dialog is opened previous
+#   session crashed and recovery is offered.
+#
+class SettingsAutosave:
+
+    journalFileSuffix = "_settings.journal"
+    maxJournalEntries = 50
+
+    def __init__(self, form, guiSignals=None, APP_DIR="", changeDelay=5000, interval=60000):
+        """
+        :param changeDelay: ms after last change of settings trees when snapshot is taken
+        :param interval: ms between periodic snapshots of form inputs
+        """
+        self.form = form
+        self.cadHelpers = FactoryCadInterface.createHelper(APP_DIR=APP_DIR)
+        self.settingsFile = JsonFile0v2(form, guiSignals=guiSignals, APP_DIR=APP_DIR)
+        self.dirtyTracker = SettingsDirtyTracker(form)
+        self.dirtyTracker.addChangeListener(self.scheduleSnapshot)
+
+        self.lastJournalFileName = None
+        self.lastUntrackedSections = {}     # sections written from form inputs as they were in last journal entry
+
+        #   used only in background thread
+        self.journalState = {}
+        self.journalEntriesCount = 0
+
+        self.executor = ThreadPoolExecutor(max_workers=1)     # one thread, entries are written in order
+
+        self.changeTimer = QtCore.QTimer()
+        self.changeTimer.setSingleShot(True)
+        self.changeTimer.setInterval(changeDelay)
+        self.changeTimer.timeout.connect(self.snapshot)
+
+        self.intervalTimer = QtCore.QTimer()
+        self.intervalTimer.setInterval(interval)
+        self.intervalTimer.timeout.connect(self.snapshot)
+
+        self.isRunning = False
+
+    def getJournalFileName(self):
+        """
+        :return: journal file next to current document or None if document is not saved yet
+        """
+        documentFileName = self.cadHelpers.getCurrDocumentFileName()
+        if not documentFileName:
+            return None
+        documentBase, ext = os.path.splitext(documentFileName)
+        return documentBase + self.journalFileSuffix
+
+    def start(self):
+        self.isRunning = True
+        self.intervalTimer.start()
+
+    def stop(self, isJournalRemoved=True):
+        """
+        Stop timers and wait for pending writes.
+        :param isJournalRemoved: remove journal, settings are not needed to be recovered (dialog closed normally)
+        """
+        self.isRunning = False
+        self.changeTimer.stop()
+        self.intervalTimer.stop()
+        if isJournalRemoved:
+            self.discard()
+        self.executor.shutdown(wait=True)
+
+    def scheduleSnapshot(self):
+        if self.isRunning:
+            self.changeTimer.start()
+
+    def discard(self):
+        """
+        Remove journal, called when settings were saved into file by user. Next snapshot starts new journal.
+        """
+        journalFileName = self.getJournalFileName()
+        self.lastJournalFileName = None
+        if journalFileName is not None:
+            self.executor.submit(self.removeJournal, journalFileName)
+
+    ###############################################################################################################################
+    #   GUI thread
+    ###############################################################################################################################
+
+    def snapshot(self):
+        """
+        Read changed sections from GUI and pass them to background thread to append them into journal.
+        """
+        journalFileName = self.getJournalFileName()
+        if journalFileName is None:
+            return
+
+        #   new journal must start with all sections
+        if journalFileName != self.lastJournalFileName:
+            self.dirtyTracker.markAllDirty()
+            self.lastUntrackedSections = {}
+            self.lastJournalFileName = journalFileName
+
+        settings = SectionSettings(None)
+        sections = {}
+        for sectionNames, writeSection in self.settingsFile.getSectionWriters():
+            if any(self.dirtyTracker.isDirty(sectionName) for sectionName in sectionNames):
+                writeSection(settings)
+                for sectionName in sectionNames:
+                    sections[sectionName] = settings.sections.get(sectionName, {})
+        self.dirtyTracker.clear()
+
+        #   form inputs are read every time, they are journaled only if they changed
+        for sectionName in list(sections.keys()):
+            if not sectionName in self.dirtyTracker.trackedSections:
+                if self.lastUntrackedSections.get(sectionName) == sections[sectionName]:
+                    del sections[sectionName]
+                else:
+                    self.lastUntrackedSections[sectionName] = sections[sectionName]
+
+        if len(sections) == 0:
+            return
+
+        #   values can reference dictionaries of settings items, they must not change while written in background
+        sections = copy.deepcopy(sections)
+        logger.debug("autosave snapshot of sections %s", sorted(sections.keys()))
+        self.executor.submit(self.appendJournalEntry, journalFileName, sections)
+
+    def getRecoverableJournal(self):
+        """
+        :return: journal file name if journal left by previous session exists
+        """
+        journalFileName = self.getJournalFileName()
+        if journalFileName is not None and os.path.exists(journalFileName):
+            return journalFileName
+        return None
+
+    def offerRecovery(self, guiHelpers):
+        """
+        If journal from previous session exists ask user if settings should be recovered from it.
+        :return: True if settings were recovered into GUI
+        """
+        journalFileName = self.getRecoverableJournal()
+        if journalFileName is None:
+            return False
+
+        isRecovered = False
+        try:
+            sections, lastTime = self.readJournal(journalFileName)
+            if len(sections) > 0 and guiHelpers.displayYesNoMessage(
+                f"Simulation settings autosaved at {lastTime} were found, previous session was probably not closed properly.\n\n"
+                f"Press Yes to recover them, No discards them."
+            ):
+                self.recover(journalFileName, sections)
+                isRecovered = True
+        except Exception as e:
+            logger.error(f"{__file__} > offerRecovery() ERROR: cannot recover settings from {journalFileName}\n{e}")
+
+        self.removeJournal(journalFileName)
+        return isRecovered
+
+    def recover(self, journalFileName, sections):
+        """
+        Load sections into GUI, they are written as settings file 0.2 and read in the same way as any settings file.
+        """
+        recoveredFileName = journalFileName + ".recovered.json"
+        settings = SectionSettings(recoveredFileName)
+        settings.sections = sections
+        settings.changedSections = set(sections.keys())
+        settings.sync()
+
+        try:
+            self.settingsFile.read(recoveredFileName)
+        finally:
+            os.remove(recoveredFileName)
+        logger.info("Settings recovered from %s", journalFileName)
+
+    ###############################################################################################################################
+    #   Background thread
+    ###############################################################################################################################
+
+    @staticmethod
+    def readJournal(journalFileName):
+        """
+        :return: (sections, time of last entry), sections are replayed from all entries
+        """
+        sections = {}
+        lastTime = None
+        with open(journalFileName, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"{journalFileName}: incomplete journal entry ignored")
+                    break
+                sections.update(entry["sections"])
+                lastTime = entry["time"]
+        return sections, lastTime
+
+    def appendJournalEntry(self, journalFileName, sections):
+        try:
+            self.journalState.update(sections)
+            self.journalEntriesCount += 1
+
+            if self.journalEntriesCount > self.maxJournalEntries:
+                #   compaction, whole state is written as one entry into temporary file which atomically replaces journal
+                tmpFileName = journalFileName + ".tmp"
+                with open(tmpFileName, "wb") as f:
+                    f.write(self.getJournalLine(self.journalState))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmpFileName, journalFileName)
+                self.journalEntriesCount = 1
+            else:
+                #   line is encoded whole before write, incomplete line of crashed write is cut so entry starts on new line
+                journalLine = self.getJournalLine(sections)
+                with open(journalFileName, "a+b") as f:
+                    self.truncateIncompleteEntry(f, journalFileName)
+                    f.write(journalLine)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"{__file__} > appendJournalEntry() ERROR: cannot write {journalFileName}\n{e}")
+
+    def getJournalLine(self, sections):
+        """
+        :return: journal entry as one line encoded into bytes
+        """
+        return (json.dumps({"time": time.strftime("%Y-%m-%d %H:%M:%S"), "sections": sections}, default=str) + "\n").encode("utf-8")
+
+    @staticmethod
+    def truncateIncompleteEntry(f, journalFileName, blockSize=4096):
+        """
+        Cut journal after its last newline, removes incomplete entry left by crash during write.
+        :param f: journal opened in binary a+ mode
+        """
+        position = f.seek(0, os.SEEK_END)
+        if position == 0:
+            return
+        f.seek(position - 1)
+        if f.read(1) == b"\n":
+            return
+
+        logger.warning(f"{journalFileName}: incomplete journal entry removed")
+        while position > 0:
+            blockStart = max(0, position - blockSize)
+            f.seek(blockStart)
+            newlineIndex = f.read(position - blockStart).rfind(b"\n")
+            if newlineIndex >= 0:
+                f.truncate(blockStart + newlineIndex + 1)
+                return
+            position = blockStart
+        f.truncate(0)
+
+    def removeJournal(self, journalFileName):
+        self.journalState = {}
+        self.journalEntriesCount = 0
+        if os.path.exists(journalFileName):
+            os.remove(journalFileName)
@@ -0,0 +1,82 @@
+#   author: Lubomir Jagos
+#
+#
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Tracks which sections of settings file were changed in GUI since last save or load.
+#
+#   Section is prefix of group name in settings file (MATERIAL, GRID, _OBJECT, ...). Each settings tree widget belongs to
+#   sections, any change of its model (item added, removed, moved or its data changed) marks them dirty. Sections which are
+#   written from form inputs (FILE, SIMULATION, SOLVER, POSTPROCESSING) are not tracked and are always considered dirty,
+#   they are small.
+#
+class SettingsDirtyTracker:
+
+    def __init__(self, form):
+        self.form = form
+        self.treeWidgetSections = [
+            (self.form.materialSettingsTreeView, ["MATERIAL"]),
+            (self.form.gridSettingsTreeView, ["GRID"]),
+            (self.form.excitationSettingsTreeView, ["EXCITATION"]),
+            (self.form.portSettingsTreeView, ["PORT"]),
+            (self.form.probeSettingsTreeView, ["PROBE"]),
+            (self.form.lumpedPartTreeView, ["LUMPEDPART"]),
+            (self.form.boundaryConditionSettingsTreeView, ["BOUNDARYCONDITION"]),
+            (self.form.objectAssignmentRightTreeWidget, ["_OBJECT"]),
+            (self.form.objectAssignmentPriorityTreeView, ["PRIORITYLIST"]),
+            (self.form.meshPriorityTreeView, ["PRIORITYLIST"]),
+        ]
+
+        self.trackedSections = set()
+        for treeWidget, sectionNames in self.treeWidgetSections:
+            self.trackedSections.update(sectionNames)
+
+        #   nothing was saved yet so everything is dirty
+        self.dirtySections = set(self.trackedSections)
+        self.changeListeners = []
+
+        for treeWidget, sectionNames in self.treeWidgetSections:
+            self.connectTreeWidget(treeWidget, sectionNames)
+
+    def connectTreeWidget(self, treeWidget, sectionNames):
+        model = treeWidget.model()
+        markDirty = lambda *args: self.markDirty(sectionNames)
+        model.rowsInserted.connect(markDirty)
+        model.rowsRemoved.connect(markDirty)
+        model.rowsMoved.connect(markDirty)
+        model.dataChanged.connect(markDirty)
+        model.layoutChanged.connect(markDirty)
+        model.modelReset.connect(markDirty)
+
+    def addChangeListener(self, callback):
+        """
+        :param callback: function without arguments called on every change of tracked tree widgets
+        """
+        self.changeListeners.append(callback)
+
+    def markDirty(self, sectionNames):
+        self.dirtySections.update(sectionNames)
+        for callback in self.changeListeners:
+            callback()
+
+    def markAllDirty(self):
+        self.dirtySections = set(self.trackedSections)
+
+    def isDirty(self, sectionName):
+        return not sectionName in self.trackedSections or sectionName in self.dirtySections
+
+    def isAllDirty(self):
+        return self.dirtySections == self.trackedSections
+
+    def getDirtySections(self):
+        return sorted(self.dirtySections)
+
+    def clear(self):
+        """
+        Mark all sections as saved, called after settings are written into file or read from it.
+        """
+        logger.debug("dirty sections cleared: %s", self.getDirtySections())
+        self.dirtySections = set()
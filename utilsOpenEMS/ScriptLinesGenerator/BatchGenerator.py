@@ -0,0 +1,191 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import traceback
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide import QtCore, QtWidgets, QtUiTools
+
+from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
+from utilsOpenEMS.GuiHelpers.GuiSignals import GuiSignals
+from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.GuiHelpers.BoundBoxCache import BoundBoxCache
+from utilsOpenEMS.GuiHelpers.ObjectAssignmentIndex import ObjectAssignmentIndex
+from utilsOpenEMS.SaveLoad.IniFile0v1 import IniFile0v1
+from utilsOpenEMS.SaveLoad.IniValidator0v1 import IniValidator0v1
+from utilsOpenEMS.ScriptLinesGenerator.MultiTargetExporter import MultiTargetExporter
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Generates simulation scripts without GUI dialog, used by command line entry point OpenEMSBatchGenerator.py.
+#
+#   For each job CAD document is opened, settings are read by IniFile0v1 into form loaded from same .ui file as dialog
+#   uses (form is never shown) and selected generators write their files in the same way as from GUI. Jobs are processed
+#   in parallel worker processes, each worker handles one document at time.
+#
+#   CAD backends:
+#       freecad - default, document is opened in FreeCAD, run under FreeCADCmd or python with FreeCAD modules in path
+#       mock    - only when asked for, for testing scripts generation without FreeCAD. Document objects are read from
+#                 .FCStd file into MockCadInterface as axis aligned boxes, so only Part::Box and Part::Cylinder without
+#                 rotation are supported. Job fails if such other object is assigned in settings or if generator needs to
+#                 export geometry (STL, STEP), mock doesn't write geometry files.
+#
+class BatchGenerator:
+
+    backends = ["freecad", "mock"]
+
+    def __init__(self, APP_DIR, backend="freecad"):
+        """
+        :param APP_DIR: addon directory containing ui/ and img/ folders
+        :param backend: "freecad" or "mock"
+        """
+        self.APP_DIR = APP_DIR
+        self.backend = backend
+
+    @staticmethod
+    def isFreeCADAvailable():
+        return importlib.util.find_spec("FreeCAD") is not None
+
+    @staticmethod
+    def getDefaultSettingsFile(documentFile):
+        """
+        Settings file which GUI uses by default for document, ie. antenna.FCStd -> antenna_settings.ini
+        """
+        documentBase, ext = os.path.splitext(documentFile)
+        return documentBase + "_settings.ini"
+
+    def getOutputDirBase(self, settingsFile, outputDir):
+        """
+        Output directories are named same as from GUI after settings file, {outputDir}/{settings file base}_{target}_simulation
+        """
+        settingsBase, ext = os.path.splitext(os.path.basename(settingsFile))
+        return os.path.join(outputDir, settingsBase)
+
+    def openDocument(self, documentFile):
+        if self.backend == "freecad":
+            import FreeCAD
+            doc = FreeCAD.openDocument(documentFile)
+            FreeCAD.setActiveDocument(doc.Name)
+            FactoryCadInterface.registerMockInterface(None)
+            return doc
+        else:
+            from utilsOpenEMS.GuiHelpers.MockCadInterface import MockCadInterface
+            cadInterface = MockCadInterface(APP_DIR=self.APP_DIR, documentFileName=documentFile)
+            cadInterface.isGeometryExportEnabled = False        # output is real simulation folder, no placeholder files
+            objectsCount = cadInterface.loadFCStd(documentFile)
+            logger.info("%s: %s objects loaded into mock CAD interface", documentFile, objectsCount)
+            FactoryCadInterface.registerMockInterface(cadInterface)
+            return cadInterface
+
+    def closeDocument(self, doc):
+        if self.backend == "freecad":
+            import FreeCAD
+            FreeCAD.closeDocument(doc.Name)
+        else:
+            FactoryCadInterface.registerMockInterface(None)
+
+    def createForm(self):
+        """
+        Load dialog .ui file as plain widget and create category items in assignment tree as dialog does in its constructor.
+        """
+        if QtWidgets.QApplication.instance() is None:
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            self.app = QtWidgets.QApplication([])
+
+        loader = QtUiTools.QUiLoader()
+        uiFile = QtCore.QFile(os.path.join(self.APP_DIR, "ui", "dialog_OpenEMS_Simulation_Creator.ui"))
+        uiFile.open(QtCore.QFile.ReadOnly)
+        form = loader.load(uiFile)
+        uiFile.close()
+
+        GuiHelpers(form, APP_DIR=self.APP_DIR).initRightColumnTopLevelItems()
+        return form
+
+    def generate(self, documentFile, settingsFile, targetNames, outputDir):
+        """
+        Generate simulation files for one document and settings file.
+        :param targetNames: list of keys from MultiTargetExporter.targetGenerators
+        :return: dictionary target -> output directory
+        """
+        GuiHelpers.isHeadless = True
+
+        doc = self.openDocument(documentFile)
+        BoundBoxCache.enable()      # document doesn't change during generation
+        try:
+            form = self.createForm()
+
+            validatorErrors = IniValidator0v1().checkFile(settingsFile)
+            for errorMsg in validatorErrors:
+                logger.warning(f"{settingsFile}: {errorMsg}")
+
+            IniFile0v1(form, guiSignals=GuiSignals(), APP_DIR=self.APP_DIR).read(settingsFile)
+            if self.backend == "mock":
+                self.checkMockObjects(doc, form)
+
+            exporter = MultiTargetExporter(form)
+            outputDirs, modelSnapshot = exporter.export(self.getOutputDirBase(settingsFile, outputDir), targetNames)
+            if self.backend == "mock" and len(doc.skippedExports) > 0:
+                raise RuntimeError(
+                    "mock backend doesn't export geometry, generated scripts are missing files: " + ", ".join(doc.skippedExports) +
+                    ", use freecad backend"
+                )
+            logger.info(exporter.getReportText(outputDirs, modelSnapshot))
+
+            form.close()
+            form.deleteLater()
+        finally:
+            BoundBoxCache.disable()
+            self.closeDocument(doc)
+
+        return outputDirs
+
+    def checkMockObjects(self, cadInterface, form):
+        """
+        Objects assigned in settings must have exact geometry in mock backend, boxes approximating other objects would
+        generate wrong simulation.
+        """
+        unsupportedObjects = []
+        for categoryName, groupName, objectLabel in ObjectAssignmentIndex.getIndex(form.objectAssignmentRightTreeWidget).getAllObjects():
+            reason = cadInterface.unsupportedObjects.get(objectLabel)
+            if reason is not None:
+                unsupportedObjects.append(f"{objectLabel} ({categoryName}, {groupName}): {reason}")
+
+        if len(unsupportedObjects) > 0:
+            raise RuntimeError("objects not supported by mock backend, use freecad backend:\n\t" + "\n\t".join(unsupportedObjects))
+
+    def run(self, jobs, workersCount=None):
+        """
+        Process jobs, each in separate worker process if workersCount > 1.
+        :param jobs: list of dictionaries {'documentFile', 'settingsFile', 'targetNames', 'outputDir'}
+        :param workersCount: number of worker processes, None means one per job up to CPU count, 1 runs in this process
+        :return: list of results {'documentFile', 'settingsFile', 'outputDirs', 'error'} in order of jobs
+        """
+        if workersCount is None:
+            workersCount = min(len(jobs), os.cpu_count() or 1)
+
+        jobsArgs = [(self.APP_DIR, self.backend, job) for job in jobs]
+        if workersCount <= 1:
+            return [runBatchJob(jobArgs) for jobArgs in jobsArgs]
+
+        #   spawn, Qt application and FreeCAD document state must not be inherited by fork
+        with ProcessPoolExecutor(max_workers=workersCount, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(runBatchJob, jobsArgs))
+
+def runBatchJob(jobArgs):
+    """
+    Worker process entry point, module level function so it can be pickled.
+    :param jobArgs: tuple (APP_DIR, backend, job dictionary)
+    """
+    APP_DIR, backend, job = jobArgs
+    result = {'documentFile': job['documentFile'], 'settingsFile': job['settingsFile'], 'outputDirs': {}, 'error': None}
+    try:
+        result['outputDirs'] = BatchGenerator(APP_DIR, backend).generate(job['documentFile'], job['settingsFile'], job['targetNames'], job['outputDir'])
+    except Exception as e:
+        logger.error(f"{__file__} > runBatchJob() ERROR: {job['documentFile']}: {e}\n{traceback.format_exc()}")
+        result['error'] = str(e)
+    return result
@@ -2,6 +2,10 @@
 #
 #
 import os
+import json
+import shutil
+import hashlib
+from contextlib import nullcontext, contextmanager
 from PySide import QtGui, QtCore, QtWidgets
 import numpy as np
 import re
@@ -11,6 +15,12 @@ from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r
 from utilsOpenEMS.SettingsItem.SettingsItem import SettingsItem
 from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
+from utilsOpenEMS.MeshTools.MaterialAwareMesher import MaterialAwareMesher
+from utilsOpenEMS.EngineProfile.EngineProfile import EngineProfile
+from utilsOpenEMS.ScriptLinesGenerator.GenerationStats import GenerationStats
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 try:
 	import FreeCAD
@@ -19,6 +29,15 @@ except:
 
 class CommonScriptLinesGenerator:
 
+    manifestFileName = "generated_files_manifest.json"     # hashes of generated files, see writeFileIfChanged()
+
+    #
+    #   port excitation field vector for port direction, ie. for z+ it's [0 0 1], for y- it's [0 -1 0]
+    #       Options x, y, z were removed from GUI, but left here due there could be saved files from previous versions
+    #       with these options so to keep backward compatibility they are treated as positive direction in that directions.
+    #
+    baseVectorStr = {'x': '[1 0 0]', 'y': '[0 1 0]', 'z': '[0 0 1]', 'x+': '[1 0 0]', 'y+': '[0 1 0]', 'z+': '[0 0 1]', 'x-': '[-1 0 0]', 'y-': '[0 -1 0]', 'z-': '[0 0 -1]', 'XY plane, top layer': '[0 0 -1]', 'XY plane, bottom layer': '[0 0 1]', 'XZ plane, front layer': '[0 -1 0]', 'XZ plane, back layer': '[0 1 0]', 'YZ plane, right layer': '[-1 0 0]', 'YZ plane, left layer': '[1 0 0]',}
+
     #
     #   constructor, get access to form GUI
     #
@@ -29,6 +48,22 @@ class CommonScriptLinesGenerator:
         self.internalPortIndexNamesList = {}
         self.internalMaterialIndexNamesList = {}
         self.internalNF2FFIndexNamesList = {}
+        self.internalPortSymmetryRScaleList = {}
+
+        #
+        #   model data shared with other generators during multi target export, see MultiTargetExporter
+        #
+        self.modelSnapshot = None
+
+        #
+        #   timing of last script generation stages, see GenerationStats
+        #
+        self.generationStats = None
+
+        #
+        #   hashes of files written during simulation script generation, see collectManifest()
+        #
+        self.manifestFiles = None
 
         #
         # GUI helpers function like display message box and so
@@ -56,6 +91,9 @@ class CommonScriptLinesGenerator:
         return targetUnitStr
 
     def getItemsByClassName(self):
+        if self.modelSnapshot is not None and self.modelSnapshot.itemsByClassName is not None:
+            return self.modelSnapshot.itemsByClassName
+
         categoryCount = self.form.objectAssignmentRightTreeWidget.invisibleRootItem().childCount()
         categoryNodes = [self.form.objectAssignmentRightTreeWidget.topLevelItem(k) for k in range(categoryCount)]
         itemsByClassName = {}
@@ -71,29 +109,183 @@ class CommonScriptLinesGenerator:
                 else:
                     itemsByClassName[itemClassName].append([item, itemData])
 
-        print("generateOpenEMSScript: Item classes found = " + ", ".join(itemsByClassName.keys()))
+        logger.debug("generateOpenEMSScript: Item classes found = %s", ', '.join(itemsByClassName.keys()))
 
         return itemsByClassName
 
+    def startGenerationStats(self):
+        self.generationStats = GenerationStats(self.__class__.__name__)
+        return self.generationStats
+
+    def measureStage(self, name, items=None):
+        """
+        Context manager measuring generation stage, objects count is number of objects assigned to items.
+        :param items: list of [treeItem, settingsItem] as returned by getItemsByClassName()
+        """
+        if self.generationStats is None:
+            return nullcontext()
+        objectsCount = sum([treeItem.childCount() for [treeItem, settingsItem] in items]) if items else 0
+        return self.generationStats.stage(name, objectsCount)
+
+    def countInStage(self, counterName, n=1):
+        """
+        Increment counter of currently measured stage, counters are logged in stage summary instead of per object messages.
+        """
+        if self.generationStats is not None:
+            self.generationStats.count(counterName, n)
+
+    #
+    #   Export objects geometry into file, during multi target export file already exported for other target is reused.
+    #   Geometry is exported into temporary file first and existing file is replaced just if its content changed.
+    #       fileFormat - 'stl' or 'step'
+    #
+    def exportGeometryFile(self, fileFormat, partToExportList, exportFileName):
+        fileBase, fileExt = os.path.splitext(exportFileName)
+        tmpFileName = f"{fileBase}.tmp{fileExt}"    # extension is kept, CAD export uses it to choose file format
+
+        sharedFileName = self.modelSnapshot.getGeometryFile(fileFormat, partToExportList) if self.modelSnapshot is not None else None
+        if sharedFileName is not None:
+            shutil.copyfile(sharedFileName, tmpFileName)
+            self.countInStage(f"{fileFormat} files reused")
+        else:
+            if fileFormat == 'stl':
+                self.cadHelpers.exportSTL(partToExportList, tmpFileName)
+            else:
+                self.cadHelpers.exportSTEP(partToExportList, tmpFileName)
+
+            self.countInStage(f"{fileFormat} files exported")
+
+            if self.modelSnapshot is not None:
+                self.modelSnapshot.addGeometryFile(fileFormat, partToExportList, exportFileName)
+
+        self.replaceFileIfChanged(tmpFileName, exportFileName, manifestSection="inputs")
+
+    #
+    #   Generated files are content addressed, file is rewritten just if its content changed so timestamps stay untouched
+    #   for make-like tools. Simulation script generation writes into each output directory manifest with SHA256 of files
+    #   written or left unchanged by this generation:
+    #       inputs  - exported geometry files
+    #       outputs - generated scripts
+    #       hash    - hash over both sections, same hash means simulation rerun can be skipped
+    #   Hashes are collected in memory and manifest is written once at the end, files from previous generations which
+    #   weren't generated again are not listed. Postprocessing scripts written outside of generation aren't in manifest.
+    #
+    def getFileHash(self, fileName):
+        fileHash = hashlib.sha256()
+        with open(fileName, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                fileHash.update(chunk)
+        return fileHash.hexdigest()
+
+    def writeFileIfChanged(self, fileName, content, manifestSection="outputs"):
+        """
+        Write text file just if its content differs from existing file.
+        :return: True if file was written
+        """
+        contentBytes = content.encode('utf-8')
+        contentHash = hashlib.sha256(contentBytes).hexdigest()
+
+        isChanged = not os.path.exists(fileName) or self.getFileHash(fileName) != contentHash
+        if isChanged:
+            with open(fileName, "wb") as f:
+                f.write(contentBytes)
+            if self.generationStats is not None:
+                self.generationStats.addBytesWritten(len(contentBytes))
+        else:
+            logger.debug("%s not changed, file left untouched", fileName)
+            self.countInStage("files unchanged")
+
+        self.addManifestEntry(fileName, contentHash, manifestSection)
+        return isChanged
+
+    def replaceFileIfChanged(self, tmpFileName, fileName, manifestSection="inputs"):
+        """
+        Move temporary file in place of fileName just if content differs, otherwise temporary file is removed.
+        :return: True if file was replaced
+        """
+        if not os.path.exists(tmpFileName):
+            logger.error(f"{__file__} > replaceFileIfChanged() ERROR: {tmpFileName} was not created")
+            return False
+
+        fileHash = self.getFileHash(tmpFileName)
+        isChanged = not os.path.exists(fileName) or self.getFileHash(fileName) != fileHash
+        if isChanged:
+            os.replace(tmpFileName, fileName)
+            if self.generationStats is not None:
+                self.generationStats.addBytesWritten(os.path.getsize(fileName))
+        else:
+            os.remove(tmpFileName)
+            logger.debug("%s not changed, file left untouched", fileName)
+            self.countInStage("files unchanged")
+
+        self.addManifestEntry(fileName, fileHash, manifestSection)
+        return isChanged
+
+    @contextmanager
+    def collectManifest(self):
+        """
+        Collect hashes of files written inside with block and write manifests when it finishes without error.
+        """
+        self.manifestFiles = {}
+        try:
+            yield
+            self.writeManifests(self.manifestFiles)
+        finally:
+            self.manifestFiles = None
+
+    def addManifestEntry(self, fileName, fileHash, manifestSection):
+        if self.manifestFiles is None:
+            return
+        self.manifestFiles[os.path.abspath(fileName)] = (manifestSection, fileHash)
+
+    def writeManifests(self, manifestFiles):
+        """
+        Write one manifest per output directory, directories of generated scripts are output directories, geometry files
+        in their subdirectories (ie. Palace stepfiles/) are listed with path relative to output directory.
+        :param manifestFiles: absolute file name -> (manifest section, hash)
+        """
+        outputDirs = sorted({os.path.dirname(fileName) for fileName, (manifestSection, fileHash) in manifestFiles.items() if manifestSection == "outputs"}, key=len, reverse=True)
+
+        manifests = {}
+        for fileName, (manifestSection, fileHash) in manifestFiles.items():
+            fileDir = os.path.dirname(fileName)
+            outputDir = next((dirName for dirName in outputDirs if fileDir == dirName or fileDir.startswith(dirName + os.sep)), fileDir)
+            manifest = manifests.setdefault(outputDir, {"inputs": {}, "outputs": {}})
+            manifest[manifestSection][os.path.relpath(fileName, outputDir).replace(os.sep, "/")] = fileHash
+
+        for outputDir, manifest in manifests.items():
+            combinedHash = hashlib.sha256()
+            for section in ["inputs", "outputs"]:
+                for name in sorted(manifest[section].keys()):
+                    combinedHash.update(f"{section}/{name}={manifest[section][name]}\n".encode('utf-8'))
+            manifest["hash"] = combinedHash.hexdigest()
+
+            self.writeManifestIfChanged(os.path.join(outputDir, self.manifestFileName), json.dumps(manifest, indent=4, sort_keys=True) + "\n")
+
+    def writeManifestIfChanged(self, manifestFile, content):
+        if os.path.exists(manifestFile):
+            with open(manifestFile, "r", encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+        with open(manifestFile, "w", encoding='utf-8') as f:
+            f.write(content)
+
     #
     #	Returns object priority
-    #		priorityItemName - string which identifies item by its text in priority tree view widget
+    #		priorityKey - tuple (category name, group name, object label) which identifies item in object priority list
     #
-    def getItemPriority(self, priorityItemName):
+    def getItemPriority(self, priorityKey):
         #
-        #	priority is read from tree view
+        #	priority is position of item in priority list index
         #
         priorityItemValue = 42
-        itemsCount = self.form.objectAssignmentPriorityTreeView.topLevelItemCount()
-        for k in range(itemsCount):
-            priorityItem = self.form.objectAssignmentPriorityTreeView.topLevelItem(k)
-            if priorityItemName in priorityItem.text(0):
-                #
-                #	THIS IS MY FORMULA TO HAVE AT LEAST TWO 0 AT END AND NOT HAVE PRIORITY INDEX 0 BUT START AT 100 AT LEAST!
-                #		ATTENTION: higher number means higher priority so fromual is: (1001 - k)     ...to get item at top of tree view with highest priority numbers!
-                #
-                priorityItemValue = (100 - k) * 100
-                break  # this will break loop SO JUST ONE ITEM FROM PRIORITY LIST IS DELETED
+        k = self.guiHelpers.getObjectPriorityIndex().getPosition(priorityKey)
+        if k is not None:
+            #
+            #	THIS IS MY FORMULA TO HAVE AT LEAST TWO 0 AT END AND NOT HAVE PRIORITY INDEX 0 BUT START AT 100 AT LEAST!
+            #		ATTENTION: higher number means higher priority so fromual is: (1001 - k)     ...to get item at top of tree view with highest priority numbers!
+            #
+            priorityItemValue = (100 - k) * 100
 
         return priorityItemValue
 
@@ -129,7 +321,7 @@ class CommonScriptLinesGenerator:
 
         if not os.path.exists(absoluteOutputDir):
             os.makedirs(absoluteOutputDir)
-            print(f"Created directory for simulation: {outputDir}")
+            logger.debug("Created directory for simulation: %s", outputDir)
 
         return absoluteOutputDir
 
@@ -140,28 +332,285 @@ class CommonScriptLinesGenerator:
 
         for [item, currSetting] in items:
             #	GET PARENT NODE DATATYPE
-            print("#")
-            print("#FREECAD OBJ.")
+            logger.debug("#")
+            logger.debug("#FREECAD OBJ.")
             if (str(item.parent().text(0)) == "Grid"):
-                print("name: Grid Default")
-                print("type: FreeCADSettingsItem")
+                logger.debug("name: Grid Default")
+                logger.debug("type: FreeCADSettingsItem")
                 pass
             elif (str(item.parent().text(0)) == "Ports"):
-                print("name: Port Default")
-                print("type: FreeCADSettingsItem")
+                logger.debug("name: Port Default")
+                logger.debug("type: FreeCADSettingsItem")
                 pass
             elif (str(item.parent().text(0)) == "Excitation"):
-                print("name: Excitation Default")
-                print("type: FreeCADSettingsItem")
+                logger.debug("name: Excitation Default")
+                logger.debug("type: FreeCADSettingsItem")
                 pass
             elif (str(item.parent().text(0)) == "Materials"):
-                print("name: Material Default")
-                print("type: FreeCADSettingsItem")
+                logger.debug("name: Material Default")
+                logger.debug("type: FreeCADSettingsItem")
                 pass
             else:
-                print("Parent of FreeCADSettingItem UNKNOWN")
+                logger.debug("Parent of FreeCADSettingItem UNKNOWN")
                 pass
 
+    def getExcitationSettings(self):
+        """
+        :return: first excitation settings item from GUI or None, whole simulation has just one excitation
+        """
+        excitationCategory = self.form.objectAssignmentRightTreeWidget.findItems("Excitation", QtCore.Qt.MatchFixedString)
+        if len(excitationCategory) == 0 or excitationCategory[0].childCount() == 0:
+            return None
+        return excitationCategory[0].child(0).data(0, QtCore.Qt.UserRole)
+
+    def getMaxFrequencyFromExcitation_Hz(self):
+        """
+        :return: highest frequency present in excitation in Hz, 0 if it cannot be determined
+        """
+        currSetting = self.getExcitationSettings()
+        if currSetting is None:
+            return 0
+
+        unitsAsNumber = currSetting.getUnitsAsNumber(currSetting.units)
+        if (currSetting.getType() == 'sinusodial'):
+            return currSetting.sinusodial['f0'] * unitsAsNumber
+        elif (currSetting.getType() == 'gaussian'):
+            return (currSetting.gaussian['f0'] + currSetting.gaussian['fc']) * unitsAsNumber
+        elif (currSetting.getType() == 'fem_gaussian'):
+            return (currSetting.femGaussian['f0'] + currSetting.femGaussian['fc']) * unitsAsNumber
+        elif (currSetting.getType() == 'sweep'):
+            return currSetting.sweep['fmax'] * unitsAsNumber
+        elif (currSetting.getType() == 'custom'):
+            return currSetting.custom['f0'] * unitsAsNumber
+        return 0
+
+    def getMinFrequencyFromExcitation_Hz(self):
+        """
+        Lowest frequency of interest in excitation, for gaussian pulse which starts at DC half of its upper frequency is taken.
+        :return: frequency in Hz, 0 if it cannot be determined
+        """
+        currSetting = self.getExcitationSettings()
+        if currSetting is None:
+            return 0
+
+        unitsAsNumber = currSetting.getUnitsAsNumber(currSetting.units)
+        if (currSetting.getType() == 'sinusodial'):
+            return currSetting.sinusodial['f0'] * unitsAsNumber
+        elif (currSetting.getType() in ['gaussian', 'fem_gaussian']):
+            excitation = currSetting.gaussian if currSetting.getType() == 'gaussian' else currSetting.femGaussian
+            fLow = excitation['f0'] - excitation['fc']
+            return (fLow if fLow > 0 else (excitation['f0'] + excitation['fc']) / 2) * unitsAsNumber
+        elif (currSetting.getType() == 'sweep'):
+            return currSetting.sweep['fmin'] * unitsAsNumber
+        elif (currSetting.getType() == 'custom'):
+            return currSetting.custom['f0'] * unitsAsNumber
+        return 0
+
+    def getMaterialRegions(self):
+        """
+        Material regions given by bounding boxes of objects assigned to materials.
+        :return: list of dictionaries {'material': name, 'type': material type, 'object': object label,
+                 'epsilon': float, 'mue': float, 'box': {'x': (min, max), 'y': (min, max), 'z': (min, max)}}
+                 coordinates are in drawing units
+        """
+        regions = []
+        materialCategory = self.form.objectAssignmentRightTreeWidget.findItems("Material", QtCore.Qt.MatchFixedString)
+        if len(materialCategory) == 0:
+            return regions
+
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+        for k in range(materialCategory[0].childCount()):
+            materialItem = materialCategory[0].child(k)
+            materialSettings = materialItem.data(0, QtCore.Qt.UserRole)
+            for n in range(materialItem.childCount()):
+                objectLabel = materialItem.child(n).text(0)
+                fcObject = self.cadHelpers.getObjectsByLabel(objectLabel)
+                if (not fcObject) or (not "Shape" in dir(fcObject[0])):
+                    continue
+                bbCoords = self.cadHelpers.getObjectBoundBox(fcObject[0])
+                regions.append({
+                    'material': materialSettings.getName(),
+                    'type': materialSettings.getType(),
+                    'object': objectLabel,
+                    'epsilon': float(materialSettings.constants.get('epsilon', 1.0)),
+                    'mue': float(materialSettings.constants.get('mue', 1.0)),
+                    'box': {
+                        'x': (sf * bbCoords.XMin, sf * bbCoords.XMax),
+                        'y': (sf * bbCoords.YMin, sf * bbCoords.YMax),
+                        'z': (sf * bbCoords.ZMin, sf * bbCoords.ZMax),
+                    },
+                })
+        return regions
+
+    def getMetalObjectLabels(self):
+        """
+        :return: set of object labels assigned to metal or conducting sheet materials
+        """
+        metalObjectLabels = set()
+        materialCategory = self.form.objectAssignmentRightTreeWidget.findItems("Material", QtCore.Qt.MatchFixedString)
+        if len(materialCategory) == 0:
+            return metalObjectLabels
+
+        for k in range(materialCategory[0].childCount()):
+            materialItem = materialCategory[0].child(k)
+            if materialItem.data(0, QtCore.Qt.UserRole).getType() in ['metal', 'conducting sheet']:
+                for n in range(materialItem.childCount()):
+                    metalObjectLabels.add(materialItem.child(n).text(0))
+        return metalObjectLabels
+
+    def getObjectBoundaries(self, gridSettingsInst, bbCoords):
+        """
+        Object boundaries in drawing units with grid offset applied when lines should be generated inside object.
+        :return: xmin, xmax, ymin, ymax, zmin, zmax
+        """
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+        _sign = lambda val: (val > 0) - (val < 0)
+
+        deltaX = 0
+        deltaY = 0
+        deltaZ = 0
+        if gridSettingsInst.generateLinesInside:
+            gridOffset = gridSettingsInst.getGridOffset()
+            unitsAsNumber = gridSettingsInst.getUnitsAsNumber(gridOffset['units'])
+            if gridSettingsInst.xenabled:
+                deltaX = gridOffset['x'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
+            if gridSettingsInst.yenabled:
+                deltaY = gridOffset['y'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
+            if gridSettingsInst.zenabled:
+                deltaZ = gridOffset['z'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
+
+        xmax = sf * bbCoords.XMax - _sign(bbCoords.XMax - bbCoords.XMin) * deltaX
+        ymax = sf * bbCoords.YMax - _sign(bbCoords.YMax - bbCoords.YMin) * deltaY
+        zmax = sf * bbCoords.ZMax - _sign(bbCoords.ZMax - bbCoords.ZMin) * deltaZ
+        xmin = sf * bbCoords.XMin + _sign(bbCoords.XMax - bbCoords.XMin) * deltaX
+        ymin = sf * bbCoords.YMin + _sign(bbCoords.YMax - bbCoords.YMin) * deltaY
+        zmin = sf * bbCoords.ZMin + _sign(bbCoords.ZMax - bbCoords.ZMin) * deltaZ
+
+        return xmin, xmax, ymin, ymax, zmin, zmax
+
+    def isMaterialAwareMesh(self, gridSettingsInst, axis):
+        """
+        Material aware mesh needs excitation frequency or max. resolution to calculate cell size, without them there would
+        be just object boundaries, then error is logged and smooth mesh is generated as without material aware option.
+        :return: True if lines in axis are calculated by getMaterialAwareMeshLines()
+        """
+        if not gridSettingsInst.smoothMesh.get('materialAware', False):
+            return False
+        if self.getMaxFrequencyFromExcitation_Hz() <= 0 and gridSettingsInst.smoothMesh[axis + 'MaxRes'] == 0:
+            logger.error(f"GRID {gridSettingsInst.getName()} material aware mesh in {axis} needs excitation frequency or max. resolution, smooth mesh without material aware option is used")
+            return False
+        return True
+
+    def getMaterialAwareMeshLines(self, gridSettingsInst, gridCategoryObj, axis):
+        """
+        Mesh lines for smooth mesh group with material aware option, max. cell size is lambda/20 inside material of each object.
+        Objects which are not assigned to any material are meshed as vacuum.
+        :param gridSettingsInst: GridSettingsItem of smooth mesh group
+        :param gridCategoryObj: grid item from object assignment tree, its children are objects
+        :param axis: 'x', 'y' or 'z'
+        :return: list of line coordinates in drawing units
+        """
+        materialRegions = {region['object']: region for region in self.getMaterialRegions()}
+
+        regions = []
+        for k in range(gridCategoryObj.childCount()):
+            objectLabel = gridCategoryObj.child(k).text(0)
+            fcObject = self.cadHelpers.getObjectsByLabel(objectLabel)
+            if (not fcObject) or (not "Shape" in dir(fcObject[0])):
+                continue
+
+            #   region boundaries are same as smooth mesh fixed lines, grid offset is applied when lines are generated inside object
+            xmin, xmax, ymin, ymax, zmin, zmax = self.getObjectBoundaries(gridSettingsInst, self.cadHelpers.getObjectBoundBox(fcObject[0]))
+            region = dict(materialRegions.get(objectLabel, {
+                'object': objectLabel,
+                'type': 'userdefined',
+                'epsilon': 1.0,
+                'mue': 1.0,
+            }))
+            region['box'] = {
+                'x': (xmin, xmax),
+                'y': (ymin, ymax),
+                'z': (zmin, zmax),
+            }
+            regions.append(region)
+
+        meshLines = MaterialAwareMesher().calculateLines(axis, regions, self.getMaxFrequencyFromExcitation_Hz(), self.getUnitLengthFromUI_m(), gridSettingsInst.smoothMesh[axis + 'MaxRes'])
+        logger.debug("GRID %s material aware lines in %s: %s", gridSettingsInst.getName(), axis, len(meshLines))
+
+        return [float(_r(line)) for line in meshLines]
+
+    def getSymmetryPlanes(self):
+        """
+        Symmetry planes from simulation params, model is cropped by them and each plane gets PEC or PMC boundary condition.
+        Planes are written as text ie. "x >= 0 PMC; y >= 12.5 PEC", it means keep part of model x >= 0 and y >= 12.5,
+        coordinates are in drawing units.
+        :return: list of dictionaries {'axis': 'x', 'keep': '>=', 'coord': 0.0, 'bc': 'PMC'}
+        """
+        planes = []
+        if not self.form.simParamsSymmetryEnable.isChecked():
+            return planes
+
+        for planeStr in self.form.simParamsSymmetryPlanes.text().split(";"):
+            match = re.match(r"^\s*([xyz])\s*(>=|<=)\s*([-+0-9.eE]+)\s*(PEC|PMC)\s*$", planeStr)
+            if match is None:
+                if planeStr.strip() != "":
+                    logger.error(f"{__file__} > getSymmetryPlanes() ERROR: cannot parse symmetry plane '{planeStr}'")
+                continue
+            planes.append({'axis': match.group(1), 'keep': match.group(2), 'coord': float(match.group(3)), 'bc': match.group(4)})
+        return planes
+
+    def getSymmetryBoundaryConditions(self):
+        """
+        :return: dictionary side -> 'PEC' or 'PMC' for simulation box sides replaced by symmetry plane, ie. {'xmin': 'PMC'}
+        """
+        boundaryConditions = {}
+        for plane in self.getSymmetryPlanes():
+            boundaryConditions[plane['axis'] + ('min' if plane['keep'] == '>=' else 'max')] = plane['bc']
+        return boundaryConditions
+
+    def getSymmetryNF2FFMirror(self):
+        """
+        :return: list of 6 values for nf2ff box sides xmin, xmax, ..., zmax, 0 = no mirror, 1 = PEC, 2 = PMC
+        """
+        boundaryConditions = self.getSymmetryBoundaryConditions()
+        return [{'PEC': 1, 'PMC': 2}.get(boundaryConditions.get(side, ''), 0) for side in ['xmin', 'xmax', 'ymin', 'ymax', 'zmin', 'zmax']]
+
+    def getSymmetryPortRScale(self, bbCoords):
+        """
+        Lumped port cut by symmetry plane is half of original port. On PMC plane just half of current flows through it so
+        its resistance is doubled, on PEC plane there is half of voltage on it so resistance is halved, then S-parameters
+        are same as for full model.
+        :param bbCoords: port boundary box in FreeCAD units
+        :return: port resistance multiplier, input impedance of full model is Zin / multiplier
+        """
+        sf = self.getFreeCADUnitLength_m() / self.getUnitLengthFromUI_m()
+        portBox = {
+            'x': (sf * bbCoords.XMin, sf * bbCoords.XMax),
+            'y': (sf * bbCoords.YMin, sf * bbCoords.YMax),
+            'z': (sf * bbCoords.ZMin, sf * bbCoords.ZMax),
+        }
+
+        rScale = 1.0
+        for plane in self.getSymmetryPlanes():
+            portMin, portMax = portBox[plane['axis']]
+            if portMin < plane['coord'] < portMax:
+                rScale *= 2.0 if plane['bc'] == 'PMC' else 0.5
+        return rScale
+
+    def getSymmetryPowerScale(self):
+        """
+        :return: multiplier of power calculated in cropped model to get power of full model
+        """
+        return 2 ** len(self.getSymmetryPlanes())
+
+    def getEngineProfile(self):
+        """
+        :return: calibrated openEMS engine profile of this machine if it's enabled in GUI, otherwise None
+        """
+        if not self.form.simParamsUseEngineProfile.isChecked():
+            return None
+        return EngineProfile().load()
+
     def getModelCoordsType(self):
         """
         Returns current coordinate system, as there can be just rectangular or just cylindrical for all grid items it's enough to look at first grid item.
@@ -185,7 +634,7 @@ class CommonScriptLinesGenerator:
         normDir = ""
         elevation = 0.0
         points = [[],[]]
-        bbCoords = freeCadObj.Shape.BoundBox
+        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
         if (_r(bbCoords.XMin) == _r(bbCoords.XMax)):
             normDir = "x"
@@ -233,7 +682,7 @@ class CommonScriptLinesGenerator:
         elevation = ""
         facesList = []
 
-        bbCoords = freeCadObj.Shape.BoundBox
+        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
         if (len(freeCadObj.Shape.Faces) > 0):
 
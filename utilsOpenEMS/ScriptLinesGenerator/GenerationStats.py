@@ -0,0 +1,102 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import json
+import time
+from contextlib import contextmanager
+
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Timing of script generation stages.
+#
+#   Each stage records wall time, number of processed objects and bytes written into files. Bytes are added to stage which
+#   is currently running. If environment variable OPENEMS_EXPORT_TIMING_JSON is set, stats are written into this JSON file
+#   after generation, it's meant for tracking generator speed in CI.
+#
+#   Instead of message per object stages count what they did by count() (ie. exported STL files) and summary line of each
+#   stage is logged at INFO level when stage ends.
+#
+class GenerationStats:
+
+    timingJsonEnvVar = "OPENEMS_EXPORT_TIMING_JSON"
+
+    def __init__(self, generatorName=""):
+        self.generatorName = generatorName
+        self.stages = []            # list of {'name', 'time_s', 'objects', 'bytes', 'counters'} in order of execution
+        self.currentStage = None
+        self.startTime = time.perf_counter()
+        self.totalTime_s = 0.0
+
+    @contextmanager
+    def stage(self, name, objectsCount=0):
+        """
+        Measure stage, use as: with stats.stage("materials", objectsCount): ...
+        """
+        stageRecord = {'name': name, 'time_s': 0.0, 'objects': objectsCount, 'bytes': 0, 'counters': {}}
+        parentStage = self.currentStage
+        self.currentStage = stageRecord
+        stageStart = time.perf_counter()
+        try:
+            yield stageRecord
+        finally:
+            stageRecord['time_s'] = time.perf_counter() - stageStart
+            self.currentStage = parentStage
+            self.stages.append(stageRecord)
+            logger.info(self.getStageSummaryText(stageRecord))
+
+    def addBytesWritten(self, bytesCount):
+        if self.currentStage is not None:
+            self.currentStage['bytes'] += bytesCount
+
+    def count(self, counterName, n=1):
+        """
+        Increment counter of currently running stage.
+        :param counterName: what is counted, ie. "stl files"
+        :param n: increment
+        """
+        if self.currentStage is not None:
+            self.currentStage['counters'][counterName] = self.currentStage['counters'].get(counterName, 0) + n
+
+    def getStageSummaryText(self, stageRecord):
+        summary = f"{self.generatorName} {stageRecord['name']}: {stageRecord['time_s']:.3f} s, {stageRecord['objects']} objects, {stageRecord['bytes']} bytes"
+        for counterName, counterValue in stageRecord['counters'].items():
+            summary += f", {counterValue} {counterName}"
+        return summary
+
+    def finish(self):
+        """
+        Stop total time measurement and dump JSON if requested by environment variable.
+        """
+        self.totalTime_s = time.perf_counter() - self.startTime
+
+        jsonFileName = os.environ.get(self.timingJsonEnvVar, "")
+        if jsonFileName:
+            try:
+                with open(jsonFileName, "w", encoding='utf-8') as f:
+                    json.dump(self.toDict(), f, indent=4)
+            except Exception as e:
+                logger.error(f"{__file__} > finish() ERROR: cannot write timing into {jsonFileName}: {e}")
+
+    def toDict(self):
+        return {
+            'generator': self.generatorName,
+            'total_s': self.totalTime_s,
+            'objects': sum([stageRecord['objects'] for stageRecord in self.stages]),
+            'bytes': sum([stageRecord['bytes'] for stageRecord in self.stages]),
+            'stages': self.stages,
+        }
+
+    def getStatusBarText(self, slowestStagesCount=3):
+        slowestStages = sorted(self.stages, key=lambda stageRecord: stageRecord['time_s'], reverse=True)[:slowestStagesCount]
+        return f"Generated in {self.totalTime_s:.2f} s (" + ", ".join([f"{stageRecord['name']} {stageRecord['time_s']:.2f} s" for stageRecord in slowestStages]) + ")"
+
+    def getReportText(self):
+        report = f"{'stage':24s} {'time [ms]':>10s} {'objects':>8s} {'bytes':>10s}\n"
+        for stageRecord in self.stages:
+            report += f"{stageRecord['name']:24s} {1000 * stageRecord['time_s']:10.1f} {stageRecord['objects']:8d} {stageRecord['bytes']:10d}\n"
+        report += f"{'total':24s} {1000 * self.totalTime_s:10.1f}\n"
+        return report
@@ -0,0 +1,105 @@
+#   author: Lubomir Jagos
+#
+#
+import os
+import importlib
+
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
+
+#
+#   Model data shared by generators during one multi target export.
+#
+#   Assignment tree is walked once, its items are stored in itemsByClassName. Each CAD object is exported once per file
+#   format, next generator which needs same file just copies it into its own output directory.
+#
+class ModelSnapshot:
+
+    def __init__(self):
+        self.itemsByClassName = None
+        self.geometryFiles = {}     # (fileFormat, objects labels) -> exported file path
+        self.exportedCount = 0
+        self.reusedCount = 0
+
+    def getKey(self, fileFormat, partToExportList):
+        return (fileFormat, tuple([part.Label for part in partToExportList]))
+
+    def getGeometryFile(self, fileFormat, partToExportList):
+        """
+        :param fileFormat: 'stl' or 'step'
+        :return: path to file with objects already exported for previous target or None
+        """
+        sharedFileName = self.geometryFiles.get(self.getKey(fileFormat, partToExportList), None)
+        if sharedFileName is None or not os.path.exists(sharedFileName):
+            return None
+        self.reusedCount += 1
+        return sharedFileName
+
+    def addGeometryFile(self, fileFormat, partToExportList, exportFileName):
+        self.geometryFiles[self.getKey(fileFormat, partToExportList)] = exportFileName
+        self.exportedCount += 1
+
+#
+#   Generates simulation files for several solvers from one model snapshot, each target is written into sibling
+#   directory {outputDirBase}_{target}_simulation.
+#
+#   Generator modules are imported when generator is needed first time, dialog uses getGeneratorClass() too so opening
+#   it doesn't import generators of all solvers.
+#
+class MultiTargetExporter:
+
+    targetGenerators = {
+        'openEMS_octave': ('utilsOpenEMS.ScriptLinesGenerator.OctaveScriptLinesGenerator2', 'OctaveScriptLinesGenerator2'),
+        'openEMS_python': ('utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator2_openems', 'PythonScriptLinesGenerator2_openems'),
+        'EMerge': ('utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator3_emerge', 'PythonScriptLinesGenerator3_emerge'),
+        'Palace': ('utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator4_palace', 'PythonScriptLinesGenerator4_palace'),
+    }
+
+    @staticmethod
+    def getGeneratorClass(targetName):
+        """
+        :param targetName: key from targetGenerators
+        :return: generator class, its module is imported at first call
+        """
+        moduleName, className = MultiTargetExporter.targetGenerators[targetName]
+        return getattr(importlib.import_module(moduleName), className)
+
+    def __init__(self, form, statusBar = None):
+        self.form = form
+        self.statusBar = statusBar
+
+    def getOutputDir(self, outputDirBase, targetName):
+        return f"{outputDirBase}_{targetName}_simulation"
+
+    def export(self, outputDirBase, targetNames):
+        """
+        :param outputDirBase: path and base name of output directories, ie. /home/user/antenna
+        :param targetNames: list of keys from targetGenerators
+        :return: tuple (dictionary target -> output directory, model snapshot)
+        """
+        modelSnapshot = ModelSnapshot()
+        outputDirs = {}
+
+        for targetName in targetNames:
+            if not targetName in self.targetGenerators:
+                logger.error(f"{__file__} > export() ERROR: unknown target {targetName}")
+                continue
+
+            generator = self.getGeneratorClass(targetName)(self.form, statusBar=self.statusBar)
+            generator.modelSnapshot = modelSnapshot
+            if modelSnapshot.itemsByClassName is None:
+                modelSnapshot.itemsByClassName = generator.getItemsByClassName()
+
+            outputDirs[targetName] = self.getOutputDir(outputDirBase, targetName)
+            logger.info("----> multi target export %s into %s", targetName, outputDirs[targetName])
+            generator.generateSimulationScript(outputDirs[targetName])
+
+        return outputDirs, modelSnapshot
+
+    def getReportText(self, outputDirs, modelSnapshot):
+        report = ""
+        for targetName, outputDir in outputDirs.items():
+            report += f"{targetName}: {outputDir}\n"
+        report += f"\nGeometry files exported: {modelSnapshot.exportedCount}, reused from previous target: {modelSnapshot.reusedCount}\n"
+        return report
@@ -63,23 +63,20 @@ class OctaveScriptLinesGenerator:
 
     #
     #	Returns object priority
-    #		priorityItemName - string which identifies item by its text in priority tree view widget
+    #		priorityKey - tuple (category name, group name, object label) which identifies item in object priority list
     #
-    def getItemPriority(self, priorityItemName):
+    def getItemPriority(self, priorityKey):
         #
-        #	priority is read from tree view
+        #	priority is position of item in priority list index
         #
         priorityItemValue = 42
-        itemsCount = self.form.objectAssignmentPriorityTreeView.topLevelItemCount()
-        for k in range(itemsCount):
-            priorityItem = self.form.objectAssignmentPriorityTreeView.topLevelItem(k)
-            if priorityItemName in priorityItem.text(0):
-                #
-                #	THIS IS MY FORMULA TO HAVE AT LEAST TWO 0 AT END AND NOT HAVE PRIORITY INDEX 0 BUT START AT 100 AT LEAST!
-                #		ATTENTION: higher number means higher priority so fromual is: (1001 - k)     ...to get item at top of tree view with highest priority numbers!
-                #
-                priorityItemValue = (100 - k) * 100
-                break  # this will break loop SO JUST ONE ITEM FROM PRIORITY LIST IS DELETED
+        k = self.guiHelpers.getObjectPriorityIndex().getPosition(priorityKey)
+        if k is not None:
+            #
+            #	THIS IS MY FORMULA TO HAVE AT LEAST TWO 0 AT END AND NOT HAVE PRIORITY INDEX 0 BUT START AT 100 AT LEAST!
+            #		ATTENTION: higher number means higher priority so fromual is: (1001 - k)     ...to get item at top of tree view with highest priority numbers!
+            #
+            priorityItemValue = (100 - k) * 100
 
         return priorityItemValue
 
@@ -261,8 +258,8 @@ class OctaveScriptLinesGenerator:
                     #
                     #	getting item priority
                     #
-                    objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                    objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                    objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                     # getting reference to FreeCAD object
                     freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -280,7 +277,7 @@ class OctaveScriptLinesGenerator:
                         #
                         genScript += "%conducting sheet object\n"
                         genScript += f"%object Label: {freeCadObj.Label}\n"
-                        bbCoords = freeCadObj.Shape.BoundBox
+                        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                         if (freeCadObj.Name.find("Sketch") > -1):
                             #
@@ -524,14 +521,14 @@ class OctaveScriptLinesGenerator:
                 for obj in freecadObjects:
                     print(f"\t{obj.Label}")
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
                     print(f'\t\t{bbCoords}')
 
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -1180,7 +1177,7 @@ class OctaveScriptLinesGenerator:
                 for obj in freecadObjects:
                     print(f"\t{obj.Label}")
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
                     print(f"\t\t{bbCoords}")
 
                     #
@@ -1373,7 +1370,7 @@ class OctaveScriptLinesGenerator:
                     print(f"\t{obj.Label}")
 
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     # PLACEMENT BOX
                     print(f"\t\t{bbCoords}")
@@ -1398,8 +1395,8 @@ class OctaveScriptLinesGenerator:
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     # WARNING: Caps param has hardwired value 1, will be generated small metal caps to connect part with circuit !!!
                     genScript += "[CSX] = AddLumpedElement(CSX, '" + lumpedPartName + "', 2, 'Caps', 1, " + lumpedPartParams + ");\n"
@@ -1429,7 +1426,7 @@ class OctaveScriptLinesGenerator:
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     #THIS HERE MUST BE !!!EXACTLY SAME!!! AS GRIDLINES IN PROBES, otherwise near field is not captured
                     if (currSetting.getType() == 'nf2ff box'):
@@ -1478,8 +1475,7 @@ class OctaveScriptLinesGenerator:
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
@@ -1515,7 +1511,7 @@ class OctaveScriptLinesGenerator:
                 if (not "Shape" in dir(fcObject)):
                     continue
 
-                bbCoords = fcObject.Shape.BoundBox
+                bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                 # If generateLinesInside is selected, grid line region is shifted inward by lambda/20.
                 if gridSettingsInst.generateLinesInside:
@@ -1557,7 +1553,7 @@ class OctaveScriptLinesGenerator:
                     if (not "Shape" in dir(fcObject)):
                         continue
 
-                    bbCoords = fcObject.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                     # If generateLinesInside is selected, grid line region is shifted inward by lambda/20.
                     if gridSettingsInst.generateLinesInside:
@@ -2,6 +2,7 @@
 #
 #
 import os
+import logging
 from PySide import QtGui, QtCore, QtWidgets
 import numpy as np
 import re
@@ -13,6 +14,10 @@ from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
 
 from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
+from utilsOpenEMS.MeshTools.ThirdsRuleMesher import ThirdsRuleMesher
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
@@ -35,13 +40,17 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         genScript += "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%\n"
 
         _bcStr = lambda pml_val, text: '\"PML_{}\"'.format(str(pml_val)) if text == 'PML' else '\"{}\"'.format(text)
+
+        #	sides cropped by symmetry planes have PEC or PMC instead of boundary condition set in GUI
+        bcSymmetry = self.getSymmetryBoundaryConditions()
+
         strBC = ""
-        strBC += _bcStr(self.form.PMLxmincells.value(), self.form.BCxmin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLxmaxcells.value(), self.form.BCxmax.currentText()) + ","
-        strBC += _bcStr(self.form.PMLymincells.value(), self.form.BCymin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLymaxcells.value(), self.form.BCymax.currentText()) + ","
-        strBC += _bcStr(self.form.PMLzmincells.value(), self.form.BCzmin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLzmaxcells.value(), self.form.BCzmax.currentText())
+        strBC += _bcStr(self.form.PMLxmincells.value(), bcSymmetry.get('xmin', self.form.BCxmin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLxmaxcells.value(), bcSymmetry.get('xmax', self.form.BCxmax.currentText())) + ","
+        strBC += _bcStr(self.form.PMLymincells.value(), bcSymmetry.get('ymin', self.form.BCymin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLymaxcells.value(), bcSymmetry.get('ymax', self.form.BCymax.currentText())) + ","
+        strBC += _bcStr(self.form.PMLzmincells.value(), bcSymmetry.get('zmin', self.form.BCzmin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLzmaxcells.value(), bcSymmetry.get('zmax', self.form.BCzmax.currentText()))
 
         genScript += "BC = {" + strBC + "};\n"
         genScript += "FDTD = SetBoundaryCond( FDTD, BC );\n"
@@ -90,7 +99,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         for [item, currSetting] in items:
 
-            print(f"#MATERIAL generates {currSetting.getName()}, {str(currSetting.constants)}")
+            logger.debug("#MATERIAL generates %s, %s", currSetting.getName(), currSetting.constants)
             genScript += "%% MATERIAL - " + currSetting.getName() + "\n"
 
             # when material metal use just AddMetal for simulator
@@ -114,7 +123,8 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 genScript += "CSX = AddConductingSheet(CSX, '" + currSetting.getName() + "', " + str(currSetting.constants["conductingSheetConductivity"]) + ", " + str(currSetting.constants["conductingSheetThicknessValue"]) + "*" + str(currSetting.getUnitsAsNumber(currSetting.constants["conductingSheetThicknessUnits"])) + ");\n"
 
             # first print all current material children names
-            print(f"assigned objects: {[item.child(k).text(0) for k in range(item.childCount())]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("assigned objects: %s", [item.child(k).text(0) for k in range(item.childCount())])
 
             # now export material children, if it's object export as STL, if it's curve export as curve
             if (generateObjects):
@@ -124,8 +134,8 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                    objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                    objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                     # getting reference to FreeCAD object
                     freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -143,7 +153,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         #
                         genScript += "%conducting sheet object\n"
                         genScript += f"%object Label: {freeCadObj.Label}\n"
-                        bbCoords = freeCadObj.Shape.BoundBox
+                        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                         if (freeCadObj.Name.find("Sketch") > -1):
                             #
@@ -163,11 +173,11 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
                                 genScript += f"CSX = AddPolygon(CSX, '{currSetting.getName()}', {str(objModelPriority)}, '{normDir}', {elevation}, points);\n"
                                 genScript += "\n"
-                                print("material conducting sheet: polygon into conducting sheet added.")
+                                logger.debug("material conducting sheet: polygon into conducting sheet added.")
                             else:
                                 genScript += normDir + "\n"
                                 genScript += "\n"
-                                print("ERROR: material conducting sheet: " + normDir)
+                                logger.error("ERROR: material conducting sheet: " + normDir)
 
                         elif (_r(bbCoords.XMin) == _r(bbCoords.XMax) or _r(bbCoords.YMin) == _r(bbCoords.YMax) or _r(bbCoords.ZMin) == _r(bbCoords.ZMax)):
                             #
@@ -215,7 +225,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
                         genScript += "CSX = AddCurve(CSX,'" + currSetting.getName() + "'," + str(
                             objModelPriority) + ", points);\n"
-                        print("Curve added to generated script using its points.")
+                        logger.debug("Curve added to generated script using its points.")
 
                     elif (freeCadObj.Name.find("Sketch") > -1):
                         #
@@ -261,7 +271,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                             genScript += f"CSX = AddCurve(CSX,'{currSetting.getName()}',{objModelPriority}, points);\n"
                             genScript += "\n"
 
-                        print("Line segments from sketch added.")
+                        logger.debug("Line segments from sketch added.")
 
                     else:
                         #
@@ -294,8 +304,8 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         else:
                             exportFileName = f"{currDir}/{stlModelFileName}"
 
-                        self.cadHelpers.exportSTL(partToExport, exportFileName)
-                        print("Material object exported as STL into: " + exportFileName)
+                        self.exportGeometryFile('stl', partToExport, exportFileName)
+                        logger.debug("Material object exported as STL into: %s", exportFileName)
 
             genScript += "\n"
 
@@ -394,7 +404,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         #       Options for select field x,y,z were removed from GUI, but left here due there could be saved files from previous versions
         #       with these options so to keep backward compatibility they are treated as positive direction in that directions.
         #
-        baseVectorStr = {'x': '[1 0 0]', 'y': '[0 1 0]', 'z': '[0 0 1]', 'x+': '[1 0 0]', 'y+': '[0 1 0]', 'z+': '[0 0 1]', 'x-': '[-1 0 0]', 'y-': '[0 -1 0]', 'z-': '[0 0 -1]', 'XY plane, top layer': '[0 0 -1]', 'XY plane, bottom layer': '[0 0 1]', 'XZ plane, front layer': '[0 -1 0]', 'XZ plane, back layer': '[0 1 0]', 'YZ plane, right layer': '[-1 0 0]', 'YZ plane, left layer': '[1 0 0]',}
+        baseVectorStr = self.baseVectorStr
         mslDirStr = {'x': '0', 'y': '1', 'z': '2', 'x+': '0', 'y+': '1', 'z+': '2', 'x-': '0', 'y-': '1', 'z-': '2', 'r+': '0', 'r-': '0', 'theta+': '1', 'theta-': '1'}
         coaxialDirStr = {'x': '0', 'y': '1', 'z': '2', 'x+': '0', 'y+': '1', 'z+': '2', 'x-': '0', 'y-': '1', 'z-': '2', 'r+': '0', 'r-': '0', 'theta+': '1', 'theta-': '1'}
         coplanarDirStr = {'x': '0', 'y': '1', 'z': '2', 'x+': '0', 'y+': '1', 'z+': '2', 'x-': '0', 'y-': '1', 'z-': '2', 'r+': '0', 'r-': '0', 'theta+': '1', 'theta-': '1'}
@@ -407,7 +417,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         for [item, currSetting] in items:
 
-            print(f"#PORT - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PORT - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -419,16 +429,16 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
                 # print(freecadObjects)
                 for obj in freecadObjects:
-                    print(f"\t{obj.Label}")
+                    logger.debug("\t%s", obj.Label)
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print(f'\t\t{bbCoords}')
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\t\t%s", bbCoords)
 
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -441,6 +451,11 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         else:
                             genScript += 'portR = ' + str(currSetting.R) + ';\n'
 
+                        symmetryPortRScale = self.getSymmetryPortRScale(bbCoords)
+                        self.internalPortSymmetryRScaleList[currSetting.name + " - " + obj.Label] = symmetryPortRScale
+                        if symmetryPortRScale != 1.0:
+                            genScript += f'portR = portR * {symmetryPortRScale:g};  % port is cut by symmetry plane\n'
+
                         genScript += 'portUnits = ' + str(currSetting.getRUnits()) + ';\n'
                         genScript += "portExcitationAmplitude = " + str(currSetting.excitationAmplitude) + ";\n"
                         genScript += 'portDirection = {}*portExcitationAmplitude;\n'.format(baseVectorStr.get(currSetting.direction, '?'))
@@ -789,7 +804,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         #       Options for select field x,y,z were removed from GUI, but left here due there could be saved files from previous versions
         #       with these options so to keep backward compatibility they are treated as positive direction in that directions.
         #
-        baseVectorStr = {'x': '[1 0 0]', 'y': '[0 1 0]', 'z': '[0 0 1]', 'x+': '[1 0 0]', 'y+': '[0 1 0]', 'z+': '[0 0 1]', 'x-': '[-1 0 0]', 'y-': '[0 -1 0]', 'z-': '[0 0 -1]', 'XY plane, top layer': '[0 0 -1]', 'XY plane, bottom layer': '[0 0 1]', 'XZ plane, front layer': '[0 -1 0]', 'XZ plane, back layer': '[0 1 0]', 'YZ plane, right layer': '[-1 0 0]', 'YZ plane, left layer': '[1 0 0]',}
+        baseVectorStr = self.baseVectorStr
         probeDirStr = {'x': '0', 'y': '1', 'z': '2', 'x+': '0', 'y+': '1', 'z+': '2', 'x-': '0', 'y-': '1', 'z-': '2', 'r+': '0', 'r-': '0', 'theta+': '1', 'theta-': '1'}
 
         genScript += "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%\n"
@@ -798,7 +813,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         for [item, currSetting] in items:
 
-            print(f"#PROBE - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PROBE - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -810,7 +825,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     #
                     # PROBE openEMS GENERATION INTO VARIABLE
@@ -921,7 +936,11 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         genScript += self.getCartesianOrCylindricalScriptLinesFromStartStop(bbCoords, "nf2ffStart", "nf2ffStop")
 
                         # genScript += 'nf2ffUnit = ' + currSetting.getUnitAsScriptLine() + ';\n'
-                        genScript += "[CSX nf2ffBox{" + str(genNF2FFBoxCounter) + "}] = CreateNF2FFBox(CSX, '" + dumpboxName + "', nf2ffStart, nf2ffStop);\n"
+                        nf2ffMirror = self.getSymmetryNF2FFMirror()
+                        if any(nf2ffMirror):
+                            genScript += "[CSX nf2ffBox{" + str(genNF2FFBoxCounter) + "}] = CreateNF2FFBox(CSX, '" + dumpboxName + "', nf2ffStart, nf2ffStop, 'Mirror', [" + " ".join([str(mirror) for mirror in nf2ffMirror]) + "]);\n"
+                        else:
+                            genScript += "[CSX nf2ffBox{" + str(genNF2FFBoxCounter) + "}] = CreateNF2FFBox(CSX, '" + dumpboxName + "', nf2ffStart, nf2ffStop);\n"
                         # NF2FF grid lines are generated below via getNF2FFDefinitionsScriptLines()
 
                         #
@@ -956,7 +975,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print(f"#LUMPED PART {currentSetting.getType()} - {currentSetting.getName()}")
+                logger.debug("#LUMPED PART %s - %s", currentSetting.getType(), currentSetting.getName())
 
                 freecadObjects = [i for i in objs if (i.Label) == childName]
                 lumpedPartChildIndex = 1
@@ -964,7 +983,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     # obj = FreeCAD Object class
 
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     genScript += self.getCartesianOrCylindricalScriptLinesFromStartStop(bbCoords, "lumpedPartStart", "lumpedPartStop")
 
@@ -1003,8 +1022,8 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     #   in octave interface there can't be two lumped part with same name, so if one category like 22nH there are more
@@ -1044,7 +1063,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     #THIS HERE MUST BE !!!EXACTLY SAME!!! AS GRIDLINES IN PROBES, otherwise near field is not captured
                     if (currSetting.getType() == 'nf2ff box'):
@@ -1093,20 +1112,19 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
 
@@ -1122,7 +1140,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
             if (gridSettingsInst.getType() in ['Fixed Distance', 'Fixed Count', 'User Defined']):
                 fcObject = fcObjects.get(FreeCADObjectName, None)
                 if (not fcObject):
-                    print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                    logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                     continue
 
                 ### Produce script output.
@@ -1130,7 +1148,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 if (not "Shape" in dir(fcObject)):
                     continue
 
-                bbCoords = fcObject.Shape.BoundBox
+                bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                 deltaX = 0
                 deltaY = 0
@@ -1140,13 +1158,13 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     unitsAsNumber = gridSettingsInst.getUnitsAsNumber(gridOffset['units'])
                     if gridSettingsInst.xenabled:
                         deltaX = gridOffset['x'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in X: {deltaX}")
+                        logger.debug("GRID generateLinesInside object detected, delta in X: %s", deltaX)
                     if gridSettingsInst.yenabled:
                         deltaY = gridOffset['y'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in Y: {deltaY}")
+                        logger.debug("GRID generateLinesInside object detected, delta in Y: %s", deltaY)
                     if gridSettingsInst.zenabled:
                         deltaZ = gridOffset['z'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in Z: {deltaZ}")
+                        logger.debug("GRID generateLinesInside object detected, delta in Z: %s", deltaZ)
 
                 xmax = sf * bbCoords.XMax - np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX
                 ymax = sf * bbCoords.YMax - np.sign(bbCoords.YMax - bbCoords.YMin) * deltaY
@@ -1167,13 +1185,17 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 yList = []
                 zList = []
 
+                #object boundaries with info if object is metal, used by thirds rule
+                objectBoxes = []
+                metalObjectLabels = self.getMetalObjectLabels() if gridSettingsInst.smoothMesh.get('thirdsRule', False) else []
+
                 #iterate over grid smooth mesh category freecad children
                 for k in range(gridCategoryObj.childCount()):
                     FreeCADObjectName = gridCategoryObj.child(k).text(0)
 
                     fcObject = fcObjects.get(FreeCADObjectName, None)
                     if (not fcObject):
-                        print("Smooth Mesh - Failed to resolve '{}'.".format(FreeCADObjectName))
+                        logger.warning("Smooth Mesh - Failed to resolve '%s'.", FreeCADObjectName)
                         continue
 
                     ### Produce script output.
@@ -1181,7 +1203,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     if (not "Shape" in dir(fcObject)):
                         continue
 
-                    bbCoords = fcObject.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                     deltaX = 0
                     deltaY = 0
@@ -1191,13 +1213,13 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         unitsAsNumber = gridSettingsInst.getUnitsAsNumber(gridOffset['units'])
                         if gridSettingsInst.xenabled:
                             deltaX = gridOffset['x'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in X: {deltaX}")
+                            logger.debug("GRID generateLinesInside object detected, delta in X: %s", deltaX)
                         if gridSettingsInst.yenabled:
                             deltaY = gridOffset['y'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in Y: {deltaY}")
+                            logger.debug("GRID generateLinesInside object detected, delta in Y: %s", deltaY)
                         if gridSettingsInst.zenabled:
                             deltaZ = gridOffset['z'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in Z: {deltaZ}")
+                            logger.debug("GRID generateLinesInside object detected, delta in Z: %s", deltaZ)
 
                     #append boundary coordinates into list
                     xList.append(sf * bbCoords.XMax - np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX)
@@ -1206,6 +1228,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                     xList.append(sf * bbCoords.XMin + np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX)
                     yList.append(sf * bbCoords.YMin + np.sign(bbCoords.YMax - bbCoords.YMin) * deltaY)
                     zList.append(sf * bbCoords.ZMin + np.sign(bbCoords.ZMax - bbCoords.ZMin) * deltaZ)
+                    objectBoxes.append(({'x': (xList[-1], xList[-2]), 'y': (yList[-1], yList[-2]), 'z': (zList[-1], zList[-2])}, FreeCADObjectName in metalObjectLabels))
 
                     # Write grid definition.
                     genScript += "%% GRID - " + gridSettingsInst.getName() + " - " + FreeCADObjectName + ' (' + gridSettingsInst.getType() + ")\n"
@@ -1215,6 +1238,13 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 yList.sort()
                 zList.sort()
 
+                #thirds rule, metal objects edges are replaced by lines 1/3 inside and 2/3 outside of edge resolution
+                if gridSettingsInst.smoothMesh.get('thirdsRule', False):
+                    thirdsRuleMesher = ThirdsRuleMesher(gridSettingsInst.smoothMesh.get('thirdsRuleResolution', 0))
+                    xList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('x', objectBoxes)]
+                    yList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('y', objectBoxes)]
+                    zList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('z', objectBoxes)]
+
             #
             #   Real octave mesh lines code generate starts here
             #
@@ -1318,7 +1348,9 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         genScript += "mesh.x(mesh.x >= {0:g} & mesh.x <= {1:g}) = [];\n".format(_r(xList[0]), _r(xList[-1]))
 
                     genScript += f"smoothMesh.x = {str(xList)};\n"
-                    if gridSettingsInst.smoothMesh['xMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'x'):
+                        genScript += f"smoothMesh.x = {str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'x'))}; %material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['xMaxRes'] == 0:
                         genScript += "smoothMesh.x = AutoSmoothMeshLines(smoothMesh.x, max_res/unit); %max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.x = AutoSmoothMeshLines(smoothMesh.x, {gridSettingsInst.smoothMesh['xMaxRes']});\n"
@@ -1330,7 +1362,9 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         genScript += "mesh.y(mesh.y >= {0:g} & mesh.y <= {1:g}) = [];\n".format(_r(yList[0]), _r(yList[-1]))
 
                     genScript += f"smoothMesh.y = {str(yList)};\n"
-                    if gridSettingsInst.smoothMesh['yMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'y'):
+                        genScript += f"smoothMesh.y = {str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'y'))}; %material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['yMaxRes'] == 0:
                         genScript += "smoothMesh.y = AutoSmoothMeshLines(smoothMesh.y, max_res/unit); %max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.y = AutoSmoothMeshLines(smoothMesh.y, {yParam});\n"
@@ -1342,7 +1376,9 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                         genScript += "mesh.z(mesh.z >= {0:g} & mesh.z <= {1:g}) = [];\n".format(_r(zList[0]), _r(zList[-1]))
 
                     genScript += f"smoothMesh.z = {str(zList)};\n"
-                    if gridSettingsInst.smoothMesh['zMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'z'):
+                        genScript += f"smoothMesh.z = {str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'z'))}; %material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['zMaxRes'] == 0:
                         genScript += "smoothMesh.z = AutoSmoothMeshLines(smoothMesh.z, max_res/unit); %max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.z = AutoSmoothMeshLines(smoothMesh.z, {gridSettingsInst.smoothMesh['zMaxRes']});\n"
@@ -1399,6 +1435,25 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         return genScript
 
+    def getSymmetryScriptLines(self):
+        genScript = ""
+
+        symmetryPlanes = self.getSymmetryPlanes()
+        if len(symmetryPlanes) == 0:
+            return genScript
+
+        genScript += "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%\n"
+        genScript += "% SYMMETRY, model is cropped by symmetry planes, there is PEC or PMC boundary condition on them\n"
+        genScript += "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%\n"
+        for plane in symmetryPlanes:
+            axis = plane['axis']
+            coord = _r(plane['coord'])
+            genScript += f"mesh.{axis} = unique([mesh.{axis}(mesh.{axis} {plane['keep']} {coord}) {coord}]);\n"
+        genScript += "CSX = DefineRectGrid(CSX, unit, mesh);\n"
+        genScript += "\n"
+
+        return genScript
+
     def getInitScriptLines(self):
         genScript = ""
         genScript += "% To be run with GNU Octave or MATLAB.\n"
@@ -1444,7 +1499,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
                 # Currently only 1 excitation is allowed. Multiple excitations could be managed by setting one of them as "selected" or "active", while all others are deactivated.
                 # This would help the user to manage different analysis scenarios / excitation ranges.
 
-                print(f"#EXCITATION - {currSetting.getName()} - {currSetting.getType()}")
+                logger.debug("#EXCITATION - %s - %s", currSetting.getName(), currSetting.getType())
 
                 genScript += "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%\n"
                 genScript += "% EXCITATION " + currSetting.getName() + "\n"
@@ -1509,7 +1564,8 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         :param outputDir:
         :return:
         """
-        self.generateOpenEMSScript(outputDir)
+        with self.collectManifest():
+            self.generateOpenEMSScript(outputDir)
 
     def generateOpenEMSScript(self, outputDir=None):
 
@@ -1517,6 +1573,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         #   if outputDir is set to same value
         #   if outputStr is None then folder with name as FreeCAD file with suffix _openEMS_simulation is created
         outputDir = self.createOuputDir(outputDir)
+        generationStats = self.startGenerationStats()
 
         # Write _OpenEMS.m script file to current directory.
         currDir, nameBase = self.getCurrDir()
@@ -1566,6 +1623,14 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
             openEMS_opt.append('--debug-PEC')
         if self.form.generateJustPreviewCheckbox.isChecked():
             openEMS_opt.append('--no-simulation')
+
+        engineProfile = self.getEngineProfile()
+        if engineProfile is not None:
+            genScript += f"% --engine        : engine from calibrated profile of this machine ({engineProfile['speed_MCps']:g} MCells/s)\n"
+            openEMS_opt.append(f"--engine={engineProfile['engine']}")
+            if engineProfile['engine'] == 'multithreaded':
+                openEMS_opt.append(f"--numThreads={engineProfile['numThreads']}")
+
         genScript += "openEMS_opts = '" + " ".join(openEMS_opt) + "';\n"
         genScript += "\n"
 
@@ -1598,41 +1663,53 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 
         genScript += ");\n\n"
 
-        print("======================== REPORT BEGIN ========================\n")
+        logger.debug("======================== REPORT BEGIN ========================\n")
 
         self.reportFreeCADItemSettings(itemsByClassName.get("FreeCADSettingsItem", None))
 
         # Write boundary conditions definitions.
-        genScript += self.getBoundaryConditionsScriptLines()
+        with self.measureStage("boundary conditions"):
+            genScript += self.getBoundaryConditionsScriptLines()
 
         # Write coordinate system definitions.
         genScript += self.getCoordinateSystemScriptLines()
 
         # Write excitation definition.
-        genScript += self.getExcitationScriptLines()
+        with self.measureStage("excitation", itemsByClassName.get("ExcitationSettingsItem", None)):
+            genScript += self.getExcitationScriptLines()
 
         # Write material definitions.
-        genScript += self.getMaterialDefinitionsScriptLines(itemsByClassName.get("MaterialSettingsItem", None), outputDir)
+        with self.measureStage("materials", itemsByClassName.get("MaterialSettingsItem", None)):
+            genScript += self.getMaterialDefinitionsScriptLines(itemsByClassName.get("MaterialSettingsItem", None), outputDir)
 
         # Write grid definitions.
-        genScript += self.getOrderedGridDefinitionsScriptLines(itemsByClassName.get("GridSettingsItem", None))
+        with self.measureStage("grid", itemsByClassName.get("GridSettingsItem", None)):
+            genScript += self.getOrderedGridDefinitionsScriptLines(itemsByClassName.get("GridSettingsItem", None))
 
         # Write port definitions, due microstrip ports it must be defined after grid.
-        genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
+        with self.measureStage("ports", itemsByClassName.get("PortSettingsItem", None)):
+            genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
         # Write lumped part definitions.
-        genScript += self.getLumpedPartDefinitionsScriptLines(itemsByClassName.get("LumpedPartSettingsItem", None))
+        with self.measureStage("lumped parts", itemsByClassName.get("LumpedPartSettingsItem", None)):
+            genScript += self.getLumpedPartDefinitionsScriptLines(itemsByClassName.get("LumpedPartSettingsItem", None))
 
         # Write probes definitions
-        genScript += self.getProbeDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
+        with self.measureStage("probes", itemsByClassName.get("ProbeSettingsItem", None)):
+            genScript += self.getProbeDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
 
         # Write NF2FF probe grid definitions.
-        genScript += self.getNF2FFDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
+        with self.measureStage("nf2ff", itemsByClassName.get("ProbeSettingsItem", None)):
+            genScript += self.getNF2FFDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
 
-        # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
-        genScript += self.getMinimalGridlineSpacingScriptLines()
+        with self.measureStage("grid postprocessing"):
+            # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
+            genScript += self.getMinimalGridlineSpacingScriptLines()
 
-        print("======================== REPORT END ========================\n")
+            # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+            genScript += self.getSymmetryScriptLines()
+
+        logger.debug("======================== REPORT END ========================\n")
 
         # Finalize script.
 
@@ -1648,14 +1725,16 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         genScript += "    RunOpenEMS( Sim_Path, Sim_CSX, openEMS_opts );\n"
         genScript += "end\n"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
+        with self.measureStage("file write"):
+            self.writeFileIfChanged(fileName, genScript)
+
+        generationStats.finish()
+        logger.info("======================== TIMING ========================\n%s", generationStats.getReportText())
 
         # Show message or update status bar to inform user that exporting has finished.
 
         self.guiHelpers.displayMessage('Simulation script written to: ' + fileName, forceModal=True)
-        print('Simulation script written to: ' + fileName)
+        logger.info("Simulation script written to: %s", fileName)
 
         return
 
@@ -1715,10 +1794,13 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         #
         #   Current NF2FF box index
         #
-        print(f"writeNf2ffButtonClicked() > generate script, getting nf2ff box index for '{nf2ffBoxName}'")
+        logger.debug("writeNf2ffButtonClicked() > generate script, getting nf2ff box index for '%s'", nf2ffBoxName)
         currentNF2FFBoxIndex = self.internalNF2FFIndexNamesList[nf2ffBoxName.replace(" ", "_")]
         currentNF2FFInputPortIndex = self.internalPortIndexNamesList[nf2ffBoxInputPortName]
 
@@ -1745,7 +1827,7 @@ class OctaveScriptLinesGenerator2(CommonScriptLinesGenerator):
 %	WARNING - hardwired 1st port
 %
 P_in_0 = interp1(freq, port{""" + str(currentNF2FFInputPortIndex) + """}.P_acc, f0);
-
+""" + (f"P_in_0 = P_in_0 * {self.getSymmetryPowerScale()};  % full model power, model is cropped by symmetry planes\n" if self.getSymmetryPowerScale() != 1 else "") + """
 % calculate the far field at phi=0 degrees and at phi=90 degrees
 
 %thetaRange = unique([0:0.5:90 90:180]);
@@ -1809,10 +1891,8 @@ DumpFF2VTK([Sim_Path '/3D_Pattern_Efield_normalized.vtk'],E_far_normalized,theta
         else:
             fileName = f"{currDir}/{nameBase}_draw_NF2FF.m"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Script to display far field written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Script to display far field written into: %s", fileName)
         self.guiHelpers.displayMessage('Script to display far field written into: ' + fileName, forceModal=False)
 
     def drawS11ButtonClicked(self, outputDir=None, portName=""):
@@ -1845,9 +1925,16 @@ DumpFF2VTK([Sim_Path '/3D_Pattern_Efield_normalized.vtk'],E_far_normalized,theta
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         # Write port definitions.
         genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
+        #	port cut by symmetry plane has scaled resistance, impedance is recalculated to full model
+        symmetryPortRScale = self.internalPortSymmetryRScaleList.get(portName, 1.0)
+        symmetryZinScriptLine = f"Zin = Zin / {symmetryPortRScale:g};  % full model impedance, port is cut by symmetry plane\n" if symmetryPortRScale != 1.0 else ""
+
         genScript += """%% postprocessing & do the plots
 freq = linspace( max([0,f0-fc]), f0+fc, 501 );
 
@@ -1855,7 +1942,7 @@ port = calcPort(port, Sim_Path, freq);
 s11 = port{""" + str(self.internalPortIndexNamesList[portName]) + """}.uf.ref ./ port{""" + str(self.internalPortIndexNamesList[portName]) + """}.uf.inc;
 s11_dB = 20*log10(abs(s11));
 Zin = port{""" + str(self.internalPortIndexNamesList[portName]) + """}.uf.tot ./ port{""" + str(self.internalPortIndexNamesList[portName]) + """}.if.tot;
-
+""" + symmetryZinScriptLine + """
 % plot feed point impedance
 figure
 plotObj1 = plot( freq/1e6, real(Zin), 'k-', 'Linewidth', 2 );
@@ -1900,10 +1987,8 @@ dlmwrite(filename, s11_dB, '-append', 'delimiter', ';');
         else:
             fileName = f"{currDir}/{nameBase}_draw_S11.m"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName, forceModal=False)
 
     def drawS11ButtonClicked_2(self, outputDir=None, portName=""):
@@ -2016,10 +2101,8 @@ dlmwrite(filename, s11_dB, '-append', 'delimiter', ';');
         else:
             fileName = f"{currDir}/{nameBase}_draw_S11.m"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName,
                                        forceModal=False)
 
@@ -2053,6 +2136,9 @@ dlmwrite(filename, s11_dB, '-append', 'delimiter', ';');
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         # Write port definitions.
         genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
@@ -2112,8 +2198,6 @@ dlmwrite(filename, s11_dB, '-append', 'delimiter', ';');
         else:
             fileName = f"{currDir}/{nameBase}_draw_S21.m"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written to: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written to: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written to: ' + fileName, forceModal=False)
@@ -126,8 +126,8 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                 #
                 #	getting item priority
                 #
-                objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                 # getting reference to FreeCAD object
                 freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -252,7 +252,7 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
                     print('\tFreeCAD lumped port BoundBox: ' + str(bbCoords))
                     print('\t\tXMin: ' + str(bbCoords.XMin))
                     print('\t\tYMin: ' + str(bbCoords.YMin))
@@ -261,8 +261,8 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -430,7 +430,7 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                     # obj = FreeCAD Object class
 
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     # PLACEMENT BOX
                     print(obj.Placement)
@@ -455,8 +455,8 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     # WARNING: Caps param has hardwired value 1, will be generated small metal caps to connect part with circuit !!!
                     genScript += "[CSX] = AddLumpedElement(CSX, '" + lumpedPartName + "', 2, 'Caps', 1, " + lumpedPartParams + ");\n"
@@ -487,7 +487,7 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     if (currSetting.getType() == 'nf2ff box'):
                         nf2ff_gridlines['x'].append(sf * bbCoords.XMin)
@@ -535,8 +535,7 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
@@ -563,7 +562,7 @@ class PythonScriptLinesGenerator(OctaveScriptLinesGenerator):
             if (not "Shape" in dir(fcObject)):
                 continue
 
-            bbCoords = fcObject.Shape.BoundBox
+            bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
             # If generateLinesInside is selected, grid line region is shifted inward by lambda/20.
             if gridSettingsInst.generateLinesInside:
@@ -1013,13 +1012,13 @@ f_res = f0;
                             # print(freecadObjects)
                             for obj in freecadObjects:
                                 # BOUNDING BOX
-                                bbCoords = obj.Shape.BoundBox
+                                bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                                 #
                                 #	getting item priority
                                 #
-                                priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                                priorityIndex = self.getItemPriority(priorityItemName)
+                                priorityKey = (item.parent().text(0), item.text(0), childName)
+                                priorityIndex = self.getItemPriority(priorityKey)
 
                                 #
                                 # PORT openEMS GENERATION INTO VARIABLE
@@ -13,6 +13,10 @@ from utilsOpenEMS.GuiHelpers.GuiHelpers import GuiHelpers
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
 
 from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
+from utilsOpenEMS.MeshTools.ThirdsRuleMesher import ThirdsRuleMesher
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
@@ -80,18 +84,17 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 #
                 materialCounter += 1
 
-                print(currSetting)
+                logger.debug(currSetting)
                 if (currSetting.getName() == 'Material Default'):
-                    print("#Material Default")
-                    print("---")
+                    logger.debug("#Material Default")
+                    logger.debug("---")
                     continue
 
-                print("#")
-                print("#MATERIAL")
-                print("#name: " + currSetting.getName())
-                print("#epsilon, mue, kappa, sigma")
-                print("#" + str(currSetting.constants['epsilon']) + ", " + str(currSetting.constants['mue']) + ", " + str(
-                    currSetting.constants['kappa']) + ", " + str(currSetting.constants['sigma']))
+                logger.debug("#")
+                logger.debug("#MATERIAL")
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#epsilon, mue, kappa, sigma")
+                logger.debug("#%s, %s, %s, %s", currSetting.constants['epsilon'], currSetting.constants['mue'], currSetting.constants['kappa'], currSetting.constants['sigma'])
 
                 genScript += f"## MATERIAL - {currSetting.getName()}\n"
                 materialPythonVariable = f"materialList['{currSetting.getName()}']"
@@ -128,8 +131,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 # first print all current material children names
                 for k in range(item.childCount()):
                     childName = item.child(k).text(0)
-                    print("##Children:")
-                    print("\t" + childName)
+                    logger.debug("##Children:")
+                    logger.debug("\t%s", childName)
 
                 # now export material children, if it's object export as STL, if it's curve export as curve
                 for k in range(item.childCount()):
@@ -139,8 +142,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                    objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                    objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                     # getting reference to FreeCAD object
                     freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -158,7 +161,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         #
                         genScript += "##conducting sheet object\n"
                         genScript += f"#object Label: {freeCadObj.Label}\n"
-                        bbCoords = freeCadObj.Shape.BoundBox
+                        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                         if (freeCadObj.Name.find("Sketch") > -1):
                             #
@@ -178,11 +181,11 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
                                 genScript += f"{materialPythonVariable}.AddPolygon(points, '{normDir}', {elevation}, priority={objModelPriority})\n"
                                 genScript += "\n"
-                                print("material conducting sheet: polygon into conducting sheet added.")
+                                logger.debug("material conducting sheet: polygon into conducting sheet added.")
                             else:
                                 genScript += f"## {normDir}\n"
                                 genScript += "\n"
-                                print("ERROR: material conducting sheet: " + normDir)
+                                logger.error("ERROR: material conducting sheet: " + normDir)
 
                         elif (_r(bbCoords.XMin) == _r(bbCoords.XMax) or _r(bbCoords.YMin) == _r(bbCoords.YMax) or _r(bbCoords.ZMin) == _r(bbCoords.ZMax)):
                             #
@@ -233,7 +236,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
                         genScript += f"{materialPythonVariable}.AddCurve(points, priority={objModelPriority})\n"
                         genScript += "\n"
-                        print("Curve added to generated script using its points.")
+                        logger.debug("Curve added to generated script using its points.")
 
                     elif (freeCadObj.Name.find("Sketch") > -1):
                         #
@@ -278,7 +281,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
                         genScript += f"{materialPythonVariable}.AddCurve(points, priority={objModelPriority})\n"
                         genScript += "\n"
-                        print("Line segments from sketch added.")
+                        logger.debug("Line segments from sketch added.")
 
                     else:
                         #
@@ -312,8 +315,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         else:
                             exportFileName = os.path.join(currDir, stlModelFileName)
 
-                        self.cadHelpers.exportSTL(partToExport, exportFileName)
-                        print("Material object exported as STL into: " + stlModelFileName)
+                        self.exportGeometryFile('stl', partToExport, exportFileName)
+                        logger.debug("Material object exported as STL into: %s", stlModelFileName)
 
                 genScript += "\n"   #newline after each COMPLETE material category code generated
 
@@ -437,7 +440,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
         for [item, currSetting] in items:
 
-            print(f"#PORT - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PORT - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -450,14 +453,14 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print('\tFreeCAD lumped port BoundBox: ' + str(bbCoords))
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\tFreeCAD lumped port BoundBox: %s", bbCoords)
 
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -470,6 +473,11 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         else:
                             genScript += 'portR = ' + str(currSetting.R) + '\n'
 
+                        symmetryPortRScale = self.getSymmetryPortRScale(bbCoords)
+                        self.internalPortSymmetryRScaleList[currSetting.name + " - " + obj.Label] = symmetryPortRScale
+                        if symmetryPortRScale != 1.0:
+                            genScript += f'portR = portR * {symmetryPortRScale:g}  # port is cut by symmetry plane\n'
+
                         genScript += 'portUnits = ' + str(currSetting.getRUnits()) + '\n'
                         genScript += "portExcitationAmplitude = " + str(currSetting.excitationAmplitude) + "\n"
                         genScript += 'portDirection = \'' + currSetting.direction + '\'\n'
@@ -640,7 +648,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
         for [item, currSetting] in items:
 
-            print(f"#PROBE - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PROBE - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -652,10 +660,10 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
                 # print(freecadObjects)
                 for obj in freecadObjects:
-                    print(f"\t{obj.Label}")
+                    logger.debug("\t%s", obj.Label)
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print(f"\t\t{bbCoords}")
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\t\t%s", bbCoords)
 
                     #
                     # PROBE openEMS GENERATION INTO VARIABLE
@@ -776,7 +784,11 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         genScript += self.getCartesianOrCylindricalScriptLinesFromStartStop(bbCoords, "nf2ffStart", "nf2ffStop")
 
                         # genScript += 'nf2ffUnit = ' + currSetting.getUnitAsScriptLine() + ';\n'
-                        genScript += f"nf2ffBoxList[dumpboxName] = FDTD.CreateNF2FFBox(dumpboxName, nf2ffStart, nf2ffStop)\n"
+                        nf2ffMirror = self.getSymmetryNF2FFMirror()
+                        if any(nf2ffMirror):
+                            genScript += f"nf2ffBoxList[dumpboxName] = FDTD.CreateNF2FFBox(dumpboxName, nf2ffStart, nf2ffStop, mirror={nf2ffMirror})\n"
+                        else:
+                            genScript += f"nf2ffBoxList[dumpboxName] = FDTD.CreateNF2FFBox(dumpboxName, nf2ffStart, nf2ffStop)\n"
                         # NF2FF grid lines are generated below via getNF2FFDefinitionsScriptLines()
 
                         #
@@ -812,14 +824,14 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
             objsExport = []
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("#LUMPED PART " + currentSetting.getType())
+                logger.debug("#LUMPED PART %s", currentSetting.getType())
 
                 freecadObjects = [i for i in objs if (i.Label) == childName]
                 for obj in freecadObjects:
                     # obj = FreeCAD Object class
 
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     genScript += self.getCartesianOrCylindricalScriptLinesFromStartStop(bbCoords, "lumpedPartStart", "lumpedPartStop")
 
@@ -849,8 +861,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     # WARNING: Caps param has hardwired value 1, will be generated small metal caps to connect part with circuit !!!
                     genScript += f"lumpedPart = CSX.AddLumpedElement({lumpedPartParams});\n"
@@ -880,7 +892,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     if (currSetting.getType() == 'nf2ff box'):
                         nf2ff_gridlines['x'].append("{0:g}".format(_r(sf * bbCoords.XMin)))
@@ -934,20 +946,19 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
 
@@ -963,7 +974,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
             if (gridSettingsInst.getType() in ['Fixed Distance', 'Fixed Count', 'User Defined']):
                 fcObject = fcObjects.get(FreeCADObjectName, None)
                 if (not fcObject):
-                    print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                    logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                     continue
 
                 ### Produce script output.
@@ -971,7 +982,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 if (not "Shape" in dir(fcObject)):
                     continue
 
-                bbCoords = fcObject.Shape.BoundBox
+                bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                 deltaX = 0
                 deltaY = 0
@@ -981,13 +992,13 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                     unitsAsNumber = gridSettingsInst.getUnitsAsNumber(gridOffset['units'])
                     if gridSettingsInst.xenabled:
                         deltaX = gridOffset['x'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in X: {deltaX}")
+                        logger.debug("GRID generateLinesInside object detected, delta in X: %s", deltaX)
                     if gridSettingsInst.yenabled:
                         deltaY = gridOffset['y'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in Y: {deltaY}")
+                        logger.debug("GRID generateLinesInside object detected, delta in Y: %s", deltaY)
                     if gridSettingsInst.zenabled:
                         deltaZ = gridOffset['z'] * unitsAsNumber * (1/self.getUnitLengthFromUI_m())
-                        print(f"GRID generateLinesInside object detected, delta in Z: {deltaZ}")
+                        logger.debug("GRID generateLinesInside object detected, delta in Z: %s", deltaZ)
 
                 xmax = sf * bbCoords.XMax - np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX
                 ymax = sf * bbCoords.YMax - np.sign(bbCoords.YMax - bbCoords.YMin) * deltaY
@@ -1008,13 +1019,17 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 yList = []
                 zList = []
 
+                #object boundaries with info if object is metal, used by thirds rule
+                objectBoxes = []
+                metalObjectLabels = self.getMetalObjectLabels() if gridSettingsInst.smoothMesh.get('thirdsRule', False) else []
+
                 #iterate over grid smooth mesh category freecad children
                 for k in range(gridCategoryObj.childCount()):
                     FreeCADObjectName = gridCategoryObj.child(k).text(0)
 
                     fcObject = fcObjects.get(FreeCADObjectName, None)
                     if (not fcObject):
-                        print("Smooth Mesh - Failed to resolve '{}'.".format(FreeCADObjectName))
+                        logger.warning("Smooth Mesh - Failed to resolve '%s'.", FreeCADObjectName)
                         continue
 
                     ### Produce script output.
@@ -1022,7 +1037,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                     if (not "Shape" in dir(fcObject)):
                         continue
 
-                    bbCoords = fcObject.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
                     deltaX = 0
                     deltaY = 0
@@ -1032,13 +1047,13 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         unitsAsNumber = gridSettingsInst.getUnitsAsNumber(gridOffset['units'])
                         if gridSettingsInst.xenabled:
                             deltaX = gridOffset['x'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in X: {deltaX}")
+                            logger.debug("GRID generateLinesInside object detected, delta in X: %s", deltaX)
                         if gridSettingsInst.yenabled:
                             deltaY = gridOffset['y'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in Y: {deltaY}")
+                            logger.debug("GRID generateLinesInside object detected, delta in Y: %s", deltaY)
                         if gridSettingsInst.zenabled:
                             deltaZ = gridOffset['z'] * unitsAsNumber * (1 / self.getUnitLengthFromUI_m())
-                            print(f"GRID generateLinesInside object detected, delta in Z: {deltaZ}")
+                            logger.debug("GRID generateLinesInside object detected, delta in Z: %s", deltaZ)
 
                     #append boundary coordinates into list
                     xList.append(sf * bbCoords.XMax - np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX)
@@ -1047,6 +1062,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                     xList.append(sf * bbCoords.XMin + np.sign(bbCoords.XMax - bbCoords.XMin) * deltaX)
                     yList.append(sf * bbCoords.YMin + np.sign(bbCoords.YMax - bbCoords.YMin) * deltaY)
                     zList.append(sf * bbCoords.ZMin + np.sign(bbCoords.ZMax - bbCoords.ZMin) * deltaZ)
+                    objectBoxes.append(({'x': (xList[-1], xList[-2]), 'y': (yList[-1], yList[-2]), 'z': (zList[-1], zList[-2])}, FreeCADObjectName in metalObjectLabels))
 
                     # Write grid definition.
                     genScript += "## GRID - " + gridSettingsInst.getName() + " - " + FreeCADObjectName + ' (' + gridSettingsInst.getType() + ")\n"
@@ -1056,6 +1072,13 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 yList.sort()
                 zList.sort()
 
+                #thirds rule, metal objects edges are replaced by lines 1/3 inside and 2/3 outside of edge resolution
+                if gridSettingsInst.smoothMesh.get('thirdsRule', False):
+                    thirdsRuleMesher = ThirdsRuleMesher(gridSettingsInst.smoothMesh.get('thirdsRuleResolution', 0))
+                    xList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('x', objectBoxes)]
+                    yList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('y', objectBoxes)]
+                    zList = [float(_r(line)) for line in thirdsRuleMesher.getFixedLines('z', objectBoxes)]
+
             #
             #   Real octave mesh lines code generate starts here
             #
@@ -1155,7 +1178,9 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         genScript += "mesh.x = np.delete(mesh.x, np.argwhere((mesh.x >= {0:g}) & (mesh.x <= {1:g})))\n".format(_r(xList[0]), _r(xList[-1]))
 
                     genScript += f"smoothMesh.x = {str(xList)};\n"
-                    if gridSettingsInst.smoothMesh['xMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'x'):
+                        genScript += f"smoothMesh.x = np.array({str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'x'))}) #material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['xMaxRes'] == 0:
                         genScript += "smoothMesh.x = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.x, max_res/unit) #max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.x = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.x, {gridSettingsInst.smoothMesh['xMaxRes']})\n"
@@ -1167,7 +1192,9 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         genScript += "mesh.y = np.delete(mesh.y, np.argwhere((mesh.y >= {0:g}) & (mesh.y <= {1:g})))\n".format(_r(yList[0]), _r(yList[-1]))
 
                     genScript += f"smoothMesh.y = {str(yList)};\n"
-                    if gridSettingsInst.smoothMesh['yMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'y'):
+                        genScript += f"smoothMesh.y = np.array({str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'y'))}) #material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['yMaxRes'] == 0:
                         genScript += "smoothMesh.y = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.y, max_res/unit) #max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.y = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.y, {yParam})\n"
@@ -1179,7 +1206,9 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                         genScript += "mesh.z = np.delete(mesh.z, np.argwhere((mesh.z >= {0:g}) & (mesh.z <= {1:g})))\n".format(_r(zList[0]), _r(zList[-1]))
 
                     genScript += f"smoothMesh.z = {str(zList)};\n"
-                    if gridSettingsInst.smoothMesh['zMaxRes'] == 0:
+                    if self.isMaterialAwareMesh(gridSettingsInst, 'z'):
+                        genScript += f"smoothMesh.z = np.array({str(self.getMaterialAwareMeshLines(gridSettingsInst, gridCategoryObj, 'z'))}) #material aware, lambda/20 inside material of each object\n"
+                    elif gridSettingsInst.smoothMesh['zMaxRes'] == 0:
                         genScript += "smoothMesh.z = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.z, max_res/unit) #max_res calculated in excitation part\n"
                     else:
                         genScript += f"smoothMesh.z = CSXCAD.SmoothMeshLines.SmoothMeshLines(smoothMesh.z, {gridSettingsInst.smoothMesh['zMaxRes']})\n"
@@ -1212,27 +1241,26 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
             gridSettingsInst = items[itemListIdx][1]
 
             fcObject = fcObjects.get(FreeCADObjectName, None)
             if (not fcObject):
-                print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                 continue
 
             ### Produce script output.
@@ -1240,13 +1268,12 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
             if (not "Shape" in dir(fcObject)):
                 continue
 
-            bbCoords = fcObject.Shape.BoundBox
+            bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
             # If generateLinesInside is selected, grid line region is shifted inward by lambda/20.
             if gridSettingsInst.generateLinesInside:
                 delta = self.maxGridResolution_m / refUnit
-                print("GRID generateLinesInside object detected, setting correction constant to " + str(
-                    delta) + " " + refUnitStr)
+                logger.debug("GRID generateLinesInside object detected, setting correction constant to %s %s", delta, refUnitStr)
             else:
                 delta = 0
 
@@ -1389,9 +1416,9 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         excitationCategory = self.form.objectAssignmentRightTreeWidget.findItems("Excitation",
                                                                                  QtCore.Qt.MatchFixedString)
         if len(excitationCategory) >= 0:
-            print("Excitation Settings detected")
-            print("#")
-            print("#EXCITATION")
+            logger.debug("Excitation Settings detected")
+            logger.debug("#")
+            logger.debug("#EXCITATION")
 
             # FOR WHOLE SIMULATION THERE IS JUST ONE EXCITATION DEFINED, so first is taken!
             if (excitationCategory[0].childCount() > 0):
@@ -1400,8 +1427,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
                 # Currently only 1 excitation is allowed. Multiple excitations could be managed by setting one of them as "selected" or "active", while all others are deactivated.
                 # This would help the user to manage different analysis scenarios / excitation ranges.
 
-                print("#name: " + currSetting.getName())
-                print("#type: " + currSetting.getType())
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#type: %s", currSetting.getType())
 
                 genScript += "#######################################################################################################################################\n"
                 genScript += "# EXCITATION " + currSetting.getName() + "\n"
@@ -1466,13 +1493,17 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         genScript += "#######################################################################################################################################\n"
 
         _bcStr = lambda pml_val, text: '\"PML_{}\"'.format(str(pml_val)) if text == 'PML' else '\"{}\"'.format(text)
+
+        #	sides cropped by symmetry planes have PEC or PMC instead of boundary condition set in GUI
+        bcSymmetry = self.getSymmetryBoundaryConditions()
+
         strBC = ""
-        strBC += _bcStr(self.form.PMLxmincells.value(), self.form.BCxmin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLxmaxcells.value(), self.form.BCxmax.currentText()) + ","
-        strBC += _bcStr(self.form.PMLymincells.value(), self.form.BCymin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLymaxcells.value(), self.form.BCymax.currentText()) + ","
-        strBC += _bcStr(self.form.PMLzmincells.value(), self.form.BCzmin.currentText()) + ","
-        strBC += _bcStr(self.form.PMLzmaxcells.value(), self.form.BCzmax.currentText())
+        strBC += _bcStr(self.form.PMLxmincells.value(), bcSymmetry.get('xmin', self.form.BCxmin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLxmaxcells.value(), bcSymmetry.get('xmax', self.form.BCxmax.currentText())) + ","
+        strBC += _bcStr(self.form.PMLymincells.value(), bcSymmetry.get('ymin', self.form.BCymin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLymaxcells.value(), bcSymmetry.get('ymax', self.form.BCymax.currentText())) + ","
+        strBC += _bcStr(self.form.PMLzmincells.value(), bcSymmetry.get('zmin', self.form.BCzmin.currentText())) + ","
+        strBC += _bcStr(self.form.PMLzmaxcells.value(), bcSymmetry.get('zmax', self.form.BCzmax.currentText()))
 
         genScript += "BC = [" + strBC + "]\n"
         genScript += "FDTD.SetBoundaryCond(BC)\n"
@@ -1527,6 +1558,27 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
 
         return genScript
 
+    def getSymmetryScriptLines(self):
+        genScript = ""
+
+        symmetryPlanes = self.getSymmetryPlanes()
+        if len(symmetryPlanes) == 0:
+            return genScript
+
+        genScript += "#######################################################################################################################################\n"
+        genScript += "# SYMMETRY, model is cropped by symmetry planes, there is PEC or PMC boundary condition on them\n"
+        genScript += "#######################################################################################################################################\n"
+        for plane in symmetryPlanes:
+            axis = plane['axis']
+            coord = _r(plane['coord'])
+            genScript += f"mesh.{axis} = openEMS_grid.GetLines('{axis}', True)\n"
+            genScript += f"mesh.{axis} = np.unique(np.append(mesh.{axis}[mesh.{axis} {plane['keep']} {coord}], {coord}))\n"
+            genScript += f"openEMS_grid.ClearLines('{axis}')\n"
+            genScript += f"openEMS_grid.AddLine('{axis}', mesh.{axis})\n"
+            genScript += "\n"
+
+        return genScript
+
     ###################################################################################################################
     #	GENERATE SCRIPT CLICKED - go through object assignment tree categories, output child item data.
     ###################################################################################################################
@@ -1537,7 +1589,8 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         :param outputDir:
         :return:
         """
-        self.generateOpenEMSScript(outputDir)
+        with self.collectManifest():
+            self.generateOpenEMSScript(outputDir)
 
     def generateOpenEMSScript(self, outputDir=None):
 
@@ -1545,6 +1598,7 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         #   if outputDir is set to same value
         #   if outputStr is None then folder with name as FreeCAD file with suffix _openEMS_simulation is created
         outputDir = self.createOuputDir(outputDir)
+        generationStats = self.startGenerationStats()
 
         # Update status bar to inform user that exporting has begun.
         if self.statusBar is not None:
@@ -1616,41 +1670,53 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         genScript += "FDTD.SetCSX(CSX)\n"
         genScript += "\n"
 
-        print("======================== REPORT BEGIN ========================\n")
+        logger.debug("======================== REPORT BEGIN ========================\n")
 
         self.reportFreeCADItemSettings(itemsByClassName.get("FreeCADSettingsItem", None))
 
         # Write boundary conditions definitions.
-        genScript += self.getBoundaryConditionsScriptLines()
+        with self.measureStage("boundary conditions"):
+            genScript += self.getBoundaryConditionsScriptLines()
 
         # Write coordinate system definitions.
         genScript += self.getCoordinateSystemScriptLines()
 
         # Write excitation definition.
-        genScript += self.getExcitationScriptLines()
+        with self.measureStage("excitation", itemsByClassName.get("ExcitationSettingsItem", None)):
+            genScript += self.getExcitationScriptLines()
 
         # Write material definitions.
-        genScript += self.getMaterialDefinitionsScriptLines(itemsByClassName.get("MaterialSettingsItem", None), outputDir)
+        with self.measureStage("materials", itemsByClassName.get("MaterialSettingsItem", None)):
+            genScript += self.getMaterialDefinitionsScriptLines(itemsByClassName.get("MaterialSettingsItem", None), outputDir)
 
         # Write grid definitions.
-        genScript += self.getOrderedGridDefinitionsScriptLines(itemsByClassName.get("GridSettingsItem", None))
+        with self.measureStage("grid", itemsByClassName.get("GridSettingsItem", None)):
+            genScript += self.getOrderedGridDefinitionsScriptLines(itemsByClassName.get("GridSettingsItem", None))
 
         # Write port definitions.
-        genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
+        with self.measureStage("ports", itemsByClassName.get("PortSettingsItem", None)):
+            genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
         # Write lumped part definitions.
-        genScript += self.getLumpedPartDefinitionsScriptLines(itemsByClassName.get("LumpedPartSettingsItem", None))
+        with self.measureStage("lumped parts", itemsByClassName.get("LumpedPartSettingsItem", None)):
+            genScript += self.getLumpedPartDefinitionsScriptLines(itemsByClassName.get("LumpedPartSettingsItem", None))
 
         # Write probes definitions
-        genScript += self.getProbeDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
+        with self.measureStage("probes", itemsByClassName.get("ProbeSettingsItem", None)):
+            genScript += self.getProbeDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
 
         # Write NF2FF probe grid definitions.
-        genScript += self.getNF2FFDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
+        with self.measureStage("nf2ff", itemsByClassName.get("ProbeSettingsItem", None)):
+            genScript += self.getNF2FFDefinitionsScriptLines(itemsByClassName.get("ProbeSettingsItem", None))
 
-        # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
-        genScript += self.getMinimalGridlineSpacingScriptLines()
+        with self.measureStage("grid postprocessing"):
+            # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
+            genScript += self.getMinimalGridlineSpacingScriptLines()
+
+            # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+            genScript += self.getSymmetryScriptLines()
 
-        print("======================== REPORT END ========================\n")
+        logger.debug("======================== REPORT END ========================\n")
 
         # Finalize script.
 
@@ -1666,7 +1732,20 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         genScript += "from CSXCAD import AppCSXCAD_BIN\n"
         genScript += "os.system(AppCSXCAD_BIN + ' \"{}\"'.format(CSX_file))\n"
         genScript += "\n"
-        genScript += "FDTD.Run(Sim_Path, verbose=3, cleanup=True, setup_only=setup_only, debug_pec=debug_pec)\n"
+
+        #
+        #   Python interface runs openEMS default engine, just threads count can be set, other engines are available only
+        #   for openEMS binary started with --engine option
+        #
+        engineProfile = self.getEngineProfile()
+        if engineProfile is not None and engineProfile['engine'] == 'multithreaded':
+            genScript += f"# threads count from calibrated engine profile of this machine ({engineProfile['speed_MCps']:g} MCells/s)\n"
+            genScript += f"FDTD.Run(Sim_Path, verbose=3, cleanup=True, setup_only=setup_only, debug_pec=debug_pec, numThreads={engineProfile['numThreads']})\n"
+        elif engineProfile is not None:
+            genScript += f"# calibrated engine profile of this machine is '{engineProfile['engine']}' which cannot be set from python, run openEMS binary with --engine={engineProfile['engine']} to use it\n"
+            genScript += "FDTD.Run(Sim_Path, verbose=3, cleanup=True, setup_only=setup_only, debug_pec=debug_pec, numThreads=1)\n"
+        else:
+            genScript += "FDTD.Run(Sim_Path, verbose=3, cleanup=True, setup_only=setup_only, debug_pec=debug_pec)\n"
 
         # Write _OpenEMS.py script file to current directory.
         currDir, nameBase = self.getCurrDir()
@@ -1676,14 +1755,16 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         else:
             fileName = f"{currDir}/{nameBase}_openEMS.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
+        with self.measureStage("file write"):
+            self.writeFileIfChanged(fileName, genScript)
+
+        generationStats.finish()
+        logger.info("======================== TIMING ========================\n%s", generationStats.getReportText())
 
         # Show message or update status bar to inform user that exporting has finished.
 
         self.guiHelpers.displayMessage('Simulation script written to: ' + fileName, forceModal=True)
-        print('Simulation script written to: ' + fileName)
+        logger.info("Simulation script written to: %s", fileName)
 
         return
 
@@ -1748,10 +1829,13 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         #
         #   Current NF2FF box index
         #
-        print(f"writeNf2ffButtonClicked() > generate script, getting nf2ff box index for '{nf2ffBoxName}'")
+        logger.debug("writeNf2ffButtonClicked() > generate script, getting nf2ff box index for '%s'", nf2ffBoxName)
         currentNF2FFBoxIndex = self.internalNF2FFIndexNamesList[nf2ffBoxName.replace(" ", "_")]
         currentNF2FFInputPortIndex = self.internalPortIndexNamesList[nf2ffBoxInputPortName]
 
@@ -1763,6 +1847,10 @@ class PythonScriptLinesGenerator2_openems(CommonScriptLinesGenerator):
         phiStop = str(self.form.portNf2ffPhiStop.value())
         phiStep = str(self.form.portNf2ffPhiStep.value())
 
+        #	model cropped by symmetry planes has just part of input power, nf2ff box mirror gives full model far field
+        symmetryPowerScale = self.getSymmetryPowerScale()
+        symmetryPowerScriptLine = f"P_in_0 = P_in_0 * {symmetryPowerScale}  # full model power, model is cropped by symmetry planes\n" if symmetryPowerScale != 1 else ""
+
         #
         #   ATTENTION THIS IS SPECIFIC FOR FAR FIELD PLOTTING, plotFrequency and frequencies count
         #       port is calculated to get P_in (input power)
@@ -1813,7 +1901,7 @@ freq = np.linspace(max([0, f0-fc]), f0+fc, {freqCount})
 plotFrequency = {plotFrequency}
 port[{currentNF2FFInputPortIndex}].CalcPort(Sim_Path, freq)
 P_in_0 = np.interp(f0, freq, port[{currentNF2FFInputPortIndex}].P_acc)
-
+{symmetryPowerScriptLine}
 #
 # Calculate the far field at phi=0 degrees and at phi=90 degrees
 #   Using angles in degrees.
@@ -1891,10 +1979,8 @@ generatorFunc_DumpFF2VTK(E_far_normalized, nf2ff.theta, nf2ff.phi, os.path.join(
         else:
             fileName = f"{currDir}/{nameBase}_draw_NF2FF.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Script to display far field written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Script to display far field written into: %s", fileName)
         self.guiHelpers.displayMessage('Script to display far field written into: ' + fileName, forceModal=False)
 
     def drawS11ButtonClicked(self, outputDir=None, portName=""):
@@ -1942,15 +2028,22 @@ generatorFunc_DumpFF2VTK(E_far_normalized, nf2ff.theta, nf2ff.phi, os.path.join(
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         # Write port definitions.
         genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
+        #	port cut by symmetry plane has scaled resistance, impedance is recalculated to full model
+        symmetryPortRScale = self.internalPortSymmetryRScaleList.get(portName, 1.0)
+        symmetryZinScriptLine = f"Zin = Zin / {symmetryPortRScale:g}  # full model impedance, port is cut by symmetry plane\n" if symmetryPortRScale != 1.0 else ""
+
         genScript += f"""## postprocessing & do the plots
 freq = np.linspace(max(1e6,f0-fc), f0+fc, 501)
 port[{self.internalPortIndexNamesList[portName]}].CalcPort(Sim_Path, freq)
 
 Zin = port[{self.internalPortIndexNamesList[portName]}].uf_tot / port[{self.internalPortIndexNamesList[portName]}].if_tot
-s11 = port[{self.internalPortIndexNamesList[portName]}].uf_ref / port[{self.internalPortIndexNamesList[portName]}].uf_inc
+{symmetryZinScriptLine}s11 = port[{self.internalPortIndexNamesList[portName]}].uf_ref / port[{self.internalPortIndexNamesList[portName]}].uf_inc
 s11_dB = 20.0*np.log10(np.abs(s11))
 
 # plot the feed point impedance
@@ -2002,10 +2095,8 @@ with open(filename, 'w', newline='') as csvfile:
         else:
             fileName = f"{currDir}/{nameBase}_draw_S11.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName, forceModal=False)
 
     def drawS21ButtonClicked(self, outputDir=None, sourcePortName="", targetPortName=""):
@@ -2052,6 +2143,9 @@ with open(filename, 'w', newline='') as csvfile:
         # Write scriptlines which removes gridline too close, must be enabled in GUI, it's checking checkbox inside
         genScript += self.getMinimalGridlineSpacingScriptLines()
 
+        # Write scriptlines which crop mesh by symmetry planes, must be enabled in GUI
+        genScript += self.getSymmetryScriptLines()
+
         # Write port definitions.
         genScript += self.getPortDefinitionsScriptLines(itemsByClassName.get("PortSettingsItem", None))
 
@@ -2106,8 +2200,6 @@ with open(filename, 'w', newline='') as csvfile:
         else:
             fileName = f"{currDir}/{nameBase}_draw_S21.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written to: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written to: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written to: ' + fileName, forceModal=False)
@@ -14,6 +14,9 @@ from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
 
 from utilsOpenEMS.ScriptLinesGenerator.CommonScriptLinesGenerator import CommonScriptLinesGenerator
 from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator2_openems import PythonScriptLinesGenerator2_openems
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 
 class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
@@ -87,17 +90,17 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 #
                 materialCounter += 1
 
-                print(currSetting)
+                logger.debug(currSetting)
                 if (currSetting.getName() == 'Material Default'):
-                    print("#Material Default")
-                    print("---")
+                    logger.debug("#Material Default")
+                    logger.debug("---")
                     continue
 
-                print("#")
-                print("#MATERIAL")
-                print("#name: " + currSetting.getName())
-                print("#epsilon, mue, tand, sigma")
-                print("#" + str(currSetting.constants['epsilon']) + ", " + str(currSetting.constants['mue']) + ", " + str(currSetting.constants['kappa']) + ", " + str(currSetting.constants['sigma']))
+                logger.debug("#")
+                logger.debug("#MATERIAL")
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#epsilon, mue, tand, sigma")
+                logger.debug("#%s, %s, %s, %s", currSetting.constants['epsilon'], currSetting.constants['mue'], currSetting.constants['kappa'], currSetting.constants['sigma'])
 
                 genScript += f"## MATERIAL - {currSetting.getName()}\n"
                 materialPythonVariable = f"materialList['{currSetting.getName()}']"
@@ -129,8 +132,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 # first print all current material children names
                 for k in range(item.childCount()):
                     childName = item.child(k).text(0)
-                    print("##Children:")
-                    print("\t" + childName)
+                    logger.debug("##Children:")
+                    logger.debug("\t%s", childName)
 
                 # now export material children, if it's object export as STL, if it's curve export as curve
                 for k in range(item.childCount()):
@@ -142,8 +145,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                     #
                     #	getting item priority
                     #
-                    objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                    objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                    objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                     # getting reference to FreeCAD object
                     freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -171,7 +174,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                         #
                         genScript += "##conducting sheet object\n"
                         genScript += f"#object Label: {freeCadObj.Label}\n"
-                        bbCoords = freeCadObj.Shape.BoundBox
+                        bbCoords = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                         if (freeCadObj.Name.find("Sketch") > -1):
                             #
@@ -191,11 +194,11 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
                                 genScript += f"{materialPythonVariable}.AddPolygon(points, '{normDir}', {elevation}, priority={objModelPriority})\n"
                                 genScript += "\n"
-                                print("material conducting sheet: polygon into conducting sheet added.")
+                                logger.debug("material conducting sheet: polygon into conducting sheet added.")
                             else:
                                 genScript += f"## {normDir}\n"
                                 genScript += "\n"
-                                print("ERROR: material conducting sheet: " + normDir)
+                                logger.error("ERROR: material conducting sheet: " + normDir)
 
                         elif (_r(bbCoords.XMin) == _r(bbCoords.XMax) or _r(bbCoords.YMin) == _r(bbCoords.YMax) or _r(bbCoords.ZMin) == _r(bbCoords.ZMax)):
                             #
@@ -246,7 +249,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
                         genScript += f"{materialPythonVariable}.AddCurve(points, priority={objModelPriority})\n"
                         genScript += "\n"
-                        print("Curve added to generated script using its points.")
+                        logger.debug("Curve added to generated script using its points.")
 
                     elif (freeCadObj.Name.find("Sketch") > -1):
                         #
@@ -291,10 +294,10 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
                         genScript += f"{materialPythonVariable}.AddCurve(points, priority={objModelPriority})\n"
                         genScript += "\n"
-                        print("Line segments from sketch added.")
+                        logger.debug("Line segments from sketch added.")
 
                     elif freeCadObj.Name.startswith('Sphere'):
-                        bbox = freeCadObj.Shape.BoundBox
+                        bbox = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                         radius = max(
                             bbox.XMax - bbox.XMin,
@@ -334,8 +337,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                         else:
                             exportFileName = os.path.join(currDir, stepModelFileName)
 
-                        self.cadHelpers.exportSTEP([freeCadObj], exportFileName)
-                        print("Material object exported as STEP into: " + stepModelFileName)
+                        self.exportGeometryFile('step', [freeCadObj], exportFileName)
+                        logger.debug("Material object exported as STEP into: %s", stepModelFileName)
 
                 genScript += "\n"   #newline after each COMPLETE material category code generated
 
@@ -356,8 +359,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
             # first print all current material children names
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("##Children:")
-                print("\t" + childName)
+                logger.debug("##Children:")
+                logger.debug("\t%s", childName)
 
             # now export material children, if it's object export as STL, if it's curve export as curve
             for k in range(item.childCount()):
@@ -368,14 +371,14 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 #
                 #	getting item priority
                 #
-                objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                 # getting reference to FreeCAD object
                 freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
 
                 if freeCadObj.Name.startswith('Sphere'):
-                    bbox = freeCadObj.Shape.BoundBox
+                    bbox = self.cadHelpers.getObjectBoundBox(freeCadObj)
 
                     radius = max(
                         bbox.XMax - bbox.XMin,
@@ -414,8 +417,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                     else:
                         exportFileName = os.path.join(currDir, stepModelFileName)
 
-                    self.cadHelpers.exportSTEP([freeCadObj], exportFileName)
-                    print("Boundary condition object exported as STEP into: " + stepModelFileName)
+                    self.exportGeometryFile('step', [freeCadObj], exportFileName)
+                    logger.debug("Boundary condition object exported as STEP into: %s", stepModelFileName)
 
             genScript += "\n"   #newline after each COMPLETE material category code generated
 
@@ -539,7 +542,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
         for [item, currSetting] in items:
 
-            print(f"#PORT - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PORT - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -554,14 +557,14 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print('\tFreeCAD lumped port BoundBox: ' + str(bbCoords))
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\tFreeCAD lumped port BoundBox: %s", bbCoords)
 
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -789,7 +792,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
         for [item, currSetting] in items:
 
-            print(f"#PROBE - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PROBE - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -801,10 +804,10 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
                 # print(freecadObjects)
                 for obj in freecadObjects:
-                    print(f"\t{obj.Label}")
+                    logger.debug("\t%s", obj.Label)
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print(f"\t\t{bbCoords}")
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\t\t%s", bbCoords)
 
                     #
                     # PROBE openEMS GENERATION INTO VARIABLE
@@ -961,14 +964,14 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
             objsExport = []
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("#LUMPED PART " + currentSetting.getType())
+                logger.debug("#LUMPED PART %s", currentSetting.getType())
 
                 freecadObjects = [i for i in objs if (i.Label) == childName]
                 for obj in freecadObjects:
                     # obj = FreeCAD Object class
 
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     genScript += self.getCartesianOrCylindricalScriptLinesFromStartStop(bbCoords, "lumpedPartStart", "lumpedPartStop")
 
@@ -998,8 +1001,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     # WARNING: Caps param has hardwired value 1, will be generated small metal caps to connect part with circuit !!!
                     genScript += f"lumpedPart = CSX.AddLumpedElement({lumpedPartParams});\n"
@@ -1031,7 +1034,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
             objsExport = []
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("#BOUNDARY CONDITION TYPE: " + currentSetting.getType())
+                logger.debug("#BOUNDARY CONDITION TYPE: %s", currentSetting.getType())
 
                 freecadObjectList = [i for i in objs if (i.Label) == childName]
                 for freecadObj in freecadObjectList:
@@ -1046,8 +1049,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                     #	getting item priority
                     #       for now this is not used as I am not sure how to use it in EMerge
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     bcType = currentSetting.getType().lower()
                     if  bcType == "absorbing":
@@ -1085,7 +1088,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
 
                     if (currSetting.getType() == 'nf2ff box'):
                         nf2ff_gridlines['x'].append("{0:g}".format(_r(sf * bbCoords.XMin)))
@@ -1139,20 +1142,19 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
 
@@ -1168,7 +1170,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
             if (gridSettingsInst.getType() in ['FEM Max Size']):
                 fcObject = fcObjects.get(FreeCADObjectName, None)
                 if (not fcObject):
-                    print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                    logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                     continue
 
                 ### Produce script output.
@@ -1221,27 +1223,26 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
             gridSettingsInst = items[itemListIdx][1]
 
             fcObject = fcObjects.get(FreeCADObjectName, None)
             if (not fcObject):
-                print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                 continue
 
             ### Produce script output.
@@ -1249,13 +1250,12 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
             if (not "Shape" in dir(fcObject)):
                 continue
 
-            bbCoords = fcObject.Shape.BoundBox
+            bbCoords = self.cadHelpers.getObjectBoundBox(fcObject)
 
             # If generateLinesInside is selected, grid line region is shifted inward by lambda/20.
             if gridSettingsInst.generateLinesInside:
                 delta = self.maxGridResolution_m / refUnit
-                print("GRID generateLinesInside object detected, setting correction constant to " + str(
-                    delta) + " " + refUnitStr)
+                logger.debug("GRID generateLinesInside object detected, setting correction constant to %s %s", delta, refUnitStr)
             else:
                 delta = 0
 
@@ -1368,9 +1368,9 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         excitationCategory = self.form.objectAssignmentRightTreeWidget.findItems("Excitation",
                                                                                  QtCore.Qt.MatchFixedString)
         if len(excitationCategory) >= 0:
-            print("Excitation Settings detected")
-            print("#")
-            print("#EXCITATION")
+            logger.debug("Excitation Settings detected")
+            logger.debug("#")
+            logger.debug("#EXCITATION")
 
             # FOR WHOLE SIMULATION THERE IS JUST ONE EXCITATION DEFINED, so first is taken!
             if (excitationCategory[0].childCount() > 0):
@@ -1379,8 +1379,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
                 # Currently only 1 excitation is allowed. Multiple excitations could be managed by setting one of them as "selected" or "active", while all others are deactivated.
                 # This would help the user to manage different analysis scenarios / excitation ranges.
 
-                print("#name: " + currSetting.getName())
-                print("#type: " + currSetting.getType())
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#type: %s", currSetting.getType())
 
                 genScript += "#######################################################################################################################################\n"
                 genScript += "# EXCITATION " + currSetting.getName() + "\n"
@@ -1479,7 +1479,8 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         :param outputDir:
         :return:
         """
-        self.generateEmergeScript(outputDir)
+        with self.collectManifest():
+            self.generateEmergeScript(outputDir)
 
     def generateEmergeScript(self, outputDir=None):
         """
@@ -1538,7 +1539,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         genScript += "\tos.mkdir(Sim_Path)    # create empty simulation folder\n"
         genScript += "\n"
 
-        print("======================== REPORT BEGIN ========================\n")
+        logger.debug("======================== REPORT BEGIN ========================\n")
 
         genScript += "# --- Unit definitions -----------------------------------------------------\n"
         genScript += "m = 1.0\n"
@@ -1665,9 +1666,9 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         genScript += "\t\tgmsh.model.addPhysicalGroup(2, objectTag2DList, name=groupName)\n"
         genScript += "\t\tgmsh.model.addPhysicalGroup(3, objectTag3DList, name=groupName)\n"
         genScript += "\n"
-        for objectName in set(self.createdObjectNameList):  #converting list to set make it unique, because some names could be under more categories and we want to use them just once
+        for objectName in dict.fromkeys(self.createdObjectNameList):  #converting list to dict keys make it unique and keeps order stable, because some names could be under more categories and we want to use them just once
             genScript += f"createGmshNamedGroup('{objectName}', '{objectName}')\n"
-        for objectName in set(self.createdObjectBoundaryNameList):  #converting list to set make it unique, because some names could be under more categories and we want to use them just once
+        for objectName in dict.fromkeys(self.createdObjectBoundaryNameList):  #converting list to dict keys make it unique and keeps order stable, because some names could be under more categories and we want to use them just once
             genScript += f"createGmshNamedGroup('{objectName}', '{objectName}Boundary', useBoundary=True)\n"
         genScript += "\n"
         genScript += f"simulationObj.export('{simulationName}.msh')\n"
@@ -1683,7 +1684,7 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         genScript += "simulationObj.view(plot_mesh=True, volume_mesh=False)\n"
         genScript += "\n"
 
-        print("======================== REPORT END ========================\n")
+        logger.debug("======================== REPORT END ========================\n")
 
         # Finalize script.
 
@@ -1711,14 +1712,12 @@ class PythonScriptLinesGenerator3_emerge(PythonScriptLinesGenerator2_openems):
         else:
             fileName = f"{currDir}/{nameBase}_emerge.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
+        self.writeFileIfChanged(fileName, genScript)
 
         # Show message or update status bar to inform user that exporting has finished.
 
         self.guiHelpers.displayMessage('Simulation script written to: ' + fileName, forceModal=True)
-        print('Simulation script written to: ' + fileName)
+        logger.info("Simulation script written to: %s", fileName)
 
         return
 
@@ -1798,10 +1797,8 @@ simulationObj.display.show()
         else:
             fileName = f"{currDir}/{nameBase}_draw_NF2FF.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Script to display far field written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Script to display far field written into: %s", fileName)
         self.guiHelpers.displayMessage('Script to display far field written into: ' + fileName, forceModal=False)
 
     #
@@ -1877,10 +1874,8 @@ simulationObj.display.show()
         else:
             fileName = f"{currDir}/{nameBase}_draw_field_{self.form.typeFieldProcessingEmerge.currentText()}.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Script to display far field written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Script to display far field written into: %s", fileName)
         self.guiHelpers.displayMessage('Script to display far field written into: ' + fileName, forceModal=False)
 
     def drawS11ButtonClicked(self, outputDir=None, portName=""):
@@ -1955,10 +1950,8 @@ simulationObj.display.show()
         else:
             fileName = f"{currDir}/{nameBase}_draw_S{sourcePortNumber}{sourcePortNumber}.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName, forceModal=False)
 
     def drawS21ButtonClicked(self, outputDir=None, sourcePortName="", targetPortName=""):
@@ -2043,9 +2036,7 @@ simulationObj.display.show()
         else:
             fileName = f"{currDir}/{nameBase}_draw_S{targetPortNumber}{sourcePortNumber}.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
+        self.writeFileIfChanged(fileName, genScript)
 
-        print('Draw result from simulation file written to: ' + fileName)
+        logger.info("Draw result from simulation file written to: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written to: ' + fileName, forceModal=False)
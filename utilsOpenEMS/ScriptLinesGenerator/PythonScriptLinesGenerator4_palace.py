@@ -10,6 +10,9 @@ import math
 from utilsOpenEMS.GlobalFunctions.GlobalFunctions import _bool, _r, _r2
 from utilsOpenEMS.GuiHelpers.FactoryCadInterface import FactoryCadInterface
 from utilsOpenEMS.ScriptLinesGenerator.PythonScriptLinesGenerator3_emerge import PythonScriptLinesGenerator3_emerge
+from utilsOpenEMS.GlobalFunctions.Logger import getLogger
+
+logger = getLogger(__name__)
 
 class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
 
@@ -22,7 +25,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
         super(PythonScriptLinesGenerator4_palace, self).__init__(form, statusBar)
 
     def generateSimulationScript(self, outputDir=None):
-        self.generatePalaceScript(outputDir)
+        with self.collectManifest():
+            self.generatePalaceScript(outputDir)
 
     def generatePalaceScript(self, outputDir=None):
         self.portBoundaryConditionScriptLinesBuffer = []
@@ -305,14 +309,12 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
         else:
             fileName = f"{currDir}/{nameBase}_palace.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
+        self.writeFileIfChanged(fileName, genScript)
 
         # Show message or update status bar to inform user that exporting has finished.
 
         self.guiHelpers.displayMessage('Simulation script written to: ' + fileName, forceModal=True)
-        print('Simulation script written to: ' + fileName)
+        logger.info("Simulation script written to: %s", fileName)
 
         return
 
@@ -342,17 +344,17 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                 #
                 materialCounter += 1
 
-                print(currSetting)
+                logger.debug(currSetting)
                 if (currSetting.getName() == 'Material Default'):
-                    print("#Material Default")
-                    print("---")
+                    logger.debug("#Material Default")
+                    logger.debug("---")
                     continue
 
-                print("#")
-                print("#MATERIAL")
-                print("#name: " + currSetting.getName())
-                print("#epsilon, mue, tand, sigma")
-                print("#" + str(currSetting.constants['epsilon']) + ", " + str(currSetting.constants['mue']) + ", " + str(currSetting.constants['kappa']) + ", " + str(currSetting.constants['sigma']))
+                logger.debug("#")
+                logger.debug("#MATERIAL")
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#epsilon, mue, tand, sigma")
+                logger.debug("#%s, %s, %s, %s", currSetting.constants['epsilon'], currSetting.constants['mue'], currSetting.constants['kappa'], currSetting.constants['sigma'])
 
                 genScript += f"## MATERIAL - {currSetting.getName()}\n"
                 # materialPythonVariable = f"materialList['{currSetting.getName()}']"
@@ -388,8 +390,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                 # first print all current material children names
                 for k in range(item.childCount()):
                     childName = item.child(k).text(0)
-                    print("##Children:")
-                    print("\t" + childName)
+                    logger.debug("##Children:")
+                    logger.debug("\t%s", childName)
 
                 # now export material children, if it's object export as STL, if it's curve export as curve
                 for k in range(item.childCount()):
@@ -401,8 +403,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                     #
                     #	getting item priority
                     #
-                    objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                    objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                    objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                     # getting reference to FreeCAD object
                     freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -435,8 +437,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                             pass
                         exportFileName = os.path.join(stepfileOutputDir, stepModelFileName)
 
-                    self.cadHelpers.exportSTEP([freeCadObj], exportFileName)
-                    print("Material object exported as STEP into: " + stepModelFileName)
+                    self.exportGeometryFile('step', [freeCadObj], exportFileName)
+                    logger.debug("Material object exported as STEP into: %s", stepModelFileName)
 
                 genScript += "\n"   #newline after each COMPLETE material category code generated
 
@@ -457,13 +459,13 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
             #   Create array of boundary condition boundaryList[<type ie. Absorbing, PEC, ...>] = list[str]
             #       - key must be proper palace boundary name as they are used in palace .json file under {...Boundary{ PEC: {Attributes: [...]...
             #
-            print(f"Working on boundary condition named '{currSetting.getName()}' type: '{currSetting.getType()}'")
+            logger.debug("Working on boundary condition named '%s' type: '%s'", currSetting.getName(), currSetting.getType())
 
             # first print all current material children names
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("##Children:")
-                print("\t" + childName)
+                logger.debug("##Children:")
+                logger.debug("\t%s", childName)
 
             # now export material children, if it's object export as STL, if it's curve export as curve
             for k in range(item.childCount()):
@@ -474,8 +476,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                 #
                 #	getting item priority
                 #
-                objModelPriorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                objModelPriority = self.getItemPriority(objModelPriorityItemName)
+                objModelPriorityKey = (item.parent().text(0), item.text(0), childName)
+                objModelPriority = self.getItemPriority(objModelPriorityKey)
 
                 # getting reference to FreeCAD object
                 freeCadObj = [i for i in self.cadHelpers.getObjects() if (i.Label) == childName][0]
@@ -507,8 +509,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
 
 
 
-                self.cadHelpers.exportSTEP([freeCadObj], exportFileName)
-                print("Boundary condition object exported as STEP into: " + stepModelFileName)
+                self.exportGeometryFile('step', [freeCadObj], exportFileName)
+                logger.debug("Boundary condition object exported as STEP into: %s", stepModelFileName)
 
             genScript += "\n"   #newline after each COMPLETE material category code generated
 
@@ -531,20 +533,19 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
 
         # Create lists and dict to be able to resolve ordered list of (grid settings instance <-> FreeCAD object) associations.
         # In its current form, this implies user-defined grid lines have to be associated with the simulation volume.
-        _assoc = lambda idx: list(map(str.strip, self.form.meshPriorityTreeView.topLevelItem(idx).text(0).split(',')))
-        orderedAssociations = [_assoc(k) for k in reversed(range(meshPrioritiesCount))]
+        orderedAssociations = list(reversed(self.guiHelpers.getMeshPriorityIndex().getKeys()))
         gridSettingsNodeNames = [gridSettingsNode.text(0) for [gridSettingsNode, gridSettingsInst] in items]
         fcObjects = {obj.Label: obj for obj in self.cadHelpers.getObjects()}
 
         for gridSettingsNodeName in gridSettingsNodeNames:
-            print("Grid type : " + gridSettingsNodeName)
+            logger.debug("Grid type : %s", gridSettingsNodeName)
 
         for k, [categoryName, gridName, FreeCADObjectName] in enumerate(orderedAssociations):
 
-            print("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
+            logger.debug("Grid priority level {} : {} :: {}".format(k, FreeCADObjectName, gridName))
 
             if not (gridName in gridSettingsNodeNames):
-                print("Failed to resolve '{}'.".format(gridName))
+                logger.warning("Failed to resolve '%s'.", gridName)
                 continue
             itemListIdx = gridSettingsNodeNames.index(gridName)
 
@@ -560,7 +561,7 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
             if (gridSettingsInst.getType() in ['FEM Max Size']):
                 fcObject = fcObjects.get(FreeCADObjectName, None)
                 if (not fcObject):
-                    print("Failed to resolve '{}'.".format(FreeCADObjectName))
+                    logger.warning("Failed to resolve '%s'.", FreeCADObjectName)
                     continue
 
                 ### Produce script output.
@@ -623,7 +624,7 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
 
         for [item, currSetting] in items:
 
-            print(f"#PORT - {currSetting.getName()} - {currSetting.getType()}")
+            logger.debug("#PORT - %s - %s", currSetting.getName(), currSetting.getType())
 
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
@@ -638,14 +639,14 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                 # print(freecadObjects)
                 for obj in freecadObjects:
                     # BOUNDING BOX
-                    bbCoords = obj.Shape.BoundBox
-                    print('\tFreeCAD lumped port BoundBox: ' + str(bbCoords))
+                    bbCoords = self.cadHelpers.getObjectBoundBox(obj)
+                    logger.debug("\tFreeCAD lumped port BoundBox: %s", bbCoords)
 
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     #
                     # PORT openEMS GENERATION INTO VARIABLE
@@ -698,8 +699,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                                     pass
                                 exportFileName = os.path.join(stepfileOutputDir, stepModelFileName)
 
-                            self.cadHelpers.exportSTEP([obj], exportFileName)
-                            print("Port object exported as STEP into: " + stepModelFileName)
+                            self.exportGeometryFile('step', [obj], exportFileName)
+                            logger.debug("Port object exported as STEP into: %s", stepModelFileName)
 
                         #
                         #   Create port definition
@@ -755,7 +756,7 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
             objs = self.cadHelpers.getObjects()
             for k in range(item.childCount()):
                 childName = item.child(k).text(0)
-                print("#LUMPED PART " + currentSetting.getType())
+                logger.debug("#LUMPED PART %s", currentSetting.getType())
 
                 lumpedPartParams = f"'{currentSetting.getName()}'"
                 if ('r' in currentSetting.getType().lower()):
@@ -774,8 +775,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                     #
                     #	getting item priority
                     #
-                    priorityItemName = item.parent().text(0) + ", " + item.text(0) + ", " + childName
-                    priorityIndex = self.getItemPriority(priorityItemName)
+                    priorityKey = (item.parent().text(0), item.text(0), childName)
+                    priorityIndex = self.getItemPriority(priorityKey)
 
                     currDir, baseName = self.getCurrDir()
                     stepModelFileName = childName + "_gen_model.step"
@@ -799,8 +800,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                             pass
                         exportFileName = os.path.join(stepfileOutputDir, stepModelFileName)
 
-                    self.cadHelpers.exportSTEP([obj], exportFileName)
-                    print("LumpedPart object exported as STEP into: " + stepModelFileName)
+                    self.exportGeometryFile('step', [obj], exportFileName)
+                    logger.debug("LumpedPart object exported as STEP into: %s", stepModelFileName)
 
                     genScript += f"mesherObj.addStepfile('{childName}', os.path.join(currDir, 'stepfiles', '{stepModelFileName}'), priority={priorityIndex})\n"
                     genScript += f"mesherObj.addObjectToLumpedPart('{currentSetting.getName()}', '{childName}')\n"
@@ -814,9 +815,9 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
 
         excitationCategory = self.form.objectAssignmentRightTreeWidget.findItems("Excitation", QtCore.Qt.MatchFixedString)
         if len(excitationCategory) >= 0:
-            print("Excitation Settings detected")
-            print("#")
-            print("#EXCITATION")
+            logger.debug("Excitation Settings detected")
+            logger.debug("#")
+            logger.debug("#EXCITATION")
 
             # FOR WHOLE SIMULATION THERE IS JUST ONE EXCITATION DEFINED, so first is taken!
             if (excitationCategory[0].childCount() > 0):
@@ -825,8 +826,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
                 # Currently only 1 excitation is allowed. Multiple excitations could be managed by setting one of them as "selected" or "active", while all others are deactivated.
                 # This would help the user to manage different analysis scenarios / excitation ranges.
 
-                print("#name: " + currSetting.getName())
-                print("#type: " + currSetting.getType())
+                logger.debug("#name: %s", currSetting.getName())
+                logger.debug("#type: %s", currSetting.getType())
 
                 # genScript += "#######################################################################################################################################\n"
                 # genScript += "# EXCITATION " + currSetting.getName() + "\n"
@@ -958,10 +959,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
         else:
             fileName = f"{currDir}/{nameBase}_draw_S{sourcePortNumber}{sourcePortNumber}.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName, forceModal=False)
 
     def drawS21ButtonClicked(self, outputDir=None, sourcePortName="", targetPortName=""):
@@ -1102,10 +1101,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
         else:
             fileName = f"{currDir}/{nameBase}_draw_{graphSParamName}.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Draw result from simulation file written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Draw result from simulation file written into: %s", fileName)
         self.guiHelpers.displayMessage('Draw result from simulation file written into: ' + fileName, forceModal=False)
 
     #
@@ -1143,10 +1140,8 @@ class PythonScriptLinesGenerator4_palace(PythonScriptLinesGenerator3_emerge):
         else:
             fileName = f"{currDir}/{nameBase}_draw_NF2FF.py"
 
-        f = open(fileName, "w", encoding='utf-8')
-        f.write(genScript)
-        f.close()
-        print('Script to display far field written into: ' + fileName)
+        self.writeFileIfChanged(fileName, genScript)
+        logger.info("Script to display far field written into: %s", fileName)
         self.guiHelpers.displayMessage('Script to display far field written into: ' + fileName, forceModal=False)
 
 '''
@@ -55,7 +55,7 @@ class GridSettingsItem(SettingsItem):
 
         self.fixedCount = {'x': 0, 'y': 0, 'z': 0} if fixedCount is None else fixedCount
         self.fixedDistance = {'x': 0, 'y': 0, 'z': 0} if fixedDistance is None else fixedDistance
-        self.smoothMesh = {'xMaxRes': 0, 'yMaxRes': 0, 'zMaxRes': 0} if smoothMeshDefault is None else smoothMeshDefault
+        self.smoothMesh = {'xMaxRes': 0, 'yMaxRes': 0, 'zMaxRes': 0, 'materialAware': False, 'thirdsRule': False, 'thirdsRuleResolution': 0} if smoothMeshDefault is None else smoothMeshDefault
         self.userDefined = {'data': ""} if userDefined is None else userDefined
         self.femMesh = {
             'femMaxSizeUnits': 'mm',